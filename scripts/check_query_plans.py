@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Apply pending schema migrations then EXPLAIN every registered query,
+reporting queries that are planned with a label scan feeding a filter (likely a missing index).
+Exits with status 1 if any are found, so it can be run against a staging database before deployment.
+"""
+import asyncio
+import sys
+
+from breedgraph.adapters.neo4j.driver import Neo4jAsyncDriver
+from breedgraph.adapters.neo4j.migrations import Neo4jSchemaMigrations
+
+import logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> int:
+    driver = Neo4jAsyncDriver()
+    try:
+        migrations = Neo4jSchemaMigrations(driver)
+        version = await migrations.migrate()
+        logger.info(f"Schema version: {version}")
+        findings = await migrations.check_query_plans()
+    finally:
+        await driver.close()
+
+    for query, scans in sorted(findings.items()):
+        for scan in scans:
+            logger.warning(f"{query}: {scan}")
+    logger.info(f"{len(findings)} queries flagged")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -38,20 +38,6 @@ async def ensure_empty_db(session: AsyncSession) -> None:
     if not is_empty:
         raise Exception("Database is not empty, aborting setup...")
 
-async def create_constraints(session: AsyncSession):
-    logger.info("Creating constraints...")
-    constraints = queries['infrastructure']['create_constraints']
-    try:
-        async with await session.begin_transaction() as tx:
-            for constraint in constraints.split(';\n'):
-                logger.debug(f"Creating constraint: {constraint}")
-                await tx.run(constraint)
-            await tx.commit()
-    except Exception as e:
-        logger.error(f"Error creating constraints: {e}")
-        logger.error(f"Continuing")
-        return
-
 async def create_system_account(uow: AbstractUnitOfWorkFactory) -> AccountStored:
     async with uow.get_uow() as uow_holder:
         logger.info("Creating system account...")
@@ -98,7 +84,9 @@ async def main():
         driver = Neo4jAsyncDriver()
         async with driver.session() as session:
             await ensure_empty_db(session)
-            await create_constraints(session)
+
+        logger.info("Applying schema migrations...")
+        await driver.ensure_schema()
 
         logger.debug("Build uow holder")
         uow = Neo4jUnitOfWorkFactory(driver)
@@ -0,0 +1,68 @@
+"""
+JSON encoding straight to bytes (orjson), for API responses and the payloads held in redis.
+
+numpy scalars and arrays, datetime, enums and UUIDs are serialized natively,
+without first being converted to Python objects. NaN and infinite floats are written as null.
+Other values are converted by the default: models with model_dump (pydantic and SerializableMixin) are dumped,
+other dataclasses are taken field by field, sets become lists,
+datetime subclasses (e.g. pandas Timestamp) ISO strings, arrays orjson does not take natively
+(e.g. non-contiguous or of object dtype) lists and anything else its string.
+
+datetime64 is the exception, orjson writes every datetime64 as a full timestamp (and NaT as the epoch),
+so these are replaced before encoding, written at the precision they hold, e.g. "2024" or "2024-03",
+so the unit is kept when read back, and NaT as null.
+"""
+import orjson
+import numpy as np
+
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+
+from typing import Any
+
+# dataclasses are passed to the default so that a model_dump is respected
+OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+def _datetime64_str(value: np.datetime64 | np.ndarray) -> Any:
+    text = np.datetime_as_string(value)
+    if isinstance(text, np.ndarray):
+        return [None if t == 'NaT' else str(t) for t in text.tolist()]
+    return None if text == 'NaT' else str(text)
+
+
+def _replace_datetime64(value: Any) -> Any:
+    """ The value with any datetime64 in it (through dicts, lists and tuples) written as strings """
+    if isinstance(value, dict):
+        return {key: _replace_datetime64(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_datetime64(item) for item in value]
+    if isinstance(value, np.datetime64):
+        return _datetime64_str(value)
+    if isinstance(value, np.ndarray) and np.issubdtype(value.dtype, np.datetime64):
+        return _datetime64_str(value)
+    return value
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, 'model_dump'):
+        return _replace_datetime64(value.model_dump())
+    if is_dataclass(value) and not isinstance(value, type):
+        return _replace_datetime64({field.name: getattr(value, field.name) for field in fields(value)})
+    if isinstance(value, (set, frozenset)):
+        return _replace_datetime64(list(value))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.ndarray):
+        return _replace_datetime64(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def dumps(value: Any) -> bytes:
+    return orjson.dumps(_replace_datetime64(value), default=_default, option=OPTIONS)
+
+
+def loads(data: bytes | str) -> Any:
+    return orjson.loads(data)
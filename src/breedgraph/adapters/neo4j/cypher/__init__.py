@@ -1,19 +1,45 @@
 import pathlib
+import re
 from importlib.resources import files
 
 queries = dict()
+fragments = dict()
 
 cypher_root = files("breedgraph.adapters.neo4j.cypher")
 
+# Fragments are parts shared between queries, written in a query as e.g. {{ readable(node=dataset, controller=TeamDatasets) }}.
+# They are substituted when the queries are loaded, with each argument replacing e.g. {{node}} in fragments/readable.cypher
+FRAGMENTS_FOLDER = "fragments"
+FRAGMENT_CALL = re.compile(r"\{\{\s*(\w+)\((.*?)\)\s*}}", re.DOTALL)
+
+
+def substitute_fragments(query: str) -> str:
+    def expand(match: re.Match) -> str:
+        name, arguments = match.group(1), match.group(2)
+        if name not in fragments:
+            raise ValueError(f"Unknown cypher fragment: {name}")
+        fragment = fragments[name]
+        for argument in filter(None, (argument.strip() for argument in arguments.split(','))):
+            key, _, value = argument.partition('=')
+            fragment = fragment.replace(f"{{{{{key.strip()}}}}}", value.strip())
+        if '{{' in fragment:
+            raise ValueError(f"Missing arguments for cypher fragment {name}: {match.group(0)}")
+        return fragment
+    return FRAGMENT_CALL.sub(expand, query)
+
+
+for fragment_path in cypher_root.joinpath(FRAGMENTS_FOLDER).iterdir():
+    if fragment_path.name.endswith(".cypher"):
+        fragments[pathlib.Path(fragment_path.name).stem] = fragment_path.read_text().strip()
+
 for folder in cypher_root.iterdir():
-    if folder.is_dir():
+    if folder.is_dir() and folder.name != FRAGMENTS_FOLDER:
         queries[folder.name] = dict()
         for cypher_path in folder.iterdir():
             if cypher_path.name.endswith(".cypher"):
-                queries[folder.name][pathlib.Path(cypher_path.name).stem] = cypher_path.read_text()
+                queries[folder.name][pathlib.Path(cypher_path.name).stem] = substitute_fragments(cypher_path.read_text())
 
 
 from breedgraph.adapters.neo4j.cypher.query_builders import ontology, controls
 
-__all__ = ['queries', 'ontology', 'controls']
-
+__all__ = ['queries', 'fragments', 'substitute_fragments', 'ontology', 'controls']
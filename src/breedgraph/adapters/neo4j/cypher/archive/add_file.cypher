@@ -0,0 +1,14 @@
+MERGE (record: FileArchiveRecord {file_id: $blob_id})
+  ON CREATE SET
+    record += $record_data,
+    record.last_accessed = datetime.transaction()
+MERGE (record)-[:STORES]->(file: StoredFile {file_id: $file_id})
+WITH record, file
+OPTIONAL MATCH (reference: Reference {file_id: $file_id})
+FOREACH (ref IN CASE WHEN reference IS NULL THEN [] ELSE [reference] END |
+  MERGE (file)-[:FOR_REFERENCE]->(ref)
+)
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
@@ -1,2 +1,4 @@
 MATCH (record: FileArchiveRecord {file_id: $file_id})
-DETACH DELETE record
\ No newline at end of file
+// a blob that was referenced again while being deleted from the archive is kept
+WHERE NOT (record)-[:STORES]->(: StoredFile)
+DETACH DELETE record
@@ -3,4 +3,7 @@ WHERE record.local_state = "local"
 AND record.file_size >= $size_limit
 AND datetime(record.last_accessed) <= datetime.transaction() - duration({days: $age_limit})
 
-RETURN record { .* }
\ No newline at end of file
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
\ No newline at end of file
@@ -1,2 +1,5 @@
 MATCH (record: FileArchiveRecord {file_id: $file_id})
-RETURN record { .* }
\ No newline at end of file
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
\ No newline at end of file
@@ -0,0 +1,13 @@
+CALL {
+  MATCH (record: FileArchiveRecord)-[:STORES]->(: StoredFile {file_id: $file_id})
+  RETURN record
+  UNION
+  // records created before content addressing are keyed by the upload UUID
+  MATCH (record: FileArchiveRecord {file_id: $file_id})
+  RETURN record
+}
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
+LIMIT 1
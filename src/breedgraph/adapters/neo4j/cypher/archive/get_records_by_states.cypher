@@ -1,4 +1,7 @@
 MATCH (record: FileArchiveRecord)
 WHERE record.archive_state IN $archive_states
-RETURN record { .* }
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
 ORDER BY record.last_attempt_at ASC
\ No newline at end of file
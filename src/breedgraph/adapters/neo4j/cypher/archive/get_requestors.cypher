@@ -1,4 +1,4 @@
-MATCH (user: User {id: $user_id})
+MATCH (user: User)
     -[:REQUESTED_RETRIEVAL]->(requests:ArchiveRequests)
     -[:REQUESTED_RETRIEVAL]->(record: FileArchiveRecord {file_id: $file_id})
 RETURN user {
@@ -1,2 +1,3 @@
-MATCH (record: FileArchiveRecord {file_id: $file_id})
-SET record.last_accessed = datetime.transaction()
\ No newline at end of file
+UNWIND $file_ids AS file_id
+MATCH (record: FileArchiveRecord {file_id: file_id})
+SET record.last_accessed = datetime.transaction()
@@ -0,0 +1,16 @@
+// the blob record for the upload, or keyed by the upload UUID for records created before content addressing
+OPTIONAL MATCH (linked: FileArchiveRecord)-[:STORES]->(file: StoredFile {file_id: $file_id})
+OPTIONAL MATCH (keyed: FileArchiveRecord {file_id: $file_id})
+WITH coalesce(linked, keyed) AS record, file
+WHERE record IS NOT NULL
+DETACH DELETE file
+WITH DISTINCT record
+// the write also locks the record against add_file until the release is committed
+SET record.archive_state = CASE
+  WHEN EXISTS { MATCH (record)-[:STORES]->(:StoredFile) } THEN record.archive_state
+  ELSE $deletion_pending
+END
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
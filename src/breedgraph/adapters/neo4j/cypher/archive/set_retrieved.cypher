@@ -3,4 +3,7 @@ MATCH (record: FileArchiveRecord {
   file_hash: $file_hash
 })
 SET record.archive_state = "archived", record.local_state = "local"
-RETURN record { .* }
\ No newline at end of file
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
\ No newline at end of file
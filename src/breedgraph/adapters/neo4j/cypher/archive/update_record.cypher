@@ -1,3 +1,6 @@
 MATCH (record: FileArchiveRecord {file_id: $file_id})
 SET record += $updates
-RETURN record { .* }
\ No newline at end of file
+RETURN record {
+  .*,
+  file_ids: [(record)-[:STORES]->(stored: StoredFile) | stored.file_id]
+}
\ No newline at end of file
@@ -0,0 +1,26 @@
+UNWIND $layouts AS layout_map
+CREATE (layout: Layout {
+  id: layout_map['id'],
+  name: layout_map['name'],
+  axes: layout_map['axes']
+})
+WITH
+  layout, layout_map
+// Link to type
+OPTIONAL CALL (layout, layout_map) {
+  MATCH (type:LayoutType {id: layout_map['type']})
+  CREATE (layout)-[:OF_LAYOUT_TYPE]->(type)
+  RETURN type.id as type
+}
+// Link to location
+OPTIONAL CALL (layout, layout_map) {
+  MATCH (location:Location {id: layout_map['location']})
+  CREATE (layout)-[:AT_LOCATION]->(location)
+  RETURN location.id as location
+}
+RETURN
+  layout {
+    .*,
+    type: type,
+    location: location
+  }
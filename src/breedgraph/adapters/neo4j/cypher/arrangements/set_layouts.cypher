@@ -0,0 +1,30 @@
+UNWIND $layouts AS layout_map
+MATCH (layout: Layout {id: layout_map['id']})
+SET
+  layout.name = layout_map['name'],
+  layout.axes = layout_map['axes']
+WITH
+  layout, layout_map
+// Update type
+CALL (layout, layout_map) {
+  MATCH (layout)-[of_type:OF_LAYOUT_TYPE]->(type:LayoutType)
+    WHERE NOT type.id = layout_map['type']
+  DELETE of_type
+}
+CALL (layout, layout_map) {
+  MATCH (type:LayoutType {id: layout_map['type']})
+  MERGE (layout)-[of_type:OF_LAYOUT_TYPE]->(type)
+  ON CREATE SET of_type.time = datetime.transaction()
+}
+// Update location
+CALL (layout, layout_map) {
+  MATCH (layout)-[at_location:AT_LOCATION]->(location:Location)
+    WHERE NOT location.id = layout_map['location']
+  DELETE at_location
+}
+CALL (layout, layout_map) {
+  MATCH (location:Location {id: layout_map['location']})
+  MERGE (layout)-[at_location:AT_LOCATION]->(location)
+  ON CREATE SET at_location.time = datetime.transaction()
+}
+RETURN count(layout) AS updated
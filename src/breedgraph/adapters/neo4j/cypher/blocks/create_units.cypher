@@ -1,30 +1,27 @@
-MERGE (counter: Counter {name: 'unit'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
-
+UNWIND $units AS unit_map
 CREATE (unit: Unit {
-  id: counter.count,
-  name: $name,
-  description: $description
+  id: unit_map['id'],
+  name: unit_map['name'],
+  description: unit_map['description']
 })
 
 WITH
-  unit
+  unit, unit_map
 // Link to subject (required for all units)
-CALL (unit) {
-  MATCH (subject:Subject {id: $subject})
+CALL (unit, unit_map) {
+  MATCH (subject:Subject {id: unit_map['subject']})
   CREATE (unit)-[:OF_SUBJECT]->(subject)
   RETURN collect(subject.id)[0] AS subject
 }
 //Link to germplasm (optional)
-OPTIONAL CALL (unit) {
-  MATCH (germplasm: Germplasm {id: $germplasm})
+OPTIONAL CALL (unit, unit_map) {
+  MATCH (germplasm: Germplasm {id: unit_map['germplasm']})
   CREATE (unit)-[:OF_GERMPLASM]->(germplasm)
   RETURN collect(germplasm.id)[0] as germplasm
 }
 // Link to positions
-CALL (unit) {
-  UNWIND $positions as position_map
+CALL (unit, unit_map) {
+  UNWIND unit_map['positions'] as position_map
   MATCH (location:Location {id: position_map['location_id']})
   OPTIONAL MATCH (layout: Layout {id: position_map['layout_id']})
   CREATE (unit)-[:IN_POSITION]->(position:Position {
@@ -45,5 +42,6 @@ RETURN
   unit {
     .*,
     subject: subject,
+    germplasm: germplasm,
     positions: positions
   }
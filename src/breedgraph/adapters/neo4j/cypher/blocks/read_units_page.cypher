@@ -0,0 +1,55 @@
+MATCH (unit: Unit)
+WHERE ($after_id IS NULL OR unit.id > $after_id)
+  AND (
+    $block_id IS NULL
+    OR unit.id = $block_id
+    OR EXISTS { MATCH (:Unit {id: $block_id})-[:INCLUDES_UNIT*]->(unit) }
+  )
+  AND (
+    $location_ids IS NULL
+    OR EXISTS {
+      MATCH (unit)-[:IN_POSITION]->(:Position)-[:AT_LOCATION]->(location:Location)
+      WHERE location.id IN $location_ids
+    }
+  )
+WITH unit
+// as in the blocks repository, unreadable units are left out, except block roots which are returned to be redacted
+WHERE NOT EXISTS { MATCH (:Unit)-[:INCLUDES_UNIT]->(unit) }
+  OR {{ readable(node=unit, controller=TeamUnits) }}
+ORDER BY unit.id
+LIMIT $limit
+
+OPTIONAL CALL (unit) {
+  MATCH (unit)-[:IN_POSITION]->(position:Position)-[:AT_LOCATION]->(location:Location)
+  WITH
+    position,
+    location,
+    coalesce(position.start, datetime('0001-01-01T00:00:00')) AS effectiveStart,
+    coalesce(position.end, datetime('9999-12-31T23:59:59')) AS effectiveEnd
+    ORDER BY effectiveStart ASC, effectiveEnd ASC
+  RETURN
+    collect(
+      position {
+        .*,
+        location_id:location.id,
+        layout_id:[(position)-[:IN_LAYOUT]->(layout:Layout)|layout.id][0]
+      }
+    ) AS positions
+}
+
+RETURN
+  unit {
+    .*,
+    subject: [(unit)-[:OF_SUBJECT]->(subject:Subject) | subject.id][0],
+    germplasm: [(unit)-[:OF_GERMPLASM]->(germplasm:Germplasm) | germplasm.id][0],
+    positions: positions,
+    parents: [(parent:Unit)-[:INCLUDES_UNIT]->(unit)
+      WHERE NOT EXISTS { MATCH (:Unit)-[:INCLUDES_UNIT]->(parent) }
+        OR {{ readable(node=parent, controller=TeamUnits) }}
+      | parent.id],
+    children: [(unit)-[:INCLUDES_UNIT]->(child:Unit)
+      WHERE {{ readable(node=child, controller=TeamUnits) }}
+      | child.id]
+  } AS unit,
+  [(unit)<-[controls:CONTROLS]-(:TeamUnits)<-[:CONTROLS]-(team:Team) |
+    {team: team.id, release: controls.releases[-1]}] AS controls
\ No newline at end of file
@@ -1,40 +1,41 @@
-MATCH (unit: Unit {id:$id})
+UNWIND $units AS unit_map
+MATCH (unit: Unit {id: unit_map['id']})
 SET
-  unit.name = $name,
-  unit.description = $description
+  unit.name = unit_map['name'],
+  unit.description = unit_map['description']
 WITH
-  unit
+  unit, unit_map
 // Update subject
-CALL (unit) {
+CALL (unit, unit_map) {
   MATCH (unit)-[of_subject:OF_SUBJECT]->(subject:Subject)
-    WHERE NOT subject.id = $subject
+    WHERE NOT subject.id = unit_map['subject']
   DELETE of_subject
 }
-CALL (unit) {
-  MATCH (subject:Subject {id: $subject})
+CALL (unit, unit_map) {
+  MATCH (subject:Subject {id: unit_map['subject']})
   MERGE (unit)-[of_subject:OF_SUBJECT]->(subject)
   ON CREATE SET of_subject.time = datetime.transaction()
 }
 
 // Update germplasm
-OPTIONAL CALL (unit) {
+OPTIONAL CALL (unit, unit_map) {
   MATCH (unit)-[of_germplasm:OF_GERMPLASM]->(germplasm:Germplasm)
-    WHERE NOT germplasm.id = $germplasm
+    WHERE NOT germplasm.id = unit_map['germplasm']
   DELETE of_germplasm
 }
-OPTIONAL CALL (unit) {
-  MATCH (germplasm:Germplasm {id: $germplasm})
+OPTIONAL CALL (unit, unit_map) {
+  MATCH (germplasm:Germplasm {id: unit_map['germplasm']})
   MERGE (unit)-[of_germplasm:OF_GERMPLASM]->(germplasm)
   ON CREATE SET of_germplasm.time = datetime.transaction()
 }
 
 // Update positions
-OPTIONAL CALL (unit ){
+OPTIONAL CALL (unit) {
   MATCH (unit)-[:IN_POSITION]->(position:Position)
   DETACH DELETE position
 }
-CALL (unit) {
-  UNWIND $positions AS position_map
+CALL (unit, unit_map) {
+  UNWIND unit_map['positions'] AS position_map
   MATCH (location:Location {id: position_map['location_id']})
   OPTIONAL MATCH (layout: Layout {id: position_map['layout_id']})
   CREATE (unit)-[:IN_POSITION]->(position:Position {
@@ -50,4 +51,4 @@ CALL (unit) {
     MERGE (position)-[:IN_LAYOUT]->(layout)
   )
 }
-RETURN NULL
+RETURN count(unit) AS updated
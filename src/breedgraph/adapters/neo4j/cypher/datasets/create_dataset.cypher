@@ -1,7 +1,12 @@
-MERGE (counter: Counter {name: 'dataset'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
-CREATE (dataset: Dataset {id: counter.count})
+CREATE (dataset: Dataset {id: $id})
+// kept up to date as records are written, see summarise_records and refresh_dataset_summaries
+CREATE (dataset)-[:HAS_SUMMARY]->(:DatasetSummary {
+  record_count: 0,
+  unit_count: 0,
+  subject_ids: [],
+  location_ids: [],
+  block_ids: []
+})
 WITH
   dataset
 //Link study
@@ -1,4 +1,5 @@
-MATCH
-  (dataset: Dataset)-[:INCLUDES_RECORD]->(record:Record)
+MATCH (dataset: Dataset)
 WHERE dataset.id in $dataset_ids
-DETACH DELETE dataset, record
\ No newline at end of file
+OPTIONAL MATCH (dataset)-[:INCLUDES_RECORD]->(record:Record)
+OPTIONAL MATCH (dataset)-[:HAS_SUMMARY]->(summary:DatasetSummary)
+DETACH DELETE dataset, record, summary
\ No newline at end of file
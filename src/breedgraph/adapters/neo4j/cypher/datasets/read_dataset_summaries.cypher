@@ -0,0 +1,7 @@
+MATCH (study: Study {id: $study_id})<-[:FOR_STUDY]-(dataset:Dataset)-[:FOR_CONCEPT]->(concept:Variable|Factor)
+WHERE {{ readable(node=dataset, controller=TeamDatasets) }}
+OPTIONAL MATCH (dataset)-[:HAS_SUMMARY]->(summary:DatasetSummary)
+RETURN
+  dataset.id AS dataset_id,
+  concept.id AS concept_id,
+  summary {.*} AS summary
@@ -1,14 +1,18 @@
 MATCH (dataset: Dataset)
 WHERE dataset.id in $dataset_ids
+WITH dataset,
+  {{ readable(node=dataset, controller=TeamDatasets) }} AS readable
+// unreadable datasets are dropped for anonymous users and returned without content to registered users
+WHERE readable OR $registered
 RETURN
   dataset {
     .*,
     study: [(dataset)-[:FOR_STUDY]->(study) | study.id][0],
     concept: [(dataset)-[:FOR_CONCEPT]-(concept: Variable|Factor)|concept.id][0],
-    contributors: [(dataset)<-[:CONTRIBUTED_TO]-(contributor:Person)|contributor.id],
-    references: [(dataset)<-[:REFERENCE_FOR]-(reference:Reference)|reference.id],
-    records: apoc.coll.sortMaps([
-        (dataset)-[:INCLUDES_RECORD]->(record:Record)-[:FOR_UNIT]->(unit:Unit) |
-        record {.*, .submitted, unit: unit.id, references: [(record)<-[:REFERENCE_FOR]-(ref:Reference)| ref.id]}
-      ],'submitted')
+    contributors: CASE WHEN readable THEN [(dataset)<-[:CONTRIBUTED_TO]-(contributor:Person)|contributor.id] ELSE [] END,
+    references: CASE WHEN readable THEN [(dataset)<-[:REFERENCE_FOR]-(reference:Reference)|reference.id] ELSE [] END,
+    records: CASE WHEN readable THEN apoc.coll.sortMaps([
+          (dataset)-[:INCLUDES_RECORD]->(record:Record)-[:FOR_UNIT]->(unit:Unit) |
+          record {.*, .submitted, unit: unit.id, references: [(record)<-[:REFERENCE_FOR]-(ref:Reference)| ref.id]}
+        ],'submitted') ELSE [] END
   }
\ No newline at end of file
@@ -0,0 +1,9 @@
+MATCH (dataset: Dataset)
+WHERE ($dataset_ids IS NULL OR dataset.id IN $dataset_ids)
+  AND ($study_ids IS NULL OR EXISTS {
+    MATCH (dataset)-[:FOR_STUDY]->(study:Study)
+    WHERE study.id IN $study_ids
+  })
+  AND {{ readable(node=dataset, controller=TeamDatasets) }}
+RETURN dataset.id AS dataset_id
+ORDER BY dataset_id
\ No newline at end of file
@@ -0,0 +1,51 @@
+MATCH (dataset: Dataset {id: $dataset_id})-[:INCLUDES_RECORD]->(record:Record)-[:FOR_UNIT]->(unit:Unit)
+WHERE $after_id IS NULL OR record.id > $after_id
+WITH dataset, record, unit
+ORDER BY record.id
+LIMIT $limit
+
+// unit details are redacted as by UnitStored.redacted, names of other entries as by their controllers
+WITH dataset, record, unit,
+  {{ readable(node=unit, controller=TeamUnits) }} AS unit_readable
+
+// the latest position of the unit during the record
+OPTIONAL CALL (record, unit, unit_readable) {
+  MATCH (unit)-[:IN_POSITION]->(position:Position)-[:AT_LOCATION]->(location:Location)
+  WHERE unit_readable
+    AND (position.start IS NULL OR record.end IS NULL OR position.start <= record.end)
+    AND (position.end IS NULL OR record.start IS NULL OR position.end >= record.start)
+  WITH position, location
+    ORDER BY coalesce(position.start, datetime('0001-01-01T00:00:00')) DESC
+    LIMIT 1
+  RETURN
+    location,
+    [(position)-[:IN_LAYOUT]->(layout:Layout) | layout.id][0] AS layout_id,
+    {{ readable(node=location, controller=TeamLocations) }} AS location_readable
+}
+
+OPTIONAL MATCH (unit)-[:OF_GERMPLASM]->(germplasm:Germplasm)
+WITH dataset, record, unit, unit_readable, location, layout_id, location_readable, germplasm,
+  germplasm IS NOT NULL AND {{ readable(node=germplasm, controller=TeamGermplasms) }} AS germplasm_readable
+
+RETURN {
+  dataset_id: dataset.id,
+  concept_id: [(dataset)-[:FOR_CONCEPT]->(concept:Variable|Factor) | concept.id][0],
+  record_id: record.id,
+  unit_id: unit.id,
+  unit_name: CASE WHEN unit_readable OR unit.name IS NULL THEN unit.name ELSE $redacted END,
+  subject_id: CASE WHEN unit_readable THEN [(unit)-[:OF_SUBJECT]->(subject:Subject) | subject.id][0] END,
+  germplasm_id: germplasm.id,
+  germplasm_name: CASE WHEN germplasm_readable OR germplasm IS NULL THEN germplasm.name ELSE $redacted END,
+  location_id: location.id,
+  location_name: CASE WHEN location_readable OR location IS NULL THEN location.name ELSE $redacted END,
+  layout_id: layout_id,
+  start: record.start,
+  start_unit: record.start_unit,
+  start_step: record.start_step,
+  end: record.end,
+  end_unit: record.end_unit,
+  end_step: record.end_step,
+  value: record.value,
+  submitted: record.submitted,
+  reference_ids: [(record)<-[:REFERENCE_FOR]-(reference:Reference) | reference.id]
+} AS row
\ No newline at end of file
@@ -0,0 +1,9 @@
+MATCH (dataset: Dataset {id: $dataset_id})
+WHERE {{ readable(node=dataset, controller=TeamDatasets) }}
+MATCH (dataset)-[:INCLUDES_RECORD]->(record:Record)-[:FOR_UNIT]->(unit:Unit)
+WHERE $after_id IS NULL OR record.id > $after_id
+WITH record, unit
+ORDER BY record.id
+LIMIT $limit
+RETURN
+  record {.*, .submitted, unit: unit.id, references: [(record)<-[:REFERENCE_FOR]-(ref:Reference)| ref.id]} AS record
\ No newline at end of file
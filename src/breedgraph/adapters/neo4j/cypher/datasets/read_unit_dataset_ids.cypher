@@ -0,0 +1,13 @@
+// datasets with records for the units (e.g. subject or positions changed),
+// or for the blocks and their descendants (block membership changed)
+CALL () {
+  MATCH (unit:Unit) WHERE unit.id IN $unit_ids
+  RETURN unit
+  UNION
+  MATCH (block:Unit) WHERE block.id IN $block_ids
+  MATCH (block)-[:INCLUDES_UNIT*0..]->(unit:Unit)
+  RETURN unit
+}
+WITH DISTINCT unit
+MATCH (unit)<-[:FOR_UNIT]-(:Record)<-[:INCLUDES_RECORD]-(dataset:Dataset)
+RETURN DISTINCT dataset.id AS dataset_id
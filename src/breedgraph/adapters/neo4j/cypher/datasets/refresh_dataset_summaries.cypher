@@ -0,0 +1,8 @@
+MATCH (dataset: Dataset) WHERE dataset.id IN $dataset_ids
+MERGE (dataset)-[:HAS_SUMMARY]->(summary:DatasetSummary)
+// locks the summary before the records are read, so records added concurrently are counted once
+SET summary.record_count = coalesce(summary.record_count, 0)
+WITH dataset, summary
+{{ summarise_dataset() }}
+SET summary += summarised
+RETURN count(summary) AS refreshed
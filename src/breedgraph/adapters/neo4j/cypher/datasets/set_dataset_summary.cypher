@@ -0,0 +1,2 @@
+MATCH (:Dataset {id: $dataset_id})-[:HAS_SUMMARY]->(summary:DatasetSummary)
+SET summary += $summary
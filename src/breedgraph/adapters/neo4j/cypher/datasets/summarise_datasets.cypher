@@ -0,0 +1,6 @@
+// read only, for datasets without a stored summary
+MATCH (dataset: Dataset) WHERE dataset.id IN $dataset_ids
+{{ summarise_dataset() }}
+RETURN
+  dataset.id AS dataset_id,
+  summarised AS summary
@@ -0,0 +1,47 @@
+// the stored summary of the dataset and the contribution of the new records to it, merged by the datasets repository
+MATCH (dataset: Dataset {id: $dataset_id})
+MERGE (dataset)-[:HAS_SUMMARY]->(summary:DatasetSummary)
+// locks the summary before the records are read, see refresh_dataset_summaries
+SET summary.record_count = coalesce(summary.record_count, 0)
+WITH dataset, summary
+CALL () {
+  MATCH (record:Record) WHERE record.id IN $record_ids
+  RETURN
+    count(record) AS record_count,
+    min(record.start) AS start,
+    max(record.end) AS end
+}
+CALL (dataset) {
+  MATCH (record:Record)-[:FOR_UNIT]->(unit:Unit) WHERE record.id IN $record_ids
+  WITH DISTINCT unit
+  // units with earlier records in the dataset are already counted
+  WITH unit, NOT EXISTS {
+    MATCH (unit)<-[:FOR_UNIT]-(other:Record)<-[:INCLUDES_RECORD]-(dataset)
+    WHERE NOT other.id IN $record_ids
+  } AS new_unit
+  OPTIONAL MATCH (unit)-[:OF_SUBJECT]->(subject:Subject)
+  OPTIONAL MATCH (block:Unit)-[:INCLUDES_UNIT*]->(unit)
+  RETURN
+    count(DISTINCT CASE WHEN new_unit THEN unit END) AS unit_count,
+    collect(DISTINCT subject.id) AS subject_ids,
+    collect(DISTINCT coalesce(block.id, unit.id)) AS block_ids
+}
+CALL () {
+  MATCH (record:Record)-[:FOR_UNIT]->(:Unit)-[:IN_POSITION]->(position:Position)
+  WHERE record.id IN $record_ids
+    AND (position.start IS NULL OR record.end IS NULL OR position.start <= record.end)
+    AND (position.end IS NULL OR record.start IS NULL OR position.end >= record.start)
+  MATCH (position)-[:AT_LOCATION]->(location:Location)
+  RETURN collect(DISTINCT location.id) AS location_ids
+}
+RETURN
+  summary {.*} AS summary,
+  {
+    record_count: record_count,
+    unit_count: unit_count,
+    subject_ids: subject_ids,
+    location_ids: location_ids,
+    block_ids: block_ids,
+    start: start,
+    end: end
+  } AS added
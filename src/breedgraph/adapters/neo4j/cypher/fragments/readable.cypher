@@ -0,0 +1,11 @@
+// readable as by Controller.has_access for READ, i.e. controlled by one of $read_teams,
+// or with no PRIVATE control and, for anonymous users, no REGISTERED control
+(
+  EXISTS {
+    MATCH ({{node}})<-[:CONTROLS]-(:{{controller}})<-[:CONTROLS]-(team:Team)
+    WHERE team.id IN $read_teams
+  } OR NOT EXISTS {
+    MATCH ({{node}})<-[controls:CONTROLS]-(:{{controller}})
+    WHERE last(controls.releases) = 'PRIVATE' OR (last(controls.releases) = 'REGISTERED' AND NOT $registered)
+  }
+)
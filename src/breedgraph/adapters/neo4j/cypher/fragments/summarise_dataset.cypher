@@ -0,0 +1,37 @@
+// the summary of all records of the bound dataset, as summarised
+CALL (dataset) {
+  CALL (dataset) {
+    OPTIONAL MATCH (dataset)-[:INCLUDES_RECORD]->(record:Record)
+    RETURN
+      count(record) AS record_count,
+      min(record.start) AS start,
+      max(record.end) AS end
+  }
+  CALL (dataset) {
+    MATCH (dataset)-[:INCLUDES_RECORD]->(:Record)-[:FOR_UNIT]->(unit:Unit)
+    WITH DISTINCT unit
+    OPTIONAL MATCH (unit)-[:OF_SUBJECT]->(subject:Subject)
+    OPTIONAL MATCH (block:Unit)-[:INCLUDES_UNIT*]->(unit)
+    RETURN
+      count(DISTINCT unit) AS unit_count,
+      collect(DISTINCT subject.id) AS subject_ids,
+      collect(DISTINCT coalesce(block.id, unit.id)) AS block_ids
+  }
+  // locations of the units during the records
+  CALL (dataset) {
+    MATCH (dataset)-[:INCLUDES_RECORD]->(record:Record)-[:FOR_UNIT]->(:Unit)-[:IN_POSITION]->(position:Position)
+    WHERE (position.start IS NULL OR record.end IS NULL OR position.start <= record.end)
+      AND (position.end IS NULL OR record.start IS NULL OR position.end >= record.start)
+    MATCH (position)-[:AT_LOCATION]->(location:Location)
+    RETURN collect(DISTINCT location.id) AS location_ids
+  }
+  RETURN {
+    record_count: record_count,
+    unit_count: unit_count,
+    subject_ids: subject_ids,
+    location_ids: location_ids,
+    block_ids: block_ids,
+    start: start,
+    end: end
+  } AS summarised
+}
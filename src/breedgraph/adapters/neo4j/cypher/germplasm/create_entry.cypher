@@ -1,8 +1,5 @@
-MERGE (counter: Counter {name: 'germplasm'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
 CREATE (entry: Germplasm {
-  id:counter.count
+  id:$id
 })
 SET entry += $params
 
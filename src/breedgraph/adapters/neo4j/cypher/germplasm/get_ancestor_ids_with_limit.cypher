@@ -1,2 +1,2 @@
 MATCH (: Germplasm {id: $entry_id})<-[:SOURCE_FOR*..$limit]-(ancestor: Germplasm)
-RETURN ancestor.id
+RETURN DISTINCT ancestor.id
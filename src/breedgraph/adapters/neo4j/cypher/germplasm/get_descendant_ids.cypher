@@ -1,2 +1,2 @@
 MATCH (: Germplasm {id: $entry_id})-[:SOURCE_FOR*]->(descendant: Germplasm)
-RETURN descendant.id
+RETURN DISTINCT descendant.id
@@ -1,2 +1,2 @@
 MATCH (: Germplasm {id: $entry_id})-[:SOURCE_FOR*..$limit]->(descendant: Germplasm)
-RETURN descendant.id
\ No newline at end of file
+RETURN DISTINCT descendant.id
\ No newline at end of file
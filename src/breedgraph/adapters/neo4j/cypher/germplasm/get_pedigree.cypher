@@ -0,0 +1,2 @@
+MATCH (source: Germplasm)-[:SOURCE_FOR]->(sink: Germplasm)
+RETURN source.id AS source_id, sink.id AS sink_id
\ No newline at end of file
@@ -0,0 +1,2 @@
+OPTIONAL MATCH (counter: Counter {name: 'pedigree'})
+RETURN coalesce(counter.count, 0) AS version
\ No newline at end of file
@@ -0,0 +1,8 @@
+UNWIND $entry_ids AS entry_id
+MATCH (:Germplasm {id: entry_id})-[relationship:SOURCE_FOR]-(:Germplasm)
+WITH DISTINCT relationship
+RETURN
+  startNode(relationship).id as source_id,
+  endNode(relationship).id as sink_id,
+  relationship.source_type as source_type,
+  relationship.description as description
\ No newline at end of file
@@ -0,0 +1,7 @@
+UNWIND $entry_ids AS entry_id
+MATCH (source:Germplasm)-[relationship:SOURCE_FOR]->(target:Germplasm {id: entry_id})
+RETURN
+  source.id as source_id,
+  target.id as sink_id,
+  relationship.source_type as source_type,
+  relationship.description as description
\ No newline at end of file
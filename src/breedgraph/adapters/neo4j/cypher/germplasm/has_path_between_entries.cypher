@@ -1,3 +1,3 @@
-MATCH path = (:Germplasm {id:$source_id})-[:SOURCE_FOR*]->(:Germplasm {id:$sink_id})
-RETURN count(path) > 0 as has_path
-LIMIT 1
+RETURN EXISTS {
+  MATCH (:Germplasm {id: $source_id})-[:SOURCE_FOR*]->(:Germplasm {id: $sink_id})
+} AS has_path
\ No newline at end of file
@@ -0,0 +1,4 @@
+MERGE (counter: Counter {name: 'pedigree'})
+  ON CREATE SET counter.count = 0
+SET counter.count = counter.count + 1
+RETURN counter.count AS version
\ No newline at end of file
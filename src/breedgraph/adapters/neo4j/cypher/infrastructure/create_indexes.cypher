@@ -1 +0,0 @@
-CREATE FULLTEXT INDEX referenceDescription FOR (reference:Reference) ON EACH [reference.description, reference.filename, reference.url, reference.external_id]
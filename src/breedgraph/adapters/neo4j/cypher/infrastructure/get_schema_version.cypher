@@ -0,0 +1,2 @@
+OPTIONAL MATCH (schema: SchemaVersion {name: 'schema'})
+RETURN coalesce(schema.version, 0) AS version
@@ -1 +1 @@
-RETURN NOT exists { MATCH (n) } AS empty
\ No newline at end of file
+RETURN NOT exists { MATCH (n) WHERE NOT n:SchemaVersion } AS empty
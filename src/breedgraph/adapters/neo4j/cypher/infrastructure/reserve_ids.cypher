@@ -0,0 +1,4 @@
+MERGE (counter: Counter {name: $name})
+  ON CREATE SET counter.count = 0
+SET counter.count = counter.count + $size
+RETURN counter.count - $size + 1 AS first
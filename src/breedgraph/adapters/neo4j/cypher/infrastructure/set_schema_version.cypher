@@ -0,0 +1,5 @@
+MERGE (schema: SchemaVersion {name: 'schema'})
+SET
+  schema.version = $version,
+  schema.migration = $migration,
+  schema.applied = datetime.transaction()
@@ -0,0 +1,17 @@
+CREATE CONSTRAINT IF NOT EXISTS FOR (counter:Counter) REQUIRE counter.name IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (user:User) REQUIRE user.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (team:Team) REQUIRE team.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (ontologyEntry:OntologyEntry) REQUIRE ontologyEntry.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (ontologyRelationship:OntologyRelationship) REQUIRE ontologyRelationship.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (germplasm:Germplasm) REQUIRE germplasm.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (program:Program) REQUIRE program.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (study:Study) REQUIRE study.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (trial:Trial) REQUIRE trial.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (location:Location) REQUIRE location.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (layout:Layout) REQUIRE layout.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (unit:Unit) REQUIRE unit.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (dataset:Dataset) REQUIRE dataset.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (record:Record) REQUIRE record.id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (record:FileArchiveRecord) REQUIRE record.file_id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (file:StoredFile) REQUIRE file.file_id IS UNIQUE;
+CREATE CONSTRAINT IF NOT EXISTS FOR (schema:SchemaVersion) REQUIRE schema.name IS UNIQUE
@@ -0,0 +1,12 @@
+// Nodes created before the lowercase lookup properties were stored
+CALL {
+  MATCH (node)
+  WHERE (node:Program OR node:Location) AND node.name IS NOT NULL AND node.name_lower IS NULL
+  SET node.name_lower = toLower(node.name)
+}
+CALL {
+  MATCH (entry:OntologyEntry)
+  WHERE entry.abbreviation IS NOT NULL AND entry.abbreviation_lower IS NULL
+  SET entry.abbreviation_lower = toLower(entry.abbreviation)
+}
+RETURN NULL
@@ -0,0 +1,10 @@
+CREATE FULLTEXT INDEX referenceDescription IF NOT EXISTS FOR (reference:Reference) ON EACH [reference.description, reference.filename, reference.url, reference.external_id];
+CREATE CONSTRAINT programNameLower IF NOT EXISTS FOR (program:Program) REQUIRE program.name_lower IS UNIQUE;
+CREATE INDEX userNameLower IF NOT EXISTS FOR (user:User) ON (user.name_lower);
+CREATE INDEX teamNameLower IF NOT EXISTS FOR (team:Team) ON (team.name_lower);
+CREATE INDEX germplasmNameLower IF NOT EXISTS FOR (germplasm:Germplasm) ON (germplasm.name_lower);
+CREATE INDEX ontologyEntryNameLower IF NOT EXISTS FOR (entry:OntologyEntry) ON (entry.name_lower);
+CREATE INDEX ontologyEntryAbbreviationLower IF NOT EXISTS FOR (entry:OntologyEntry) ON (entry.abbreviation_lower);
+CREATE INDEX locationNameLower IF NOT EXISTS FOR (location:Location) ON (location.name_lower);
+CREATE INDEX locationCode IF NOT EXISTS FOR (location:Location) ON (location.code);
+CREATE INDEX referenceFileId IF NOT EXISTS FOR (reference:Reference) ON (reference.file_id)
@@ -0,0 +1,4 @@
+CREATE INDEX fileArchiveRecordArchiveState IF NOT EXISTS FOR (record:FileArchiveRecord) ON (record.archive_state);
+CREATE INDEX fileArchiveRecordLocalState IF NOT EXISTS FOR (record:FileArchiveRecord) ON (record.local_state, record.file_size);
+CREATE INDEX ontologyLifecycleDrafted IF NOT EXISTS FOR (lifecycle:OntologyLifecycle) ON (lifecycle.drafted);
+CREATE INDEX ontologyLifecycleRemoved IF NOT EXISTS FOR (lifecycle:OntologyLifecycle) ON (lifecycle.removed)
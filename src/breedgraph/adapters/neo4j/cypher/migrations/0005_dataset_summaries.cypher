@@ -0,0 +1,12 @@
+// Datasets stored before summaries were kept, and summaries from when they were marked stale to be refreshed on read
+MATCH (dataset: Dataset)
+WHERE NOT EXISTS {
+  MATCH (dataset)-[:HAS_SUMMARY]->(summary:DatasetSummary)
+  WHERE summary.stale IS NULL
+}
+MERGE (dataset)-[:HAS_SUMMARY]->(summary:DatasetSummary)
+REMOVE summary.stale
+WITH dataset, summary
+{{ summarise_dataset() }}
+SET summary += summarised
+RETURN count(summary) AS refreshed
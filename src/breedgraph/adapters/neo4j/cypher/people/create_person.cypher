@@ -1,8 +1,5 @@
-MERGE (counter: Counter {name: 'person'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
 CREATE (person: Person {
-  id:          counter.count,
+  id:          $id,
   name:        $name,
   fullname:    $fullname,
   email:       $email,
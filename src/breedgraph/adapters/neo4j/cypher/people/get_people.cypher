@@ -1,9 +1,13 @@
 MATCH (person: Person)
+WITH person,
+  {{ readable(node=person, controller=TeamPeople) }} AS readable
+// unreadable people are dropped for anonymous users and returned without relationships to registered users
+WHERE readable OR $registered
 RETURN
   person {
   .*,
-    teams: [(person)-[:IN_TEAM]->(team:Team)|team.id],
-    locations: [(person)-[:AT_LOCATION]->(location:Location)|location.id],
-    roles: [(person)-[:HAS_ROLE]->(role:PersonRole)|role.id],
-    titles:  [(person)-[:AT_LOCATION]->(title:PersonTitle)|title.id]
+    teams: CASE WHEN readable THEN [(person)-[:IN_TEAM]->(team:Team)|team.id] ELSE [] END,
+    locations: CASE WHEN readable THEN [(person)-[:AT_LOCATION]->(location:Location)|location.id] ELSE [] END,
+    roles: CASE WHEN readable THEN [(person)-[:HAS_ROLE]->(role:PersonRole)|role.id] ELSE [] END,
+    titles: CASE WHEN readable THEN [(person)-[:AT_LOCATION]->(title:PersonTitle)|title.id] ELSE [] END
   }
@@ -1,7 +1,4 @@
-MERGE (counter: Counter {name: 'program'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
-CREATE (program: Program {id: counter.count})
+CREATE (program: Program {id: $id})
 SET program += $program_data
 WITH
   program
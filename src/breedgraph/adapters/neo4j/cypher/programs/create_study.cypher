@@ -1,8 +1,5 @@
 MATCH (trial: Trial {id: $trial_id})
-MERGE (counter: Counter {name: 'study'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
-CREATE (trial)-[:HAS_STUDY]->(study: Study {id: counter.count})
+CREATE (trial)-[:HAS_STUDY]->(study: Study {id: $id})
 SET study += $study_data
 
 WITH
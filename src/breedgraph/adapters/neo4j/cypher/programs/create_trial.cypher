@@ -1,8 +1,5 @@
 MATCH (program:Program {id:$program_id})
-MERGE (counter: Counter {name: 'trial'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
-CREATE (program)-[:HAS_TRIAL]->(trial: Trial {id: counter.count})
+CREATE (program)-[:HAS_TRIAL]->(trial: Trial {id: $id})
 SET trial += $trial_data
 WITH
   trial
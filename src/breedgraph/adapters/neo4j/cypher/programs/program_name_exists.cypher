@@ -0,0 +1,3 @@
+RETURN EXISTS {
+  MATCH (program: Program {name_lower: $name_lower})
+} AS exists
@@ -36,6 +36,15 @@ def record_writes(label:ControlledModelLabel):
     """
 
 def get_controllers(label:ControlledModelLabel):
+    return f"""
+        MATCH (entity: {label.label} ) WHERE entity.id in $entity_ids
+        RETURN
+            entity.id as entity_id,
+            [(entity)<-[controls:CONTROLS]-(:Team{label.plural})<-[:CONTROLS]-(team:Team) |
+            {{team: team.id, release: controls.releases[-1]}}] as controls
+   """
+
+def get_controller_details(label:ControlledModelLabel):
     return f"""
         MATCH (entity: {label.label} ) WHERE entity.id in $entity_ids
         RETURN
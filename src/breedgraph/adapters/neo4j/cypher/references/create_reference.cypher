@@ -1,8 +1,5 @@
-MERGE (counter: Counter {name: 'reference'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
 CREATE (reference: Reference {
-  id: counter.count
+  id: $id
 })
 SET reference += $params
 
@@ -1,3 +1,5 @@
 MATCH (reference: Reference)
+// unreadable references are dropped for anonymous users, registered users receive them redacted
+WHERE $registered OR {{ readable(node=reference, controller=TeamReferences) }}
 RETURN
   reference {.*}
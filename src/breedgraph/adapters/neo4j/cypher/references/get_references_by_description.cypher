@@ -1,2 +1,4 @@
 CALL db.index.fulltext.queryNodes("referenceDescription", $description) YIELD node, score
+// unreadable references are dropped for anonymous users, registered users receive them redacted
+WHERE $registered OR {{ readable(node=node, controller=TeamReferences) }}
 RETURN node {.*} as reference, score
\ No newline at end of file
@@ -1,3 +1,5 @@
 CALL db.index.fulltext.queryNodes("referenceDescription", $description) YIELD node, score
 WHERE node.type in $types
+// unreadable references are dropped for anonymous users, registered users receive them redacted
+  AND ($registered OR {{ readable(node=node, controller=TeamReferences) }})
 RETURN node {.*} as reference, score
\ No newline at end of file
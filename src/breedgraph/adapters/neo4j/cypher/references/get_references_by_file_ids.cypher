@@ -1,4 +1,6 @@
 MATCH (reference: Reference) where reference.file_id in $file_ids
+// unreadable references are dropped for anonymous users, registered users receive them redacted
+  AND ($registered OR {{ readable(node=reference, controller=TeamReferences) }})
 RETURN
   reference {.*},
   [{label: "Reference", model_id: reference.id, key: "file_id"}] AS matches
@@ -1,3 +1,5 @@
 MATCH (reference: Reference) where reference.id in $reference_ids
+// unreadable references are dropped for anonymous users, registered users receive them redacted
+  AND ($registered OR {{ readable(node=reference, controller=TeamReferences) }})
 RETURN
   reference {.*}
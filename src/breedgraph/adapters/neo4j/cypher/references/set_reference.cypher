@@ -2,5 +2,11 @@ MATCH
   (reference: Reference {id: $reference_id})
 SET
   reference += $params
+WITH reference
+// uploads are registered with their blob before the reference is given the file_id, see add_file
+OPTIONAL MATCH (file: StoredFile {file_id: reference.file_id})
+FOREACH (stored IN CASE WHEN file IS NULL THEN [] ELSE [file] END |
+  MERGE (stored)-[:FOR_REFERENCE]->(reference)
+)
 RETURN
-  reference {.*}
\ No newline at end of file
+  reference {.*}
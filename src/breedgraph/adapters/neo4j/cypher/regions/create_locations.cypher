@@ -1,28 +1,25 @@
-MERGE (counter: Counter {name: 'location'})
-  ON CREATE SET counter.count = 0
-SET counter.count = counter.count + 1
+UNWIND $locations AS location_map
 CREATE (location: Location {
-  id: counter.count,
-  name: $name,
-  synonyms: $synonyms,
-  description: $description,
-  code: $code,
-  address: $address
+  id: location_map['id'],
+  name: location_map['name'],
+  name_lower: location_map['name_lower'],
+  synonyms: location_map['synonyms'],
+  description: location_map['description'],
+  code: location_map['code'],
+  address: location_map['address']
 })
 WITH
-  location
+  location, location_map
 
 // Link to type
-CALL {
-  WITH location
-  MATCH (type: LocationType {id: $type})
+CALL (location, location_map) {
+  MATCH (type: LocationType {id: location_map['type']})
   CREATE (location)-[:OF_LOCATION_TYPE]->(type)
   RETURN collect(type.id)[0] as type
 }
 // Create coordinates
-CALL {
-  WITH location
-  UNWIND $coordinates AS c
+CALL (location, location_map) {
+  UNWIND coalesce(location_map['coordinates'], []) AS c
   CREATE (location)<-[:COORDINATE_OF]-(coordinate:Coordinate {
     sequence:    c.sequence,
     latitude:    c.latitude,
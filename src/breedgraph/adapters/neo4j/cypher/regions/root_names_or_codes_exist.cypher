@@ -0,0 +1,5 @@
+RETURN EXISTS {
+  MATCH (root: Location)
+  WHERE (root.name_lower IN $names_lower OR root.code IN $codes)
+  AND NOT (root)<-[:INCLUDES_LOCATION]-(:Location)
+} AS exists
@@ -0,0 +1,41 @@
+UNWIND $locations AS location_map
+MATCH (location: Location {id: location_map['id']})
+SET
+  location.name = location_map['name'],
+  location.name_lower = location_map['name_lower'],
+  location.synonyms = location_map['synonyms'],
+  location.description = location_map['description'],
+  location.code = location_map['code'],
+  location.address = location_map['address']
+WITH
+  location, location_map
+// Link type
+CALL (location, location_map) {
+  MATCH (location)-[of_type:OF_LOCATION_TYPE]->(type:LocationType)
+  WHERE NOT type.id = location_map['type']
+  DELETE of_type
+}
+CALL (location, location_map) {
+  MATCH (type:LocationType {id: location_map['type']})
+  MERGE (location)-[of_type:OF_LOCATION_TYPE]->(type)
+  ON CREATE SET of_type.time = datetime.transaction()
+}
+// Remove existing coordinates
+OPTIONAL CALL (location) {
+  MATCH (location)<-[coordinate_of:COORDINATE_OF]-(coordinate: Coordinate)
+  DETACH DELETE coordinate
+}
+// Create coordinates
+CALL (location, location_map) {
+  WITH coalesce(location_map['coordinates'], []) AS coordinates
+  UNWIND range(0, size(coordinates) - 1) AS i
+  CREATE (location)<-[coordinate_of:COORDINATE_OF {position: i}]-(coordinate:Coordinate {
+    sequence:    coordinates[i].sequence,
+    latitude:    coordinates[i].latitude,
+    longitude:   coordinates[i].longitude,
+    altitude:    coordinates[i].altitude,
+    uncertainty: coordinates[i].uncertainty,
+    description: coordinates[i].description
+  })
+}
+RETURN count(location) AS updated
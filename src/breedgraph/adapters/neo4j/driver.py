@@ -2,6 +2,10 @@ from neo4j import AsyncGraphDatabase, AsyncDriver, NotificationClassification
 from breedgraph.service_layer.infrastructure.driver import AbstractAsyncDriver
 
 from breedgraph.config import get_bolt_url, get_graphdb_auth, DATABASE_NAME
+from breedgraph.adapters.neo4j.migrations import Neo4jSchemaMigrations
+
+import logging
+logger = logging.getLogger(__name__)
 
 class Neo4jAsyncDriver(AbstractAsyncDriver):
     def __init__(self):
@@ -23,4 +27,15 @@ class Neo4jAsyncDriver(AbstractAsyncDriver):
     async def close(self):
         await self.driver.close()
 
-
+    async def ensure_schema(self):
+        """
+        Apply any pending schema migrations.
+        Later queries rely on the constraints and indexes, so a failed migration stops startup.
+        The version is not advanced, so once the cause is fixed (e.g. existing data violating a new uniqueness constraint)
+        the migration is retried at the next startup.
+        """
+        try:
+            await Neo4jSchemaMigrations(self).migrate()
+        except Exception as e:
+            logger.error(f"Failed to apply schema migrations: {e}")
+            raise
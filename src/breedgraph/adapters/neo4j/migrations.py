@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+from breedgraph.service_layer.infrastructure.driver import AbstractAsyncDriver
+from breedgraph.adapters.neo4j.cypher import queries
+
+import logging
+logger = logging.getLogger(__name__)
+
+# operators that read every node (with a label) and are then filtered,
+# when this is done on a property predicate it usually means an index is missing
+SCAN_OPERATORS = ('AllNodesScan', 'NodeByLabelScan', 'UnionNodeByLabelsScan', 'IntersectionNodeByLabelsScan')
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: List[str]
+
+
+def get_migrations() -> List[Migration]:
+    """
+    Migrations are the files in cypher/migrations named <version>_<description>.cypher,
+    with statements separated by ";\\n", returned in version order.
+    """
+    migrations = []
+    for name, query in queries['migrations'].items():
+        version, _, description = name.partition('_')
+        statements = [statement.strip() for statement in query.split(';\n') if statement.strip()]
+        migrations.append(Migration(version=int(version), name=description, statements=statements))
+    migrations.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicate migration versions: {versions}")
+    return migrations
+
+
+def find_filtered_scans(plan: dict, parent: dict | None = None) -> List[str]:
+    """ Label (or all node) scans that feed directly into a filter, described by operator and details """
+    scans = []
+    operator = plan.get('operatorType', '').split('@')[0]
+    if operator in SCAN_OPERATORS and parent is not None:
+        if parent.get('operatorType', '').startswith('Filter'):
+            details = plan.get('args', plan.get('arguments', {})).get('Details', '')
+            scans.append(f"{operator} {details}".strip())
+    for child in plan.get('children', []):
+        scans.extend(find_filtered_scans(child, plan))
+    return scans
+
+
+class Neo4jSchemaMigrations:
+    """
+    Applies the numbered migrations in order and records the applied version on a SchemaVersion node.
+
+    Each statement is run in its own transaction, as schema and data changes can't be mixed.
+    A migration interrupted part way is re-run from the start, so statements must be idempotent,
+    e.g. CREATE INDEX ... IF NOT EXISTS.
+    """
+
+    def __init__(self, driver: AbstractAsyncDriver):
+        self.driver = driver
+
+    async def get_version(self) -> int:
+        async with self.driver.session() as session:
+            result = await session.run(queries['infrastructure']['get_schema_version'])
+            record = await result.single()
+            return record.get('version')
+
+    async def migrate(self) -> int:
+        version = await self.get_version()
+        pending = [migration for migration in get_migrations() if migration.version > version]
+        if not pending:
+            logger.debug(f"Schema is up to date at version {version}")
+            return version
+
+        async with self.driver.session() as session:
+            for migration in pending:
+                logger.info(f"Applying schema migration {migration.version}: {migration.name}")
+                for statement in migration.statements:
+                    result = await session.run(statement)
+                    await result.consume()
+                result = await session.run(
+                    queries['infrastructure']['set_schema_version'],
+                    version=migration.version,
+                    migration=migration.name
+                )
+                await result.consume()
+                version = migration.version
+        return version
+
+    async def check_query_plans(self) -> Dict[str, List[str]]:
+        """
+        EXPLAIN every registered query (other than migrations) and report those planned with a filtered scan.
+        The queries are planned but not run, missing parameters only produce a notification.
+        """
+        findings = dict()
+        async with self.driver.session() as session:
+            for folder, folder_queries in queries.items():
+                if folder == 'migrations':
+                    continue
+                for name, query in folder_queries.items():
+                    key = f"{folder}/{name}"
+                    try:
+                        result = await session.run(f"EXPLAIN {query}")
+                        summary = await result.consume()
+                    except Exception as e:
+                        findings[key] = [f"Failed to plan: {e}"]
+                        continue
+                    scans = find_filtered_scans(summary.plan or {})
+                    if scans:
+                        findings[key] = scans
+        return findings
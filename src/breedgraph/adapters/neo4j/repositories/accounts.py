@@ -8,6 +8,7 @@ from breedgraph.domain.model.organisations import Access, Authorisation
 from breedgraph.adapters.neo4j.cypher import queries
 from breedgraph.service_layer.tracking import TrackableProtocol, TrackedList
 from breedgraph.service_layer.repositories.base import BaseRepository
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
 from breedgraph.domain.events.accounts import AccountCreated
 
 # for typing only
@@ -21,9 +22,10 @@ logger = logging.getLogger(__name__)
 
 class Neo4jAccountRepository(BaseRepository[AccountInput, AccountStored]):
 
-    def __init__(self, tx: AsyncTransaction):
+    def __init__(self, tx: AsyncTransaction, id_allocator: AbstractIdAllocator):
         super().__init__()
         self.tx = tx
+        self.id_allocator = id_allocator
 
     async def _create(self, account: AccountInput) -> AccountStored:
         user = await self._create_user(account.user)
@@ -38,6 +40,7 @@ class Neo4jAccountRepository(BaseRepository[AccountInput, AccountStored]):
         props['email_lower'] = user.email.casefold()
         result = await self.tx.run(
             queries['accounts']['create_user'],
+            id=await self.id_allocator.next_id('user'),
             props=props
         )
         record = await result.single()
@@ -6,6 +6,7 @@ from breedgraph.domain.model.arrangements import (
     LayoutInput, LayoutStored, Arrangement
 )
 from breedgraph.adapters.neo4j.cypher import queries
+from breedgraph.config import WRITE_BATCH_SIZE
 from breedgraph.service_layer.tracking import TrackableProtocol, TrackedObject
 from breedgraph.service_layer.repositories.controlled import ControlledQueryResult
 from breedgraph.adapters.neo4j.repositories.controlled import Neo4jControlledRepository
@@ -27,18 +28,34 @@ class Neo4jArrangementsRepository(
         return LayoutStored(**record)
 
     async def _create_controlled(self, layout: LayoutInput) -> Arrangement:
-        stored_layout = await self._create_layout(layout)
-        return Arrangement(nodes=[stored_layout])
-
-    async def _create_layout(self, layout: LayoutInput) -> LayoutStored:
-        logger.debug(f"Create layout: {layout}")
-        result: AsyncResult = await self.tx.run(queries['arrangements']['create_layout'], **layout.model_dump())
-        record: Record = await result.single()
-        return self.record_to_layout(record)
-
-    async def _update_layout(self, layout: LayoutStored) -> None:
-        logger.debug(f"Set layout: {layout}")
-        await self.tx.run(queries['arrangements']['set_layout'], layout.model_dump())
+        stored_layouts = await self._create_layouts([layout])
+        return Arrangement(nodes=stored_layouts)
+
+    async def _create_layouts(self, layouts: List[LayoutInput]) -> List[LayoutStored]:
+        """ Create layouts with a query per WRITE_BATCH_SIZE layouts, returning the stored layouts in the same order """
+        logger.debug(f"Create layouts: {len(layouts)}")
+        layout_ids = await self.id_allocator.allocate('layout', len(layouts))
+        stored = {}
+        for start in range(0, len(layouts), WRITE_BATCH_SIZE):
+            layouts_data = []
+            for layout, layout_id in zip(layouts[start:start + WRITE_BATCH_SIZE], layout_ids[start:start + WRITE_BATCH_SIZE]):
+                layout_data = layout.model_dump()
+                layout_data['id'] = layout_id
+                layouts_data.append(layout_data)
+            result: AsyncResult = await self.tx.run(queries['arrangements']['create_layouts'], layouts=layouts_data)
+            async for record in result:
+                stored_layout = self.record_to_layout(record)
+                stored[stored_layout.id] = stored_layout
+        return [stored[layout_id] for layout_id in layout_ids]
+
+    async def _update_layouts(self, layouts: List[LayoutStored]) -> None:
+        logger.debug(f"Set layouts: {[layout.id for layout in layouts]}")
+        for start in range(0, len(layouts), WRITE_BATCH_SIZE):
+            result: AsyncResult = await self.tx.run(
+                queries['arrangements']['set_layouts'],
+                layouts=[layout.model_dump() for layout in layouts[start:start + WRITE_BATCH_SIZE]]
+            )
+            await result.consume()
 
     async def _delete_layouts(self, layout_ids: List[int]) -> None:
         logger.debug(f"Remove layouts: {layout_ids}")
@@ -93,23 +110,30 @@ class Neo4jArrangementsRepository(
         if not arrangement.changed:
             return
 
+        added_ids = []
+        added_layouts = []
         for layout_id in arrangement._graph.added_nodes:
             layout = arrangement.get_entry(layout_id)
-
             if isinstance(layout, LayoutInput):
-                stored_layout = await self._create_layout(layout)
+                added_ids.append(layout_id)
+                added_layouts.append(layout)
+
+        if added_layouts:
+            stored_layouts = await self._create_layouts(added_layouts)
+            for layout_id, stored_layout in zip(added_ids, stored_layouts):
                 arrangement._graph.replace_with_stored(layout_id, stored_layout)
 
         if arrangement._graph.removed_nodes:
             await self._delete_layouts(list(arrangement._graph.removed_nodes))
 
+        changed_layouts = []
         for node_id in arrangement._graph.changed_nodes:
-
             layout = arrangement.get_layout(node_id)
             if not isinstance(layout, LayoutStored):
                 raise ValueError("Can only commit changes to stored layouts")
-
-            await self._update_layout(layout)
+            changed_layouts.append(layout)
+        if changed_layouts:
+            await self._update_layouts(changed_layouts)
 
         await self._delete_edges(arrangement._graph.removed_edges)
         await self._create_edges([(*e, arrangement._graph.edges[e]['position']) for e in arrangement._graph.added_edges])
@@ -6,6 +6,7 @@ from breedgraph.domain.model.blocks import (
     UnitInput, UnitStored, Block, Position
 )
 from breedgraph.adapters.neo4j.cypher import queries
+from breedgraph.config import WRITE_BATCH_SIZE
 from breedgraph.service_layer.tracking import TrackableProtocol
 from breedgraph.service_layer.repositories.controlled import ControlledQueryResult
 from breedgraph.adapters.neo4j.repositories.controlled import Neo4jControlledRepository
@@ -17,17 +18,35 @@ logger = logging.getLogger(__name__)
 class Neo4jBlocksRepository(Neo4jControlledRepository[UnitInput, Block]):
 
     async def _create_controlled(self, unit: UnitInput) -> Block:
-        stored_unit = await self._create_unit(unit)
-        return Block(nodes=[stored_unit])
+        stored_units = await self._create_units([unit])
+        return Block(nodes=stored_units)
 
-    async def _create_unit(self, unit: UnitInput) -> UnitStored:
-        logger.debug(f"Create unit: {unit}")
+    async def _create_controlled_many(self, units: List[UnitInput]) -> List[Block]:
+        """ A block for each unit, written with a query per WRITE_BATCH_SIZE units """
+        return [Block(nodes=[unit]) for unit in await self._create_units(units)]
+
+    def _unit_params(self, unit: UnitInput | UnitStored) -> Dict[str, Any]:
         unit_data = unit.model_dump()
         for position in unit_data.get('positions', []):
             self.serialize_dt64(position, to_neo4j=True)
-        result: AsyncResult = await self.tx.run(queries['blocks']['create_unit'], **unit_data)
-        record: Record = await result.single()
-        return self.record_to_unit(record.get('unit'))
+        return unit_data
+
+    async def _create_units(self, units: List[UnitInput]) -> List[UnitStored]:
+        """ Create units with a query per WRITE_BATCH_SIZE units, returning the stored units in the same order """
+        logger.debug(f"Create units: {len(units)}")
+        unit_ids = await self.id_allocator.allocate('unit', len(units))
+        stored = {}
+        for start in range(0, len(units), WRITE_BATCH_SIZE):
+            units_data = []
+            for unit, unit_id in zip(units[start:start + WRITE_BATCH_SIZE], unit_ids[start:start + WRITE_BATCH_SIZE]):
+                unit_data = self._unit_params(unit)
+                unit_data['id'] = unit_id
+                units_data.append(unit_data)
+            result: AsyncResult = await self.tx.run(queries['blocks']['create_units'], units=units_data)
+            async for record in result:
+                stored_unit = self.record_to_unit(record.get('unit'))
+                stored[stored_unit.id] = stored_unit
+        return [stored[unit_id] for unit_id in unit_ids]
 
     def record_to_unit(self, record):
         for position in record.get('positions', []):
@@ -35,16 +54,45 @@ class Neo4jBlocksRepository(Neo4jControlledRepository[UnitInput, Block]):
         record['positions'] = [Position(**position) for position in record.get('positions', [])]
         return UnitStored(**record)
 
-    async def _update_unit(self, unit: UnitStored):
-        logger.debug(f"Set unit: {unit}")
-        unit_data = unit.model_dump()
-        for position in unit_data.get('positions', []):
-            self.serialize_dt64(position, to_neo4j=True)
-        await self.tx.run(queries['blocks']['set_unit'], **unit_data)
+    async def _get_recorded_dataset_ids(self, unit_ids: List[int] = (), block_ids: List[int] = ()) -> List[int]:
+        """
+        Dataset summaries include the subjects, locations and blocks of the recorded units,
+        so datasets with records for the units (or the descendants of the blocks) are refreshed when these change.
+        Read before the change, as deleted units and edges no longer lead to the datasets.
+        """
+        if not (unit_ids or block_ids):
+            return []
+        result: AsyncResult = await self.tx.run(
+            queries['datasets']['read_unit_dataset_ids'],
+            unit_ids=list(unit_ids),
+            block_ids=list(block_ids)
+        )
+        return [record['dataset_id'] async for record in result]
+
+    async def _refresh_dataset_summaries(self, dataset_ids: List[int]):
+        if dataset_ids:
+            result: AsyncResult = await self.tx.run(
+                queries['datasets']['refresh_dataset_summaries'],
+                dataset_ids=dataset_ids
+            )
+            await result.consume()
+
+    async def _update_units(self, units: List[UnitStored]):
+        logger.debug(f"Set units: {[unit.id for unit in units]}")
+        dataset_ids = await self._get_recorded_dataset_ids(unit_ids=[unit.id for unit in units])
+        for start in range(0, len(units), WRITE_BATCH_SIZE):
+            result: AsyncResult = await self.tx.run(
+                queries['blocks']['set_units'],
+                units=[self._unit_params(unit) for unit in units[start:start + WRITE_BATCH_SIZE]]
+            )
+            await result.consume()
+        await self._refresh_dataset_summaries(dataset_ids)
 
     async def _delete_units(self, unit_ids: List[int]) -> None:
         logger.debug(f"Remove units: {unit_ids}")
+        dataset_ids = await self._get_recorded_dataset_ids(unit_ids=unit_ids)
         await self.tx.run(queries['blocks']['delete_units'], unit_ids=unit_ids)
+        await self._refresh_dataset_summaries(dataset_ids)
 
     async def _get_controlled(self, unit_id: int|None = None) -> ControlledQueryResult[Block]|None:
         if unit_id is None:
@@ -106,22 +154,30 @@ class Neo4jBlocksRepository(Neo4jControlledRepository[UnitInput, Block]):
         if not block.changed:
             return
 
+        added_ids = []
+        added_units = []
         for unit_id in block._graph.added_nodes:
             unit = block.get_entry(unit_id)
-
             if isinstance(unit, UnitInput):
-                stored_unit = await self._create_unit(unit)
+                added_ids.append(unit_id)
+                added_units.append(unit)
+
+        if added_units:
+            stored_units = await self._create_units(added_units)
+            for unit_id, stored_unit in zip(added_ids, stored_units):
                 block._graph.replace_with_stored(unit_id, stored_unit)
 
         if block._graph.removed_nodes:
             await self._delete_units(list(block._graph.removed_nodes))
 
+        changed_units = []
         for node_id in block._graph.changed_nodes:
-
             unit = block.get_unit(node_id)
             if not isinstance(unit, UnitStored):
                 raise ValueError("Can only commit changes to stored layouts")
-            await self._update_unit(unit)
+            changed_units.append(unit)
+        if changed_units:
+            await self._update_units(changed_units)
 
         to_remove = block._graph.removed_edges - block._graph.added_edges
         to_add = block._graph.added_edges - block._graph.removed_edges
@@ -129,10 +185,15 @@ class Neo4jBlocksRepository(Neo4jControlledRepository[UnitInput, Block]):
         await self._delete_edges(to_remove)
 
     async def _create_edges(self, edges: Set[Tuple[int, int]]):
-        if edges:
-            await self.tx.run(queries['blocks']['create_edges'], edges=list(edges))
+        edges = list(edges)
+        dataset_ids = await self._get_recorded_dataset_ids(block_ids=list({sink for _, sink in edges}))
+        for start in range(0, len(edges), WRITE_BATCH_SIZE):
+            await self.tx.run(queries['blocks']['create_edges'], edges=edges[start:start + WRITE_BATCH_SIZE])
+        await self._refresh_dataset_summaries(dataset_ids)
 
     async def _delete_edges(self, edges: Set[tuple[int, int]]):
         if edges:
+            dataset_ids = await self._get_recorded_dataset_ids(block_ids=list({sink for _, sink in edges}))
             await self.tx.run(queries['blocks']['delete_edges'], edges=list(edges))
+            await self._refresh_dataset_summaries(dataset_ids)
 
@@ -8,6 +8,8 @@ from breedgraph.service_layer.repositories.controlled import (
     ControlledRepository, TControlledAggregate, TAggregateInput, ControlledQueryResult
 )
 from breedgraph.domain.model.controls import ControlledAggregate
+from breedgraph.domain.model.organisations import Access
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
 
 from typing import AsyncGenerator, Generic
 
@@ -19,9 +21,22 @@ class Neo4jControlledRepository(
     Generic[TAggregateInput, TControlledAggregate]
 ):
 
-    def __init__(self, tx: AsyncTransaction, **kwargs):
+    def __init__(self, tx: AsyncTransaction, id_allocator: AbstractIdAllocator, **kwargs):
         super().__init__(**kwargs)
         self.tx = tx
+        self.id_allocator = id_allocator
+
+    @property
+    def read_visibility(self) -> dict:
+        """
+        Parameters for read queries that evaluate visibility in the database,
+        so unreadable content is not fetched and, for anonymous users, unreadable aggregates are not returned.
+        Redaction in _get_all remains the final guard.
+        """
+        return {
+            'read_teams': list(self.access_teams[Access.READ]),
+            'registered': self.user_id is not None
+        }
 
     @abstractmethod
     async def _create_controlled(self, aggregate_input: BaseModel) -> ControlledAggregate:
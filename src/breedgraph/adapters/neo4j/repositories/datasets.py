@@ -31,11 +31,17 @@ class Neo4jDatasetsRepository(Neo4jControlledRepository[DatasetInput, DatasetSto
         logger.debug(f"Create dataset: {dataset}")
         params = dataset.model_dump()
         records = params.pop('records', [])
-        result: AsyncResult = await self.tx.run(queries['datasets']['create_dataset'], **params)
+        result: AsyncResult = await self.tx.run(
+            queries['datasets']['create_dataset'],
+            id=await self.id_allocator.next_id('dataset'),
+            **params
+        )
         dataset_record: Record = await result.single()
         if records:
-            for record_data in records:
+            record_ids = await self.id_allocator.allocate('record', len(records))
+            for record_data, record_id in zip(records, record_ids):
                 self.serialize_dt64(record_data, to_neo4j=True)
+                record_data['id'] = record_id
             result = await self.tx.run(
                 queries['datasets']['create_records'],
                 dataset_id=dataset_record.get('dataset').get('id'),
@@ -43,6 +49,7 @@ class Neo4jDatasetsRepository(Neo4jControlledRepository[DatasetInput, DatasetSto
             )
             dataset_record_dict = dataset_record.data()
             dataset_record_dict['records'] = [record.get('record') async for record in result]
+            await self._add_records_to_summary(dataset_record.get('dataset').get('id'), record_ids)
         dataset = self.record_to_dataset(dataset_record.get('dataset'))
         return dataset
 
@@ -68,9 +75,14 @@ class Neo4jDatasetsRepository(Neo4jControlledRepository[DatasetInput, DatasetSto
                     queries['datasets']['delete_records'],
                     record_ids=[r.id for r in dataset.records.removed]
                 )
+            # changed or removed records may narrow the summary, so it is refreshed in full
+            refresh_summary = bool(dataset.records.changed or dataset.records.removed)
             if dataset.records.added:
                 ordered_added = list(dataset.records.added)
                 added_records = [self.serialize_dt64(dataset.records[i].model_dump(), to_neo4j=True) for i in ordered_added]
+                record_ids = await self.id_allocator.allocate('record', len(added_records))
+                for record_data, record_id in zip(added_records, record_ids):
+                    record_data['id'] = record_id
                 result = await self.tx.run(
                     queries['datasets']['create_records'],
                     dataset_id=dataset.id,
@@ -83,10 +95,52 @@ class Neo4jDatasetsRepository(Neo4jControlledRepository[DatasetInput, DatasetSto
                     record_index = ordered_added[i]
                     dataset.records[record_index] = DataRecordStored(**record)
                     i += 1
+                if not refresh_summary:
+                    await self._add_records_to_summary(dataset.id, record_ids)
+
+            if refresh_summary:
+                await self.tx.run(queries['datasets']['refresh_dataset_summaries'], dataset_ids=[dataset.id])
+
+    async def _add_records_to_summary(self, dataset_id: int, record_ids: List[int]):
+        """ Add the contribution of new records to the stored summary of the dataset (see DatasetSummary) """
+        result: AsyncResult = await self.tx.run(
+            queries['datasets']['summarise_records'],
+            dataset_id=dataset_id,
+            record_ids=record_ids
+        )
+        record: Record = await result.single(strict=True)
+        summary = record.get('summary')
+        if 'unit_count' not in summary:
+            # a summary that was only just created can't be added to
+            await self.tx.run(queries['datasets']['refresh_dataset_summaries'], dataset_ids=[dataset_id])
+            return
+        await self.tx.run(
+            queries['datasets']['set_dataset_summary'],
+            dataset_id=dataset_id,
+            summary=self.add_to_summary(summary, record.get('added'))
+        )
+
+    @staticmethod
+    def add_to_summary(summary: dict, added: dict) -> dict:
+        """
+        The summary including the contribution of new records,
+        where the unit count of the contribution is of units without earlier records in the dataset.
+        """
+        starts = [start for start in (summary.get('start'), added.get('start')) if start is not None]
+        ends = [end for end in (summary.get('end'), added.get('end')) if end is not None]
+        return {
+            'record_count': summary['record_count'] + added['record_count'],
+            'unit_count': summary['unit_count'] + added['unit_count'],
+            'subject_ids': sorted(set(summary['subject_ids']) | set(added['subject_ids'])),
+            'location_ids': sorted(set(summary['location_ids']) | set(added['location_ids'])),
+            'block_ids': sorted(set(summary['block_ids']) | set(added['block_ids'])),
+            'start': min(starts) if starts else None,
+            'end': max(ends) if ends else None
+        }
 
     async def _delete_datasets(self, dataset_ids: List[int]) -> None:
         logger.debug(f"Remove datasets: {dataset_ids}")
-        await self.tx.run(queries['datasets']['remove_datasets'], dataset_ids=dataset_ids)
+        await self.tx.run(queries['datasets']['delete_datasets'], dataset_ids=dataset_ids)
 
     async def _get_controlled(
             self,
@@ -114,27 +168,31 @@ class Neo4jDatasetsRepository(Neo4jControlledRepository[DatasetInput, DatasetSto
                 result: AsyncResult = await self.tx.run(
                     queries['datasets']['read_datasets_for_studies_and_concepts'],
                     study_ids=study_ids,
-                    concept_ids=concept_ids
+                    concept_ids=concept_ids,
+                    **self.read_visibility
                 )
             else:
                 result: AsyncResult = await self.tx.run(
                     queries['datasets']['read_datasets_for_studies'],
-                    study_ids=study_ids
+                    study_ids=study_ids,
+                    **self.read_visibility
                 )
         elif concept_ids is not None:
             result: AsyncResult = await self.tx.run(
                 queries['datasets']['read_datasets_for_concepts'],
-                concept_ids=concept_ids
+                concept_ids=concept_ids,
+                **self.read_visibility
             )
         elif dataset_ids is not None:
             result: AsyncResult = await self.tx.run(
                 queries['datasets']['read_datasets_by_id'],
-                dataset_ids=dataset_ids
+                dataset_ids=dataset_ids,
+                **self.read_visibility
             )
 
 
         else:
-            result: AsyncResult = await self.tx.run(queries['datasets']['read_datasets'])
+            result: AsyncResult = await self.tx.run(queries['datasets']['read_datasets'], **self.read_visibility)
 
         async for record in result:
             yield ControlledQueryResult(self.record_to_dataset(record.get('dataset')))
@@ -17,6 +17,7 @@ from breedgraph.adapters.neo4j.repositories.regions import Neo4jRegionsRepositor
 from breedgraph.domain.model.controls import ReadRelease
 
 from breedgraph.service_layer.repositories.holder import AbstractRepoHolder
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
 
 import logging
 logger = logging.getLogger(__name__)
@@ -27,6 +28,7 @@ class Neo4jRepoHolder(AbstractRepoHolder):
             self,
             tx: AsyncTransaction,
             controls: AbstractAccessControlService,
+            id_allocator: AbstractIdAllocator,
             release: ReadRelease = ReadRelease.PRIVATE,
             redacted: bool = True,
             write_team: int | None = None
@@ -36,11 +38,12 @@ class Neo4jRepoHolder(AbstractRepoHolder):
         self.write_team = write_team
 
         # Access control for account security
-        self.accounts = Neo4jAccountRepository(self.tx)
+        self.accounts = Neo4jAccountRepository(self.tx, id_allocator)
         # Similarly, the access control for organisations is via internally described affiliations
 
         self.organisations = Neo4jOrganisationsRepository(
             self.tx,
+            id_allocator,
             user_id=controls.user_id,
             redacted=redacted
         )
@@ -59,6 +62,7 @@ class Neo4jRepoHolder(AbstractRepoHolder):
         """
         repo_params = {
             'tx': self.tx,
+            'id_allocator': id_allocator,
             'controls': controls,
             'release': release,
             'write_team': write_team
@@ -15,6 +15,7 @@ from breedgraph.domain.model.organisations import (
 from breedgraph.adapters.neo4j.cypher import queries
 from breedgraph.service_layer.tracking import TrackableProtocol
 from breedgraph.service_layer.repositories.base import BaseRepository
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
 
 from typing import AsyncGenerator, Set, List
 
@@ -23,10 +24,17 @@ logger = logging.getLogger(__name__)
 
 class Neo4jOrganisationsRepository(BaseRepository[TeamInput, Organisation]):
 
-    def __init__(self, tx: AsyncTransaction, user_id: int|None = None, redacted: bool = True):
+    def __init__(
+            self,
+            tx: AsyncTransaction,
+            id_allocator: AbstractIdAllocator,
+            user_id: int|None = None,
+            redacted: bool = True
+    ):
         super().__init__()
         self.user_id: int|None = user_id
         self.tx = tx
+        self.id_allocator = id_allocator
         self.redacted = redacted
 
     async def _create(self, team: TeamInput, *args) -> Organisation:
@@ -44,6 +52,7 @@ class Neo4jOrganisationsRepository(BaseRepository[TeamInput, Organisation]):
         logger.debug(f"Create team: {team}")
         result: AsyncResult = await self.tx.run(
             queries['organisations']['create_team'],
+            id=await self.id_allocator.next_id('team'),
             name=team.name,
             name_lower=team.name.casefold(),
             fullname=team.fullname,
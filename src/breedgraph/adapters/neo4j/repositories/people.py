@@ -18,6 +18,7 @@ class Neo4jPeopleRepository(Neo4jControlledRepository[PersonInput, PersonStored]
 
     async def _create_controlled(self, person: PersonInput) -> PersonStored:
         params = person.model_dump()
+        params['id'] = await self.id_allocator.next_id('person')
         result = await self.tx.run(queries['people']['create_person'], params)
         record = await result.single()
         return PersonStored(**record['person'])
@@ -46,13 +47,14 @@ class Neo4jPeopleRepository(Neo4jControlledRepository[PersonInput, PersonStored]
 
     async def _get_all_controlled(self, name: str|None = None) -> AsyncGenerator[ControlledQueryResult[PersonStored], None]:
         if name is None:
-            result = await self.tx.run(queries['people']['get_people'])
+            result = await self.tx.run(queries['people']['get_people'], **self.read_visibility)
             async for record in result:
                 yield ControlledQueryResult(PersonStored(**record['person']))
         else:
             result = await self.tx.run(
                 queries['people']['get_people_by_name'],
-                name_regex=f"(?i)^{name}$"
+                name_regex=f"(?i)^{name}$",
+                **self.read_visibility
             )
             async for record in result:
                 person=PersonStored(**record['person'])
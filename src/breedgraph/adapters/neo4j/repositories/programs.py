@@ -17,9 +17,13 @@ logger = logging.getLogger(__name__)
 class Neo4jProgramsRepository(Neo4jControlledRepository[ProgramInput, ProgramStored]):
 
     async def _create_controlled(self, program: ProgramInput) -> ProgramStored:
-        async for existing_program in self._get_all_controlled():
-            if program.name.casefold() == existing_program.aggregate.name.casefold():
-                raise ValueError("A program with this name is already registered")
+        result: AsyncResult = await self.tx.run(
+            queries['programs']['program_name_exists'],
+            name_lower=program.name.casefold()
+        )
+        record: Record = await result.single()
+        if record.get('exists'):
+            raise ValueError("A program with this name is already registered")
 
         stored_program = await self._create_program(program)
         return stored_program
@@ -27,10 +31,12 @@ class Neo4jProgramsRepository(Neo4jControlledRepository[ProgramInput, ProgramSto
     async def _create_program(self, program: ProgramInput) -> ProgramStored:
         logger.debug(f"Create program: {program}")
         program_data = program.model_dump()
+        program_data['name_lower'] = program.name.casefold()
         contact_ids = program_data.pop('contact_ids')
         reference_ids = program_data.pop('reference_ids')
         result: AsyncResult = await self.tx.run(
             queries['programs']['create_program'],
+            id = await self.id_allocator.next_id('program'),
             program_data = program_data,
             contact_ids = contact_ids,
             reference_ids = reference_ids
@@ -46,6 +52,7 @@ class Neo4jProgramsRepository(Neo4jControlledRepository[ProgramInput, ProgramSto
         reference_ids = trial_data.pop('reference_ids')
         result: AsyncResult = await self.tx.run(
             queries['programs']['create_trial'],
+            id = await self.id_allocator.next_id('trial'),
             trial_data = trial_data,
             contact_ids = contact_ids,
             reference_ids = reference_ids,
@@ -63,6 +70,7 @@ class Neo4jProgramsRepository(Neo4jControlledRepository[ProgramInput, ProgramSto
         design_id = study_data.pop('design_id')
         result: AsyncResult = await self.tx.run(
             queries['programs']['create_study'],
+            id = await self.id_allocator.next_id('study'),
             study_data=study_data,
             reference_ids = reference_ids,
             licence_id = licence_id,
@@ -76,6 +84,7 @@ class Neo4jProgramsRepository(Neo4jControlledRepository[ProgramInput, ProgramSto
         logger.debug(f"Set program: {program}")
         program_data = program.model_dump()
         program_data.pop('trials')
+        program_data['name_lower'] = program.name.casefold()
         program_id = program_data.pop('id')
         contact_ids = program_data.pop('contact_ids')
         reference_ids = program_data.pop('reference_ids')
@@ -155,6 +164,7 @@ class Neo4jProgramsRepository(Neo4jControlledRepository[ProgramInput, ProgramSto
             record = record.data()
         if 'program' in record:
             record = record.get('program')
+        record.pop('name_lower', None)
 
         if 'trials' in record:
             record['trials'] = {
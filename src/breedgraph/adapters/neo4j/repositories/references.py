@@ -43,7 +43,11 @@ class Neo4jReferencesRepository(Neo4jControlledRepository[ReferenceBase, Referen
             reference: ReferenceBase,
     ) -> ReferenceStoredBase:
         params = reference.model_dump()
-        result = await self.tx.run(queries['references']['create_reference'], params=params)
+        result = await self.tx.run(
+            queries['references']['create_reference'],
+            id=await self.id_allocator.next_id('reference'),
+            params=params
+        )
         record = await result.single()
         return self.record_to_reference(record.get('reference'))
 
@@ -103,26 +107,36 @@ class Neo4jReferencesRepository(Neo4jControlledRepository[ReferenceBase, Referen
     ) -> AsyncGenerator[ControlledQueryResult[ReferenceStoredBase], None]:
         match_field = None
         if reference_ids is not None:
-            result = await self.tx.run(queries['references']['get_references_by_ids'], reference_ids=reference_ids)
+            result = await self.tx.run(
+                queries['references']['get_references_by_ids'],
+                reference_ids=reference_ids,
+                **self.read_visibility
+            )
         elif file_ids is not None:
-            result = await self.tx.run(queries['references']['get_references_by_file_ids'], file_ids=file_ids)
+            result = await self.tx.run(
+                queries['references']['get_references_by_file_ids'],
+                file_ids=file_ids,
+                **self.read_visibility
+            )
             match_field = "file_id"
         elif description is not None:
             if reference_types is not None:
                 result = await self.tx.run(
                     queries['references']['get_references_by_description_and_types'],
                     description=description,
-                    types=reference_types
+                    types=reference_types,
+                    **self.read_visibility
                 )
                 match_field = "description"
             else:
                 result = await self.tx.run(
                     queries['references']['get_references_by_description'],
-                    description=description
+                    description=description,
+                    **self.read_visibility
                 )
                 match_field = "description"
         else:
-            result = await self.tx.run(queries['references']['get_references'])
+            result = await self.tx.run(queries['references']['get_references'], **self.read_visibility)
 
         async for record in result:
             reference = self.record_to_reference(record)
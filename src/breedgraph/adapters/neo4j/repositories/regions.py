@@ -7,32 +7,65 @@ from breedgraph.domain.model.regions import (
     Region, LocationInput, LocationStored
 )
 from breedgraph.adapters.neo4j.cypher import queries
+from breedgraph.config import WRITE_BATCH_SIZE
 from breedgraph.service_layer.tracking import TrackableProtocol
 from breedgraph.domain.model.controls import DiscoveryMatch
 from breedgraph.service_layer.repositories.controlled import ControlledQueryResult
 from breedgraph.adapters.neo4j.repositories.controlled import Neo4jControlledRepository
 
-from typing import Set, AsyncGenerator, Tuple, List
+from typing import Set, AsyncGenerator, Tuple, List, Dict, Any
 
 logger = logging.getLogger(__name__)
 
 class Neo4jRegionsRepository(Neo4jControlledRepository[LocationInput, Region]):
 
     async def _create_controlled(self, location: LocationInput) -> Region:
-        stored_location = await self._create_location(location)
-        return Region(nodes=[stored_location])
+        stored_locations = await self._create_locations([location])
+        return Region(nodes=stored_locations)
 
-    async def _create_location(self, location: LocationInput) -> LocationStored:
-        logger.debug(f"Create location: {location}")
-        async for _ in self._get_all_controlled(location.name, location.code):
-            raise IdentityExistsError("A region root location with this name or code is already registered")
-        result: AsyncResult = await self.tx.run(queries['regions']['create_location'], **location.model_dump())
+    @staticmethod
+    def _location_params(location: LocationInput | LocationStored) -> Dict[str, Any]:
+        location_data = location.model_dump()
+        location_data['name_lower'] = location.name.casefold()
+        return location_data
+
+    async def _create_locations(self, locations: List[LocationInput]) -> List[LocationStored]:
+        """ Create locations with a query per WRITE_BATCH_SIZE locations, returning the stored locations in the same order """
+        logger.debug(f"Create locations: {len(locations)}")
+        result: AsyncResult = await self.tx.run(
+            queries['regions']['root_names_or_codes_exist'],
+            names_lower=[location.name.casefold() for location in locations],
+            codes=[location.code for location in locations if location.code is not None]
+        )
         record: Record = await result.single()
-        return LocationStored(**record['location'])
+        if record.get('exists'):
+            raise IdentityExistsError("A region root location with this name or code is already registered")
 
-    async def _update_location(self, location: LocationStored):
-        logger.debug(f"Set location: {location}")
-        await self.tx.run(queries['regions']['set_location'], location.model_dump())
+        location_ids = await self.id_allocator.allocate('location', len(locations))
+        stored = {}
+        for start in range(0, len(locations), WRITE_BATCH_SIZE):
+            locations_data = []
+            for location, location_id in zip(
+                    locations[start:start + WRITE_BATCH_SIZE],
+                    location_ids[start:start + WRITE_BATCH_SIZE]
+            ):
+                location_data = self._location_params(location)
+                location_data['id'] = location_id
+                locations_data.append(location_data)
+            result: AsyncResult = await self.tx.run(queries['regions']['create_locations'], locations=locations_data)
+            async for record in result:
+                stored_location = self.record_to_location(record['location'])
+                stored[stored_location.id] = stored_location
+        return [stored[location_id] for location_id in location_ids]
+
+    async def _update_locations(self, locations: List[LocationStored]):
+        logger.debug(f"Set locations: {[location.id for location in locations]}")
+        for start in range(0, len(locations), WRITE_BATCH_SIZE):
+            result: AsyncResult = await self.tx.run(
+                queries['regions']['set_locations'],
+                locations=[self._location_params(location) for location in locations[start:start + WRITE_BATCH_SIZE]]
+            )
+            await result.consume()
 
     async def _delete_locations(self, location_ids: List[int]) -> None:
         logger.debug(f"Remove locations: {location_ids}")
@@ -45,7 +78,7 @@ class Neo4jRegionsRepository(Neo4jControlledRepository[LocationInput, Region]):
             edges = []
             async for record in result:
                 parent_id = record.get('location').pop('parent_id', None)
-                location = LocationStored(**record.get('location'))
+                location = self.record_to_location(record.get('location'))
                 nodes.append(location)
                 if parent_id is not None:
                     edges.append((parent_id, location.id, None))
@@ -60,6 +93,11 @@ class Neo4jRegionsRepository(Neo4jControlledRepository[LocationInput, Region]):
             except StopAsyncIteration:
                 return None
 
+    @staticmethod
+    def record_to_location(location: dict) -> LocationStored:
+        location.pop('name_lower', None)
+        return LocationStored(**location)
+
     @staticmethod
     def record_to_region(record) -> Region:
         edges = []
@@ -67,7 +105,7 @@ class Neo4jRegionsRepository(Neo4jControlledRepository[LocationInput, Region]):
             parent_id = entry.pop('parent_id', None)
             if parent_id is not None:
                 edges.append((parent_id, entry.get('id'), None))
-        locations = [LocationStored(**l) for l in record['region']]
+        locations = [Neo4jRegionsRepository.record_to_location(l) for l in record['region']]
         return Region(nodes=locations, edges=edges)
 
     async def _get_all_controlled(self, name:str|None = None, code:str|None = None) -> AsyncGenerator[ControlledQueryResult[Region], None]:
@@ -92,23 +130,30 @@ class Neo4jRegionsRepository(Neo4jControlledRepository[LocationInput, Region]):
         if not region.changed:
             return
 
+        added_ids = []
+        added_locations = []
         for location_id in region._graph.added_nodes:
             location = region.get_entry(location_id)
-
             if isinstance(location, LocationInput):
-                stored_location = await self._create_location(location)
+                added_ids.append(location_id)
+                added_locations.append(location)
+
+        if added_locations:
+            stored_locations = await self._create_locations(added_locations)
+            for location_id, stored_location in zip(added_ids, stored_locations):
                 region._graph.replace_with_stored(location_id, stored_location)
 
         if region._graph.removed_nodes:
             await self._delete_locations(list(region._graph.removed_nodes))
 
+        changed_locations = []
         for node_id in region._graph.changed_nodes:
-
             location = region.get_location(node_id)
             if not isinstance(location, LocationStored):
                 raise ValueError("Can only commit changes to stored locations")
-
-            await self._update_location(location)
+            changed_locations.append(location)
+        if changed_locations:
+            await self._update_locations(changed_locations)
 
         # here, we remove removed from added and added from removed to ensure that changes that are
         # both added and removed are not affected by the order of processing,
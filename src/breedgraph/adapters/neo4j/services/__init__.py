@@ -4,3 +4,4 @@ from .germplasm_persistence import Neo4jGermplasmPersistenceService
 from .aggregate_restructuring_service import Neo4jAggregateRestructuringService
 from .file_archival_service import Neo4jFileArchivalService
 from .dependency_guards import Neo4jDependencyGuards
+from .id_allocator import Neo4jIdAllocator
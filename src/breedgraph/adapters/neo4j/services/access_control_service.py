@@ -83,7 +83,23 @@ class Neo4jAccessControlService(AbstractAccessControlService):
 
         result = await self.tx.run(
             controls.get_controllers(label=label),
-            entity_ids=model_ids
+            entity_ids=model_ids if isinstance(model_ids, list) else list(model_ids)
+        )
+        controllers = {}
+        async for record in result:
+            controllers[record['entity_id']] = Controller(controls={
+                control['team']: Control(team_id=control['team'], release=ReadRelease(control['release']))
+                for control in record['controls']
+            })
+        return controllers
+
+    async def _get_controller_details(self, label: ControlledModelLabel, model_ids: Set[int]|List[int]) -> Dict[int, Controller]:
+        if not model_ids:
+            return {}
+
+        result = await self.tx.run(
+            controls.get_controller_details(label=label),
+            entity_ids=model_ids if isinstance(model_ids, list) else list(model_ids)
         )
         controllers = {}
         async for record in result:
@@ -13,7 +13,7 @@ from breedgraph.config.files import LOCAL_STORAGE_DURATION, LOCAL_SIZE_LIMIT
 
 from breedgraph.domain.model.time_descriptors import deserialize_time
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, List
 
 
 import logging
@@ -41,7 +41,8 @@ class Neo4jFileArchivalService(AbstractFileArchivalService):
         if record['local_state'] == LocalState.LOCAL:
             file_size: int = record['file_size']
             file_path = Path(self.file_storage_path, record['file_id'])
-            record['local_completion'] = int(100 * file_path.stat().st_size / file_size)
+            if file_path.exists() and file_size:
+                record['local_completion'] = int(100 * file_path.stat().st_size / file_size)
 
         # Convert timestamps
         if record.get('last_attempt_at'):
@@ -67,25 +68,59 @@ class Neo4jFileArchivalService(AbstractFileArchivalService):
         }
         return props
 
-    async def create(self, record: FileArchivalRecord) -> FileArchivalRecord:
-        """Create a new archival record"""
-        logger.debug(f"Creating archival record for file {record.file_id}")
+    async def _add_file(self, file_id: str, record: FileArchivalRecord) -> FileArchivalRecord:
+        logger.debug(f"Adding file {file_id} to archival record for blob {record.file_id}")
         async with self.driver.session() as session:
             result = await session.run(
-                queries['archive']['create_record'],
-                file_id = record.file_id,
+                queries['archive']['add_file'],
+                file_id=file_id,
+                blob_id=record.file_id,
                 record_data=self.archival_record_to_props(record)
             )
             returned_record = await result.single(strict=True)
             return self.record_to_archival_record(returned_record)
 
+    async def _release_file(
+            self,
+            file_id: str,
+            delete_local: Callable[[str], Awaitable[None]] | None
+    ) -> FileArchivalRecord | None:
+        async with self.driver.session() as session:
+            async with await session.begin_transaction() as tx:
+                # holds the write lock on the blob record until the transaction is committed
+                result = await tx.run(
+                    queries['archive']['release_file'],
+                    file_id=file_id,
+                    deletion_pending=ArchiveState.DELETION_PENDING.value
+                )
+                returned_record = await result.single()
+                if returned_record is None:
+                    return None
+                record = self.record_to_archival_record(returned_record)
+                if not record.file_ids and delete_local is not None:
+                    await delete_local(record.file_id)
+                return record
+
     async def get(self, file_id: str) -> FileArchivalRecord:
         async with self.driver.session() as session:
             result = await session.run(
                 queries['archive']['get_record'],
                 file_id = file_id
             )
-            returned_record = await result.single(strict=True)
+            returned_record = await result.single()
+            if returned_record is None:
+                raise NoResultFoundError(f"No archival record found for blob {file_id}")
+            return self.record_to_archival_record(returned_record)
+
+    async def get_for_file(self, file_id: str) -> FileArchivalRecord:
+        async with self.driver.session() as session:
+            result = await session.run(
+                queries['archive']['get_record_for_file'],
+                file_id = file_id
+            )
+            returned_record = await result.single()
+            if returned_record is None:
+                raise NoResultFoundError(f"No archival record found for file {file_id}")
             return self.record_to_archival_record(returned_record)
 
     async def _set_state_values(
@@ -166,9 +201,9 @@ class Neo4jFileArchivalService(AbstractFileArchivalService):
                 record = await result.single(strict=True)
                 return self.record_to_archival_record(record)
 
-    async def mark_accessed(self, file_id: str):
+    async def _mark_accessed(self, file_ids: List[str]):
         async with self.driver.session() as session:
-            await session.run(queries['archive']['mark_accessed'], file_id=file_id)
+            await session.run(queries['archive']['mark_accessed'], file_ids=file_ids)
 
     async def add_requestor(self, file_id: str, user_id: int) -> None:
         async with self.driver.session() as session:
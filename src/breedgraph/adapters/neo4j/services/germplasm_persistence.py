@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, AsyncGenerator
+from typing import Dict, List, Optional, AsyncGenerator, Tuple
 from neo4j import AsyncTransaction, Record
 
 from breedgraph.domain.model.germplasm import (
@@ -7,8 +7,11 @@ from breedgraph.domain.model.germplasm import (
 )
 from breedgraph.domain.model.time_descriptors import serialize_npdt64, deserialize_time
 from breedgraph.service_layer.persistence.germplasm import GermplasmPersistenceService
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
+from breedgraph.service_layer.infrastructure.pedigree_index import PedigreeIndex
 
 from breedgraph.adapters.neo4j.cypher import queries
+from breedgraph.config import WRITE_BATCH_SIZE
 
 import logging
 
@@ -19,10 +22,36 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
     """
     Neo4j implementation of germplasm persistence service.
     Handles all database operations for germplasm entries and their relationships.
+
+    When given a pedigree index, ancestry and path queries are answered from a copy of the index
+    holding the relationship changes made in this transaction, rather than by variable length graph queries.
     """
 
-    def __init__(self, tx: AsyncTransaction):
+    def __init__(
+            self,
+            tx: AsyncTransaction,
+            id_allocator: AbstractIdAllocator,
+            pedigree_index: PedigreeIndex | None = None
+    ):
         self.tx = tx
+        self.id_allocator = id_allocator
+        self.pedigree_index = pedigree_index
+        self._pedigree: PedigreeIndex | None = None
+
+    async def _read_pedigree(self) -> List[Tuple[int, int]]:
+        result = await self.tx.run(queries['germplasm']['get_pedigree'])
+        return [(record['source_id'], record['sink_id']) async for record in result]
+
+    async def _get_pedigree(self) -> PedigreeIndex:
+        """ The pedigree as seen by this transaction, taken before any relationships are changed """
+        if self._pedigree is None:
+            self._pedigree = await self.pedigree_index.snapshot(await self.get_pedigree_version(), self._read_pedigree)
+        return self._pedigree
+
+    async def _increment_pedigree_version(self) -> None:
+        result = await self.tx.run(queries['germplasm']['increment_pedigree_version'])
+        record = await result.single(strict=True)
+        self.pedigree_version = record['version']
 
     @staticmethod
     def record_to_entry(record: Record) -> GermplasmStored:
@@ -51,7 +80,11 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
         control_methods = params.pop('control_methods', [])
         references = params.pop('references', [])
         result = await self.tx.run(
-            query, params = params, control_methods=control_methods, references=references
+            query,
+            id=await self.id_allocator.next_id('germplasm'),
+            params=params,
+            control_methods=control_methods,
+            references=references
         )
         record = await result.single(strict=True)
         return self.record_to_entry(record)
@@ -138,8 +171,15 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
         relationships_dump = [
             relationship.model_dump() for relationship in relationships
         ]
+        if not relationships:
+            return
+        if self.pedigree_index is not None:
+            pedigree = await self._get_pedigree()
+            pedigree.add_edges((rel.source_id, rel.sink_id) for rel in relationships)
         query = queries['germplasm']['create_relationships']
-        await self.tx.run(query, relationships=relationships_dump)
+        for start in range(0, len(relationships_dump), WRITE_BATCH_SIZE):
+            await self.tx.run(query, relationships=relationships_dump[start:start + WRITE_BATCH_SIZE])
+        await self._increment_pedigree_version()
 
     async def update_relationships(self, relationships: List[GermplasmRelationship]) -> None:
         """Update relationships between germplasm entries."""
@@ -148,16 +188,24 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
             relationship.model_dump() for relationship in relationships
         ]
         query = queries['germplasm']['set_relationships']
-        await self.tx.run(query, relationships=relationships_dump)
+        for start in range(0, len(relationships_dump), WRITE_BATCH_SIZE):
+            await self.tx.run(query, relationships=relationships_dump[start:start + WRITE_BATCH_SIZE])
 
     async def delete_relationships(self, relationships: List[GermplasmRelationship]) -> None:
-        """Update relationships between germplasm entries."""
+        """Delete relationships between germplasm entries."""
         # convert enum to string for storage in neo4j
         relationships_dump = [
             relationship.model_dump() for relationship in relationships
         ]
+        if not relationships:
+            return
+        if self.pedigree_index is not None:
+            pedigree = await self._get_pedigree()
+            pedigree.remove_edges((rel.source_id, rel.sink_id) for rel in relationships)
         query = queries['germplasm']['delete_relationships']
-        await self.tx.run(query, relationships=relationships_dump)
+        for start in range(0, len(relationships_dump), WRITE_BATCH_SIZE):
+            await self.tx.run(query, relationships=relationships_dump[start:start + WRITE_BATCH_SIZE])
+        await self._increment_pedigree_version()
 
     async def get_relationships(self, entry_id: int) -> AsyncGenerator[GermplasmRelationship, None]:
         """Get all relationships for a germplasm entry."""
@@ -180,6 +228,35 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
         async for record in result:
             yield GermplasmRelationship(**record)
 
+    async def get_relationships_for_entries(self, entry_ids: List[int]) -> List[GermplasmRelationship]:
+        """Get all relationships for the germplasm entries in a single query."""
+        if not entry_ids:
+            return []
+        query = queries['germplasm']['get_relationships_by_entry_ids']
+        result = await self.tx.run(query, entry_ids=list(entry_ids))
+        return [GermplasmRelationship(**record) async for record in result]
+
+    async def get_pedigree_relationships(self, entry_ids: List[int]) -> List[GermplasmRelationship]:
+        """Get the source relationships of the entries and their ancestors, with a query per generation."""
+        relationships = []
+        seen = set(entry_ids)
+        pending = list(seen)
+        while pending:
+            result = await self.tx.run(queries['germplasm']['get_source_relationships_by_sink_ids'], entry_ids=pending)
+            pending = []
+            async for record in result:
+                rel = GermplasmRelationship(**record)
+                relationships.append(rel)
+                if rel.source_id not in seen:
+                    seen.add(rel.source_id)
+                    pending.append(rel.source_id)
+        return relationships
+
+    async def get_pedigree_version(self) -> int:
+        result = await self.tx.run(queries['germplasm']['get_pedigree_version'])
+        record = await result.single(strict=True)
+        return record['version']
+
     async def get_root_entries(self) -> AsyncGenerator[GermplasmStored, None]:
         query = queries['germplasm']['get_root_entries']
         result = await self.tx.run(query)
@@ -187,6 +264,9 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
             yield self.record_to_entry(record)
 
     async def get_ancestor_ids(self, entry_id: int, path_length_limit=None) -> List[int]:
+        if self.pedigree_index is not None:
+            pedigree = await self._get_pedigree()
+            return pedigree.get_ancestor_ids(entry_id, path_length_limit)
         if path_length_limit:
             query = queries['germplasm']['get_ancestor_ids_with_limit']
             result = await self.tx.run(query, entry_id=entry_id, limit=path_length_limit)
@@ -196,6 +276,9 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
         return [record['ancestor.id'] async for record in result]
 
     async def get_descendant_ids(self, entry_id: int, path_length_limit=None) -> List[int]:
+        if self.pedigree_index is not None:
+            pedigree = await self._get_pedigree()
+            return pedigree.get_descendant_ids(entry_id, path_length_limit)
         if path_length_limit:
             query = queries['germplasm']['get_descendant_ids_with_limit']
             result = await self.tx.run(query, entry_id=entry_id, limit=path_length_limit)
@@ -204,8 +287,17 @@ class Neo4jGermplasmPersistenceService(GermplasmPersistenceService):
             result = await self.tx.run(query, entry_id=entry_id, limit=path_length_limit)
         return [record['descendant.id'] async for record in result]
 
+    async def get_cycle_ids(self, relationships: List[GermplasmRelationship]) -> List[int]:
+        if self.pedigree_index is None:
+            return await super().get_cycle_ids(relationships)
+        pedigree = await self._get_pedigree()
+        return pedigree.get_cycle_ids((rel.source_id, rel.sink_id) for rel in relationships)
+
     async def has_path(self, source_id: int, sink_id: int) -> bool:
         """Check if there's a path between two entries (for cycle detection)."""
+        if self.pedigree_index is not None:
+            pedigree = await self._get_pedigree()
+            return pedigree.has_path(source_id, sink_id)
         query = queries['germplasm']['has_path_between_entries']
         result = await self.tx.run(query, source_id=source_id, sink_id=sink_id)
         record = await result.single()
@@ -0,0 +1,28 @@
+from neo4j import AsyncManagedTransaction
+
+from breedgraph.service_layer.infrastructure.driver import AbstractAsyncDriver
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
+from breedgraph.adapters.neo4j.cypher import queries
+
+from breedgraph.config import ID_BLOCK_SIZE
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class Neo4jIdAllocator(AbstractIdAllocator):
+    """ Reserves ID blocks from the Counter nodes, each reservation in its own (retried) write transaction """
+
+    def __init__(self, driver: AbstractAsyncDriver, block_size: int = ID_BLOCK_SIZE):
+        super().__init__(block_size=block_size)
+        self.driver = driver
+
+    @staticmethod
+    async def _reserve_tx(tx: AsyncManagedTransaction, name: str, size: int) -> int:
+        result = await tx.run(queries['infrastructure']['reserve_ids'], name=name, size=size)
+        record = await result.single(strict=True)
+        return record['first']
+
+    async def _reserve(self, name: str, size: int) -> int:
+        async with self.driver.session() as session:
+            return await session.execute_write(self._reserve_tx, name, size)
@@ -39,8 +39,9 @@ class Neo4jOntologyPersistenceService(OntologyPersistenceService):
         for patch in patches:
             entry_dict.update(patch)
 
-        # remove lowercase name from record
+        # remove lowercase name and abbreviation from record
         entry_dict.pop('name_lower')
+        entry_dict.pop('abbreviation_lower', None)
         # replace strings with enums
         if 'scale_type' in entry_dict:
             entry_dict['scale_type'] = ScaleType(entry_dict['scale_type'])
@@ -100,6 +101,8 @@ class Neo4jOntologyPersistenceService(OntologyPersistenceService):
         version = await self.get_current_version()
         params = entry.model_dump()
         params['name_lower'] = params['name'].casefold()
+        if params.get('abbreviation'):
+            params['abbreviation_lower'] = params['abbreviation'].casefold()
         authors = params.pop('authors')
         references = params.pop('references')
         query = ontology.create_ontology_entry(entry.label)
@@ -133,6 +136,8 @@ class Neo4jOntologyPersistenceService(OntologyPersistenceService):
 
         if 'name' in diff:
             diff['name_lower'] = diff['name'].casefold()
+        if 'abbreviation' in diff:
+            diff['abbreviation_lower'] = diff['abbreviation'].casefold() if diff['abbreviation'] else None
 
         diff.pop('authors', None)
         authors_added = list(set(entry.authors) - set(stored_entry.authors))
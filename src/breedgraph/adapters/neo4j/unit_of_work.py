@@ -22,7 +22,10 @@ from breedgraph.service_layer.infrastructure import (
     AbstractDependencyGuards,
     AbstractConstraintsHandler,
     AbstractUnitHolder,
-    AbstractUnitOfWorkFactory
+    AbstractUnitOfWorkFactory,
+    AbstractAsyncDriver,
+    AbstractIdAllocator,
+    PedigreeIndex
 )
 
 from breedgraph.service_layer.repositories import AbstractRepoHolder
@@ -32,7 +35,8 @@ from breedgraph.adapters.neo4j.services import (
     Neo4jOntologyPersistenceService,
     Neo4jGermplasmPersistenceService,
     Neo4jAggregateRestructuringService,
-    Neo4jDependencyGuards
+    Neo4jDependencyGuards,
+    Neo4jIdAllocator
 )
 from breedgraph.adapters.neo4j.repositories.holder import Neo4jRepoHolder
 from breedgraph.adapters.neo4j.constraints.constraints import Neo4jConstraintsHandler
@@ -72,6 +76,8 @@ class Neo4jUnitHolder(AbstractUnitHolder):
     async def create(
             cls,
             tx: AsyncTransaction,
+            id_allocator: AbstractIdAllocator,
+            pedigree_index: PedigreeIndex | None = None,
             user_id: int | None = None,
             redacted: bool = True,
             write_team: int | None = None,
@@ -96,7 +102,7 @@ class Neo4jUnitHolder(AbstractUnitHolder):
         )
 
 
-        germplasm_persistence = Neo4jGermplasmPersistenceService(tx)
+        germplasm_persistence = Neo4jGermplasmPersistenceService(tx, id_allocator, pedigree_index)
         germplasm_service = GermplasmApplicationService(
             persistence_service=germplasm_persistence,
             access_control_service=access_control_service,
@@ -107,7 +113,14 @@ class Neo4jUnitHolder(AbstractUnitHolder):
         restructuring = Neo4jAggregateRestructuringService(tx)
         guards = Neo4jDependencyGuards(tx)
         constraints = Neo4jConstraintsHandler(tx, user_id)
-        repositories = Neo4jRepoHolder(tx, access_control_service, release=release, redacted=redacted, write_team=write_team)
+        repositories = Neo4jRepoHolder(
+            tx,
+            access_control_service,
+            id_allocator,
+            release=release,
+            redacted=redacted,
+            write_team=write_team
+        )
 
         return cls(
             tx=tx,
@@ -152,6 +165,11 @@ class Neo4jUnitHolder(AbstractUnitHolder):
 
 class Neo4jUnitOfWorkFactory(AbstractUnitOfWorkFactory):
 
+    def __init__(self, driver: AbstractAsyncDriver):
+        super().__init__(driver)
+        # shared by all units of work so ID blocks are reserved once per process rather than per transaction
+        self.id_allocator: AbstractIdAllocator = Neo4jIdAllocator(driver)
+
     @asynccontextmanager
     async def _get_uow(
             self,
@@ -166,6 +184,8 @@ class Neo4jUnitOfWorkFactory(AbstractUnitOfWorkFactory):
 
         unit_holder = await Neo4jUnitHolder.create(
             tx=tx,
+            id_allocator=self.id_allocator,
+            pedigree_index=self.pedigree_index,
             user_id=user_id,
             redacted=redacted,
             release=release,
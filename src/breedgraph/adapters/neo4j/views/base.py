@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 
 from breedgraph.adapters.neo4j.views.datasets import Neo4jDatasetsView
+from breedgraph.adapters.neo4j.views.blocks import Neo4jBlocksView
 from breedgraph.adapters.neo4j.views.ontology import Neo4jOntologyView
 from breedgraph.service_layer.infrastructure.state_store import AbstractStateStore
 from breedgraph.service_layer.queries.views.views import AbstractViewsHolder, AbstractViewsFactory
@@ -19,12 +20,14 @@ class Neo4jViewsHolder(AbstractViewsHolder):
             accounts: Neo4jAccountsView,
             regions: Neo4jRegionsView,
             datasets: Neo4jDatasetsView,
+            blocks: Neo4jBlocksView,
             ontology: Neo4jOntologyView
     ):
         self.ontology = ontology
         self.accounts = accounts
         self.regions = regions
         self.datasets = datasets
+        self.blocks = blocks
 
 
 class Neo4jViewsFactory(AbstractViewsFactory):
@@ -45,5 +48,6 @@ class Neo4jViewsFactory(AbstractViewsFactory):
                 ontology = Neo4jOntologyView(session=session),
                 accounts = accounts_view,
                 regions = Neo4jRegionsView(state_store=self.state_store, read_teams=read_teams, session=session),
-                datasets = Neo4jDatasetsView(read_teams=read_teams, session=session)
+                datasets = Neo4jDatasetsView(read_teams=read_teams, session=session, user_id=user_id),
+                blocks = Neo4jBlocksView(read_teams=read_teams, session=session, user_id=user_id)
             )
@@ -0,0 +1,50 @@
+from neo4j import AsyncSession, AsyncResult
+
+from breedgraph.service_layer.queries.views import AbstractBlocksView
+from breedgraph.service_layer.repositories.base import BaseRepository
+from breedgraph.domain.model.blocks import UnitStored, UnitOutput, Position
+from breedgraph.domain.model.controls import Controller, Control, ReadRelease
+
+from breedgraph.adapters.neo4j.cypher import queries
+
+from typing import List
+
+
+class Neo4jBlocksView(AbstractBlocksView):
+
+    def __init__(self, session: AsyncSession, read_teams: List[int], user_id: int | None = None):
+        self.session = session
+        self.read_teams = read_teams
+        self.user_id = user_id
+
+    def record_to_unit(self, unit_data: dict, controls: List[dict]) -> UnitOutput:
+        parents = unit_data.pop('parents')
+        children = unit_data.pop('children')
+        unit_data['positions'] = [
+            Position(**BaseRepository.deserialize_dt64(position)) for position in unit_data.get('positions', [])
+        ]
+        controller = Controller(controls={
+            control['team']: Control(team_id=control['team'], release=ReadRelease(control['release']))
+            for control in controls
+        })
+        unit = UnitStored(**unit_data).redacted(controller, self.user_id, set(self.read_teams))
+        return UnitOutput(**unit.model_dump(), parents=parents, children=children)
+
+    async def _get_units(
+            self,
+            after_id: int | None,
+            limit: int,
+            block_id: int | None,
+            location_ids: List[int] | None
+    ) -> List[UnitOutput]:
+        async with await self.session.begin_transaction() as tx:
+            result: AsyncResult = await tx.run(
+                queries['blocks']['read_units_page'],
+                after_id=after_id,
+                limit=limit,
+                block_id=block_id,
+                location_ids=location_ids,
+                read_teams=self.read_teams,
+                registered=self.user_id is not None
+            )
+            return [self.record_to_unit(record['unit'], record['controls']) async for record in result]
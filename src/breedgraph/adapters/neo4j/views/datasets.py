@@ -2,6 +2,9 @@ from neo4j import AsyncSession, AsyncResult
 
 from breedgraph.service_layer.queries.views import AbstractDatasetsView
 from breedgraph.service_layer.queries.read_models import DatasetSummary
+from breedgraph.service_layer.repositories.base import BaseRepository
+from breedgraph.domain.model.datasets import DataRecordStored
+from breedgraph.domain.model.controls import ControlledModel
 
 from breedgraph.adapters.neo4j.cypher import queries
 
@@ -10,17 +13,94 @@ from typing import List
 
 class Neo4jDatasetsView(AbstractDatasetsView):
 
-    def __init__(self, session: AsyncSession, read_teams: List[int]):
+    def __init__(self, session: AsyncSession, read_teams: List[int], user_id: int | None = None):
         self.session = session
         self.read_teams = read_teams
+        self.user_id = user_id
 
-    async def _get_dataset_summaries(self, study_id: int) -> List[DatasetSummary]:
+    async def _read_dataset_summaries(self, study_id: int) -> List[dict]:
         async with await self.session.begin_transaction() as tx:
             result: AsyncResult = await tx.run(
-                queries['datasets']['get_dataset_summaries_for_read_teams'],
+                queries['datasets']['read_dataset_summaries'],
                 study_id=study_id,
-                read_teams = self.read_teams
+                read_teams=self.read_teams,
+                registered=self.user_id is not None
+            )
+            return [record.data() async for record in result]
+
+    async def _summarise_datasets(self, dataset_ids: List[int]) -> dict[int, dict]:
+        async with await self.session.begin_transaction() as tx:
+            result: AsyncResult = await tx.run(
+                queries['datasets']['summarise_datasets'],
+                dataset_ids=dataset_ids
             )
+            return {record['dataset_id']: record['summary'] async for record in result}
+
+    async def _get_dataset_summaries(self, study_id: int) -> List[DatasetSummary]:
+        """
+        Summaries are stored with each dataset and kept up to date as records and recorded units are written.
+        Any dataset without a stored summary (i.e. before the schema migration) is summarised here without storing it.
+        """
+        summaries = await self._read_dataset_summaries(study_id)
+        unsummarised_ids = [s['dataset_id'] for s in summaries if s['summary'] is None]
+        if unsummarised_ids:
+            summarised = await self._summarise_datasets(unsummarised_ids)
+            for s in summaries:
+                if s['summary'] is None:
+                    s['summary'] = summarised.get(s['dataset_id'])
+
+        return [
+            DatasetSummary(
+                id=s['dataset_id'],
+                concept_id=s['concept_id'],
+                subject_ids=s['summary']['subject_ids'],
+                location_ids=s['summary']['location_ids'],
+                block_ids=s['summary']['block_ids'],
+                unit_count=s['summary']['unit_count'],
+                record_count=s['summary']['record_count'],
+                start=s['summary'].get('start'),
+                end=s['summary'].get('end')
+            )
+            # datasets without records are not summarised
+            for s in summaries if s['summary'] is not None and s['summary']['record_count']
+        ]
+
+    async def _get_records(self, dataset_id: int, after_id: int | None, limit: int) -> List[dict]:
+        async with await self.session.begin_transaction() as tx:
+            result: AsyncResult = await tx.run(
+                queries['datasets']['read_records_page'],
+                dataset_id=dataset_id,
+                after_id=after_id,
+                limit=limit,
+                read_teams=self.read_teams,
+                registered=self.user_id is not None
+            )
+            # as records of a dataset output
             return [
-                DatasetSummary(**record.get('dataset_summary')) async for record in result
+                DataRecordStored(**BaseRepository.deserialize_dt64(record['record'])).model_dump()
+                async for record in result
             ]
+
+    async def _get_export_dataset_ids(self, dataset_ids: List[int] | None, study_ids: List[int] | None) -> List[int]:
+        async with await self.session.begin_transaction() as tx:
+            result: AsyncResult = await tx.run(
+                queries['datasets']['read_export_dataset_ids'],
+                dataset_ids=dataset_ids,
+                study_ids=study_ids,
+                read_teams=self.read_teams,
+                registered=self.user_id is not None
+            )
+            return [record['dataset_id'] async for record in result]
+
+    async def _get_export_rows(self, dataset_id: int, after_id: int | None, limit: int) -> List[dict]:
+        async with await self.session.begin_transaction() as tx:
+            result: AsyncResult = await tx.run(
+                queries['datasets']['read_export_rows'],
+                dataset_id=dataset_id,
+                after_id=after_id,
+                limit=limit,
+                read_teams=self.read_teams,
+                registered=self.user_id is not None,
+                redacted=ControlledModel.redacted_str
+            )
+            return [BaseRepository.deserialize_dt64(record['row']) async for record in result]
\ No newline at end of file
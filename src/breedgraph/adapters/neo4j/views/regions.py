@@ -28,4 +28,6 @@ class Neo4jRegionsView(AbstractRegionsView):
                 read_teams=self.read_teams
             )
             async for record in result:
-                yield LocationOutput(**record['location'])
\ No newline at end of file
+                location = record['location']
+                location.pop('name_lower', None)
+                yield LocationOutput(**location)
\ No newline at end of file
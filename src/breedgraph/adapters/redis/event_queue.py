@@ -0,0 +1,283 @@
+import os
+import socket
+
+from collections import defaultdict, deque
+
+import redis.asyncio as redis
+from redis.exceptions import ResponseError
+
+from breedgraph.service_layer.infrastructure.event_queue import AbstractEventQueue, EventDelivery, get_event_types
+
+from breedgraph.config import (
+    get_redis_host_and_port, DEFAULT_EVENT_PRIORITY, EVENT_MAX_DELIVERIES, EVENT_RETRY_IDLE, EVENT_POLL_BLOCK
+)
+
+from typing import Deque, Dict, List, Self, Set
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class RedisEventQueue(AbstractEventQueue):
+    """
+    Durable event queue on Redis Streams, one stream per lane and priority read through a shared consumer group,
+    so any number of processes can consume a lane and each event is delivered to one of them.
+    Higher priority streams are read first, a blocking read across all of them waits for new events.
+
+    Events are acknowledged (and deleted) once handled.
+    Unacknowledged events, from a failed handler or a worker that stopped part way,
+    are claimed for retry by any worker once idle for retry_idle milliseconds.
+    The handlers that completed for a delivery are kept in a set beside the stream,
+    so a retry only runs the handlers that have not yet completed.
+    After max_deliveries attempts an event is moved to the dead letter stream,
+    as is a message that can't be decoded (e.g. of an event type that no longer exists) when it is first read.
+    """
+    STREAM_PREFIX = "events"
+    DEAD_LETTER_STREAM = "events:dead"
+    # seconds to keep the handlers completed for a delivery, well beyond retry_idle * max_deliveries
+    HANDLED_EXPIRY = 7 * 24 * 60 * 60
+
+    def __init__(
+            self,
+            connection: redis.Redis,
+            lanes: Dict[str, str] | None = None,
+            priorities: Dict[str, int] | None = None,
+            depths: Dict[str, int] | None = None,
+            group: str = "breedgraph",
+            consumer: str | None = None,
+            max_deliveries: int = EVENT_MAX_DELIVERIES,
+            retry_idle: int = EVENT_RETRY_IDLE,
+            poll_block: int = EVENT_POLL_BLOCK
+    ):
+        super().__init__(lanes, priorities, depths)
+        self.connection = connection
+        self.group = group
+        self.consumer = consumer or f"{socket.gethostname()}:{os.getpid()}"
+        self.max_deliveries = max_deliveries
+        self.retry_idle = retry_idle
+        self.poll_block = poll_block
+        self.event_types = get_event_types()
+        self._groups: Set[str] = set()
+        # messages read by a blocking read across priorities, beyond the one returned,
+        # these are pending for this consumer and are claimed again before they are returned (see _reclaim)
+        self._buffered: Dict[str, Deque[EventDelivery]] = defaultdict(deque)
+
+    @classmethod
+    async def create(cls, connection: redis.Redis | None = None, db: int = 0, **kwargs) -> Self:
+        if connection is None:
+            host, port = get_redis_host_and_port()
+            connection = await redis.Redis(host=host, port=port, db=db)
+        return cls(connection, **kwargs)
+
+    def stream(self, lane: str, priority: int = DEFAULT_EVENT_PRIORITY) -> str:
+        if priority == DEFAULT_EVENT_PRIORITY:
+            return f"{self.STREAM_PREFIX}:{lane}"
+        return f"{self.STREAM_PREFIX}:{lane}:{priority}"
+
+    @staticmethod
+    def handled_key(stream: str, delivery_id: str) -> str:
+        return f"{stream}:handled:{delivery_id}"
+
+    def streams(self, lane: str) -> Dict[str, int]:
+        """ The streams for a lane in priority order, with their priority """
+        return {self.stream(lane, priority): priority for priority in self.lane_priorities(lane)}
+
+    async def _ensure_group(self, stream: str) -> None:
+        if stream in self._groups:
+            return
+        try:
+            await self.connection.xgroup_create(name=stream, groupname=self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add(stream)
+
+    async def _put(self, delivery: EventDelivery) -> None:
+        await self.connection.xadd(
+            self.stream(delivery.lane, delivery.priority),
+            {"type": type(delivery.event).__name__, "event": delivery.event.model_dump_json()}
+        )
+
+    async def depth(self, lane: str) -> int:
+        # handled events are deleted, so the stream length is the events waiting plus those pending
+        depth = 0
+        for stream in self.streams(lane):
+            await self._ensure_group(stream)
+            async with self.connection.pipeline(transaction=False) as pipe:
+                pipe.xlen(stream)
+                pipe.xpending(stream, self.group)
+                length, pending = await pipe.execute()
+            depth += max(0, length - pending["pending"])
+        return depth
+
+    async def _to_delivery(
+            self,
+            lane: str,
+            stream: str,
+            priority: int,
+            message_id: bytes,
+            fields: Dict[bytes, bytes],
+            attempts: int = 1
+    ) -> EventDelivery | None:
+        """ The delivery of a message, or None if it can't be decoded and was moved to the dead letter stream """
+        try:
+            event_type = self.event_types[fields[b"type"].decode()]
+            event = event_type.model_validate_json(fields[b"event"])
+        except (KeyError, ValueError) as e:
+            logger.error(f"Undecodable message {message_id} in {stream}, dead lettered: {e!r}")
+            async with self.connection.pipeline(transaction=True) as pipe:
+                pipe.xadd(self.DEAD_LETTER_STREAM, {**fields, "lane": lane, "error": repr(e)})
+                pipe.xack(stream, self.group, message_id)
+                pipe.xdel(stream, message_id)
+                await pipe.execute()
+            return None
+        delivery_id = message_id.decode()
+        return EventDelivery(
+            event=event,
+            lane=lane,
+            delivery_id=delivery_id,
+            attempts=attempts,
+            priority=priority,
+            # stream ids start with the time added in milliseconds
+            enqueued=int(delivery_id.split("-")[0]) / 1000
+        )
+
+    async def _claim(self, lane: str, stream: str, priority: int) -> EventDelivery | None:
+        response = await self.connection.xautoclaim(
+            name=stream,
+            groupname=self.group,
+            consumername=self.consumer,
+            min_idle_time=self.retry_idle,
+            start_id="0-0",
+            count=1
+        )
+        claimed = response[1]
+        if not claimed:
+            return None
+        message_id, fields = claimed[0]
+        if not fields:
+            # deleted while pending
+            await self.connection.xack(stream, self.group, message_id)
+            return None
+        pending = await self.connection.xpending_range(
+            name=stream, groupname=self.group, min=message_id, max=message_id, count=1
+        )
+        attempts = pending[0]["times_delivered"] if pending else 1
+        delivery = await self._to_delivery(lane, stream, priority, message_id, fields, attempts)
+        if delivery is None:
+            return None
+        if attempts > self.max_deliveries:
+            # every attempt stopped the worker before the delivery could be nacked
+            await self.nack(delivery, RuntimeError(f"Not acknowledged after {attempts - 1} deliveries"))
+            return None
+        handled = await self.connection.smembers(self.handled_key(stream, delivery.delivery_id))
+        delivery.handled = {handler.decode() if isinstance(handler, bytes) else handler for handler in handled}
+        return delivery
+
+    async def _read(self, lane: str, streams: Dict[str, int], block: int | None) -> List[EventDelivery]:
+        response = await self.connection.xreadgroup(
+            groupname=self.group,
+            consumername=self.consumer,
+            streams={stream: ">" for stream in streams},
+            count=1,
+            block=block
+        )
+        deliveries = []
+        for stream, messages in response or []:
+            stream = stream.decode() if isinstance(stream, bytes) else stream
+            for message_id, fields in messages:
+                delivery = await self._to_delivery(lane, stream, streams[stream], message_id, fields)
+                if delivery is not None:
+                    deliveries.append(delivery)
+        return sorted(deliveries, key=lambda delivery: (delivery.priority, delivery.enqueued))
+
+    async def _reclaim(self, delivery: EventDelivery) -> bool:
+        """
+        Whether a buffered delivery is still pending for this consumer, if so its idle time is reset,
+        so it is not claimed for retry by another worker while this one is busy.
+        """
+        stream = self.stream(delivery.lane, delivery.priority)
+        pending = await self.connection.xpending_range(
+            name=stream,
+            groupname=self.group,
+            min=delivery.delivery_id,
+            max=delivery.delivery_id,
+            count=1,
+            consumername=self.consumer
+        )
+        if not pending:
+            # idle for longer than retry_idle and claimed by another worker
+            return False
+        await self.connection.xclaim(
+            name=stream,
+            groupname=self.group,
+            consumername=self.consumer,
+            min_idle_time=0,
+            message_ids=[delivery.delivery_id],
+            justid=True
+        )
+        return True
+
+    async def get(self, lane: str) -> EventDelivery:
+        streams = self.streams(lane)
+        for stream in streams:
+            await self._ensure_group(stream)
+        buffered = self._buffered[lane]
+        while True:
+            while buffered:
+                delivery = buffered.popleft()
+                if await self._reclaim(delivery):
+                    return delivery
+            for stream, priority in streams.items():
+                delivery = await self._claim(lane, stream, priority)
+                if delivery is not None:
+                    logger.info(f"Retrying {type(delivery.event).__name__}, attempt {delivery.attempts}")
+                    return delivery
+            # new events in priority order, without waiting
+            for stream, priority in streams.items():
+                deliveries = await self._read(lane, {stream: priority}, block=None)
+                if deliveries:
+                    return deliveries[0]
+            # then wait for an event at any priority
+            deliveries = await self._read(lane, streams, block=self.poll_block)
+            if deliveries:
+                buffered.extend(deliveries[1:])
+                return deliveries[0]
+
+    async def mark_handled(self, delivery: EventDelivery, handler: str) -> None:
+        await super().mark_handled(delivery, handler)
+        key = self.handled_key(self.stream(delivery.lane, delivery.priority), delivery.delivery_id)
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.sadd(key, handler)
+            pipe.expire(key, self.HANDLED_EXPIRY)
+            await pipe.execute()
+
+    async def ack(self, delivery: EventDelivery) -> None:
+        stream = self.stream(delivery.lane, delivery.priority)
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.xack(stream, self.group, delivery.delivery_id)
+            pipe.xdel(stream, delivery.delivery_id)
+            pipe.delete(self.handled_key(stream, delivery.delivery_id))
+            await pipe.execute()
+
+    async def nack(self, delivery: EventDelivery, error: Exception) -> None:
+        if delivery.attempts < self.max_deliveries:
+            # left pending, to be claimed again once idle
+            logger.warning(f"{type(delivery.event).__name__} failed on attempt {delivery.attempts}: {error}")
+            return
+        logger.error(f"{type(delivery.event).__name__} failed after {delivery.attempts} attempts, dead lettered: {error}")
+        stream = self.stream(delivery.lane, delivery.priority)
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.xadd(self.DEAD_LETTER_STREAM, {
+                "lane": delivery.lane,
+                "type": type(delivery.event).__name__,
+                "event": delivery.event.model_dump_json(),
+                "error": str(error)
+            })
+            pipe.xack(stream, self.group, delivery.delivery_id)
+            pipe.xdel(stream, delivery.delivery_id)
+            pipe.delete(self.handled_key(stream, delivery.delivery_id))
+            await pipe.execute()
+
+    async def close(self) -> None:
+        await self.connection.aclose()
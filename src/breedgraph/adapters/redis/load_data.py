@@ -65,7 +65,9 @@ class RedisLoader:
                     read_teams=[]
                 )
                 async for record in result:
-                    country = LocationOutput(**record['location'])
+                    location = record['location']
+                    location.pop('name_lower', None)
+                    country = LocationOutput(**location)
                     await self.connection.hset(
                         name="country",
                         key=country.code,
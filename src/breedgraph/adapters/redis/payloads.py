@@ -0,0 +1,93 @@
+"""
+Compact encoding for the large payloads held in redis (dataset submissions and analysis configurations).
+
+Lists of dicts, e.g. submitted records, are stored by column, so field names are written once per list
+rather than once per record, and values of the same kind sit together where they compress well.
+The JSON is compressed with zlib and split into chunks, stored in hash fields alongside a header field
+so that no single value grows with the payload.
+The chunks of a payload are read together and decompressed in turn, then the JSON is parsed as a whole.
+"""
+import zlib
+
+from breedgraph.adapters.json_encoding import dumps, loads
+
+from typing import Any, Iterable, List
+
+PAYLOAD_ENCODING = "zlib-columns-1"
+
+COLUMNS = "__columns__"
+LENGTH = "__length__"
+MISSING = "__missing__"
+
+
+def to_columns(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: to_columns(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if len(value) > 1 and all(isinstance(item, dict) for item in value):
+            keys = list(dict.fromkeys(key for item in value for key in item))
+            columns = dict()
+            missing = dict()
+            for key in keys:
+                column = []
+                absent = []
+                for i, item in enumerate(value):
+                    if key in item:
+                        column.append(to_columns(item[key]))
+                    else:
+                        column.append(None)
+                        absent.append(i)
+                columns[key] = column
+                if absent:
+                    missing[key] = absent
+            table = {COLUMNS: columns, LENGTH: len(value)}
+            if missing:
+                table[MISSING] = missing
+            return table
+        return [to_columns(item) for item in value]
+    return value
+
+
+def from_columns(value: Any) -> Any:
+    if isinstance(value, dict):
+        if COLUMNS in value:
+            rows = [dict() for _ in range(value[LENGTH])]
+            missing = value.get(MISSING, {})
+            for key, column in value[COLUMNS].items():
+                absent = set(missing.get(key, ()))
+                for i, item in enumerate(column):
+                    if i not in absent:
+                        rows[i][key] = from_columns(item)
+            return rows
+        return {key: from_columns(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [from_columns(item) for item in value]
+    return value
+
+
+def encode_payload(payload: dict, chunk_size: int) -> List[bytes]:
+    compressed = zlib.compress(dumps(to_columns(payload)))
+    return [compressed[i:i + chunk_size] for i in range(0, len(compressed), chunk_size)]
+
+
+def decode_payload(chunks: Iterable[bytes]) -> dict:
+    decompressor = zlib.decompressobj()
+    parts = [decompressor.decompress(chunk) for chunk in chunks]
+    parts.append(decompressor.flush())
+    return from_columns(loads(b"".join(parts)))
+
+
+def payload_header(chunk_count: int) -> str:
+    return f"{PAYLOAD_ENCODING}:{chunk_count}"
+
+
+def parse_payload_header(header: bytes) -> int | None:
+    """ The number of chunks, or None if the field holds a plain JSON payload (stored before chunking) """
+    encoding, _, chunk_count = header.decode('utf-8').partition(':')
+    if encoding != PAYLOAD_ENCODING:
+        return None
+    return int(chunk_count)
+
+
+def chunk_field(field: str, index: int) -> str:
+    return f"{field}:{index}"
@@ -1,9 +1,15 @@
-import json
+import asyncio
 import redis.asyncio as redis
 
 from breedgraph.service_layer.infrastructure.state_store import AbstractStateStore
+from breedgraph.adapters.json_encoding import dumps, loads
+from breedgraph.adapters.redis.payloads import (
+    encode_payload, decode_payload, payload_header, parse_payload_header, chunk_field
+)
 
-from breedgraph.config import get_redis_host_and_port, LOCAL_STORAGE_DURATION
+from breedgraph.config import (
+    get_redis_host_and_port, LOCAL_STORAGE_DURATION, PAYLOAD_CHUNK_SIZE, PAYLOAD_THREAD_DECODE_SIZE
+)
 
 from breedgraph.domain.model.regions import LocationInput, LocationStored
 from breedgraph.domain.model.errors import ItemError
@@ -12,10 +18,17 @@ from breedgraph.domain.model.submissions import SubmissionStatus, SubmissionKeys
 import logging
 logger = logging.getLogger(__name__)
 
-from typing import AsyncGenerator, List, Self
+from typing import AsyncGenerator, Dict, List, Self
 
 
 class RedisStateStore(AbstractStateStore):
+    """
+    Multi-step writes are queued on a transactional pipeline (MULTI/EXEC) and sent in one round-trip,
+    multi-field reads use HMGET and multi-key reads use a non-transactional pipeline.
+
+    Submission and analysis payloads are stored compressed in chunks (see payloads),
+    the named field holds a header with the number of chunks, stored in the fields "<field>:<index>".
+    """
     def __init__(self, connection: redis.Redis = None):
         self.connection = connection
 
@@ -39,26 +52,140 @@ class RedisStateStore(AbstractStateStore):
     async def get_countries(self) -> AsyncGenerator[LocationInput|LocationStored, None]:
         countries_bytes = await self.connection.hgetall("country")
         for code, country in countries_bytes.items():
-            country_json = json.loads(country)
+            country_json = loads(country)
             if country_json.get('id'):
                 yield LocationStored(**country_json)
             else:
                 yield LocationInput(**country_json)
 
-    async def _set_agent(self, agent_id: int, key: str):
-        await self.connection.hset(
-            name=key,
-            key=SubmissionKeys.AGENT.value,
-            value=str(agent_id)
+    async def _create_entry(self, agent_id: int, key: str, user_index: str, mapping: Dict[str, str]):
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                name=key,
+                mapping={
+                    SubmissionKeys.AGENT.value: str(agent_id),
+                    **mapping,
+                    SubmissionKeys.STATUS.value: SubmissionStatus.PENDING.value
+                }
+            )
+            pipe.sadd(f"user:{agent_id}:{user_index}", key)
+            await pipe.execute()
+
+    @staticmethod
+    async def _payload_mapping(field: str, payload: dict) -> Dict[str, str | bytes]:
+        chunks = await asyncio.to_thread(encode_payload, payload, PAYLOAD_CHUNK_SIZE)
+        mapping: Dict[str, str | bytes] = {field: payload_header(len(chunks))}
+        mapping.update({chunk_field(field, i): chunk for i, chunk in enumerate(chunks)})
+        return mapping
+
+    async def _get_payload(self, key: str, field: str) -> dict | None:
+        header = await self.connection.hget(key, field)
+        if header is None:
+            return None
+        chunk_count = parse_payload_header(header)
+        if chunk_count is None:
+            return loads(header)
+        chunks = await self.connection.hmget(key, [chunk_field(field, i) for i in range(chunk_count)])
+        if any(chunk is None for chunk in chunks):
+            raise ValueError(f"Incomplete payload stored for key: {key}")
+        if sum(len(chunk) for chunk in chunks) > PAYLOAD_THREAD_DECODE_SIZE:
+            return await asyncio.to_thread(decode_payload, chunks)
+        return decode_payload(chunks)
+
+    async def _payload_chunk_fields(self, key: str, fields: List[str]) -> List[str]:
+        """ The chunk fields currently stored for the given payload fields """
+        prefixes = tuple(chunk_field(field, "") for field in fields)
+        return [
+            stored.decode('utf-8') for stored in await self.connection.hkeys(key)
+            if stored.decode('utf-8').startswith(prefixes)
+        ]
+
+    async def _create_submission(self, agent_id: int, submission_id: str, submission: dict):
+        await self._create_entry(
+            agent_id,
+            submission_id,
+            "submissions",
+            await self._payload_mapping(SubmissionKeys.DATA.value, submission)
         )
 
+    async def _create_analysis(self, agent_id: int, analysis_id: str, analysis: dict):
+        await self._create_entry(
+            agent_id,
+            analysis_id,
+            "analyses",
+            await self._payload_mapping(SubmissionKeys.ANALYSIS.value, analysis)
+        )
+
+    async def _create_file(self, agent_id: int, file_id: str, filename: str, reference_id: int | None = None):
+        mapping = {'filename': filename, 'progress': '0'}
+        if reference_id is not None:
+            mapping[SubmissionKeys.FILE_ID.value] = str(reference_id)
+        await self._create_entry(agent_id, file_id, "files", mapping)
+
+    @staticmethod
+    def _decode_int(value: bytes | None) -> int | None:
+        return int(value.decode('utf-8')) if value else None
+
     async def verify_agent(self, agent_id, key: str):
-        agent = await self.connection.hget(key, key="agent")
-        if agent is None:
-            raise ValueError(f"Agent information not found for key: {key}")
-        agent = int(agent.decode('utf-8'))
-        if not agent_id == agent:
-            raise ValueError(f"Requesting user does not match stored agent for this key: {key}")
+        agent = await self.connection.hget(key, key=SubmissionKeys.AGENT.value)
+        self._check_agent(agent_id, key, self._decode_int(agent))
+
+    async def _get_state(self, key: str) -> Dict[str, object]:
+        agent, status, errors, item_errors, dataset_id, file_id, progress = await self.connection.hmget(
+            key,
+            [
+                SubmissionKeys.AGENT.value,
+                SubmissionKeys.STATUS.value,
+                SubmissionKeys.ERRORS.value,
+                SubmissionKeys.ITEM_ERRORS.value,
+                SubmissionKeys.DATASET_ID.value,
+                SubmissionKeys.FILE_ID.value,
+                'progress'
+            ]
+        )
+        return {
+            SubmissionKeys.AGENT.value: self._decode_int(agent),
+            SubmissionKeys.STATUS.value: SubmissionStatus(status.decode('utf-8')) if status else None,
+            SubmissionKeys.ERRORS.value: loads(errors) if errors else [],
+            SubmissionKeys.ITEM_ERRORS.value: [ItemError(**e) for e in loads(item_errors)] if item_errors else [],
+            SubmissionKeys.DATASET_ID.value: self._decode_int(dataset_id),
+            SubmissionKeys.FILE_ID.value: self._decode_int(file_id),
+            'progress': int(progress.decode('utf-8')) if progress else (None if progress is None else 0)
+        }
+
+    async def _set_final_status(
+            self,
+            key: str,
+            status: SubmissionStatus,
+            duration_seconds: int,
+            remove_keys: List[SubmissionKeys] | None = None
+    ):
+        remove_fields = [k.value for k in remove_keys or []]
+        if remove_fields:
+            remove_fields += await self._payload_chunk_fields(key, remove_fields)
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.hset(name=key, key=SubmissionKeys.STATUS.value, value=status.value)
+            if remove_fields:
+                pipe.hdel(key, *remove_fields)
+            pipe.expire(name=key, time=duration_seconds)
+            await pipe.execute()
+
+    async def _keys_exist(self, keys: List[str]) -> List[bool]:
+        if not keys:
+            return []
+        async with self.connection.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.exists(key)
+            return [bool(e) for e in await pipe.execute()]
+
+    async def _get_statuses(self, keys: List[str]) -> List[SubmissionStatus | None]:
+        if not keys:
+            return []
+        async with self.connection.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hget(key, SubmissionKeys.STATUS.value)
+            statuses = await pipe.execute()
+        return [SubmissionStatus(status.decode('utf-8')) if status else None for status in statuses]
 
     async def _set_expiry(self, key: str, duration_seconds: int):
         await self.connection.expire(name=key, time=duration_seconds)
@@ -66,66 +193,41 @@ class RedisStateStore(AbstractStateStore):
     async def _get_ttl(self, key):
         return await self.connection.ttl(key)
 
-    async def _store_user_submission(self, agent_id: int, submission_id: str):
-        await self.connection.sadd(
-            f"user:{agent_id}:submissions",
-            submission_id
-        )
-
-    async def _store_user_analysis(self, agent_id: int, analysis_id: str):
-        await self.connection.sadd(
-            f"user:{agent_id}:analyses",
-            analysis_id
-        )
-
-
-    async def _store_user_file(self, agent_id: int, file_id: str):
-        await self.connection.sadd(
-            f"user:{agent_id}:files",
-            file_id
-        )
-
-    async def _set_submission_data(self, submission_id: str, submission: dict):
-        await self.connection.hset(
-            name=submission_id,
-            key=SubmissionKeys.DATA.value,
-            value=json.dumps(submission, default=str) # the default str makes datetime64 objects strings
-        )
-
     async def _set_analysis_config(self, analysis_id: str, analysis: dict):
-        await self.connection.hset(
-            name=analysis_id,
-            key=SubmissionKeys.ANALYSIS.value,
-            value=json.dumps(analysis, default=str) # the default str makes datetime64 objects strings
-        )
+        mapping = await self._payload_mapping(SubmissionKeys.ANALYSIS.value, analysis)
+        stale = [
+            field for field in await self._payload_chunk_fields(analysis_id, [SubmissionKeys.ANALYSIS.value])
+            if field not in mapping
+        ]
+        async with self.connection.pipeline(transaction=True) as pipe:
+            if stale:
+                pipe.hdel(analysis_id, *stale)
+            pipe.hset(name=analysis_id, mapping=mapping)
+            await pipe.execute()
 
     async def _get_analysis_config(self, analysis_id: str):
-        dataset_json = await self.connection.hget(analysis_id, key=SubmissionKeys.ANALYSIS.value)
-        return json.loads(dataset_json)
+        return await self._get_payload(analysis_id, SubmissionKeys.ANALYSIS.value)
 
     async def _set_analysis_result(self, analysis_id: str, result: dict):
-        await self.connection.hset(
-            name=analysis_id,
-            key=SubmissionKeys.RESULT.value,
-            value=json.dumps(result)
-        )
+        # results, e.g. relationship matrices, may be as large as the submitted payloads
+        mapping = await self._payload_mapping(SubmissionKeys.RESULT.value, result)
+        mapping[SubmissionKeys.STATUS.value] = SubmissionStatus.COMPLETED.value
+        stale = [
+            field for field in await self._payload_chunk_fields(analysis_id, [SubmissionKeys.RESULT.value])
+            if field not in mapping
+        ]
+        async with self.connection.pipeline(transaction=True) as pipe:
+            if stale:
+                pipe.hdel(analysis_id, *stale)
+            pipe.hset(name=analysis_id, mapping=mapping)
+            await pipe.execute()
 
     async def _get_analysis_result(self, analysis_id: str) -> dict | None:
-        result_json = await self.connection.hget(analysis_id, key=SubmissionKeys.RESULT.value)
-        if result_json is None:
-            return None
-        return json.loads(result_json)
-
-    async def _set_filename(self, file_id: str, filename: str):
-        await self.connection.hset(
-            name=file_id,
-            key='filename',
-            value=filename
-        )
+        return await self._get_payload(analysis_id, SubmissionKeys.RESULT.value)
 
-    async def set_file_progress(self, file_id: str, progress: int):
+    async def set_progress(self, key: str, progress: int):
         await self.connection.hset(
-            name=file_id,
+            name=key,
             key='progress',
             value=str(progress)
         )
@@ -144,9 +246,6 @@ class RedisStateStore(AbstractStateStore):
             value=str(dataset_id)
         )
 
-    async def _remove_submission_data(self, submission_id: str):
-        await self.connection.hdel(submission_id, SubmissionKeys.DATA.value)
-
     async def _set_status(self, key: str, status: SubmissionStatus):
         await self.connection.hset(
             name=key,
@@ -158,7 +257,7 @@ class RedisStateStore(AbstractStateStore):
         await self.connection.hset(
             name=key,
             key=SubmissionKeys.ERRORS.value,
-            value=json.dumps(errors)
+            value=dumps(errors)
         )
 
     async def _set_submission_item_errors(self, submission_id: str, item_errors: List[ItemError]):
@@ -166,7 +265,7 @@ class RedisStateStore(AbstractStateStore):
         await self.connection.hset(
             name=submission_id,
             key=SubmissionKeys.ITEM_ERRORS.value,
-            value=json.dumps(serialized_item_errors)
+            value=dumps(serialized_item_errors)
         )
 
     async def _get_user_submissions(self, agent_id: int) -> List[str]:
@@ -174,16 +273,12 @@ class RedisStateStore(AbstractStateStore):
         submission_ids = await self.connection.smembers(user_submissions_key)
         return list(submission_ids)
 
-    async def _submission_exists(self, submission_id: str) -> bool:
-        return await self.connection.exists(submission_id)
-
-    async def _remove_user_submission(self, user_id, submission_id):
+    async def _remove_user_submissions(self, user_id, submission_ids: List[str]):
         user_submissions_key = f"user:{user_id}:submissions"
-        await self.connection.srem(user_submissions_key, submission_id)
+        await self.connection.srem(user_submissions_key, *submission_ids)
 
     async def _get_submission_data(self, submission_id: str):
-        dataset_json = await self.connection.hget(submission_id, key=SubmissionKeys.DATA.value)
-        return json.loads(dataset_json)
+        return await self._get_payload(submission_id, SubmissionKeys.DATA.value)
 
     async def _get_submission_dataset_id(self, submission_id):
         dataset_id = await self.connection.hget(submission_id, key=SubmissionKeys.DATASET_ID.value)
@@ -200,11 +295,11 @@ class RedisStateStore(AbstractStateStore):
 
     async def _get_errors(self, submission_id):
         errors = await self.connection.hget(submission_id, key=SubmissionKeys.ERRORS.value)
-        return json.loads(errors) if errors else []
+        return loads(errors) if errors else []
 
     async def _get_submission_item_errors(self, submission_id):
         errors = await self.connection.hget(submission_id, key=SubmissionKeys.ITEM_ERRORS.value)
-        item_errors = json.loads(errors) if errors else []
+        item_errors = loads(errors) if errors else []
         return [ItemError(**e) for e in item_errors]
 
     async def _get_file_progress(self, file_id: str):
@@ -225,30 +320,36 @@ class RedisStateStore(AbstractStateStore):
             name=file_id,
             key=SubmissionKeys.FILE_ID.value
         )
-        if reference_id is None:
-            return None
-        return int(reference_id.decode('utf-8')) if reference_id else None
+        return self._decode_int(reference_id)
+
+    async def get_file_reference_ids(self, file_ids: List[str]) -> List[int | None]:
+        if not file_ids:
+            return []
+        async with self.connection.pipeline(transaction=False) as pipe:
+            for file_id in file_ids:
+                pipe.hget(file_id, SubmissionKeys.FILE_ID.value)
+            return [self._decode_int(reference_id) for reference_id in await pipe.execute()]
 
     async def _get_errors(self, file_id: str):
         errors = await self.connection.hget(file_id, key=SubmissionKeys.ERRORS.value)
-        return json.loads(errors) if errors else []
+        return loads(errors) if errors else []
 
     async def _get_user_files(self, agent_id) -> List[str]:
         user_files_key = f"user:{agent_id}:files"
         file_ids = await self.connection.smembers(user_files_key)
         return list(file_ids)
 
-    async def _file_exists(self, file_id) -> bool:
-        return await self.connection.exists(file_id)
-
-    async def _remove_user_file(self, agent_id, file_id) -> None:
+    async def _remove_user_files(self, agent_id, file_ids: List[str]) -> None:
         user_files_key = f"user:{agent_id}:files"
-        await self.connection.srem(user_files_key, file_id)
+        await self.connection.srem(user_files_key, *file_ids)
 
     """ Brute force protection state """
 
-    async def _increment_failed_logins(self, attempts_key: str) -> int:
-        attempts = await self.connection.incr(attempts_key)
+    async def _increment_failed_logins(self, attempts_key: str, duration_seconds: int) -> int:
+        async with self.connection.pipeline(transaction=True) as pipe:
+            pipe.incr(attempts_key)
+            pipe.expire(name=attempts_key, time=duration_seconds)
+            attempts, _ = await pipe.execute()
         return attempts
 
     async def _set_locked_out(self, lockout_key: str, duration_seconds: int):
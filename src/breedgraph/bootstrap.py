@@ -1,5 +1,3 @@
-from asyncio import Queue
-
 from breedgraph.service_layer.infrastructure.driver import AbstractAsyncDriver
 from breedgraph.service_layer.infrastructure.unit_of_work import AbstractUnitOfWorkFactory
 from breedgraph.service_layer.queries.views.views import AbstractViewsFactory
@@ -8,13 +6,16 @@ from breedgraph.service_layer.infrastructure import (
     AbstractNotifications,
     AbstractAuthService,
     FileManagementService,
-    AbstractFileArchivalService
+    AbstractFileArchivalService,
+    AbstractEventQueue,
+    InMemoryEventQueue
 )
 
 from breedgraph.adapters.neo4j.driver import Neo4jAsyncDriver
 from breedgraph.adapters.neo4j.unit_of_work import Neo4jUnitOfWorkFactory
 from breedgraph.adapters.neo4j.views import Neo4jViewsFactory
 from breedgraph.adapters.redis.state_store import RedisStateStore
+from breedgraph.adapters.redis.event_queue import RedisEventQueue
 from breedgraph.adapters.aiosmtp import EmailNotifications
 from breedgraph.adapters.its_dangerous import ItsDangerousAuthService
 
@@ -22,6 +23,7 @@ from breedgraph.adapters.its_dangerous import ItsDangerousAuthService
 
 from breedgraph.service_layer.handlers import handlers
 from breedgraph.service_layer.messagebus import MessageBus
+from breedgraph.config import EVENT_QUEUE_BACKEND
 
 
 from typing import Type
@@ -36,18 +38,28 @@ async def bootstrap(
         state_store: Type[AbstractStateStore] = RedisStateStore,
         notifications: Type[AbstractNotifications] = EmailNotifications,
         auth_service: Type[AbstractAuthService] = ItsDangerousAuthService,
-        event_queue: Queue = Queue(),
+        event_queue: AbstractEventQueue | None = None,
         archival_service: Type[AbstractFileArchivalService]|None = None
 ) -> MessageBus:
     logger.debug("Init driver")
     driver = driver()
 
+    logger.debug("Ensure database schema")
+    await driver.ensure_schema()
+
     logger.debug("Init uow factory")
     uow_factory = uow_factory(driver=driver)
 
     logger.debug("Init state store")
     state_store = await state_store.create()
 
+    if event_queue is None:
+        logger.debug(f"Init {EVENT_QUEUE_BACKEND} event queue")
+        if EVENT_QUEUE_BACKEND == 'redis':
+            event_queue = await RedisEventQueue.create()
+        else:
+            event_queue = InMemoryEventQueue()
+
     logger.debug("Init views factory")
     views_factory = views_factory(driver=driver, state_store=state_store)
 
@@ -1,15 +1,35 @@
 from .logging import LOG_CONFIG, ENVIRONMENT, Environment
-from .multiprocessing import N_EVENT_HANDLERS
+from .multiprocessing import N_EVENT_HANDLERS, ID_BLOCK_SIZE, WRITE_BATCH_SIZE
+from .events import (
+    EVENT_QUEUE_BACKEND,
+    DEFAULT_EVENT_LANE,
+    EVENT_LANES,
+    EVENT_LANE_WORKERS,
+    EVENT_CONSUME_LANES,
+    DEFAULT_EVENT_PRIORITY,
+    EVENT_PRIORITIES,
+    EVENT_LANE_DEPTHS,
+    EVENT_MAX_DELIVERIES,
+    EVENT_RETRY_IDLE,
+    EVENT_POLL_BLOCK,
+    METRICS_AUTH_TOKEN,
+    EVENT_METRICS_LOG_INTERVAL
+)
 from .routing import (
     get_bolt_url,
     get_gql_url,
     get_base_url,
     get_vue_url,
     get_download_endpoint,
+    get_export_endpoint,
     get_redis_host_and_port,
     DATABASE_NAME,
     SITE_NAME,
     GQL_API_PATH,
+    GQL_QUERY_CACHE_SIZE,
+    GQL_MAX_QUERY_DEPTH,
+    GQL_MAX_QUERY_COST,
+    GQL_LIST_COST_FACTOR,
     MAIL_HOST,
     MAIL_PORT,
     MAIL_USERNAME,
@@ -33,18 +53,35 @@ from .secrets import (
     CSRF_SALT,
     CSRF_EXPIRES
 )
-from .passwords import get_password_policy
-from .retention import SUBMISSION_RETENTION_DAYS, ANALYSIS_RETENTION_DAYS
+from .passwords import (
+    get_password_policy,
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS,
+    PASSWORD_HASH_QUEUE_LIMIT,
+    MAX_CONCURRENT_LOGIN_ATTEMPTS
+)
+from .retention import (
+    SUBMISSION_RETENTION_DAYS,
+    ANALYSIS_RETENTION_DAYS,
+    PAYLOAD_CHUNK_SIZE,
+    PAYLOAD_THREAD_DECODE_SIZE,
+    RELATIONSHIP_MATRIX_CACHE_SIZE
+)
 from .files import (
     FILE_STORAGE_PATH,
     FILE_DOWNLOAD_EXPIRES,
     FILE_DOWNLOAD_SALT,
+    DATASET_EXPORT_SALT,
     MAX_CONCURRENT_UPLOADS,
+    UPLOAD_CHUNK_SIZE,
+    UPLOAD_QUEUE_DEPTH,
+    UPLOAD_WRITE_BUFFER,
     LOCAL_SIZE_LIMIT,
     LOCAL_STORAGE_DURATION,
+    ACCESS_FLUSH_INTERVAL,
     ARCHIVE_ATTEMPT_LIMIT,
     RETRIEVE_ATTEMPT_LIMIT,
     ARCHIVE_AUTH_TOKEN,
     RETENTION_AUTH_TOKEN
 )
-from .data import COUNTRY_CODES_PATH
\ No newline at end of file
+from .data import COUNTRY_CODES_PATH, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, EXPORT_PAGE_SIZE
\ No newline at end of file
@@ -1,3 +1,8 @@
 import os
 
-COUNTRY_CODES_PATH = os.environ.get("COUNTRY_CODES_PATH", 'country_codes.csv')
\ No newline at end of file
+COUNTRY_CODES_PATH = os.environ.get("COUNTRY_CODES_PATH", 'country_codes.csv')
+# pages of large collections (records, units), the size when not requested and the largest allowed
+DEFAULT_PAGE_SIZE = int(os.environ.get("DEFAULT_PAGE_SIZE", 500))
+MAX_PAGE_SIZE = int(os.environ.get("MAX_PAGE_SIZE", 5000))
+# records read per query when exporting datasets, also the rows per parquet row group
+EXPORT_PAGE_SIZE = int(os.environ.get("EXPORT_PAGE_SIZE", 10000))
\ No newline at end of file
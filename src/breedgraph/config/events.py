@@ -0,0 +1,61 @@
+import os
+
+from .multiprocessing import N_EVENT_HANDLERS
+
+# "memory" keeps events in process, "redis" uses Redis Streams so events survive restarts
+# and can be consumed by separate worker processes
+EVENT_QUEUE_BACKEND = os.environ.get('EVENT_QUEUE_BACKEND', 'memory')
+
+def _parse_mapping(value: str) -> dict[str, str]:
+    return dict(item.strip().split(':', 1) for item in value.split(',') if item.strip())
+
+# events are routed to named lanes, each consumed by its own pool of workers,
+# events not listed here go to the default lane
+DEFAULT_EVENT_LANE = 'default'
+EVENT_LANES = _parse_mapping(os.environ.get(
+    'EVENT_LANES',
+    'DatasetSubmitted:ingest,DatasetUpdateSubmitted:ingest,DatasetRecordsSubmitted:ingest,UnitsImportSubmitted:ingest,'
+    'AnalysisRequested:analysis,RelationshipMatrixRequested:analysis'
+))
+# workers per lane, lanes not listed get a single worker
+EVENT_LANE_WORKERS = {
+    lane: int(workers) for lane, workers in _parse_mapping(os.environ.get(
+        'EVENT_LANE_WORKERS',
+        f'{DEFAULT_EVENT_LANE}:{N_EVENT_HANDLERS},ingest:1,analysis:1'
+    )).items()
+}
+# lanes consumed by this process, e.g. only "default" on the web server with a worker process for the others
+EVENT_CONSUME_LANES = [
+    lane.strip() for lane in os.environ.get(
+        'EVENT_CONSUME_LANES',
+        ','.join(sorted({DEFAULT_EVENT_LANE, *EVENT_LANES.values()}))
+    ).split(',') if lane.strip()
+]
+
+# events are taken from a lane in priority order (lowest first), events not listed get the default priority
+DEFAULT_EVENT_PRIORITY = 10
+EVENT_PRIORITIES = {
+    event: int(priority) for event, priority in _parse_mapping(os.environ.get(
+        'EVENT_PRIORITIES',
+        'UploadCompleted:0,UploadFailed:0,RetrievalSucceeded:0,RetrievalFailed:0'
+    )).items()
+}
+# events waiting in a lane before new events are refused, lanes not listed (or 0) are unlimited
+EVENT_LANE_DEPTHS = {
+    lane: int(depth) for lane, depth in _parse_mapping(os.environ.get(
+        'EVENT_LANE_DEPTHS',
+        'ingest:100,analysis:100'
+    )).items()
+}
+
+# deliveries of a durable event before it is moved to the dead letter stream
+EVENT_MAX_DELIVERIES = int(os.environ.get('EVENT_MAX_DELIVERIES', 3))
+# milliseconds an unacknowledged durable event is left before another worker may claim it for retry
+EVENT_RETRY_IDLE = int(os.environ.get('EVENT_RETRY_IDLE', 60000))
+# milliseconds a worker blocks waiting for new events before checking for events to retry
+EVENT_POLL_BLOCK = int(os.environ.get('EVENT_POLL_BLOCK', 5000))
+
+# bearer token for the /metrics endpoint, it is disabled when not set
+METRICS_AUTH_TOKEN = os.environ.get('METRICS_AUTH_TOKEN')
+# seconds between lane metrics logged by worker processes, 0 to disable
+EVENT_METRICS_LOG_INTERVAL = float(os.environ.get('EVENT_METRICS_LOG_INTERVAL', 300))
@@ -2,14 +2,25 @@ import os
 
 FILE_STORAGE_PATH = os.environ.get('FILE_STORAGE_PATH')
 FILE_DOWNLOAD_SALT = os.environ.get('FILE_DOWNLOAD_SALT', 'file_download_salt')
+DATASET_EXPORT_SALT = os.environ.get('DATASET_EXPORT_SALT', 'dataset_export_salt')
 FILE_DOWNLOAD_EXPIRES = int(os.environ.get('FILE_DOWNLOAD_EXPIRES', 1440))  # minutes
 MAX_CONCURRENT_UPLOADS = int(os.environ.get('MAX_CONCURRENT_UPLOADS', 5))
 
+# bytes read from an upload per chunk
+UPLOAD_CHUNK_SIZE = int(os.environ.get('UPLOAD_CHUNK_SIZE', 1024 * 1024))
+# chunks that may be waiting for the upload worker thread before the upload is paused
+UPLOAD_QUEUE_DEPTH = int(os.environ.get('UPLOAD_QUEUE_DEPTH', 8))
+# bytes buffered by the upload worker thread between writes to disk
+UPLOAD_WRITE_BUFFER = int(os.environ.get('UPLOAD_WRITE_BUFFER', 4 * 1024 * 1024))
+
 # bytes for file size above which local copies of the file will be removed after local storage duration
 LOCAL_SIZE_LIMIT = int(os.environ.get('LOCAL_SIZE_LIMIT', 10000000))
 # days to temporarily keep a file larger than archival file size on the web server
 LOCAL_STORAGE_DURATION = int(os.environ.get('LOCAL_STORAGE_DURATION', 28))
 
+# seconds between batched writes of file last accessed times
+ACCESS_FLUSH_INTERVAL = float(os.environ.get('ACCESS_FLUSH_INTERVAL', 5))
+
 # how many times to attempt to archive a file before failing
 ARCHIVE_ATTEMPT_LIMIT = int(os.environ.get('ARCHIVE_ATTEMPT_LIMIT', 5))
 # how many times to attempt to retrieve an archived a file before failing
@@ -1 +1,7 @@
+import os
+
 N_EVENT_HANDLERS = 3
+# IDs reserved per counter in a single transaction, then handed out from memory
+ID_BLOCK_SIZE = int(os.environ.get('ID_BLOCK_SIZE', 100))
+# rows written per UNWIND query in bulk writes, e.g. unit imports
+WRITE_BATCH_SIZE = int(os.environ.get('WRITE_BATCH_SIZE', 1000))
@@ -10,3 +10,12 @@ def get_password_policy() -> PasswordPolicy:
         special=os.environ.get('PASSWORD_MIN_SPECIAL', 1)
     )
 
+
+# bcrypt work factor for new hashes, existing hashes keep the cost they were created with
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+# threads dedicated to hashing, bcrypt releases the GIL so these run in parallel
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 2))
+# hashing requests allowed to wait for a worker before new requests are rejected
+PASSWORD_HASH_QUEUE_LIMIT = int(os.environ.get('PASSWORD_HASH_QUEUE_LIMIT', 32))
+# concurrent login attempts allowed per identifier
+MAX_CONCURRENT_LOGIN_ATTEMPTS = int(os.environ.get('MAX_CONCURRENT_LOGIN_ATTEMPTS', 1))
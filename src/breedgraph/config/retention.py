@@ -3,3 +3,11 @@ import os
 SUBMISSION_RETENTION_DAYS = int(os.environ.get('SUBMISSION_RETENTION_DAYS', 7))
 ANALYSIS_RETENTION_DAYS = int(os.environ.get('ANALYSIS_RETENTION_DAYS', 7))
 
+
+# submission and analysis payloads held in the state store are compressed then split into chunks of this many bytes
+PAYLOAD_CHUNK_SIZE = int(os.environ.get('PAYLOAD_CHUNK_SIZE', 1024 * 1024))
+# payloads larger than this many (compressed) bytes are decoded in a thread, off the event loop
+PAYLOAD_THREAD_DECODE_SIZE = int(os.environ.get('PAYLOAD_THREAD_DECODE_SIZE', 64 * 1024))
+
+# relationship matrix results kept by the analysis workers, reused while the pedigree is unchanged
+RELATIONSHIP_MATRIX_CACHE_SIZE = int(os.environ.get('RELATIONSHIP_MATRIX_CACHE_SIZE', 8))
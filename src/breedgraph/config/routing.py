@@ -10,6 +10,13 @@ SITE_NAME = os.environ.get("SITE_NAME", 'BreedGraph')
 HOST_ADDRESS = os.environ.get("HOST_ADDRESS", 'localhost')
 HOST_PORT = os.environ.get("HOST_PORT", 8000)
 GQL_API_PATH = os.environ.get("GRAPHQL_API_PATH", 'graphql')
+# parsed and validated GraphQL operations kept by each worker, also the store for persisted queries
+GQL_QUERY_CACHE_SIZE = int(os.environ.get("GRAPHQL_QUERY_CACHE_SIZE", 500))
+# operations are rejected beyond this depth or estimated cost, each field costs 1 and fields within lists count this many times
+GQL_MAX_QUERY_DEPTH = int(os.environ.get("GRAPHQL_MAX_QUERY_DEPTH", 16))
+# selecting every field of any query to three levels costs at most about 2,000, the widest types cost 30,000 to 70,000 at four
+GQL_MAX_QUERY_COST = int(os.environ.get("GRAPHQL_MAX_QUERY_COST", 50000))
+GQL_LIST_COST_FACTOR = int(os.environ.get("GRAPHQL_LIST_COST_FACTOR", 10))
 VUE_PORT = os.environ.get("VUE_PORT", 8080)
 
 MAIL_HOST = os.environ.get('MAIL_HOST')
@@ -37,6 +44,12 @@ def get_download_endpoint():
     else:
         return f'{PROTOCOL}://{HOST_ADDRESS}/download?token='
 
+def get_export_endpoint():
+    if not HOST_PORT in [80, 443]:
+        return f'{PROTOCOL}://{HOST_ADDRESS}:{HOST_PORT}/export?token='
+    else:
+        return f'{PROTOCOL}://{HOST_ADDRESS}/export?token='
+
 DATABASE_NAME = os.environ.get("DATABASE_NAME")  # currently only a single database available
 def get_bolt_url():
     host = os.environ.get('DB_HOST', 'localhost')
@@ -30,3 +30,7 @@ class ExistingUniqueRelationship(IllegalOperationError):
 class InconsistentStateError(IllegalOperationError):
     """Raised when the system detects an inconsistent state that prevents safe operation completion."""
     pass
+
+class ServiceBusyError(Exception):
+    """Raised when a bounded resource is saturated and the request should be retried later."""
+    pass
@@ -2,4 +2,8 @@ from .base import Command
 
 class RequestAnalysis(Command):
     agent_id: int
-    analysis_id: str
\ No newline at end of file
+    analysis_id: str
+
+class RequestRelationshipMatrix(Command):
+    agent_id: int
+    analysis_id: str
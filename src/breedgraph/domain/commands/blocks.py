@@ -84,3 +84,10 @@ class RemovePosition(Command):
     start: PyDT64|None = None
     end: PyDT64|None = None
 
+
+class ImportUnits(Command):
+    agent_id: int
+    write_team: int | None = None
+    release: ReadRelease = ReadRelease.PRIVATE
+
+    submission_id: str
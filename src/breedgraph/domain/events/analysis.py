@@ -2,4 +2,8 @@ from .base import Event
 
 class AnalysisRequested(Event):
     agent_id: int
-    analysis_id: str
\ No newline at end of file
+    analysis_id: str
+
+class RelationshipMatrixRequested(Event):
+    agent_id: int
+    analysis_id: str
@@ -0,0 +1,10 @@
+from .base import Event
+from breedgraph.domain.model.controls import ReadRelease
+
+
+class UnitsImportSubmitted(Event):
+    agent_id: int
+    write_team: int | None = None
+    release: ReadRelease = ReadRelease.PRIVATE
+
+    submission_id: str
@@ -0,0 +1,10 @@
+from typing import List, Tuple
+
+from .base import Event
+
+
+class GermplasmRelationshipsChanged(Event):
+    """ Relationships (source_id, sink_id) were added or removed, moving the stored pedigree to version """
+    version: int
+    added: List[Tuple[int, int]] = []
+    removed: List[Tuple[int, int]] = []
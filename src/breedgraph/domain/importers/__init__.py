@@ -14,4 +14,5 @@ coercion is insufficient (e.g. datasets containing nested records).
 
 """
 from .dataset import DatasetImport, DatasetUpdateImport, RecordImport
-from .analysis import AnalysisImport, AnalysisVariableImport, InteractionTermImport
\ No newline at end of file
+from .analysis import AnalysisImport, AnalysisVariableImport, InteractionTermImport, RelationshipMatrixImport
+from .blocks import UnitImport, read_unit_rows
@@ -19,3 +19,9 @@ class AnalysisImport(BaseModel):
     independent_variables: list[AnalysisVariableImport] = Field(default_factory=list)
     interaction_terms: list[InteractionTermImport] = Field(default_factory=list)
     timepoint_boundaries: list[PyDT64] = Field(default_factory=list)
+
+class RelationshipMatrixImport(BaseModel):
+    name: str | None = None
+    germplasm_ids: list[int] = Field(default_factory=list)
+    # relationships at or below this value are left out of the (sparse) result
+    min_relationship: float = 0.0
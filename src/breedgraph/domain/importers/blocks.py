@@ -0,0 +1,112 @@
+import csv
+import io
+import json
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic.alias_generators import to_camel
+
+from breedgraph.domain.model.blocks import UnitInput, Position
+from breedgraph.domain.model.time_descriptors import PyDT64
+
+# separates values within a cell of an imported table, e.g. parent refs "plot-1;plot-2"
+LIST_SEPARATOR = ';'
+
+
+class UnitImport(BaseModel):
+    """
+    A unit to import, parents are stored units (parent_ids) or other units in the same import (parent_refs).
+    As for single units, a unit without parents starts a new block and must have a position.
+    Fields are read by name or camelCase alias, e.g. subject_id or subjectId.
+    """
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    ref: str | None = None
+
+    subject_id: int
+    germplasm_id: int | None = None
+    name: str | None = None
+    description: str | None = None
+
+    parent_ids: list[int] = Field(default_factory=list)
+    parent_refs: list[str] = Field(default_factory=list)
+
+    location_id: int | None = None
+    layout_id: int | None = None
+    coordinates: list[str | int | float] | None = None
+    start: PyDT64 | None = None
+    end: PyDT64 | None = None
+
+    @model_validator(mode='before')
+    @classmethod
+    def _empty_as_none(cls, data):
+        # empty cells in a table are missing values
+        if isinstance(data, dict):
+            return {key: None if value == '' else value for key, value in data.items()}
+        return data
+
+    @field_validator('parent_ids', 'parent_refs', mode='before')
+    @classmethod
+    def _split_list(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+        if isinstance(value, (int, float)):
+            return [value]
+        return value
+
+    @field_validator('coordinates', mode='before')
+    @classmethod
+    def _split_coordinates(cls, value):
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(LIST_SEPARATOR)]
+        return value
+
+    @model_validator(mode='after')
+    def _has_location_if_not_parent(self):
+        if not (self.parent_ids or self.parent_refs) and self.location_id is None:
+            raise ValueError("Units without parents start a new block and must have a position")
+        return self
+
+    @property
+    def has_parents(self) -> bool:
+        return bool(self.parent_ids or self.parent_refs)
+
+    def to_position(self) -> Position | None:
+        if self.location_id is None:
+            return None
+        return Position(
+            location_id=self.location_id,
+            layout_id=self.layout_id,
+            coordinates=self.coordinates,
+            start=self.start,
+            end=self.end
+        )
+
+    def to_unit_input(self) -> UnitInput:
+        position = self.to_position()
+        return UnitInput(
+            subject=self.subject_id,
+            germplasm=self.germplasm_id,
+            name=self.name,
+            description=self.description,
+            positions=[position] if position is not None else []
+        )
+
+
+def read_unit_rows(content: str, file_format: str) -> list[dict]:
+    """
+    Rows of a unit import file, either CSV with a header row of UnitImport field names or aliases
+    (list values separated by LIST_SEPARATOR) or JSON, a list of objects or an object with a "units" list.
+    """
+    if file_format == 'json':
+        data = json.loads(content)
+        if isinstance(data, dict):
+            data = data.get('units', [])
+        if not isinstance(data, list):
+            raise ValueError("JSON unit imports must be a list of units")
+        return data
+    elif file_format == 'csv':
+        return list(csv.DictReader(io.StringIO(content)))
+    else:
+        raise ValueError(f"Unsupported unit import format: {file_format}")
@@ -33,8 +33,13 @@ class FileArchivalRecord:
 
     This is a service-layer concern separate from the domain model.
     It tracks infrastructure state for file archival operations.
+
+    Records are kept per stored blob rather than per upload,
+    so identical uploads are stored and archived only once.
+    The upload UUIDs (reference file_id values) that point at the blob are listed in file_ids,
+    when none remain the blob is removed locally and from the archive.
     """
-    file_id: str  # UUID used as filename in file storage, unique identifier
+    file_id: str  # blob ID used as filename in file storage (content hash, or UUID for legacy records)
     file_size: int  # size in bytes
     file_hash: str  # SHA256 hash for integrity verification
     last_accessed: datetime  # when this file was last accessed (for pruning of local files)
@@ -48,6 +53,9 @@ class FileArchivalRecord:
     attempts: int = 0
     last_attempt_at: Optional[datetime] = None
 
+    # Upload UUIDs that reference this blob
+    file_ids: List[str] = field(default_factory=list)
+
 
 @dataclass
 class FileArchivalUpdate:
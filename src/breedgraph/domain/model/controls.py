@@ -72,7 +72,8 @@ class Control:
     # currently the release is just set by the "minimum" current release level,
     # but we could alternatively set the release behaviour according to the most recent release set
     #
-    time: datetime64 = datetime64('now')
+    # time and audit are only loaded with the controller details, access checks need only the release
+    time: datetime64 | None = None
     audit: List[ControlAuditEntry] = field(default_factory=list)
 
     def model_dump(self):
@@ -86,6 +87,10 @@ class DiscoveryMatch:
 
 @dataclass
 class Controller:
+    """
+    The controlling teams with their current release, which is all that access checks and redaction require.
+    Control times, the audit of release changes and write stamps are only populated when loaded with details.
+    """
     controls: Dict[int, Control] = field(default_factory=dict) # key should be team_id
     writes: List[WriteStamp] = field(default_factory=list)  # timestamps of writes to DB
 
@@ -0,0 +1,150 @@
+import numpy as np
+
+from breedgraph.domain.model.germplasm import GermplasmRelationship, GermplasmSourceType
+
+from typing import Dict, Iterable, List, Tuple
+import logging
+logger = logging.getLogger(__name__)
+
+# marks an unknown parent, which takes a row and column of zeros after the last entry in the matrix
+UNKNOWN = -1
+
+
+class RelationshipMatrixService:
+    """
+    Additive (numerator) relationship matrix from the germplasm pedigree, by the tabular method.
+
+    Parents are taken from source relationships:
+      - MATERNAL is the dam and PATERNAL the sire of a controlled cross (the same source for a self-fertilisation),
+      - SEED, without a MATERNAL source, is the dam with an unknown sire (e.g. open pollination),
+      - TISSUE makes the entry a clone of its source, with the same relationships,
+      - UNKNOWN relationships are not considered (e.g. to the crop or species).
+    Entries without known parents are taken as unrelated, non-inbred founders.
+
+    Entries are grouped into generations, each after the generations of its parents.
+    The rows of a generation depend only on earlier rows, so a whole generation is computed at once:
+        a(i, j) = (a(dam_i, j) + a(sire_i, j)) / 2 for earlier j, or a(source_i, j) for a clone,
+        a(i, i) = 1 + a(dam_i, sire_i) / 2, or a(source_i, source_i) for a clone.
+    The inbreeding coefficient is a(i, i) - 1 and the coancestry (kinship) of i and j is a(i, j) / 2.
+    """
+
+    def __init__(self, entry_ids: List[int], relationships: Iterable[GermplasmRelationship]):
+        self.entry_ids = list(dict.fromkeys(entry_ids))
+        self.parents = self._get_parents(relationships)
+        self.ids, self.generation_starts = self._order()
+        self.positions = {entry_id: i for i, entry_id in enumerate(self.ids)}
+        self.matrix: np.ndarray | None = None
+
+    @staticmethod
+    def _get_parents(relationships: Iterable[GermplasmRelationship]) -> Dict[int, Tuple[int, int, int]]:
+        """ (dam, sire, clone source) by entry ID, with UNKNOWN where not known """
+        sources: Dict[int, Dict[GermplasmSourceType, List[int]]] = dict()
+        for rel in relationships:
+            sources.setdefault(rel.sink_id, dict()).setdefault(rel.source_type, []).append(rel.source_id)
+
+        parents = dict()
+        for sink_id, by_type in sources.items():
+            for source_type, source_ids in by_type.items():
+                if source_type is not GermplasmSourceType.UNKNOWN and len(source_ids) > 1:
+                    raise ValueError(f"Germplasm {sink_id} has more than one {source_type.value} source")
+            clone = by_type.get(GermplasmSourceType.TISSUE, [UNKNOWN])[0]
+            if clone != UNKNOWN:
+                parents[sink_id] = (UNKNOWN, UNKNOWN, clone)
+                continue
+            dam = by_type.get(GermplasmSourceType.MATERNAL, by_type.get(GermplasmSourceType.SEED, [UNKNOWN]))[0]
+            sire = by_type.get(GermplasmSourceType.PATERNAL, [UNKNOWN])[0]
+            if dam != UNKNOWN or sire != UNKNOWN:
+                parents[sink_id] = (dam, sire, UNKNOWN)
+        return parents
+
+    def _order(self) -> Tuple[List[int], List[int]]:
+        """ The requested entries and their ancestors ordered by generation, and the position each generation starts at """
+        ids = set(self.entry_ids)
+        pending = list(ids)
+        children: Dict[int, List[int]] = dict()
+        while pending:
+            entry_id = pending.pop()
+            for parent_id in set(self.parents.get(entry_id, ())) - {UNKNOWN}:
+                children.setdefault(parent_id, []).append(entry_id)
+                if parent_id not in ids:
+                    ids.add(parent_id)
+                    pending.append(parent_id)
+
+        # each generation follows the latest generation of its parents
+        parent_counts = {entry_id: len(set(self.parents.get(entry_id, ())) - {UNKNOWN}) for entry_id in ids}
+        generations = {entry_id: 0 for entry_id, count in parent_counts.items() if count == 0}
+        ready = list(generations)
+        while ready:
+            parent_id = ready.pop()
+            for entry_id in children.get(parent_id, ()):
+                generations[entry_id] = max(generations.get(entry_id, 0), generations[parent_id] + 1)
+                parent_counts[entry_id] -= 1
+                if parent_counts[entry_id] == 0:
+                    ready.append(entry_id)
+        if len(generations) < len(ids):
+            raise ValueError(f"The pedigree contains a cycle among germplasm {sorted(ids - set(generations))}")
+
+        ordered = sorted(ids, key=lambda entry_id: (generations[entry_id], entry_id))
+        counts = np.bincount([generations[entry_id] for entry_id in ordered])
+        starts = np.concatenate([[0], np.cumsum(counts)]).tolist()
+        return ordered, starts
+
+    def build_matrix(self) -> np.ndarray:
+        size = len(self.ids)
+        unknown = size
+        matrix = np.zeros((size + 1, size + 1))
+        dams = np.full(size, unknown)
+        sires = np.full(size, unknown)
+        clones = np.full(size, unknown)
+        for entry_id, (dam, sire, clone) in self.parents.items():
+            if entry_id not in self.positions:
+                continue
+            i = self.positions[entry_id]
+            if dam != UNKNOWN:
+                dams[i] = self.positions[dam]
+            if sire != UNKNOWN:
+                sires[i] = self.positions[sire]
+            if clone != UNKNOWN:
+                clones[i] = self.positions[clone]
+
+        for start, end in zip(self.generation_starts[:-1], self.generation_starts[1:]):
+            is_clone = clones[start:end] != unknown
+            dam, sire, clone = dams[start:end], sires[start:end], clones[start:end]
+            # relationships to earlier generations
+            earlier = np.where(
+                is_clone[:, None],
+                matrix[clone, :start],
+                (matrix[dam, :start] + matrix[sire, :start]) / 2
+            )
+            matrix[start:end, :start] = earlier
+            matrix[:start, start:end] = earlier.T
+            # relationships within the generation, from the relationships of each entry to the parents of the others
+            block = matrix[start:end]
+            within = np.where(is_clone[None, :], block[:, clone], (block[:, dam] + block[:, sire]) / 2)
+            within = (within + within.T) / 2
+            np.fill_diagonal(within, np.where(is_clone, matrix[clone, clone], 1 + matrix[dam, sire] / 2))
+            matrix[start:end, start:end] = within
+
+        self.matrix = matrix[:size, :size]
+        return self.matrix
+
+    def get_result(self, min_value: float = 0.0) -> dict:
+        """
+        Inbreeding coefficients and the relationships among the requested entries.
+        Relationships are sparse, coordinates (row, column with row < column) in germplasm_ids,
+        and values of the additive relationship, where greater than min_value.
+        """
+        if self.matrix is None:
+            self.build_matrix()
+        requested = [self.positions[entry_id] for entry_id in self.entry_ids]
+        matrix = self.matrix[np.ix_(requested, requested)]
+        rows, columns = np.triu_indices(len(requested), k=1)
+        values = matrix[rows, columns]
+        kept = values > min_value
+        return {
+            'germplasm_ids': self.entry_ids,
+            'inbreeding': (np.diagonal(matrix) - 1).tolist(),
+            'rows': rows[kept].tolist(),
+            'columns': columns[kept].tolist(),
+            'values': values[kept].tolist()
+        }
@@ -3,18 +3,23 @@ from contextlib import asynccontextmanager
 
 from breedgraph.adapters.neo4j.services import Neo4jFileArchivalService
 from breedgraph.entrypoints.fastapi.middleware import setup_middlewares
+from breedgraph.entrypoints.fastapi.responses import EncodedJSONResponse
 
 from breedgraph.entrypoints.fastapi.redirect import router as redirect_router
 from breedgraph.entrypoints.fastapi.security import router as security_router
 from breedgraph.entrypoints.fastapi.downloads import router as download_router
 from breedgraph.entrypoints.fastapi.archive import router as archive_router
 from breedgraph.entrypoints.fastapi.retention import router as retention_router
+from breedgraph.entrypoints.fastapi.metrics import router as metrics_router
 
 from breedgraph.entrypoints.fastapi.graphql_endpoint import router as graphql_router
 from breedgraph.entrypoints.fastapi.graphql.schema import create_graphql_schema
+from breedgraph.entrypoints.fastapi.graphql.query_cache import QueryCache
 
 from breedgraph import bootstrap
+from breedgraph.config import GQL_QUERY_CACHE_SIZE
 from breedgraph.service_layer.infrastructure.brute_force_protection import BruteForceProtectionService
+from breedgraph.service_layer.infrastructure.password_hashing import PasswordHashingService
 
 from breedgraph.service_layer.messagebus import MessageBus
 
@@ -34,31 +39,40 @@ async def lifespan(fast_api_app: FastAPI):
     logger.info("Starting event processors")
     await bus.start()  # start event process workers
 
+    logger.debug("Load password hashing service")
+    password_hasher = PasswordHashingService()
+    fast_api_app.password_hasher = password_hasher
+
     logger.debug("Load brute force protection service")
-    brute_force_service = BruteForceProtectionService(state_store=bus.state_store)
+    brute_force_service = BruteForceProtectionService(state_store=bus.state_store, password_hasher=password_hasher)
     fast_api_app.brute_force_service = brute_force_service
 
     logger.debug("Load graphql schema")
     graphql_schema = create_graphql_schema()
     fast_api_app.graphql_schema = graphql_schema
+    fast_api_app.graphql_query_cache = QueryCache(GQL_QUERY_CACHE_SIZE)
 
     yield
 
     logger.info("Start shutting down")
+    password_hasher.shutdown()
     if bus is not None:
+        # stop event processors first, pending events and access records still need the connections
+        logger.info("Stopping event processors")
+        await bus.stop()
         if hasattr(bus.uow_factory, "driver"):
             logger.info("Closing driver")
             await bus.uow_factory.driver.close()
+        logger.info("Closing event queue")
+        await bus.event_queue.close()
         if hasattr(bus.state_store, "connection"):
             logger.info("Closing state_store connection pool")
             await bus.state_store.connection.aclose()
-        logger.info("Stopping event processors")
-        await bus.stop()
     logger.info("Finished shutting down")
 
 
 logger.debug("Start FastAPI app")
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=EncodedJSONResponse)
 
 setup_middlewares(app)
 
@@ -72,5 +86,7 @@ app.include_router(download_router)
 app.include_router(archive_router)
 # Cron job to trigger file cleanup
 app.include_router(retention_router)
+# Event lane monitoring
+app.include_router(metrics_router)
 
 logger.debug('Started')
\ No newline at end of file
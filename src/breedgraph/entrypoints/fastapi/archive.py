@@ -1,4 +1,3 @@
-from pathlib import Path
 import aiofiles
 
 from fastapi import APIRouter, HTTPException, Request, Header, Depends
@@ -6,7 +5,7 @@ from fastapi.responses import Response, FileResponse
 
 from breedgraph.domain.model.archive import FileArchivalUpdate, ArchiveState
 
-from breedgraph.config import ARCHIVE_AUTH_TOKEN, FILE_STORAGE_PATH
+from breedgraph.config import ARCHIVE_AUTH_TOKEN
 
 import logging
 logger = logging.getLogger(__name__)
@@ -107,6 +106,9 @@ async def update_archive(file_id: str, update: FileArchivalUpdate, request: Requ
             file_id=file_id,
             archive_state=update.archive_state
         )
+        if archive_record is None:
+            # record removed after deletion from the archive
+            return {"file_id": file_id}
 
         return {
             "file_id": archive_record.file_id,
@@ -119,8 +121,8 @@ async def update_archive(file_id: str, update: FileArchivalUpdate, request: Requ
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @router.get("/download/{file_id}")
-async def download_file_to_archive(file_id: str):
-    file_path = Path(FILE_STORAGE_PATH, file_id)
+async def download_file_to_archive(file_id: str, request: Request):
+    file_path = request.app.bus.file_management.get_path(file_id)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
     return FileResponse(
@@ -130,12 +132,15 @@ async def download_file_to_archive(file_id: str):
 
 @router.put("/upload/{file_id}")
 async def upload_file_to_restore(file_id: str, request: Request):
-    destination = Path(FILE_STORAGE_PATH, file_id)
+    store = request.app.bus.file_management.store
+    # write to a temporary path so a blob that is already present (e.g. re-uploaded meanwhile) is never truncated
+    destination = store.restore_path(file_id)
 
     try:
         async with aiofiles.open(destination, "wb") as f:
             async for chunk in request.stream():
                 await f.write(chunk)
+        store.replace(destination, file_id)
 
         return {"file_id": file_id}
 
@@ -1,13 +1,16 @@
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import StreamingResponse
 
-from pathlib import Path
-from itsdangerous import URLSafeTimedSerializer, SignatureExpired
+from itsdangerous import URLSafeTimedSerializer, SignatureExpired, BadSignature
 
+from breedgraph.custom_exceptions import NoResultFoundError
+from breedgraph.entrypoints.fastapi.responses import BlobFileResponse
+from breedgraph.entrypoints.fastapi.exports import get_export_writer, stream_export
+from breedgraph.service_layer.queries.read_models import ExportFormat
 from breedgraph.config import (
-    FILE_STORAGE_PATH,
     SECRET_KEY,
     FILE_DOWNLOAD_SALT,
+    DATASET_EXPORT_SALT,
     FILE_DOWNLOAD_EXPIRES
 )
 
@@ -16,34 +19,78 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.get("/download")
-async def download_file(token: str, request: Request):
+
+def load_token(token: str, salt: str, kind: str, required: tuple[str, ...]) -> dict:
+    """
+    The details signed into a download or export token, with any of the required keys set.
+    Expired, tampered and incomplete tokens are refused with 401.
+    """
     ts = URLSafeTimedSerializer(SECRET_KEY)
     try:
-        file_details = ts.loads(token, salt=FILE_DOWNLOAD_SALT, max_age=FILE_DOWNLOAD_EXPIRES * 60)
-        uuid = file_details.get('uuid')
-        if not uuid:
-            raise HTTPException(status_code=401, detail="Invalid download token")
+        details = ts.loads(token, salt=salt, max_age=FILE_DOWNLOAD_EXPIRES * 60)
+    except SignatureExpired as e:
+        logger.debug(f"Attempt to use expired {kind} token, signed: {e.date_signed}")
+        raise HTTPException(status_code=401, detail=f"{kind.capitalize()} token has expired")
+    except BadSignature:
+        raise HTTPException(status_code=401, detail=f"Invalid {kind} token")
+    if not isinstance(details, dict) or not any(details.get(key) for key in required):
+        raise HTTPException(status_code=401, detail=f"Invalid {kind} token")
+    return details
+
 
-        file_path = Path(FILE_STORAGE_PATH, uuid)
+@router.get("/download")
+async def download_file(token: str, request: Request):
+    file_details = load_token(token, FILE_DOWNLOAD_SALT, "download", required=('uuid',))
+    uuid = file_details['uuid']
 
-        if not file_path.exists():
+    bus = request.app.bus
+    # files are stored by content, tokens issued before content addressing only carry the uuid
+    # so the blob is found through the archival record for the file
+    blob_id = file_details.get('blob')
+    file_hash = blob_id
+    if not blob_id:
+        try:
+            record = await bus.archival_service.get_for_file(uuid)
+        except NoResultFoundError:
             raise HTTPException(status_code=404, detail="File not found")
+        blob_id, file_hash = record.file_id, record.file_hash
 
-        # update the archival service last accessed attribute:
-        bus = request.app.bus
-        archival_service = bus.archival_service
-        await archival_service.mark_accessed(file_id=uuid)
-        
-        filename = file_details.get('filename')
-        content_type = file_details.get('contentType')
-        return FileResponse(
-            file_path,
-            media_type=content_type,
-            filename=filename
-        )
+    file_path = bus.file_management.get_path(blob_id)
+    if not file_path.exists():
+        raise HTTPException(status_code=404, detail="File not found")
 
-    except SignatureExpired as e:
-        logger.debug(f"Attempt to use expired token, signed: {e.date_signed}")
-        raise HTTPException(status_code=401, detail="Download token has expired")
+    # recorded in memory and written in batches by the archival service
+    bus.archival_service.mark_accessed(file_id=blob_id)
+
+    return BlobFileResponse(
+        file_path,
+        file_hash=file_hash,
+        media_type=file_details.get('contentType'),
+        filename=file_details.get('filename')
+    )
+
+@router.get("/export")
+async def export_datasets(token: str, request: Request):
+    """
+    Stream the records of datasets, by ID and/or study, as CSV or Parquet.
+    Tokens are issued by the datasetsExport query, the export includes only what the requesting user may read.
+    """
+    export_details = load_token(token, DATASET_EXPORT_SALT, "export", required=('dataset_ids', 'study_ids'))
+    dataset_ids = export_details.get('dataset_ids')
+    study_ids = export_details.get('study_ids')
+
+    writer = get_export_writer(ExportFormat(export_details.get('format', ExportFormat.CSV.value)))
+    bus = request.app.bus
+
+    async def yield_pages():
+        # the views session is held open while the export is streamed
+        async with bus.views_factory.get_views(user_id=export_details.get('user_id')) as views:
+            async for rows in views.datasets.yield_export_rows(dataset_ids=dataset_ids, study_ids=study_ids):
+                yield rows
 
+    filename = f"{export_details.get('filename', 'datasets')}.{writer.extension}"
+    return StreamingResponse(
+        stream_export(yield_pages(), writer),
+        media_type=writer.media_type,
+        headers={"content-disposition": f'attachment; filename="{filename}"'}
+    )
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Streaming dataset exports.
+
+Rows (see EXPORT_COLUMNS) arrive in pages from the datasets view and each page is encoded as it arrives,
+as CSV lines or as a Parquet row group, so an export is never held in memory as a whole.
+"""
+import asyncio
+import csv
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from breedgraph.service_layer.queries.read_models import ExportFormat, EXPORT_COLUMNS
+
+from typing import Any, AsyncIterator, List
+
+import logging
+logger = logging.getLogger(__name__)
+
+# start and end are kept as text, they are stored with the precision they were recorded at (e.g. a year)
+PARQUET_SCHEMA = pa.schema([
+    ('dataset_id', pa.int64()),
+    ('concept_id', pa.int64()),
+    ('record_id', pa.int64()),
+    ('unit_id', pa.int64()),
+    ('unit_name', pa.string()),
+    ('subject_id', pa.int64()),
+    ('germplasm_id', pa.int64()),
+    ('germplasm_name', pa.string()),
+    ('location_id', pa.int64()),
+    ('location_name', pa.string()),
+    ('layout_id', pa.int64()),
+    ('start', pa.string()),
+    ('end', pa.string()),
+    ('value', pa.string()),
+    ('submitted', pa.timestamp('us', tz='UTC')),
+    ('reference_ids', pa.list_(pa.int64()))
+])
+
+
+def _time_str(value: np.datetime64 | datetime | None) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class ExportWriter(ABC):
+    media_type: str
+    extension: str
+
+    @abstractmethod
+    def write(self, rows: List[dict]) -> bytes:
+        """ The encoded rows """
+        ...
+
+    @abstractmethod
+    def close(self) -> bytes:
+        """ Anything left to send after the last rows """
+        ...
+
+
+class CsvExportWriter(ExportWriter):
+    media_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow(EXPORT_COLUMNS)
+
+    @staticmethod
+    def _cell(column: str, value: Any) -> Any:
+        if value is None:
+            return ''
+        if column == 'reference_ids':
+            return ';'.join(str(i) for i in value)
+        if column in ('start', 'end', 'submitted'):
+            return _time_str(value)
+        return value
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode('utf-8')
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def write(self, rows: List[dict]) -> bytes:
+        self._writer.writerows([self._cell(column, row.get(column)) for column in EXPORT_COLUMNS] for row in rows)
+        return self._drain()
+
+    def close(self) -> bytes:
+        return self._drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """ A write-only file that holds what was written until drained, the position counts all bytes written """
+
+    def __init__(self):
+        super().__init__()
+        self._parts: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+class ParquetExportWriter(ExportWriter):
+    media_type = 'application/vnd.apache.parquet'
+    extension = 'parquet'
+
+    def __init__(self):
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, PARQUET_SCHEMA)
+
+    @staticmethod
+    def _row(row: dict) -> dict:
+        row = {column: row.get(column) for column in EXPORT_COLUMNS}
+        row['start'] = _time_str(row['start'])
+        row['end'] = _time_str(row['end'])
+        if row['value'] is not None:
+            row['value'] = str(row['value'])
+        return row
+
+    def write(self, rows: List[dict]) -> bytes:
+        # each page is a row group
+        self._writer.write_table(pa.Table.from_pylist([self._row(row) for row in rows], schema=PARQUET_SCHEMA))
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+def get_export_writer(export_format: ExportFormat) -> ExportWriter:
+    if export_format is ExportFormat.PARQUET:
+        return ParquetExportWriter()
+    return CsvExportWriter()
+
+
+async def stream_export(pages: AsyncIterator[List[dict]], writer: ExportWriter) -> AsyncIterator[bytes]:
+    """ The encoded export, a chunk per page of rows, each encoded off the event loop """
+    async for rows in pages:
+        chunk = await asyncio.to_thread(writer.write, rows)
+        if chunk:
+            yield chunk
+    chunk = await asyncio.to_thread(writer.close)
+    if chunk:
+        yield chunk
@@ -0,0 +1,112 @@
+import hashlib
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+
+from typing import Any, Dict, List
+
+import logging
+logger = logging.getLogger(__name__)
+
+APQ_VERSION = 1
+
+
+class PersistedQueryNotFound(Exception):
+    """ A persisted query hash was sent without the query, and the query is not cached """
+    pass
+
+
+class PersistedQueryMismatch(Exception):
+    """ A persisted query hash was sent with a query that does not have that hash """
+    pass
+
+
+@dataclass
+class CachedQuery:
+    query: str
+    document: DocumentNode
+    # validation errors against the schema, None until validated
+    errors: List[GraphQLError] | None = field(default=None)
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+class QueryCache:
+    """
+    Parsed and validated GraphQL documents, least recently used first, keyed by the sha256 hash of the query.
+
+    Also serves Automatic Persisted Queries (Apollo): a client may send only the hash in
+    extensions.persistedQuery.sha256Hash, and sends the full query with the hash when it is not found.
+    Persisted queries are the cached queries, so each worker holds its own and an evicted query is sent again.
+
+    Validation results are cached with the document, this relies on the schema and validation rules
+    being the same for every request, as they are for the application schema.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._queries: OrderedDict[str, CachedQuery] = OrderedDict()
+
+    def __len__(self):
+        return len(self._queries)
+
+    def get(self, data: Dict[str, Any]) -> CachedQuery | None:
+        """
+        The cached query for the request data, parsing the query if not yet cached.
+        A query sent by hash alone is added to the data.
+        Returns None if the data has no query to parse, leaving the error to the GraphQL server.
+        Raises GraphQLError if the query does not parse,
+        PersistedQueryNotFound or PersistedQueryMismatch for invalid persisted query requests.
+        """
+        if not isinstance(data, dict):
+            return None
+        query = data.get('query')
+        persisted = (data.get('extensions') or {}).get('persistedQuery')
+        if persisted:
+            if persisted.get('version') != APQ_VERSION:
+                raise PersistedQueryMismatch(f"Unsupported persisted query version: {persisted.get('version')}")
+            query_hash = persisted.get('sha256Hash')
+            if query is None:
+                cached = self._get(query_hash)
+                if cached is None:
+                    raise PersistedQueryNotFound(query_hash)
+                data['query'] = cached.query
+                return cached
+            elif not isinstance(query, str) or get_query_hash(query) != query_hash:
+                raise PersistedQueryMismatch("Provided sha256Hash does not match query")
+        elif not isinstance(query, str) or not query:
+            return None
+        else:
+            query_hash = get_query_hash(query)
+
+        return self._get(query_hash) or self._add(query_hash, query)
+
+    def _get(self, query_hash: str) -> CachedQuery | None:
+        cached = self._queries.get(query_hash)
+        if cached is not None:
+            self._queries.move_to_end(query_hash)
+        return cached
+
+    def _add(self, query_hash: str, query: str) -> CachedQuery:
+        # parse errors are raised and not cached
+        cached = CachedQuery(query=query, document=parse(query))
+        self._queries[query_hash] = cached
+        while len(self._queries) > self.max_size:
+            self._queries.popitem(last=False)
+        logger.debug(f"Cached GraphQL query {query_hash}, {len(self._queries)} cached")
+        return cached
+
+    @staticmethod
+    def get_validator(cached: CachedQuery):
+        """ A query validator for the cached document, validating on first use """
+        def validate_cached(schema: GraphQLSchema, document_ast: DocumentNode, **kwargs) -> List[GraphQLError]:
+            if document_ast is not cached.document:
+                return validate(schema, document_ast, **kwargs)
+            if cached.errors is None:
+                cached.errors = validate(schema, document_ast, **kwargs)
+            return cached.errors
+        return validate_cached
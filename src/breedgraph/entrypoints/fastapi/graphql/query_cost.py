@@ -0,0 +1,109 @@
+from graphql import (
+    GraphQLError,
+    GraphQLSchema,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLInterfaceType,
+    ValidationRule,
+    OperationDefinitionNode,
+    FragmentDefinitionNode,
+    SelectionSetNode,
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    get_named_type,
+    is_list_type,
+    is_non_null_type
+)
+
+from breedgraph.config import GQL_MAX_QUERY_DEPTH, GQL_MAX_QUERY_COST, GQL_LIST_COST_FACTOR
+
+from typing import Dict, FrozenSet, Tuple
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def _returns_list(field_type) -> bool:
+    if is_non_null_type(field_type):
+        field_type = field_type.of_type
+    return is_list_type(field_type)
+
+
+def get_selection_cost(
+        schema: GraphQLSchema,
+        parent_type: GraphQLNamedType | None,
+        selection_set: SelectionSetNode,
+        fragments: Dict[str, FragmentDefinitionNode],
+        visited: FrozenSet[str] = frozenset()
+) -> Tuple[int, int]:
+    """
+    The estimated cost and the depth of a selection.
+    Each field costs 1, and the selections within a list are counted GQL_LIST_COST_FACTOR times.
+    Introspection fields are not counted, unknown fields and fragments are left to the other validation rules.
+    """
+    cost = 0
+    depth = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            name = selection.name.value
+            if name.startswith('__'):
+                continue
+            cost += 1
+            depth = max(depth, 1)
+            if selection.selection_set is None or not isinstance(
+                    parent_type, (GraphQLObjectType, GraphQLInterfaceType)
+            ):
+                continue
+            field = parent_type.fields.get(name)
+            if field is None:
+                continue
+            field_cost, field_depth = get_selection_cost(
+                schema, get_named_type(field.type), selection.selection_set, fragments, visited
+            )
+            cost += field_cost * (GQL_LIST_COST_FACTOR if _returns_list(field.type) else 1)
+            depth = max(depth, 1 + field_depth)
+        else:
+            if isinstance(selection, InlineFragmentNode):
+                fragment = selection
+            else:
+                name = selection.name.value
+                # fragment cycles are reported by the specified rules
+                if name in visited or name not in fragments:
+                    continue
+                fragment = fragments[name]
+                visited = visited | {name}
+            fragment_type = parent_type
+            if fragment.type_condition is not None:
+                fragment_type = schema.get_type(fragment.type_condition.name.value)
+            fragment_cost, fragment_depth = get_selection_cost(
+                schema, fragment_type, fragment.selection_set, fragments, visited
+            )
+            cost += fragment_cost
+            depth = max(depth, fragment_depth)
+    return cost, depth
+
+
+class QueryCostRule(ValidationRule):
+    """
+    Rejects operations deeper than GQL_MAX_QUERY_DEPTH or costing more than GQL_MAX_QUERY_COST before they run,
+    e.g. deeply nested children of units or locations, which multiply the entries loaded at each level.
+    """
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args):
+        schema = self.context.schema
+        root_type = schema.get_root_type(node.operation)
+        fragments = {
+            definition.name.value: definition for definition in self.context.document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        cost, depth = get_selection_cost(schema, root_type, node.selection_set, fragments)
+        logger.debug(f"GraphQL operation cost {cost}, depth {depth}")
+        if depth > GQL_MAX_QUERY_DEPTH:
+            self.report_error(GraphQLError(
+                f"Query depth {depth} exceeds the maximum of {GQL_MAX_QUERY_DEPTH}", node
+            ))
+        if cost > GQL_MAX_QUERY_COST:
+            self.report_error(GraphQLError(
+                f"Query cost {cost} exceeds the maximum of {GQL_MAX_QUERY_COST}", node
+            ))
@@ -14,6 +14,7 @@ from breedgraph.domain.model.ontology import (
 )
 from breedgraph.domain.model.references import DataFormat
 from breedgraph.domain.model.submissions import SubmissionStatus
+from breedgraph.service_layer.queries.read_models import ExportFormat
 
 # Import query and mutation objects (this triggers all resolver registration)
 from .queries import graphql_query
@@ -48,6 +49,7 @@ graphql_resolvers.register_enums(EnumType("OntologyNodeLabel", OntologyEntryLabe
 graphql_resolvers.register_enums(EnumType("OntologyRelationshipLabel", OntologyRelationshipLabel))
 graphql_resolvers.register_enums(EnumType("LifecyclePhase", LifecyclePhase))
 graphql_resolvers.register_enums(EnumType('OntologyRole', OntologyRole))
+graphql_resolvers.register_enums(EnumType('ExportFormat', ExportFormat))
 graphql_resolvers.register_enums(EnumType("SubmissionStatus", SubmissionStatus))
 graphql_resolvers.register_enums(EnumType("DataFormat", DataFormat))
 
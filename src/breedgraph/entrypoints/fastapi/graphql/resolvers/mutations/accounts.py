@@ -1,4 +1,3 @@
-import bcrypt
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired
 
 from breedgraph import config
@@ -46,10 +45,7 @@ async def create_account(
         error_messages = [str(error) for error in password_errors]
         raise ValueError(f"Password does not meet security requirements: {'; '.join(error_messages)}")
 
-    # the bcrypt hash result includes the salt,
-    # it is concatenated into the hash then encoded in a modified base64
-    # so we can just store the hash in db
-    password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    password_hash = await info.context['password_hasher'].hash(password)
     cmd = CreateAccount(
         name=name,
         fullname=fullname,
@@ -97,9 +93,7 @@ async def reset_password(
             error_messages = [str(error) for error in password_errors]
             raise ValueError(f"Password does not meet security requirements: {'; '.join(error_messages)}")
 
-
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
-
+    password_hash = await info.context['password_hasher'].hash(password)
     cmd = UpdateUser(user_id=user_id, password_hash=password_hash)
     await info.context['bus'].handle(cmd)
     return True
@@ -139,38 +133,41 @@ async def login(
                 await brute_force_service.record_failed_attempt(username)
             raise UnauthorisedOperationError(fail_message)
 
-        if bcrypt.checkpw(password.encode(), account.user.password_hash.encode()):
-            if not account.user.email_verified:
-                raise UnauthorisedOperationError("Please confirm email before logging in")
+    # verify outside the unit of work, the session isn't needed while the hash is computed
+    if brute_force_service:
+        verified = await brute_force_service.verify_password(username, password, account.user.password_hash)
+    else:
+        verified = await info.context['password_hasher'].verify(password, account.user.password_hash)
 
-            # Successful login - clear failed attempts
-            if brute_force_service:
-                await brute_force_service.record_successful_attempt(username)
-
-            bus = info.context.get('bus')
-            await bus.handle(Login(user_id=account.user.id))
-            token = bus.auth_service.create_login_token(account.user.id)
-
-            # Queue the cookie to be set on the response
-            cookie_data = {
-                "key": "auth_token",
-                "value": token,
-                "max_age": LOGIN_EXPIRES * 60,  # Convert minutes to seconds
-                "httponly": True,
-                "secure": True,  # Set to True for HTTPS
-                "samesite": "strict",
-                "path": "/"
-            }
-            info.context["cookies_to_set"].append(cookie_data)
-
-            logger.debug(f"Auth token cookie queued for user {account.user.id}")
-            return True
-        else:
-            # Failed password check
-            if brute_force_service:
-                await brute_force_service.record_failed_attempt(username)
-            raise UnauthorisedOperationError(fail_message)
+    if not verified:
+        # failed attempts are recorded by the brute force service
+        raise UnauthorisedOperationError(fail_message)
+
+    if not account.user.email_verified:
+        raise UnauthorisedOperationError("Please confirm email before logging in")
+
+    # Successful login - clear failed attempts
+    if brute_force_service:
+        await brute_force_service.record_successful_attempt(username)
 
+    bus = info.context.get('bus')
+    await bus.handle(Login(user_id=account.user.id))
+    token = bus.auth_service.create_login_token(account.user.id)
+
+    # Queue the cookie to be set on the response
+    cookie_data = {
+        "key": "auth_token",
+        "value": token,
+        "max_age": LOGIN_EXPIRES * 60,  # Convert minutes to seconds
+        "httponly": True,
+        "secure": True,  # Set to True for HTTPS
+        "samesite": "strict",
+        "path": "/"
+    }
+    info.context["cookies_to_set"].append(cookie_data)
+
+    logger.debug(f"Auth token cookie queued for user {account.user.id}")
+    return True
 
 @graphql_mutation.field("accountsLogout")
 @graphql_payload
@@ -217,7 +214,7 @@ async def update_user(
             error_messages = [str(error) for error in password_errors]
             raise ValueError(f"Password does not meet security requirements: {', '.join(error_messages)}")
 
-        password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+        password_hash = await info.context['password_hasher'].hash(password)
     else:
         password_hash = password
     cmd = UpdateUser(
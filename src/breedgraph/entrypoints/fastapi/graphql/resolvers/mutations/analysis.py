@@ -1,5 +1,5 @@
 from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, require_authentication
-from breedgraph.domain.commands.analysis import RequestAnalysis
+from breedgraph.domain.commands.analysis import RequestAnalysis, RequestRelationshipMatrix
 
 
 import logging
@@ -22,3 +22,19 @@ async def submit_analysis(
     cmd = RequestAnalysis(agent_id=user_id, analysis_id=key)
     await bus.handle(cmd)
     return key
+
+@graphql_mutation.field("analysisRelationshipMatrixSubmit")
+@graphql_payload
+@require_authentication
+async def submit_relationship_matrix(
+        _,
+        info,
+        request: dict
+) -> str:
+    user_id: int = info.context.get('user_id')
+    logger.debug(f"User {user_id} requesting relationship matrix {request}")
+    bus = info.context.get('bus')
+    key = await bus.state_store.store_analysis(agent_id=user_id, analysis=request)
+    cmd = RequestRelationshipMatrix(agent_id=user_id, analysis_id=key)
+    await bus.handle(cmd)
+    return key
@@ -1,10 +1,13 @@
+from fastapi import UploadFile
+
 from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, require_authentication
 from breedgraph.domain.commands.blocks import (
     CreateUnit,
     UpdateUnit,
     DeleteUnit,
     AddPosition,
-    RemovePosition
+    RemovePosition,
+    ImportUnits
 )
 from breedgraph.domain.model.controls import ReadRelease
 
@@ -122,3 +125,26 @@ async def remove_position(
     )
     await info.context['bus'].handle(cmd)
     return True
+
+@graphql_mutation.field("blocksImportUnits")
+@graphql_payload
+@require_authentication
+async def import_units(
+        _,
+        info,
+        file: UploadFile,
+        control_team_id: int | None = None,
+        release: ReadRelease = ReadRelease.PRIVATE
+) -> str:
+    user_id = info.context.get('user_id')
+    logger.debug(f"User {user_id} imports units from: {file.filename}")
+    file_format = 'json' if (file.filename or '').lower().endswith('.json') else 'csv'
+    content = (await file.read()).decode('utf-8-sig')
+    bus = info.context.get('bus')
+    key = await bus.state_store.store_submission(agent_id=user_id, submission={
+        "format": file_format,
+        "content": content
+    })
+    cmd = ImportUnits(agent_id=user_id, write_team=control_team_id, release=release, submission_id=key)
+    await bus.handle(cmd)
+    return key
@@ -2,7 +2,9 @@ from ariadne import ObjectType
 
 from breedgraph.adapters.redis.state_store import SubmissionStatus
 
+from breedgraph.domain.model.submissions import SubmissionKeys
 from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, require_authentication
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders import get_submission_state
 
 from typing import List
 
@@ -18,8 +20,12 @@ analysis_submission = ObjectType("AnalysisSubmission")
 analysis_result = ObjectType("AnalysisResult")
 analysis_config = ObjectType("AnalysisConfig")
 anova_row = ObjectType("AnovaRow")
+relationship_matrix_submission = ObjectType("RelationshipMatrixSubmission")
+relationship_matrix = ObjectType("RelationshipMatrix")
 
-graphql_resolvers.register_type_resolvers(group_summary, analysis_submission, analysis_result, anova_row)
+graphql_resolvers.register_type_resolvers(
+    group_summary, analysis_submission, analysis_result, anova_row, relationship_matrix_submission, relationship_matrix
+)
 
 """Submission resolver"""
 @graphql_query.field("analysisSubmission")
@@ -30,18 +36,14 @@ async def get_submission(_, info, id: str):
 
 @analysis_submission.field('status')
 async def resolve_status(analysis_id: str, info):
-    bus = info.context.get('bus')
-    user_id = info.context.get('user_id')
-    status = await bus.state_store.get_status(agent_id=user_id, key=analysis_id)
-    return status
+    state = await get_submission_state(info.context, analysis_id)
+    return state[SubmissionKeys.STATUS.value]
 
 
 @analysis_submission.field('errors')
 async def resolve_errors(analysis_id: str, info):
-    bus = info.context.get('bus')
-    user_id = info.context.get('user_id')
-    errors = await bus.state_store.get_errors(agent_id=user_id, key=analysis_id)
-    return errors
+    state = await get_submission_state(info.context, analysis_id)
+    return state[SubmissionKeys.ERRORS.value]
 
 @analysis_submission.field('result')
 async def resolve_result(analysis_id: str, info):
@@ -104,4 +106,31 @@ async def resolve_tukey(result:dict, info):
     result = result.get('result')
     if result:
         return result.get('tukey')
-    return None
\ No newline at end of file
+    return None
+
+"""Relationship matrix resolvers"""
+@graphql_query.field("analysisRelationshipMatrix")
+@graphql_payload
+@require_authentication
+async def get_relationship_matrix_submission(_, info, id: str):
+    return id
+
+@relationship_matrix_submission.field('status')
+async def resolve_relationship_matrix_status(analysis_id: str, info):
+    state = await get_submission_state(info.context, analysis_id)
+    return state[SubmissionKeys.STATUS.value]
+
+@relationship_matrix_submission.field('errors')
+async def resolve_relationship_matrix_errors(analysis_id: str, info):
+    state = await get_submission_state(info.context, analysis_id)
+    return state[SubmissionKeys.ERRORS.value]
+
+@relationship_matrix_submission.field('result')
+async def resolve_relationship_matrix(analysis_id: str, info):
+    bus = info.context.get('bus')
+    user_id = info.context.get('user_id')
+    return await bus.state_store.get_analysis_result(agent_id=user_id, analysis_id=analysis_id)
+
+@relationship_matrix.field('kinship')
+async def resolve_kinship(result: dict, info):
+    return [value / 2 for value in result.get('values', [])]
@@ -6,10 +6,16 @@ from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders im
     update_ontology_map,
     update_locations_map,
     update_layouts_map,
-    update_germplasm_map
+    update_germplasm_map,
+    get_submission_state
+)
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.lookahead import (
+    get_selected_paths, selects, prefetch_units, RESULT
 )
 
 from breedgraph.domain.model.blocks import UnitOutput, Position
+from breedgraph.domain.model.submissions import SubmissionKeys, SubmissionStatus
+from breedgraph.domain.model.errors import ItemError
 from breedgraph.service_layer.queries.read_models import OntologyViewMode
 
 from typing import List
@@ -21,7 +27,8 @@ from . import graphql_query
 from ..registry import graphql_resolvers
 unit = ObjectType("Unit")
 position = ObjectType("Position")
-graphql_resolvers.register_type_resolvers(unit, position)
+units_import_submission = ObjectType("UnitsImportSubmission")
+graphql_resolvers.register_type_resolvers(unit, position, units_import_submission)
 
 @graphql_query.field("blocks")
 @graphql_payload
@@ -30,7 +37,9 @@ async def get_blocks(_, info, location_ids: List[int] = None) -> List[UnitOutput
     await update_units_map(info.context, location_ids=location_ids)
     units_map = info.context.get('units_map')
     block_roots = info.context.get('block_roots')
-    return [units_map.get(i) for i in block_roots]
+    blocks = [units_map.get(i) for i in block_roots]
+    await prefetch_units(info.context, blocks, get_selected_paths(info), RESULT)
+    return blocks
 
 @graphql_query.field("blocksUnits")
 @graphql_payload
@@ -38,7 +47,41 @@ async def get_blocks(_, info, location_ids: List[int] = None) -> List[UnitOutput
 async def get_units(_, info, ids: List[int]) -> List[UnitOutput]:
     await update_units_map(info.context, unit_ids=ids)
     units_map = info.context.get('units_map')
-    return [units_map.get(i) for i in ids]
+    units = [units_map.get(i) for i in ids]
+    await prefetch_units(info.context, units, get_selected_paths(info), RESULT)
+    return units
+
+@graphql_query.field("blocksUnitsPage")
+@graphql_payload
+@require_authentication
+async def get_units_page(
+        _,
+        info,
+        block_id: int | None = None,
+        location_ids: List[int] | None = None,
+        first: int | None = None,
+        after: str | None = None
+) -> dict:
+    user_id = info.context.get('user_id')
+    bus = info.context.get('bus')
+    async with bus.views_factory.get_views(user_id=user_id) as views:
+        page = await views.blocks.get_units_page(
+            first=first,
+            after=after,
+            block_id=block_id,
+            location_ids=location_ids
+        )
+    paths = get_selected_paths(info)
+    # parents and children are resolved from the units map, the blocks of the page are loaded only if selected
+    if selects(paths, f"{RESULT}.units", 'parents') or selects(paths, f"{RESULT}.units", 'children'):
+        await update_units_map(info.context, unit_ids=[
+            unit_id for unit in page.items for unit_id in unit.parents + unit.children
+        ])
+    await prefetch_units(info.context, page.items, paths, f"{RESULT}.units")
+    return {
+        'units': page.items,
+        'page_info': {'end_cursor': page.end_cursor, 'has_next_page': page.has_next_page}
+    }
 
 @unit.field("subject")
 async def resolve_subject(obj, info):
@@ -82,3 +125,31 @@ async def resolve_layout(obj, info):
     layouts_map = info.context.get('layouts_map')
     return layouts_map.get(obj.layout_id)
 
+"""Import submission resolvers"""
+@graphql_query.field("blocksImportSubmission")
+@graphql_payload
+@require_authentication
+async def get_import_submission(_, info, id: str) -> str:
+    user_id = info.context.get('user_id')
+    await info.context['bus'].state_store.verify_agent(agent_id=user_id, key=id)
+    return id
+
+@units_import_submission.field("status")
+async def resolve_import_status(submission_id: str, info) -> SubmissionStatus:
+    state = await get_submission_state(info.context, submission_id)
+    return state[SubmissionKeys.STATUS.value]
+
+@units_import_submission.field("progress")
+async def resolve_import_progress(submission_id: str, info) -> int:
+    state = await get_submission_state(info.context, submission_id)
+    return state['progress']
+
+@units_import_submission.field("errors")
+async def resolve_import_errors(submission_id: str, info) -> List[str]:
+    state = await get_submission_state(info.context, submission_id)
+    return state[SubmissionKeys.ERRORS.value]
+
+@units_import_submission.field("itemErrors")
+async def resolve_import_item_errors(submission_id: str, info) -> List[ItemError]:
+    state = await get_submission_state(info.context, submission_id)
+    return state[SubmissionKeys.ITEM_ERRORS.value]
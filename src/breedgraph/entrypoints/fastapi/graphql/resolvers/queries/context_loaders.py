@@ -227,15 +227,12 @@ async def update_units_map(context, location_ids: List[int] | None = None, unit_
             if unit_ids is not None:
                 unmapped = set(unit_ids) - units_map.keys()
                 if unmapped:
-                    for unit_id in unmapped:
-                        if unit_id in units_map:
-                            continue # likely to have been loaded along with units from a previously retrieved block
-                        block = await uow.repositories.blocks.get(unit_id=unit_id)
-                        if block is not None:
-                            units_map.update(block.to_output_map())
-                            block_root = block.root
-                            if not block_root in block_roots:
-                                block_roots.append(block_root)
+                    # the blocks of all unmapped units in one query
+                    async for block in uow.repositories.blocks.get_all(unit_ids=list(unmapped)):
+                        units_map.update(block.to_output_map())
+                        block_root = block.root
+                        if not block_root in block_roots:
+                            block_roots.append(block_root)
 
             context['units_map'] = units_map
             context['block_roots'] = block_roots
@@ -291,3 +288,17 @@ async def update_reference_map(
                 ):
                     context['reference_map'][reference.id] = reference
 
+
+async def get_submission_state(context, key: str) -> dict:
+    """
+    Status, errors, item errors, dataset ID, reference ID and progress for a submission, analysis or file,
+    read from the state store once per request and shared by the field resolvers.
+    """
+    async with _get_lock(context, '_submission_state_lock'):
+        if not 'submission_state_map' in context:
+            context['submission_state_map'] = dict()
+        if key not in context['submission_state_map']:
+            bus = context.get('bus')
+            user_id = context.get('user_id')
+            context['submission_state_map'][key] = await bus.state_store.get_state(agent_id=user_id, key=key)
+        return context['submission_state_map'][key]
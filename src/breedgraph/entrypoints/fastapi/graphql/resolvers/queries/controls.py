@@ -1,4 +1,5 @@
 from ariadne import ObjectType, EnumType
+from graphql import FieldNode
 
 from breedgraph.domain.model.time_descriptors import WriteStamp
 from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, require_authentication
@@ -23,6 +24,31 @@ write_stamp = ObjectType("WriteStamp")
 graphql_resolvers.register_type_resolvers(controller, control, write_stamp)
 graphql_resolvers.register_enums(EnumType("ControlledModelLabel", ControlledModelLabel))
 
+# Controller fields that need the control times, audit or write stamps rather than just teams and release
+HISTORY_FIELDS = {'writes', 'created', 'updated', 'time'}
+
+def _requests_history(selection_set) -> bool:
+    if selection_set is None:
+        return False
+    for selection in selection_set.selections:
+        if not isinstance(selection, FieldNode):
+            # fragments are not expanded here, just load the details
+            return True
+        if selection.name.value in HISTORY_FIELDS:
+            return True
+        if selection.name.value == 'controls' and _requests_history(selection.selection_set):
+            return True
+    return False
+
+def _result_requests_history(info) -> bool:
+    for field_node in info.field_nodes:
+        for selection in field_node.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return True
+            if selection.name.value == 'result' and _requests_history(selection.selection_set):
+                return True
+    return False
+
 @graphql_query.field("controlsControllers")
 @graphql_payload
 @require_authentication
@@ -30,7 +56,10 @@ async def get_controllers(_, info, entity_label: ControlledModelLabel, entity_id
     user_id = info.context.get('user_id')
     bus = info.context.get('bus')
     async with bus.uow_factory.get_uow(user_id=user_id) as uow:
-        controllers = await uow.controls.get_controllers(label=entity_label, model_ids=entity_ids)
+        if _result_requests_history(info):
+            controllers = await uow.controls.get_controller_details(label=entity_label, model_ids=entity_ids)
+        else:
+            controllers = await uow.controls.get_controllers(label=entity_label, model_ids=entity_ids)
         return [controllers.get(entity_id) for entity_id in entity_ids]
 
 @controller.field("controls")
@@ -1,20 +1,28 @@
 from numpy import datetime64
 from ariadne import ObjectType
+from datetime import datetime, timedelta
+from itsdangerous import URLSafeTimedSerializer
 
 from breedgraph.adapters.redis.state_store import SubmissionStatus
+from breedgraph.config import SECRET_KEY, DATASET_EXPORT_SALT, FILE_DOWNLOAD_EXPIRES, get_export_endpoint
 
 from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, require_authentication
 
+from breedgraph.domain.model.submissions import SubmissionKeys
 from breedgraph.domain.model.datasets import DatasetInput, DatasetStored, DatasetOutput, DataRecordStored
 from breedgraph.domain.model.errors import ItemError
 from breedgraph.service_layer.handlers.commands.regions import update_location
-from breedgraph.service_layer.queries.read_models import DatasetSummary, OntologyViewMode
+from breedgraph.service_layer.queries.read_models import DatasetSummary, OntologyViewMode, ExportFormat
 
 from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders import (
     update_ontology_map,
     update_units_map,
     update_locations_map,
-    update_reference_map
+    update_reference_map,
+    get_submission_state
+)
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.lookahead import (
+    get_selected_paths, prefetch_datasets, prefetch_records, RESULT
 )
 
 from typing import List
@@ -50,7 +58,8 @@ async def get_datasets(
             study_ids=study_ids,
             concept_ids=concept_ids
         )]
-        return datasets
+    await prefetch_datasets(info.context, datasets, get_selected_paths(info))
+    return datasets
 
 @dataset.field('concept')
 async def resolve_concept(obj, info):
@@ -60,8 +69,7 @@ async def resolve_concept(obj, info):
 
 @record.field('unit')
 async def resolve_unit(obj: dict, info):
-    # todo preload all units if units are requested,
-    #  there are many cases like this throughout resolvers that require query introspection
+    # units of all records are usually preloaded by the datasets resolver, see lookahead
     await update_units_map(info.context, unit_ids=[obj.get('unit')])
     units_map = info.context.get('units_map')
     return units_map.get(obj.get('unit'))
@@ -73,6 +81,50 @@ async def resolve_references(obj: dict, info):
     return [reference_map.get(ref_id) for ref_id in obj.get('references')]
 
 
+"""Records page resolver"""
+@graphql_query.field("datasetsRecords")
+@graphql_payload
+@require_authentication
+async def get_records_page(_, info, dataset_id: int, first: int | None = None, after: str | None = None) -> dict:
+    user_id = info.context.get('user_id')
+    bus = info.context.get('bus')
+    async with bus.views_factory.get_views(user_id=user_id) as views:
+        page = await views.datasets.get_records_page(dataset_id=dataset_id, first=first, after=after)
+    await prefetch_records(info.context, page.items, get_selected_paths(info), f"{RESULT}.records")
+    return {
+        'records': page.items,
+        'page_info': {'end_cursor': page.end_cursor, 'has_next_page': page.has_next_page}
+    }
+
+
+"""Export resolver"""
+@graphql_query.field("datasetsExport")
+@graphql_payload
+@require_authentication
+async def get_datasets_export(
+        _,
+        info,
+        ids: List[int] | None = None,
+        study_ids: List[int] | None = None,
+        format: ExportFormat = ExportFormat.CSV
+) -> dict:
+    # records are streamed by the export endpoint, read access is applied as they are read
+    if not ids and not study_ids:
+        raise ValueError("Dataset IDs or study IDs are required")
+    export_details = {
+        'user_id': info.context.get('user_id'),
+        'dataset_ids': ids,
+        'study_ids': study_ids,
+        'format': format.value,
+        'filename': f"dataset_{ids[0]}" if ids and len(ids) == 1 and not study_ids else 'datasets'
+    }
+    token = URLSafeTimedSerializer(SECRET_KEY).dumps(export_details, salt=DATASET_EXPORT_SALT)
+    return {
+        'expires_at': datetime.now() + timedelta(minutes=FILE_DOWNLOAD_EXPIRES),
+        'url': f'{get_export_endpoint()}{token}'
+    }
+
+
 """Submission resolver"""
 @graphql_query.field("datasetsSubmission")
 @graphql_payload
@@ -89,37 +141,30 @@ async def resolve_submission_data(submission_id: str, info):
 
 @dataset_submission.field("datasetId")
 async def resolve_submission_dataset_id(submission_id: str, info) -> str:
-    user_id = info.context.get('user_id')
-    bus = info.context.get('bus')
     logger.debug(f"Resolving submission dataset_id for submission_id: {submission_id}")
-    dataset_id = await bus.state_store.get_submission_dataset_id(agent_id=user_id, submission_id=submission_id)
-    return dataset_id
+    state = await get_submission_state(info.context, submission_id)
+    return state[SubmissionKeys.DATASET_ID.value]
 
 @dataset_submission.field("status")
 async def resolve_submission_status(submission_id: str, info) -> SubmissionStatus:
-    user_id = info.context.get('user_id')
-    bus = info.context.get('bus')
     logger.debug(f"Resolving submission status for submission_id: {submission_id}")
-    status = await bus.state_store.get_status(agent_id=user_id, key=submission_id)
-    return status
+    state = await get_submission_state(info.context, submission_id)
+    return state[SubmissionKeys.STATUS.value]
 
 @dataset_submission.field("errors")
 async def resolve_submission_errors(submission_id: str, info) -> List[str]:
-    user_id = info.context.get('user_id')
-    bus = info.context.get('bus')
     logger.debug(f"Resolving submission errors for submission_id: {submission_id}")
-    errors = await bus.state_store.get_errors(agent_id=user_id, key=submission_id)
+    state = await get_submission_state(info.context, submission_id)
+    errors = state[SubmissionKeys.ERRORS.value]
     logger.debug(f'errors resolved: {errors}')
     return errors
 
 
 @dataset_submission.field("itemErrors")
 async def resolve_submission_item_errors(submission_id: str, info) -> List[ItemError]:
-    user_id = info.context.get('user_id')
-    bus = info.context.get('bus')
     logger.debug(f"Resolving submission item errors for submission_id: {submission_id}")
-    errors = await bus.state_store.get_submission_item_errors(agent_id=user_id, submission_id=submission_id)
-    return errors
+    state = await get_submission_state(info.context, submission_id)
+    return state[SubmissionKeys.ITEM_ERRORS.value]
 
 """Summary resolvers"""
 @graphql_query.field("datasetsSummaries")
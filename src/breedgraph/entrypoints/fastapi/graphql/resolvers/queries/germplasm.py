@@ -6,6 +6,7 @@ from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, r
 from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders import (
     update_germplasm_map, update_locations_map, update_ontology_map, update_reference_map
 )
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.lookahead import get_selected_paths, prefetch_germplasm
 
 from typing import List
 
@@ -34,6 +35,7 @@ async def get_germplasm_entries(
 ) -> List[GermplasmOutput]:
     await update_germplasm_map(info.context, entry_ids=ids, names=names)
     germplasm = [value for key, value in info.context.get('germplasm_map').items()]
+    await prefetch_germplasm(info.context, germplasm, get_selected_paths(info))
     return germplasm
 
 @graphql_query.field("germplasmCrops")
@@ -46,7 +48,9 @@ async def get_germplasm_crops(
     bus = info.context.get('bus')
     user_id = info.context.get('user_id')
     async with bus.uow_factory.get_uow(user_id=user_id) as uow:
-        return [entry async for entry in uow.germplasm.get_root_entries(as_output=True)]
+        crops = [entry async for entry in uow.germplasm.get_root_entries(as_output=True)]
+    await prefetch_germplasm(info.context, crops, get_selected_paths(info))
+    return crops
 
 async def resolve_germplasm_entries(context, entry_ids):
     await update_germplasm_map(context, entry_ids=entry_ids)
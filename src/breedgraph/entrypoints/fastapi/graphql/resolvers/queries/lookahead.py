@@ -0,0 +1,179 @@
+"""
+Lookahead for the top level query resolvers.
+
+Nested field resolvers each load what they reference into the request context maps (see context_loaders),
+so a list of records resolving their units would otherwise load one block at a time.
+The top level resolvers inspect the selection set of the query,
+then load everything the selected fields will reference in bulk, before the nested resolvers run.
+The nested resolvers are unchanged, they find the entries already mapped.
+"""
+from graphql import GraphQLResolveInfo, SelectionSetNode, FieldNode, FragmentSpreadNode, InlineFragmentNode
+
+from breedgraph.domain.model.blocks import UnitOutput
+from breedgraph.domain.model.datasets import DatasetOutput
+from breedgraph.domain.model.germplasm import GermplasmOutput
+from breedgraph.domain.model.regions import LocationOutput
+from breedgraph.service_layer.queries.read_models import OntologyViewMode
+
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders import (
+    update_ontology_map,
+    update_units_map,
+    update_locations_map,
+    update_layouts_map,
+    update_germplasm_map,
+    update_reference_map
+)
+
+from typing import FrozenSet, Iterable, List, Set
+
+import logging
+logger = logging.getLogger(__name__)
+
+# the field of the payload types holding the result
+RESULT = 'result'
+
+
+def get_selected_paths(info: GraphQLResolveInfo) -> Set[str]:
+    """
+    Dotted paths of the fields selected below the resolved field, by field name (not alias), e.g. "result.records.unit".
+    Fragments are expanded, directives are not considered so a path may be selected but skipped.
+    """
+    paths = set()
+
+    def visit(selection_set: SelectionSetNode, prefix: str, fragments: FrozenSet[str]):
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                path = f"{prefix}.{selection.name.value}" if prefix else selection.name.value
+                paths.add(path)
+                if selection.selection_set is not None:
+                    visit(selection.selection_set, path, fragments)
+            elif isinstance(selection, InlineFragmentNode):
+                visit(selection.selection_set, prefix, fragments)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = info.fragments.get(name)
+                if fragment is not None and name not in fragments:
+                    visit(fragment.selection_set, prefix, fragments | {name})
+
+    for field_node in info.field_nodes:
+        if field_node.selection_set is not None:
+            visit(field_node.selection_set, '', frozenset())
+    return paths
+
+
+def selects(paths: Set[str], prefix: str, field: str) -> bool:
+    """ Whether the field path is selected anywhere below the prefix, e.g. "subject" of units and of their children """
+    return any(path == f"{prefix}.{field}" or (path.startswith(f"{prefix}.") and path.endswith(f".{field}")) for path in paths)
+
+
+async def prefetch_ontology(context, entry_ids: Iterable[int | None]):
+    entry_ids = list({i for i in entry_ids if i is not None})
+    if entry_ids:
+        await update_ontology_map(context, entry_ids=entry_ids, view=OntologyViewMode.REFERENTIAL)
+
+
+async def prefetch_germplasm_entries(context, entry_ids: Iterable[int | None]) -> List[GermplasmOutput]:
+    entry_ids = list({i for i in entry_ids if i is not None})
+    # with no IDs the germplasm map loader would load every entry
+    if not entry_ids:
+        return []
+    await update_germplasm_map(context, entry_ids=entry_ids)
+    germplasm_map = context.get('germplasm_map')
+    return [germplasm_map[i] for i in entry_ids if i in germplasm_map]
+
+
+async def prefetch_references(context, reference_ids: Iterable[int | None]):
+    reference_ids = list({i for i in reference_ids if i is not None})
+    if reference_ids:
+        await update_reference_map(context, reference_ids=reference_ids)
+
+
+async def prefetch_positions(context, positions: List[dict], paths: Set[str], prefix: str):
+    if selects(paths, prefix, 'positions.location'):
+        location_ids = list({p.get('location_id') for p in positions} - {None})
+        if location_ids:
+            await update_locations_map(context, location_ids=location_ids)
+    if selects(paths, prefix, 'positions.layout'):
+        layout_ids = list({p.get('layout_id') for p in positions} - {None})
+        if layout_ids:
+            await update_layouts_map(context, layout_ids=layout_ids)
+
+
+async def prefetch_units(context, units: List[UnitOutput | None], paths: Set[str], prefix: str):
+    """ Load the subjects, germplasm, locations and layouts of units (and of their selected parents and children) """
+    units = [u for u in units if u is not None]
+    if not units:
+        return
+    # parents and children are in the same blocks, so already mapped
+    units_map = context.get('units_map', dict())
+    relatives = [field for field in ('parents', 'children') if selects(paths, prefix, field)]
+    if relatives:
+        found = {unit.id: unit for unit in units}
+        pending = list(found.values())
+        while pending:
+            unit = pending.pop()
+            for field in relatives:
+                for unit_id in getattr(unit, field):
+                    if unit_id not in found and unit_id in units_map:
+                        found[unit_id] = units_map[unit_id]
+                        pending.append(units_map[unit_id])
+        units = list(found.values())
+
+    if selects(paths, prefix, 'subject'):
+        await prefetch_ontology(context, [unit.subject for unit in units])
+    if selects(paths, prefix, 'germplasm'):
+        await prefetch_germplasm_entries(context, [unit.germplasm for unit in units])
+    await prefetch_positions(context, [p for unit in units for p in unit.positions], paths, prefix)
+
+
+async def prefetch_datasets(context, datasets: List[DatasetOutput], paths: Set[str], prefix: str = RESULT):
+    """ Load the concepts, units and references of datasets and their records """
+    if f"{prefix}.concept" in paths:
+        await prefetch_ontology(context, [dataset.concept for dataset in datasets])
+
+    records = [record for dataset in datasets for record in dataset.records or []]
+    await prefetch_records(context, records, paths, f"{prefix}.records")
+
+
+async def prefetch_records(context, records: List[dict], paths: Set[str], prefix: str):
+    """ Load the units and references of records """
+    if f"{prefix}.references" in paths:
+        await prefetch_references(context, [i for record in records for i in record.get('references') or []])
+
+    record_units = f"{prefix}.unit"
+    if record_units in paths:
+        unit_ids = list({record.get('unit') for record in records} - {None})
+        if unit_ids:
+            await update_units_map(context, unit_ids=unit_ids)
+            units_map = context.get('units_map')
+            await prefetch_units(context, [units_map.get(i) for i in unit_ids], paths, record_units)
+
+
+async def prefetch_germplasm(context, entries: List[GermplasmOutput], paths: Set[str], prefix: str = RESULT):
+    """ Load the sources and sinks of germplasm entries, and the locations, control methods and references of both """
+    entries = list(entries)
+    related_ids = set()
+    if f"{prefix}.sources.source" in paths:
+        related_ids.update(rel.source_id for entry in entries for rel in entry.sources)
+    if f"{prefix}.sinks.sink" in paths:
+        related_ids.update(rel.sink_id for entry in entries for rel in entry.sinks)
+    entries += await prefetch_germplasm_entries(context, related_ids)
+
+    if selects(paths, prefix, 'origin'):
+        location_ids = list({entry.origin for entry in entries} - {None})
+        if location_ids:
+            await update_locations_map(context, location_ids=location_ids)
+    if selects(paths, prefix, 'controlMethods'):
+        await prefetch_ontology(context, [i for entry in entries for i in entry.control_methods or []])
+    if selects(paths, prefix, 'references'):
+        await prefetch_references(context, [i for entry in entries for i in entry.references or []])
+
+
+async def prefetch_locations(context, locations: List[LocationOutput], paths: Set[str], prefix: str = RESULT):
+    """ Load the location types, for the locations and any selected parents, children or regions (already mapped) """
+    if selects(paths, prefix, 'type'):
+        locations_map = context.get('locations_map', dict())
+        locations = list(locations)
+        if any(selects(paths, prefix, field) for field in ('parent', 'children', 'region')):
+            locations = list(locations_map.values())
+        await prefetch_ontology(context, [location.type for location in locations if location is not None])
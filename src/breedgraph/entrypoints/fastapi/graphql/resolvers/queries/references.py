@@ -6,7 +6,9 @@ from breedgraph.service_layer.application.access_control import AbstractAccessCo
 
 from breedgraph.adapters.redis.state_store import SubmissionStatus
 
+from breedgraph.domain.model.submissions import SubmissionKeys
 from breedgraph.entrypoints.fastapi.graphql.decorators import graphql_payload, require_authentication
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders import get_submission_state
 
 
 from breedgraph.domain.model.controls import (
@@ -154,27 +156,23 @@ async def get_file_submission(_, info, file_id: str) -> str:
 
 @file_submission.field("referenceId")
 async def get_file_reference_id(file_id, info) -> int:
-    bus = info.context['bus']
-    reference_id = await bus.state_store.get_file_reference_id(file_id)
-    return reference_id
+    state = await get_submission_state(info.context, file_id)
+    return state[SubmissionKeys.FILE_ID.value]
 
 @file_submission.field("status")
 async def get_file_status(file_id, info) -> SubmissionStatus:
-    bus = info.context['bus']
-    status = await bus.state_store._get_status(file_id)
-    return status
+    state = await get_submission_state(info.context, file_id)
+    return state[SubmissionKeys.STATUS.value]
 
 @file_submission.field("progress")
 async def get_file_progress(file_id, info) -> int:
-    bus = info.context['bus']
-    progress = await bus.state_store._get_file_progress(file_id)
-    return progress
+    state = await get_submission_state(info.context, file_id)
+    return state['progress']
 
 @file_submission.field("errors")
 async def get_file_errors(file_id, info) -> List[str]:
-    bus = info.context['bus']
-    errors = await bus.state_store._get_errors(file_id)
-    return errors
+    state = await get_submission_state(info.context, file_id)
+    return state[SubmissionKeys.ERRORS.value]
 
 @graphql_query.field("referencesFileDownloadState")
 @graphql_payload
@@ -188,7 +186,7 @@ async def get_file_download_state(_, info, file_id: str):
     logger.debug(f'User {user_id} requesting download of file {file_id}')
     bus = info.context['bus']
     archival_service = bus.archival_service
-    record: FileArchivalRecord = await archival_service.get(file_id)
+    record: FileArchivalRecord = await archival_service.get_for_file(file_id)
     if record.local_state == LocalState.LOCAL:
         status = "AVAILABLE"
         recovery = None
@@ -236,7 +234,7 @@ async def get_file_download(_, info, file_id: str):
             # Check if the upload is still in progress
             status = await bus.state_store.get_status(agent_id=user_id, key=file_id)
             if status and status is not SubmissionStatus.COMPLETED:
-                if status in [SubmissionStatus.PENDING, SubmissionStatus.PROCESSING]:
+                if status in [SubmissionStatus.PENDING, SubmissionStatus.QUEUED, SubmissionStatus.PROCESSING]:
                     raise NoResultFoundError("The file upload is still in progress")
                 elif status == SubmissionStatus.FAILED:
                     raise NoResultFoundError("The requested file failed to upload successfully")
@@ -266,8 +264,14 @@ async def get_file_download(_, info, file_id: str):
             else:
                 raise ValueError("Unexpected error. The file reference is missing a file id")
 
+        try:
+            record: FileArchivalRecord = await bus.archival_service.get_for_file(reference.file_id)
+        except NoResultFoundError:
+            raise NoResultFoundError("The file is still being processed")
+
         file_details = {
             'uuid': reference.file_id,
+            'blob': record.file_id,
             'filename': reference.filename,
             'contentType': reference.content_type
         }
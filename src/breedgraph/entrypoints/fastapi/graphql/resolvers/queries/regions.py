@@ -10,6 +10,7 @@ from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.context_loaders im
     update_locations_map,
     update_ontology_map
 )
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.lookahead import get_selected_paths, prefetch_locations
 
 from typing import List
 
@@ -37,7 +38,9 @@ async def get_regions(_, info) -> List[LocationOutput]:
     await update_locations_map(info.context)
     locations_map = info.context.get('locations_map')
     region_roots = info.context.get('region_roots')
-    return [locations_map.get(i) for i in region_roots if i in locations_map]
+    regions = [locations_map.get(i) for i in region_roots if i in locations_map]
+    await prefetch_locations(info.context, regions, get_selected_paths(info))
+    return regions
 
 @graphql_query.field("regionsLocations")
 @graphql_payload
@@ -45,7 +48,9 @@ async def get_regions(_, info) -> List[LocationOutput]:
 async def get_locations(_, info, ids: List[int]|None = None) -> List[LocationOutput]:
     await update_locations_map(info.context, location_ids=ids)
     locations_map = info.context.get('locations_map')
-    return [locations_map.get(i) for i in ids if i in locations_map]
+    locations = [locations_map.get(i) for i in ids if i in locations_map]
+    await prefetch_locations(info.context, locations, get_selected_paths(info))
+    return locations
 
 @graphql_query.field("regionsLocationsByType")
 @graphql_payload
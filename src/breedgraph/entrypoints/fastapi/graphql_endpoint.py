@@ -1,13 +1,18 @@
 import json
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 from ariadne import graphql, combine_multipart_data
+from graphql import GraphQLError
 
 from typing import Optional, Dict, Any
 
 from breedgraph.domain.model.accounts import AccountStored
 from breedgraph.custom_exceptions import UnauthorisedOperationError
 from breedgraph.config import GQL_API_PATH
+from breedgraph.entrypoints.fastapi.graphql.query_cache import (
+    PersistedQueryNotFound, PersistedQueryMismatch
+)
+from breedgraph.entrypoints.fastapi.graphql.query_cost import QueryCostRule
+from breedgraph.entrypoints.fastapi.responses import EncodedJSONResponse
 
 # logging
 import logging
@@ -38,6 +43,7 @@ async def get_context_value(request: Request):
         "bus": request.app.bus,
         "auth_service": request.app.bus.auth_service,
         "brute_force_service": request.app.brute_force_service,
+        "password_hasher": request.app.password_hasher,
         "user_id": await get_user_id(request),
         "cached_uow": None,
         "cookies_to_set": []  # List to store cookies that should be set
@@ -94,16 +100,36 @@ async def graphql_server(request: Request):
     logger.debug("GraphQL endpoint started")
     try:
         data = await extract_graphql_data(request)
+        # parsed and validated documents are reused for repeated operations, including persisted queries
+        try:
+            cached = request.app.graphql_query_cache.get(data)
+        except PersistedQueryNotFound:
+            return EncodedJSONResponse(content={"errors": [{
+                "message": "PersistedQueryNotFound",
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}
+            }]})
+        except PersistedQueryMismatch as e:
+            return EncodedJSONResponse(
+                content={"errors": [{"message": str(e), "extensions": {"code": "BAD_REQUEST"}}]},
+                status_code=400
+            )
+        except GraphQLError:
+            # left for the server to report
+            cached = None
+
         context = await get_context_value(request)
         success, result = await graphql(
             request.app.graphql_schema,
             data,
             context_value=context,
+            query_document=cached.document if cached else None,
+            query_validator=request.app.graphql_query_cache.get_validator(cached) if cached else None,
+            validation_rules=[QueryCostRule],
             debug=True,
         )
         status_code = 200 if success else 400
         # Create the response with the GraphQL result
-        json_response = JSONResponse(content=result, status_code=status_code)
+        json_response = EncodedJSONResponse(content=result, status_code=status_code)
         # Set any cookies that were queued during GraphQL execution
         for cookie_data in context.get("cookies_to_set", []):
             # Extract the cookie name from the 'key' field WITHOUT removing it
@@ -118,7 +144,7 @@ async def graphql_server(request: Request):
 
     except Exception as e:
         logger.error(f"GraphQL endpoint error: {str(e)}")
-        return JSONResponse(
+        return EncodedJSONResponse(
             content={"errors": [{"message": "Internal server error"}]},
             status_code=500
         )
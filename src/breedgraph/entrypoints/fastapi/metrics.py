@@ -0,0 +1,31 @@
+from fastapi import APIRouter, HTTPException, Request, Header, Depends
+
+from breedgraph.config import METRICS_AUTH_TOKEN
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+"""
+Event lane metrics for monitoring, e.g. scraped by a local monitoring service.
+Handling times are for the lanes consumed by this process, depths are read from the event queue,
+so with separate worker processes the depth of every lane is reported here
+and worker handling times are logged by the workers (see EVENT_METRICS_LOG_INTERVAL).
+"""
+
+def verify_service_token(authorization: str = Header(None)):
+    if not METRICS_AUTH_TOKEN:
+        raise HTTPException(status_code=404, detail="Metrics are not enabled")
+    if authorization != f"Bearer {METRICS_AUTH_TOKEN}":
+        raise HTTPException(status_code=401, detail="Unauthorized service request")
+
+router = APIRouter(dependencies=[Depends(verify_service_token)])
+
+@router.get("/metrics")
+async def get_metrics(request: Request):
+    try:
+        bus = request.app.bus
+        return {"lanes": await bus.get_lane_metrics()}
+    except Exception as e:
+        logger.error(f"Failed to read lane metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,108 @@
+import anyio
+import anyio.to_thread
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, JSONResponse, Response
+from starlette.types import Scope, Receive, Send
+
+from breedgraph.adapters.json_encoding import dumps
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class EncodedJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by the shared encoder (see json_encoding),
+    written straight to bytes and taking numpy, datetime and dataclass values as they are.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+class BlobFileResponse(FileResponse):
+    """
+    FileResponse for content-addressed blobs.
+
+    The content hash is used as a strong ETag,
+    so it is stable across local expiry and restore from the archive,
+    and If-None-Match / If-Range are answered without reading the file.
+    Range requests are handled by FileResponse.
+
+    When the server supports the ASGI zero-copy send extension,
+    the whole file or a single range is handed to the server as a file descriptor to be sent with sendfile.
+    Otherwise, the path send extension (whole file) or streaming in large chunks (ranges) is used.
+    """
+    chunk_size = 1024 * 1024
+    ZERO_COPY_EXTENSION = "http.response.zerocopysend"
+
+    def __init__(self, path, file_hash: str | None = None, headers: dict | None = None, **kwargs):
+        headers = dict(headers or {})
+        if file_hash:
+            headers["etag"] = f'"{file_hash}"'
+        headers.setdefault("cache-control", "private, no-cache")
+        super().__init__(path, headers=headers, **kwargs)
+        self.zero_copy = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            request_headers = Headers(scope=scope)
+            if self.status_code == 200 and self._is_not_modified(request_headers):
+                not_modified_headers = {
+                    key: value for key, value in self.headers.items()
+                    if key in ("etag", "cache-control", "content-location", "expires", "vary")
+                }
+                await Response(status_code=304, headers=not_modified_headers)(scope, receive, send)
+                return
+            self.zero_copy = (
+                    self.ZERO_COPY_EXTENSION in scope.get("extensions", {})
+                    and scope["method"].upper() != "HEAD"
+            )
+        await super().__call__(scope, receive, send)
+
+    def _is_not_modified(self, request_headers: Headers) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        etag = self.headers.get("etag")
+        if if_none_match is None or etag is None:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # weak comparison as required for If-None-Match
+        etag = etag.removeprefix("W/")
+        return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+    def _should_use_range(self, http_if_range: str) -> bool:
+        # If-Range requires a strong comparison, only an exact ETag or last-modified match is accepted
+        return http_if_range in (self.headers.get("etag"), self.headers.get("last-modified"))
+
+    async def _send_zero_copy(self, send: Send, offset: int, count: int) -> None:
+        file = await anyio.to_thread.run_sync(open, self.path, "rb")
+        try:
+            await send({
+                "type": self.ZERO_COPY_EXTENSION,
+                "file": file,
+                "offset": offset,
+                "count": count,
+                "more_body": False
+            })
+        finally:
+            file.close()
+
+    async def _handle_simple(self, send: Send, send_header_only: bool, send_pathsend: bool) -> None:
+        if not self.zero_copy:
+            return await super()._handle_simple(send, send_header_only, send_pathsend)
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        file_size = int(self.headers["content-length"])
+        await self._send_zero_copy(send, 0, file_size)
+
+    async def _handle_single_range(
+            self, send: Send, start: int, end: int, file_size: int, send_header_only: bool
+    ) -> None:
+        if not self.zero_copy:
+            return await super()._handle_single_range(send, start, end, file_size, send_header_only)
+        headers = MutableHeaders(raw=list(self.raw_headers))
+        headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        headers["content-length"] = str(end - start)
+        await send({"type": "http.response.start", "status": 206, "headers": headers.raw})
+        await self._send_zero_copy(send, start, end - start)
@@ -163,6 +163,12 @@ class AbstractAccessControlService(ABC):
         """
         return await self._get_controllers(label, model_ids)
 
+    async def get_controller_details(self, label: ControlledModelLabel, model_ids: Iterable[int]) -> Dict[int, Controller]:
+        """
+        Get multiple controllers including control times, release audit and write stamps
+        """
+        return await self._get_controller_details(label, model_ids)
+
     async def get_controllers_for_aggregate(self, aggregate: ControlledAggregate) -> Dict[ControlledModelLabel, Dict[int, Controller]]:
         """
         :param aggregate:
@@ -180,9 +186,18 @@ class AbstractAccessControlService(ABC):
     # Abstract methods for concrete implementations
     @abstractmethod
     async def _get_controllers(self, label: ControlledModelLabel, model_ids: Iterable[int]) -> Dict[int, Controller]:
-        """Get controllers for multiple model instances - key batch operation"""
+        """
+        Get controllers for multiple model instances - key batch operation
+        Only the controlling teams and their current release are required.
+        """
         ...
 
+    async def _get_controller_details(self, label: ControlledModelLabel, model_ids: Iterable[int]) -> Dict[int, Controller]:
+        """
+        Override where _get_controllers returns a projection without history
+        """
+        return await self._get_controllers(label, model_ids)
+
     @abstractmethod
     async def remove_controls(self, label: ControlledModelLabel, model_ids: Iterable[int], team_id: int) -> None:
         """Remove a specific team's control from multiple models - batch operation"""
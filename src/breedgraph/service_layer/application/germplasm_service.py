@@ -5,6 +5,7 @@ from breedgraph.domain.model.germplasm import (
 )
 from breedgraph.domain.model.controls import ReadRelease, Access, ControlledModelLabel
 from breedgraph.domain.events.base import Event
+from breedgraph.domain.events.germplasm import GermplasmRelationshipsChanged
 from breedgraph.service_layer.persistence.germplasm import GermplasmPersistenceService
 from breedgraph.service_layer.application.access_control import AbstractAccessControlService
 from breedgraph.custom_exceptions import IllegalOperationError, UnauthorisedOperationError
@@ -78,6 +79,20 @@ class GermplasmApplicationService:
         while self.events:
             yield self.events.pop(0)
 
+    def _record_relationships_changed(
+            self,
+            added: List[GermplasmRelationship] | None = None,
+            removed: List[GermplasmRelationship] | None = None
+    ) -> None:
+        """Record a change to the pedigree, to update the pedigree index once committed."""
+        if self.persistence.pedigree_version is None:
+            return
+        self.events.append(GermplasmRelationshipsChanged(
+            version=self.persistence.pedigree_version,
+            added=[(rel.source_id, rel.sink_id) for rel in added or []],
+            removed=[(rel.source_id, rel.sink_id) for rel in removed or []]
+        ))
+
     async def create_entry(
             self,
             entry: GermplasmInput
@@ -168,6 +183,34 @@ class GermplasmApplicationService:
             model_ids=entry_ids
         )
 
+        readable_ids = {
+            entry_id for entry_id, controller in controllers.items()
+            if controller.has_access(Access.READ, self.user_id, self.access_teams[Access.READ])
+        }
+        if as_output:
+            # get relationships for all readable entries, and controllers for all related entries, in one batch each
+            relationships = await self.persistence.get_relationships_for_entries(
+                [entry_id for entry_id in entry_ids if entry_id in readable_ids]
+            )
+            related_ids = {i for rel in relationships for i in (rel.source_id, rel.sink_id)}
+            controllers_to_fetch = [i for i in related_ids if i not in controllers]
+            if controllers_to_fetch:
+                related_controllers = await self.access_control.get_controllers(
+                    label=ControlledModelLabel.GERMPLASM,
+                    model_ids=controllers_to_fetch
+                )
+                readable_ids.update(
+                    entry_id for entry_id, controller in related_controllers.items()
+                    if controller.has_access(Access.READ, self.user_id, self.access_teams[Access.READ])
+                )
+            # return relationships where we have read access to the related entries
+            sources: Dict[int, List[GermplasmRelationship]] = dict()
+            sinks: Dict[int, List[GermplasmRelationship]] = dict()
+            for rel in relationships:
+                if rel.source_id in readable_ids and rel.sink_id in readable_ids:
+                    sinks.setdefault(rel.source_id, []).append(rel)
+                    sources.setdefault(rel.sink_id, []).append(rel)
+
         # Apply access control and yield results using stored context
         for entry in entries:
             controller = controllers.get(entry.id)
@@ -175,33 +218,12 @@ class GermplasmApplicationService:
             if not controller:
                 raise ValueError("Controller not found for entry")
 
-            if controller.has_access(Access.READ, self.user_id, self.access_teams[Access.READ]):
+            if entry.id in readable_ids:
                 if as_output:
-                    # get relationships and return where we have read access to the related entries
-                    sources = []
-                    sinks = []
-                    relationships = [rel async for rel in self.get_relationships(entry.id)]
-                    # get controllers for related:
-                    related_model_ids = [next(x for x in [rel.source_id, rel.sink_id] if x != entry.id) for rel in relationships]
-                    controllers_to_fetch = [i for i in related_model_ids if i not in controllers]
-                    related_controllers = await self.access_control.get_controllers(
-                        label=ControlledModelLabel.GERMPLASM,
-                        model_ids=controllers_to_fetch
-                    )
-                    for rel in relationships:
-                        other_id = next(x for x in [rel.source_id, rel.sink_id] if x != entry.id)
-                        controller = controllers.get(other_id) if other_id in controllers else related_controllers.get(other_id)
-                        if controller.has_access(Access.READ, self.user_id, self.access_teams[Access.READ]):
-                            if rel.source_id == entry.id:
-                                sinks.append(rel)
-                            elif rel.sink_id == entry.id:
-                                sources.append(rel)
-                    yield entry.to_output(sources=sources, sinks=sinks)
-
+                    yield entry.to_output(sources=sources.get(entry.id, []), sinks=sinks.get(entry.id, []))
                 else:
                     yield entry
 
-
             elif self.user_id is not None:
                 if suppress_redacted:
                     continue
@@ -227,6 +249,10 @@ class GermplasmApplicationService:
             )
         async for _ in self.persistence.get_sink_relationships(entry_id):
             raise IllegalOperationError("Cannot delete entries that have sinks")
+        sources = [rel async for rel in self.persistence.get_source_relationships(entry_id)]
+        if sources:
+            await self.persistence.delete_relationships(sources)
+            self._record_relationships_changed(removed=sources)
         await self.persistence.delete_entry(entry_id)
 
     async def update_entry(self, entry: GermplasmStored) -> None:
@@ -331,106 +357,109 @@ class GermplasmApplicationService:
             await self.create_relationships(to_create)
 
     async def create_relationships(self, relationships: List[GermplasmRelationship]) -> None:
-        for relationship in relationships:
-            await self.validate_new_relationship(relationship)
+        await self.validate_new_relationships(relationships)
         # Create the relationships
         await self.persistence.create_relationships(relationships)
+        self._record_relationships_changed(added=relationships)
 
     async def create_relationship(self, relationship: GermplasmRelationship) -> None:
-        await self. create_relationships(relationships=[relationship])
+        await self.create_relationships(relationships=[relationship])
 
     async def validate_new_relationship(self, relationship: GermplasmRelationship) -> None:
-        """Add a source relationship between germplasm entries with access control"""
-        sink_id = relationship.sink_id
-        source_id = relationship.source_id
-        source_type = relationship.source_type
+        await self.validate_new_relationships([relationship])
 
-        logger.debug(f"Adding source relationship: {source_id} -[{source_type}]> {sink_id}")
+    async def validate_new_relationships(self, relationships: List[GermplasmRelationship]) -> None:
+        """
+        Validate source relationships between germplasm entries with access control.
+        Controllers and existence are fetched once for all entries, and cycles are checked for the whole set,
+        so relationships among the new relationships are considered.
+        """
+        if not relationships:
+            return
+        sink_ids = list(dict.fromkeys(rel.sink_id for rel in relationships))
+        source_ids = list(dict.fromkeys(rel.source_id for rel in relationships))
+        entry_ids = list(dict.fromkeys(sink_ids + source_ids))
+        logger.debug(f"Validating {len(relationships)} source relationships among {len(entry_ids)} entries")
 
-        # Check that user has WRITE or CURATE access to sink and READ access to source using stored context
+        # Check that user has WRITE or CURATE access to sinks and READ access to sources using stored context
         controllers = await self.access_control.get_controllers(
             label=ControlledModelLabel.GERMPLASM,
-            model_ids=[sink_id, source_id]
+            model_ids=entry_ids
         )
+        for sink_id in sink_ids:
+            sink_controller = controllers.get(sink_id)
+            if sink_controller and not any([
+                sink_controller.has_access(Access.WRITE, self.user_id, self.access_teams[Access.WRITE]),
+                sink_controller.has_access(Access.CURATE, self.user_id, self.access_teams[Access.CURATE]),
+            ]):
+                raise IllegalOperationError(
+                    f"User {self.user_id} does not have permission to write or curate source relationships to sink germplasm entry {sink_id}"
+                )
+        for source_id in source_ids:
+            source_controller = controllers.get(source_id)
+            if source_controller and not source_controller.has_access(
+                    Access.READ, self.user_id, self.access_teams[Access.READ]
+            ):
+                raise IllegalOperationError(
+                    f"User {self.user_id} does not have permission to read source germplasm entry {source_id}"
+                )
 
-        sink_controller = controllers.get(sink_id)
-        source_controller = controllers.get(source_id)
-
-        if sink_controller and not any([
-            sink_controller.has_access(Access.WRITE, self.user_id, self.access_teams[Access.WRITE]),
-            sink_controller.has_access(Access.CURATE, self.user_id, self.access_teams[Access.CURATE]),
-        ]):
-            raise IllegalOperationError(
-                f"User {self.user_id} does not have permission to write or curate source relationships to sink germplasm entry {sink_id}"
-            )
-
-        if source_controller and not source_controller.has_access(
-                Access.READ, self.user_id, self.access_teams[Access.READ]
-        ):
-            raise IllegalOperationError(
-                f"User {self.user_id} does not have permission to read source germplasm entry {source_id}"
-            )
-
-        # Validate both entries exist
-        entries_exist = await self.persistence.entries_exist([sink_id, source_id])
-        if not entries_exist.get(sink_id):
-            raise ValueError(f"sink entry {sink_id} does not exist")
-        if not entries_exist.get(source_id):
-            raise ValueError(f"Source entry {source_id} does not exist")
+        # Validate all entries exist
+        entries_exist = await self.persistence.entries_exist(entry_ids)
+        for sink_id in sink_ids:
+            if not entries_exist.get(sink_id):
+                raise ValueError(f"sink entry {sink_id} does not exist")
+        for source_id in source_ids:
+            if not entries_exist.get(source_id):
+                raise ValueError(f"Source entry {source_id} does not exist")
 
         # Check for circular guards
-        if await self.persistence.has_path(sink_id, source_id):
+        cycle_ids = await self.persistence.get_cycle_ids(relationships)
+        if cycle_ids:
             raise ValueError(
-                f"Adding relationship from {source_id} to {sink_id} would create a circular dependency"
+                f"Adding these relationships would create a circular dependency among entries: {cycle_ids}"
             )
 
+    async def _validate_curate_sinks(self, relationships: List[GermplasmRelationship], error: type[Exception]) -> None:
+        """Check that user has CURATE access to the sinks of the relationships"""
+        sink_ids = list(dict.fromkeys(rel.sink_id for rel in relationships))
+        controllers = await self.access_control.get_controllers(
+            label=ControlledModelLabel.GERMPLASM,
+            model_ids=sink_ids
+        )
+        for sink_id in sink_ids:
+            sink_controller = controllers.get(sink_id)
+            if sink_controller and not sink_controller.has_access(
+                    Access.CURATE, self.user_id, self.access_teams[Access.CURATE]
+            ):
+                raise error(
+                    f"User {self.user_id} does not have permission to curate source relationships to sink germplasm entry {sink_id}"
+                )
+
     async def update_relationships(self, relationships: List[GermplasmRelationship]) -> None:
         """Update existing relationships with new details."""
-        for relationship in relationships:
-            await self.update_relationship(relationship)
+        if not relationships:
+            return
+        logger.debug(f"Updating {len(relationships)} source relationships")
+        await self._validate_curate_sinks(relationships, IllegalOperationError)
+        await self.persistence.update_relationships(relationships)
 
     async def update_relationship(self, relationship: GermplasmRelationship) -> None:
         """Update an existing relationship between germplasm entries."""
-        sink_id = relationship.sink_id
-        source_id = relationship.source_id
-        source_type = relationship.source_type
-
-        logger.debug(f"Updating source relationship: {source_id} -[{source_type}]> {sink_id}")
-
-        # Check that user has CURATE access to sink
-        controllers = await self.access_control.get_controllers(
-            label=ControlledModelLabel.GERMPLASM,
-            model_ids=[sink_id]
-        )
-        sink_controller = controllers.get(sink_id)
-        if sink_controller and not sink_controller.has_access(
-                Access.CURATE, self.user_id, self.access_teams[Access.CURATE]
-        ):
-            raise IllegalOperationError(
-                f"User {self.user_id} does not have permission to curate source relationships to sink germplasm entry {sink_id}"
-            )
-        # Create the relationship
-        await self.persistence.update_relationship(relationship)
+        await self.update_relationships([relationship])
 
     async def delete_relationships(self, relationships: List[GermplasmRelationship]) -> None:
         """Delete multiple relationships."""
-        for relationship in relationships:
-            await self.delete_relationship(relationship)
+        if not relationships:
+            return
+        logger.debug(f"Deleting {len(relationships)} source relationships")
+        await self._validate_curate_sinks(relationships, UnauthorisedOperationError)
+        await self.persistence.delete_relationships(relationships)
+        self._record_relationships_changed(removed=relationships)
 
     async def delete_relationship(self, relationship: GermplasmRelationship) -> None:
         """Delete a relationship between germplasm entries with access control."""
-        sink_id = relationship.sink_id
-
-        # Check that user has CURATE access to sink
-        controller = await self.access_control.get_controller(ControlledModelLabel.GERMPLASM, sink_id)
-        if controller and not controller.has_access(Access.CURATE, self.user_id, self.access_teams[Access.CURATE]):
-            raise UnauthorisedOperationError(
-                f"User {self.user_id} does not have permission to curate relationships from germplasm entry {sink_id}"
-            )
-
-        await self.persistence.delete_relationship(relationship)
-
-
+        await self.delete_relationships([relationship])
 
     async def validate_read(self, entry_id: int) -> None:
         """Check if user has read access to a germplasm entry using stored context."""
@@ -460,6 +489,28 @@ class GermplasmApplicationService:
     async def get_descendant_ids(self, entry_id: int, path_length_limit=None) -> List[int]:
         return await self.persistence.get_descendant_ids(entry_id, path_length_limit)
 
+    async def validate_read_entries(self, entry_ids: List[int]) -> None:
+        """Check the user has read access to each of the germplasm entries."""
+        controllers = await self.access_control.get_controllers(
+            label=ControlledModelLabel.GERMPLASM,
+            model_ids=entry_ids
+        )
+        for entry_id in entry_ids:
+            controller = controllers.get(entry_id)
+            if controller is None or not controller.has_access(Access.READ, self.user_id, self.access_teams[Access.READ]):
+                raise UnauthorisedOperationError(f"User {self.user_id} does not have read access to entry {entry_id}")
+
+    async def get_pedigree_relationships(self, entry_ids: List[int]) -> List[GermplasmRelationship]:
+        """
+        Source relationships of the entries and their ancestors.
+        Read access is not checked here, callers check it first with validate_read_entries
+        (the relationship matrix handler does so before a cached result is used).
+        """
+        return await self.persistence.get_pedigree_relationships(entry_ids)
+
+    async def get_pedigree_version(self) -> int | None:
+        return await self.persistence.get_pedigree_version()
+
     async def validate_control_permission(self, entry_ids: List[int]):
         if not self.user_id:
             raise UnauthorisedOperationError("User ID required to set controls in germplasm service")
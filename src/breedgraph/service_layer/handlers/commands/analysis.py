@@ -1,8 +1,9 @@
-from asyncio import Queue
+from breedgraph.service_layer.infrastructure import AbstractEventQueue, AbstractStateStore
 
 from breedgraph.domain import commands, events
 
 from ..registry import handlers
+from .datasets import queue_submission
 
 import logging
 logger = logging.getLogger(__name__)
@@ -10,7 +11,17 @@ logger = logging.getLogger(__name__)
 @handlers.command_handler()
 async def request_analysis(
         cmd: commands.analysis.RequestAnalysis,
-        event_queue: Queue
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
 ):
     event = events.analysis.AnalysisRequested(agent_id=cmd.agent_id, analysis_id=cmd.analysis_id)
-    await event_queue.put(event)
\ No newline at end of file
+    await queue_submission(event, cmd.analysis_id, event_queue, state_store)
+
+@handlers.command_handler()
+async def request_relationship_matrix(
+        cmd: commands.analysis.RequestRelationshipMatrix,
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
+):
+    event = events.analysis.RelationshipMatrixRequested(agent_id=cmd.agent_id, analysis_id=cmd.analysis_id)
+    await queue_submission(event, cmd.analysis_id, event_queue, state_store)
@@ -13,14 +13,14 @@ async def request_file_restore(
         cmd: commands.archive.RequestFileRestore,
         archival_service: AbstractFileArchivalService
 ):
-    record = await archival_service.get(cmd.file_id)
+    record = await archival_service.get_for_file(cmd.file_id)
     if record.local_state == LocalState.LOCAL:
         return
 
-    await archival_service.add_requestor(file_id=cmd.file_id, user_id=cmd.agent_id)
+    await archival_service.add_requestor(file_id=record.file_id, user_id=cmd.agent_id)
     if record.archive_state == ArchiveState.ARCHIVED:
         await archival_service.update_archive_state(
-            file_id = cmd.file_id,
+            file_id = record.file_id,
             archive_state=ArchiveState.RETRIEVAL_PENDING
         )
 
@@ -30,6 +30,8 @@ async def trigger_file_retention_policy(
         archival_service: AbstractFileArchivalService,
         file_management: FileManagementService
 ):
+    # write any pending accesses so recently downloaded files are not considered expired
+    await archival_service.access_recorder.flush()
     to_delete = []
     async for record in archival_service.get_expired_local():
         if record.archive_state is ArchiveState.ARCHIVED:
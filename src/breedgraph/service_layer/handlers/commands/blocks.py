@@ -1,11 +1,16 @@
 from breedgraph.custom_exceptions import NoResultFoundError
-from breedgraph.service_layer.infrastructure import AbstractUnitOfWorkFactory, AbstractUnitHolder
-from breedgraph.domain import commands
+from breedgraph.service_layer.infrastructure import (
+    AbstractUnitOfWorkFactory, AbstractUnitHolder, AbstractEventQueue, AbstractStateStore
+)
+from breedgraph.domain import commands, events
 from breedgraph.domain.model.blocks import UnitInput, Position
 from breedgraph.domain.model.ontology import AxisType, OntologyEntryLabel, LayoutTypeStored
 
 
 from ..registry import handlers
+from .datasets import queue_submission
+
+from typing import Dict, List, Tuple
 
 import logging
 logger = logging.getLogger(__name__)
@@ -46,7 +51,7 @@ async def create_unit(
                 start=cmd.start,
                 end=cmd.end
             )
-            await _validate_position(uow, position)
+            await validate_position(uow, position)
             unit = block.get_unit(unit_id)
             unit.positions.append(position)
 
@@ -116,12 +121,20 @@ async def add_position(
             start=cmd.start,
             end=cmd.end
         )
-        await _validate_position(uow, position)
+        await validate_position(uow, position)
         unit = block.get_unit(cmd.unit_id)
         unit.positions.append(position)
         await uow.commit()
 
-async def _validate_position(uow: AbstractUnitHolder, position: Position):
+async def validate_position(
+        uow: AbstractUnitHolder,
+        position: Position,
+        layouts: Dict[int, Tuple[int, int, List[AxisType]]] | None = None
+):
+    """
+    Check the position against its layout.
+    Pass a dict as layouts to keep the layout details between calls, e.g. when importing many units.
+    """
     if not position.location_id:
         raise ValueError("Positions require location_id")
 
@@ -133,26 +146,38 @@ async def _validate_position(uow: AbstractUnitHolder, position: Position):
         if not position.coordinates:
             raise ValueError("Coordinates required if a layout is specified")
 
-        arrangement = await uow.repositories.arrangements.get(layout_id=position.layout_id)
-        if arrangement is None:
-            raise NoResultFoundError("Arrangement with the provided layout ID was not found")
-        layout = arrangement.get_layout(position.layout_id)
-        if not len(position.coordinates) == len(layout.axes):
+        if layouts is not None and position.layout_id in layouts:
+            location_id, axes_count, axes = layouts[position.layout_id]
+        else:
+            location_id, axes_count, axes = await _get_layout_details(uow, position.layout_id)
+            if layouts is not None:
+                layouts[position.layout_id] = (location_id, axes_count, axes)
+
+        if not len(position.coordinates) == axes_count:
             raise ValueError(f"Coordinates must match the length of specified layout axes")
 
-        if not arrangement.get_location(layout.id) == position.location_id:
+        if not location_id == position.location_id:
             raise ValueError("Layout location does not match the position location")
 
-        layout_type = await uow.ontology.get_entry(entry_id=layout.type, label=OntologyEntryLabel.LAYOUT_TYPE)
-        if layout_type is None:
-            raise NoResultFoundError("Layout type with the provided type ID was not found")
         for i, p in enumerate(position.coordinates):
-            if layout_type.axes[i] in [AxisType.COORDINATE, AxisType.CARTESIAN]:
+            if axes[i] in [AxisType.COORDINATE, AxisType.CARTESIAN]:
                 try:
                     float(p)
                 except ValueError:
                     raise ValueError("Coordinate and Cartesian positions require numeric values")
 
+async def _get_layout_details(uow: AbstractUnitHolder, layout_id: int) -> Tuple[int, int, List[AxisType]]:
+    """ The location of the layout, the number of layout axes and the axis types of the layout type """
+    arrangement = await uow.repositories.arrangements.get(layout_id=layout_id)
+    if arrangement is None:
+        raise NoResultFoundError("Arrangement with the provided layout ID was not found")
+    layout = arrangement.get_layout(layout_id)
+
+    layout_type = await uow.ontology.get_entry(entry_id=layout.type, label=OntologyEntryLabel.LAYOUT_TYPE)
+    if layout_type is None:
+        raise NoResultFoundError("Layout type with the provided type ID was not found")
+    return arrangement.get_location(layout.id), len(layout.axes), layout_type.axes
+
 @handlers.command_handler()
 async def remove_position(
         cmd: commands.blocks.RemovePosition,
@@ -172,4 +197,18 @@ async def remove_position(
             unit.positions.remove(position)
         except ValueError:
             raise ValueError("A position matching the provided details was not found, nothing changed")
-        await uow.commit()
\ No newline at end of file
+        await uow.commit()
+
+@handlers.command_handler()
+async def import_units(
+        cmd: commands.blocks.ImportUnits,
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
+):
+    event = events.blocks.UnitsImportSubmitted(
+        agent_id=cmd.agent_id,
+        write_team=cmd.write_team,
+        release=cmd.release,
+        submission_id=cmd.submission_id
+    )
+    await queue_submission(event, cmd.submission_id, event_queue, state_store)
@@ -1,7 +1,6 @@
-from asyncio import Queue
-
-from breedgraph.service_layer.infrastructure import AbstractUnitOfWorkFactory
+from breedgraph.service_layer.infrastructure import AbstractUnitOfWorkFactory, AbstractEventQueue, AbstractStateStore
 
+from breedgraph.custom_exceptions import ServiceBusyError
 from breedgraph.domain import commands, events
 from breedgraph.domain.model.errors import ItemError
 from breedgraph.domain.model.submissions import SubmissionStatus
@@ -11,10 +10,26 @@ from ..registry import handlers
 import logging
 logger = logging.getLogger(__name__)
 
+async def queue_submission(
+        event: events.Event,
+        key: str,
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
+):
+    """ Queue the event to process a stored submission, the submission fails if the queue is full """
+    await state_store.set_status(key=key, status=SubmissionStatus.QUEUED)
+    try:
+        await event_queue.put(event)
+    except ServiceBusyError as e:
+        await state_store.set_errors(key=key, errors=[str(e)])
+        await state_store.set_status(key=key, status=SubmissionStatus.FAILED)
+        raise
+
 @handlers.command_handler()
 async def submit_records(
         cmd: commands.datasets.CreateDataset,
-        event_queue: Queue
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
 ):
     event = events.datasets.DatasetSubmitted(
         agent_id=cmd.agent_id,
@@ -22,23 +37,25 @@ async def submit_records(
         release=cmd.release,
         submission_id=cmd.submission_id
     )
-    await event_queue.put(event)
+    await queue_submission(event, cmd.submission_id, event_queue, state_store)
 
 @handlers.command_handler()
 async def update_dataset(
         cmd: commands.datasets.UpdateDataset,
-        event_queue: Queue
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
 ):
     event = events.datasets.DatasetUpdateSubmitted(agent_id=cmd.agent_id, submission_id=cmd.submission_id)
-    await event_queue.put(event)
+    await queue_submission(event, cmd.submission_id, event_queue, state_store)
 
 @handlers.command_handler()
 async def add_records(
         cmd: commands.datasets.AddRecords,
-        event_queue: Queue
+        event_queue: AbstractEventQueue,
+        state_store: AbstractStateStore
 ):
     event = events.datasets.DatasetRecordsSubmitted(agent_id=cmd.agent_id, submission_id=cmd.submission_id)
-    await event_queue.put(event)
+    await queue_submission(event, cmd.submission_id, event_queue, state_store)
 
 @handlers.command_handler()
 async def remove_records(
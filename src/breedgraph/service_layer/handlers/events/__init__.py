@@ -1,3 +1,3 @@
-from . import accounts, references, analysis, datasets, ontology
+from . import accounts, references, analysis, datasets, blocks, ontology, germplasm
 
 
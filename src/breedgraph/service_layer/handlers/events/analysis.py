@@ -1,3 +1,8 @@
+import asyncio
+
+from collections import OrderedDict
+
+from breedgraph.config import RELATIONSHIP_MATRIX_CACHE_SIZE
 from breedgraph.domain import events
 from breedgraph.service_layer.infrastructure import AbstractStateStore, AbstractUnitOfWorkFactory
 from ..registry import handlers
@@ -8,9 +13,13 @@ from breedgraph.domain.model.analysis import (
     AnalysisConfig
 )
 from breedgraph.domain.services.analysis import AnalysisService
+from breedgraph.domain.services.pedigree import RelationshipMatrixService
 from breedgraph.domain.model.submissions import SubmissionStatus
 
-from breedgraph.domain.importers import AnalysisImport
+from breedgraph.domain.importers import AnalysisImport, RelationshipMatrixImport
+
+# results by (pedigree version, germplasm ids, min relationship), most recently used last
+_relationship_matrices: OrderedDict = OrderedDict()
 
 @handlers.event_handler()
 async def analysis_requested(
@@ -102,3 +111,53 @@ async def analysis_requested(
     except Exception as e:
         await state_store.set_errors(key=event.analysis_id, errors=[str(e)])
         await state_store.set_status(key=event.analysis_id, status=SubmissionStatus.FAILED)
+
+
+def _compute_relationship_matrix(germplasm_ids, relationships, min_relationship) -> dict:
+    return RelationshipMatrixService(germplasm_ids, relationships).get_result(min_value=min_relationship)
+
+
+@handlers.event_handler()
+async def relationship_matrix_requested(
+        event: events.analysis.RelationshipMatrixRequested,
+        state_store: AbstractStateStore,
+        uow_factory: AbstractUnitOfWorkFactory
+):
+    """
+    Additive relationships and inbreeding for a set of germplasm entries, from their pedigree.
+    Results are cached by the stored pedigree version, so repeated requests are not recomputed until it changes.
+    """
+    await state_store.set_status(key=event.analysis_id, status=SubmissionStatus.PROCESSING)
+    try:
+        stored_config_input = await state_store.get_analysis_config(agent_id=event.agent_id, analysis_id=event.analysis_id)
+        matrix_import = RelationshipMatrixImport(**stored_config_input)
+        if not matrix_import.germplasm_ids:
+            raise ValueError("Germplasm IDs are required")
+
+        async with uow_factory.get_uow(user_id=event.agent_id) as uow:
+            await uow.germplasm.validate_read_entries(matrix_import.germplasm_ids)
+            version = await uow.germplasm.get_pedigree_version()
+            key = (version, tuple(matrix_import.germplasm_ids), matrix_import.min_relationship)
+            result = _relationship_matrices.get(key) if version is not None else None
+            if result is None:
+                relationships = await uow.germplasm.get_pedigree_relationships(matrix_import.germplasm_ids)
+                # the tabular method is CPU bound, keep the event loop free for other lanes
+                result = await asyncio.to_thread(
+                    _compute_relationship_matrix,
+                    matrix_import.germplasm_ids,
+                    relationships,
+                    matrix_import.min_relationship
+                )
+                result['pedigree_version'] = version
+                if version is not None:
+                    _relationship_matrices[key] = result
+                    while len(_relationship_matrices) > RELATIONSHIP_MATRIX_CACHE_SIZE:
+                        _relationship_matrices.popitem(last=False)
+            else:
+                _relationship_matrices.move_to_end(key)
+
+        await state_store.set_analysis_result(analysis_id=event.analysis_id, result=result)
+
+    except Exception as e:
+        await state_store.set_errors(key=event.analysis_id, errors=[str(e)])
+        await state_store.set_status(key=event.analysis_id, status=SubmissionStatus.FAILED)
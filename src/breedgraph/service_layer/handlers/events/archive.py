@@ -40,12 +40,18 @@ async def retrieval_succeeded(
 ):
     """Handle successful retrieval by notifying requesting users"""
     logger.info(f"Retrieval succeeded for file {event.file_id}")
+    record = await archival_service.get(event.file_id)
     async for requestor in archival_service.get_requestors(event.file_id):
         try:
             # get reference associated with the file to include file name etc.
             # this is per request as the user may now only have restricted read access to the record
+            # the blob may be shared by several references, notify for the first readable one
             async with uow_factory.get_uow(user_id=requestor.id) as uow:
-                reference: FileReferenceBase = await uow.repositories.references.get(file_id=event.file_id)
+                reference: FileReferenceBase | None = None
+                async for candidate in uow.repositories.references.get_all(file_ids=record.file_ids or [event.file_id]):
+                    if candidate.file_id is not None:
+                        reference = candidate
+                        break
                 if reference is None:
                     logger.info(
                         f" File {event.file_id} was retrieved for user {requestor.id},"
@@ -56,6 +62,7 @@ async def retrieval_succeeded(
                 else:
                     file_details = {
                         'uuid': reference.file_id,
+                        'blob': record.file_id,
                         'filename': reference.filename,
                         'contentType': reference.content_type
                     }
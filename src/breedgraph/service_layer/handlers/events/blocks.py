@@ -0,0 +1,169 @@
+import logging
+
+from pydantic import ValidationError
+
+from breedgraph.config import WRITE_BATCH_SIZE
+from breedgraph.service_layer.infrastructure import AbstractStateStore, AbstractUnitOfWorkFactory, AbstractUnitHolder
+
+from breedgraph.domain import events
+from breedgraph.domain.model.blocks import Block
+from breedgraph.domain.model.submissions import SubmissionStatus
+from breedgraph.domain.model.errors import ItemError
+from breedgraph.domain.importers import UnitImport, read_unit_rows
+
+from ..registry import handlers
+from ..commands.blocks import validate_position
+
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# progress reported once rows are validated, the remainder is split between building blocks and writing them
+VALIDATED_PROGRESS = 20
+BUILT_PROGRESS = 60
+
+
+def _import_order(units: Dict[int, UnitImport], item_errors: List[ItemError]) -> List[int]:
+    """
+    Row indexes ordered so that rows come after the rows they reference as parents.
+    Rows with duplicate or unknown references, or in a cycle of references, are recorded as item errors and left out.
+    """
+    ref_rows: Dict[str, int] = dict()
+    for i, unit in units.items():
+        if unit.ref is None:
+            continue
+        if unit.ref in ref_rows:
+            item_errors.append(ItemError(index=i, error=f"Duplicate ref: {unit.ref}"))
+        else:
+            ref_rows[unit.ref] = i
+
+    order = []
+    # 0: not visited, 1: in progress, 2: ordered, 3: failed
+    state = {i: 0 for i in units}
+    for start in units:
+        if state[start]:
+            continue
+        stack = [(start, iter(units[start].parent_refs))]
+        state[start] = 1
+        while stack:
+            i, refs = stack[-1]
+            ref = next(refs, None)
+            if ref is None:
+                stack.pop()
+                state[i] = 2
+                order.append(i)
+                continue
+            parent = ref_rows.get(ref)
+            if parent is None or state[parent] in (1, 3):
+                error = f"Unknown parent ref: {ref}" if parent is None else f"Parent ref in a cycle or failed: {ref}"
+                # the row and the rows that depend on it can not be imported
+                for j, _ in stack:
+                    state[j] = 3
+                    item_errors.append(ItemError(index=j, error=error))
+                stack.clear()
+            elif state[parent] == 0:
+                state[parent] = 1
+                stack.append((parent, iter(units[parent].parent_refs)))
+    return order
+
+
+async def _build_blocks(
+        uow: AbstractUnitHolder,
+        units: Dict[int, UnitImport],
+        order: List[int],
+        item_errors: List[ItemError],
+        state_store: AbstractStateStore,
+        submission_id: str
+) -> None:
+    """ Add the units to new or existing blocks in the unit of work, to be written on commit """
+    ref_rows = {unit.ref: i for i, unit in units.items() if unit.ref is not None}
+
+    stored_parent_ids = list({parent_id for unit in units.values() for parent_id in unit.parent_ids})
+    blocks_by_unit: Dict[int, Block] = dict()
+    if stored_parent_ids:
+        async for block in uow.repositories.blocks.get_all(unit_ids=stored_parent_ids):
+            for unit_id in block.entries:
+                blocks_by_unit[unit_id] = block
+
+    # rows without parents start new blocks, created together
+    root_rows = [i for i in order if not units[i].has_parents]
+    root_blocks = await uow.repositories.blocks.create_many([units[i].to_unit_input() for i in root_rows])
+    row_blocks: Dict[int, Block] = dict(zip(root_rows, root_blocks))
+    row_unit_ids: Dict[int, int] = {i: block.get_root_id() for i, block in row_blocks.items()}
+    for count, i in enumerate(order, start=1):
+        unit = units[i]
+        missing = [parent_id for parent_id in unit.parent_ids if parent_id not in blocks_by_unit]
+        failed = [ref for ref in unit.parent_refs if ref_rows[ref] not in row_blocks]
+        if missing:
+            item_errors.append(ItemError(index=i, error=f"Parent units not found: {missing}"))
+        elif failed:
+            item_errors.append(ItemError(index=i, error=f"Parent refs failed to import: {failed}"))
+        elif unit.has_parents:
+            parents = unit.parent_ids + [row_unit_ids[ref_rows[ref]] for ref in unit.parent_refs]
+            parent_blocks = [blocks_by_unit[parent_id] for parent_id in unit.parent_ids]
+            parent_blocks += [row_blocks[ref_rows[ref]] for ref in unit.parent_refs]
+            block = parent_blocks[0]
+            if any(parent_block is not block for parent_block in parent_blocks[1:]):
+                item_errors.append(ItemError(index=i, error="Parents must all be in the same block"))
+            else:
+                row_blocks[i] = block
+                row_unit_ids[i] = block.add_unit(unit.to_unit_input(), parents=parents)
+
+        if count % WRITE_BATCH_SIZE == 0:
+            progress = VALIDATED_PROGRESS + (BUILT_PROGRESS - VALIDATED_PROGRESS) * count // len(order)
+            await state_store.set_progress(submission_id, progress)
+
+
+@handlers.event_handler()
+async def units_import_submitted(
+        event: events.blocks.UnitsImportSubmitted,
+        state_store: AbstractStateStore,
+        uow_factory: AbstractUnitOfWorkFactory
+):
+    """
+    Units are validated and added to blocks in memory, then written in batches on commit.
+    As for datasets, the import is only committed if every row is valid.
+    """
+    async with uow_factory.get_uow(user_id=event.agent_id, write_team=event.write_team, release=event.release) as uow:
+        try:
+            await state_store.set_submission_status(event.submission_id, SubmissionStatus.PROCESSING)
+            await state_store.set_progress(event.submission_id, 0)
+            submission = await state_store.get_submission_data(agent_id=event.agent_id, submission_id=event.submission_id)
+            rows = read_unit_rows(submission.get('content', ''), submission.get('format'))
+
+            item_errors = []
+            units: Dict[int, UnitImport] = dict()
+            for i, row in enumerate(rows):
+                try:
+                    units[i] = UnitImport(**row)
+                except (ValidationError, TypeError) as e:
+                    item_errors.append(ItemError(index=i, error=str(e)))
+
+            order = _import_order(units, item_errors)
+
+            layouts = dict()
+            for i in order:
+                position = units[i].to_position()
+                if position is not None:
+                    try:
+                        await validate_position(uow, position, layouts)
+                    except Exception as e:
+                        item_errors.append(ItemError(index=i, error=str(e)))
+
+            if item_errors:
+                await state_store.add_submission_item_errors(event.submission_id, item_errors)
+                raise ValueError(f"Some items did not parse correctly")
+            await state_store.set_progress(event.submission_id, VALIDATED_PROGRESS)
+
+            await _build_blocks(uow, units, order, item_errors, state_store, event.submission_id)
+            if item_errors:
+                await state_store.add_submission_item_errors(event.submission_id, item_errors)
+                raise ValueError(f"Some items could not be added to blocks")
+            await state_store.set_progress(event.submission_id, BUILT_PROGRESS)
+
+            await uow.commit()
+            await state_store.set_progress(event.submission_id, 100)
+            await state_store.set_submission_status(event.submission_id, SubmissionStatus.COMPLETED)
+        except Exception as e:
+            await state_store.add_submission_errors(event.submission_id, [f"Failed to import units: {type(e).__name__, e}"])
+            await state_store.set_submission_status(event.submission_id, SubmissionStatus.FAILED)
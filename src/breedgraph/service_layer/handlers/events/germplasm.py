@@ -0,0 +1,20 @@
+from breedgraph.domain import events
+from breedgraph.service_layer.infrastructure import AbstractUnitOfWorkFactory
+
+from ..registry import handlers
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+@handlers.event_handler()
+async def germplasm_relationships_changed(
+        event: events.germplasm.GermplasmRelationshipsChanged,
+        uow_factory: AbstractUnitOfWorkFactory
+):
+    """
+    Apply committed relationship changes to the pedigree index of this process.
+    Changes that do not follow the indexed version are skipped, the index is then reloaded when next used.
+    """
+    if not uow_factory.pedigree_index.apply(event.version, added=event.added, removed=event.removed):
+        logger.debug(f"Pedigree index not at version {event.version - 1}, it will be reloaded when next used")
@@ -1,10 +1,7 @@
-from datetime import datetime
-
 from breedgraph.domain import events
 
 from ...infrastructure.notifications import email_templates
 from breedgraph.domain.model.references import FileReferenceStored
-from breedgraph.domain.model.archive import FileArchivalRecord, ArchiveState, LocalState
 
 from breedgraph.service_layer.infrastructure import AbstractNotifications, AbstractUnitOfWorkFactory, \
     FileManagementService, AbstractFileArchivalService
@@ -17,22 +14,19 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-async def mark_file_for_archival(
-        self,
+async def release_file(
         file_id: str,
-        file_size: int,
-        file_hash: str
+        file_management: FileManagementService,
+        archival_service: AbstractFileArchivalService
 ) -> None:
-    """Create an archival record for a large file"""
-    if not self.archival_service:
-        logger.warning(f"Archival service not configured, cannot archive file {file_id}")
-        return
-
-    try:
-
-        logger.info(f"File {file_id} marked for archival")
-    except Exception as e:
-        logger.exception(f"Failed to mark file {file_id} for archival: {e}")
+    """
+    Remove an upload from its stored blob, deleting the local blob if no references remain.
+    The blob is deleted by the archival service as part of the release, see release_file there.
+    """
+    record = await archival_service.release_file(file_id, delete_local=file_management.delete_file)
+    if record is None:
+        # not registered with a blob, e.g. the upload did not complete or was already released
+        await file_management.delete_file(uuid=file_id)
 
 
 @handlers.event_handler()
@@ -43,41 +37,44 @@ async def upload_completed(
         file_management: FileManagementService,
         archival_service: AbstractFileArchivalService
 ):
+    # Register the upload against the blob for its content, then move it to content-addressed storage.
+    # The upload is linked first so the blob can't be released and deleted after a duplicate upload is discarded.
+    await archival_service.add_file(
+        file_id=event.uuid,
+        file_size=event.file_size,
+        file_hash=event.file_hash
+    )
+    try:
+        await file_management.store_blob(uuid=event.uuid, file_hash=event.file_hash, file_size=event.file_size)
+    except Exception:
+        # the upload is unlinked again, its staged file is kept for the retry
+        await archival_service.release_file(event.uuid, delete_local=file_management.delete_file)
+        raise
+
+    # the reference is only given the file_id, and the user only notified, once the file is stored
     async with uow_factory.get_uow(user_id=event.user_id) as uow:
         reference: FileReferenceStored = await uow.repositories.references.get(reference_id=event.reference_id)
+        replaced_file_id = None
         if reference.file_id and not reference.file_id == event.uuid:
-            # delete any old referenced file if it exists
-            await file_management.delete_file(uuid=reference.file_id)
-            # mark for deletion from the archive also
-            await archival_service.update_archive_state(
-                file_id=event.uuid,
-                archive_state=ArchiveState.DELETION_PENDING
-            )
+            # the old referenced file is released once the new file is referenced
+            replaced_file_id = reference.file_id
         # update the reference to give it the file_id
         reference.file_id = event.uuid
-
         account = await uow.repositories.accounts.get(user_id=event.user_id)
-        message = email_templates.FileUploadSuccess(
-            account.user,
-            filename=reference.filename,
-            reference_id=reference.id
-        )
-        await notifications.send(
-            [account.user],
-            message
-        )
         await uow.commit()
 
-    # Prepare for archival
-    record = FileArchivalRecord(
-        file_id=event.uuid,
-        file_size=event.file_size,
-        file_hash=event.file_hash,
-        last_accessed=datetime.now(),
-        archive_state=ArchiveState.ARCHIVAL_PENDING,
-        local_state=LocalState.LOCAL
+    message = email_templates.FileUploadSuccess(
+        account.user,
+        filename=reference.filename,
+        reference_id=reference.id
+    )
+    await notifications.send(
+        [account.user],
+        message
     )
-    await archival_service.create(record)
+
+    if replaced_file_id is not None:
+        await release_file(replaced_file_id, file_management, archival_service)
 
 
 @handlers.event_handler()
@@ -110,9 +107,4 @@ async def file_reference_deleted(
         file_management: FileManagementService,
         archival_service: AbstractFileArchivalService
 ):
-    await file_management.delete_file(uuid=event.uuid)
-
-    await archival_service.update_archive_state(
-        file_id=event.uuid,
-        archive_state=ArchiveState.DELETION_PENDING
-    )
\ No newline at end of file
+    await release_file(event.uuid, file_management, archival_service)
@@ -1,10 +1,16 @@
 from .driver import AbstractAsyncDriver
 from .auth_service import AbstractAuthService
 from .notifications import AbstractNotifications
+from .id_allocator import AbstractIdAllocator
 from .unit_of_work import AbstractUnitOfWorkFactory, AbstractUnitHolder
 from .state_store import AbstractStateStore
+from .event_queue import AbstractEventQueue, InMemoryEventQueue, EventDelivery, LaneMetrics
+from .password_hashing import PasswordHashingService
 from .brute_force_protection import BruteForceProtectionService
+from .upload_sink import UploadSink
 from .file_management import FileManagementService
+from .access_recorder import LastAccessRecorder
 from .archival_service import AbstractFileArchivalService
 from .constraints import AbstractConstraintsHandler
-from .dependency_guards import AbstractDependencyGuards
\ No newline at end of file
+from .dependency_guards import AbstractDependencyGuards
+from .pedigree_index import PedigreeIndex
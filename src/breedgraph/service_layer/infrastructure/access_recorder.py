@@ -0,0 +1,59 @@
+import asyncio
+
+from typing import Awaitable, Callable, List, Set
+
+from breedgraph.config import ACCESS_FLUSH_INTERVAL
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class LastAccessRecorder:
+    """
+    Collects accessed keys in memory and writes them in batches.
+
+    Recording an access is a set insertion, so it can be called on every request.
+    A background task flushes the pending keys every interval seconds with a single call to flush_callback,
+    repeated accesses to the same key within an interval cost a single write.
+    """
+
+    def __init__(
+            self,
+            flush_callback: Callable[[List[str]], Awaitable[None]],
+            interval: float = ACCESS_FLUSH_INTERVAL
+    ):
+        self.flush_callback = flush_callback
+        self.interval = interval
+        self._pending: Set[str] = set()
+        self._task: asyncio.Task | None = None
+
+    def record(self, key: str) -> None:
+        self._pending.add(key)
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        keys = list(self._pending)
+        self._pending.clear()
+        try:
+            await self.flush_callback(keys)
+        except Exception as e:
+            logger.error(f"Failed to record access for {len(keys)} keys: {e}")
+            # keep them for the next attempt
+            self._pending.update(keys)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from asyncio import Queue
+from datetime import datetime
 import hashlib
 import aiofiles
 
 from breedgraph.custom_exceptions import NoResultFoundError
 from breedgraph.service_layer.infrastructure.driver import AbstractAsyncDriver
+from breedgraph.service_layer.infrastructure.access_recorder import LastAccessRecorder
+from breedgraph.service_layer.infrastructure.event_queue import AbstractEventQueue
 from breedgraph.domain.model.archive import (
     FileArchivalRecord, FileArchivalUpdate, ArchiveState, LocalState,
     ArchiveRequestor
@@ -18,7 +20,7 @@ from breedgraph.domain.events.archive import (
 )
 from breedgraph.config import FILE_STORAGE_PATH, ARCHIVE_ATTEMPT_LIMIT, RETRIEVE_ATTEMPT_LIMIT
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Awaitable, Callable, List
 
 import logging
 
@@ -35,25 +37,127 @@ class AbstractFileArchivalService(ABC):
         ArchiveState.RETRIEVING: ArchiveState.RETRIEVING,
         ArchiveState.DELETING: ArchiveState.DELETING,
     }
+    DELETION_STATES = {
+        ArchiveState.DELETION_PENDING,
+        ArchiveState.DELETING,
+        ArchiveState.DELETION_FAILED
+    }
+    RETRIEVAL_STATES = {
+        ArchiveState.RETRIEVAL_PENDING,
+        ArchiveState.RETRIEVING,
+        ArchiveState.RETRIEVAL_FAILED
+    }
 
-    def __init__(self, driver: AbstractAsyncDriver, queue: Queue):
+    def __init__(self, driver: AbstractAsyncDriver, queue: AbstractEventQueue):
         self.driver = driver
         self.queue = queue
         self.file_storage_path = Path(FILE_STORAGE_PATH)
+        self.access_recorder = LastAccessRecorder(self._mark_accessed)
+
+    async def start(self):
+        """Start writing batched last accessed times. Call once at application startup."""
+        await self.access_recorder.start()
+
+    async def stop(self):
+        """Write any pending last accessed times and stop. Call at application shutdown."""
+        await self.access_recorder.stop()
+
+    async def add_file(self, file_id: str, file_size: int, file_hash: str) -> FileArchivalRecord:
+        """
+        Register an uploaded file (by upload UUID) against the blob for its content.
+        A new blob record is created for archival if this content has not been stored before,
+        otherwise the existing blob gains another reference.
+        """
+        record = FileArchivalRecord(
+            file_id=file_hash,
+            file_size=file_size,
+            file_hash=file_hash,
+            last_accessed=datetime.now(),
+            archive_state=ArchiveState.ARCHIVAL_PENDING,
+            local_state=LocalState.LOCAL
+        )
+        stored = await self._add_file(file_id, record)
+
+        if stored.archive_state in self.DELETION_STATES:
+            # referenced again while marked for removal, keep it and ensure it is archived
+            logger.debug(f"Blob {stored.file_id} referenced again, returning to archival")
+            stored = await self._set_state_values(
+                stored.file_id,
+                archive_state=ArchiveState.ARCHIVAL_PENDING,
+                local_state=LocalState.LOCAL
+            )
+        elif stored.local_state == LocalState.EXPIRED:
+            # the upload has provided a fresh local copy of the blob
+            if stored.archive_state in self.RETRIEVAL_STATES:
+                await self._clear_attempts(stored.file_id)
+                stored = await self._set_state_values(
+                    stored.file_id,
+                    archive_state=ArchiveState.ARCHIVED,
+                    local_state=LocalState.LOCAL
+                )
+                await self.queue.put(RetrievalSucceeded(file_id=stored.file_id))
+            else:
+                stored = await self._set_state_values(stored.file_id, local_state=LocalState.LOCAL)
+        return stored
 
     @abstractmethod
-    async def create(self, record: FileArchivalRecord) -> FileArchivalRecord:
-        """Create a new archival record"""
+    async def _add_file(self, file_id: str, record: FileArchivalRecord) -> FileArchivalRecord:
+        """ Merge the blob record (creating it from record if new) and link the upload file_id to it """
+        ...
+
+    async def release_file(
+            self,
+            file_id: str,
+            delete_local: Callable[[str], Awaitable[None]] | None = None
+    ) -> FileArchivalRecord | None:
+        """
+        Remove an upload UUID from the blob it references.
+        If no references to the blob remain it is marked for deletion from the archive,
+        and delete_local is awaited with the blob ID before the release is committed.
+        Uploads of the same content can't link to the blob until then,
+        so the local blob is never deleted after another upload has relied on it.
+        Returns the blob record, or None if the file was not registered (or was already released).
+        """
+        record = await self._release_file(file_id, delete_local)
+        if record is not None and not record.file_ids:
+            logger.debug(f"Blob {record.file_id} has no remaining references, marked for deletion")
+        return record
+
+    @abstractmethod
+    async def _release_file(
+            self,
+            file_id: str,
+            delete_local: Callable[[str], Awaitable[None]] | None
+    ) -> FileArchivalRecord | None:
+        """
+        In a single transaction, holding the blob record against concurrent add_file:
+        unlink the upload file_id from its blob (or find the record keyed by file_id, from before content addressing),
+        mark the blob for deletion if no references remain and if so await delete_local with the blob ID.
+        Return the blob record or None if not found.
+        """
         ...
 
     @abstractmethod
     async def get(self, file_id: str) -> FileArchivalRecord:
-        """Get an existing archival record"""
+        """Get an existing archival record by blob ID
+        If not found raise NoResultFoundError
+        """
+        ...
+
+    @abstractmethod
+    async def get_for_file(self, file_id: str) -> FileArchivalRecord:
+        """Get the archival record for the blob referenced by an upload UUID
+        If not found raise NoResultFoundError
+        """
         ...
 
+    def mark_accessed(self, file_id: str):
+        """ Record an access, the last accessed attribute is updated in the next batch """
+        self.access_recorder.record(file_id)
+
     @abstractmethod
-    async def mark_accessed(self, file_id: str):
-        """ Update the last accessed attribute """
+    async def _mark_accessed(self, file_ids: List[str]):
+        """ Update the last accessed attribute for a batch of records """
         ...
 
     async def collect_for_archival(self, resume: bool = False) -> FileArchivalRecord | None:
@@ -172,7 +276,7 @@ class AbstractFileArchivalService(ABC):
 
     @abstractmethod
     async def delete_record(self, file_id: str):
-        """ Delete the archival record for the corresponding file_id """
+        """ Delete the archival record for the corresponding blob, unless it has been referenced again """
         ...
 
     @abstractmethod
@@ -1,7 +1,12 @@
 import logging
 from operator import truediv
 
+from typing import Dict
+
+from breedgraph.config import MAX_CONCURRENT_LOGIN_ATTEMPTS
+from breedgraph.custom_exceptions import ServiceBusyError
 from breedgraph.service_layer.infrastructure.state_store import AbstractStateStore
+from breedgraph.service_layer.infrastructure.password_hashing import PasswordHashingService
 
 logger = logging.getLogger(__name__)
 
@@ -10,13 +15,27 @@ class BruteForceProtectionService:
     """
     Service to protect against brute force login attempts.
     Uses the state store to track failed login attempts per username/IP.
+
+    Password checks are run through the password hashing service,
+    with a limit on concurrent attempts per identifier,
+    so parallel guesses can't all be verified before the failed attempt count triggers a lockout.
     """
 
-    def __init__(self, state_store: AbstractStateStore, max_attempts: int = 5, lockout_duration: int = 300):
+    def __init__(
+            self,
+            state_store: AbstractStateStore,
+            password_hasher: PasswordHashingService | None = None,
+            max_attempts: int = 5,
+            lockout_duration: int = 300,
+            max_concurrent_attempts: int = MAX_CONCURRENT_LOGIN_ATTEMPTS
+    ):
 
         self.state_store = state_store
+        self.password_hasher = password_hasher or PasswordHashingService()
         self.max_attempts = max_attempts
         self.lockout_duration = lockout_duration
+        self.max_concurrent_attempts = max_concurrent_attempts
+        self._in_flight: Dict[str, int] = dict()
 
     async def is_locked_out(self, identifier: str) -> bool:
         """
@@ -33,6 +52,38 @@ class BruteForceProtectionService:
         else:
             return False
 
+    async def verify_password(self, identifier: str, password: str, password_hash: str) -> bool:
+        """
+        Check a password against a stored hash, recording a failed attempt if it does not match.
+
+        Args:
+            identifier: Username or IP address
+            password: The password provided
+            password_hash: The stored bcrypt hash
+
+        Returns:
+            True if the password matches, False otherwise
+
+        Raises:
+            ServiceBusyError: if too many attempts for this identifier are in progress,
+            or the password hashing service is saturated
+        """
+        if self._in_flight.get(identifier, 0) >= self.max_concurrent_attempts:
+            logger.warning(f"Concurrent login attempt rejected for {identifier}")
+            raise ServiceBusyError("A login attempt is already in progress, please try again shortly")
+
+        self._in_flight[identifier] = self._in_flight.get(identifier, 0) + 1
+        try:
+            verified = await self.password_hasher.verify(password, password_hash)
+        finally:
+            self._in_flight[identifier] -= 1
+            if not self._in_flight[identifier]:
+                del self._in_flight[identifier]
+
+        if not verified:
+            await self.record_failed_attempt(identifier)
+        return verified
+
     async def record_failed_attempt(self, identifier: str) -> None:
         """
         Record a failed login attempt and potentially trigger lockout.
@@ -8,4 +8,8 @@ class AbstractAsyncDriver(ABC):
 
     @abstractmethod
     async def close(self):
-        ...
\ No newline at end of file
+        ...
+
+    async def ensure_schema(self):
+        """ Bring the database schema (indexes, constraints etc.) up to date, called at startup """
+        pass
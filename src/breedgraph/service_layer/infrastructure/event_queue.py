@@ -0,0 +1,207 @@
+import time
+
+from abc import ABC, abstractmethod
+from asyncio import Event as Signal, PriorityQueue
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Dict, List, Set, Type
+
+from breedgraph.custom_exceptions import ServiceBusyError
+from breedgraph.domain.events import Event
+from breedgraph.config import (
+    DEFAULT_EVENT_LANE, EVENT_LANES, DEFAULT_EVENT_PRIORITY, EVENT_PRIORITIES, EVENT_LANE_DEPTHS
+)
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EventDelivery:
+    event: Event
+    lane: str
+    delivery_id: str | None = None
+    attempts: int = 1
+    priority: int = DEFAULT_EVENT_PRIORITY
+    enqueued: float = field(default_factory=time.time)
+    # handlers that completed on an earlier attempt, not run again on redelivery
+    handled: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class LaneMetrics:
+    """ Running totals for the events handled in a lane by this process """
+    handled: int = 0
+    failed: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    handler_seconds: float = 0.0
+    max_handler_seconds: float = 0.0
+
+    def record(self, wait_seconds: float, handler_seconds: float, failed: bool = False) -> None:
+        self.handled += 1
+        if failed:
+            self.failed += 1
+        self.wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        self.handler_seconds += handler_seconds
+        self.max_handler_seconds = max(self.max_handler_seconds, handler_seconds)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            'handled': self.handled,
+            'failed': self.failed,
+            'mean_wait_seconds': self.wait_seconds / self.handled if self.handled else 0.0,
+            'max_wait_seconds': self.max_wait_seconds,
+            'mean_handler_seconds': self.handler_seconds / self.handled if self.handled else 0.0,
+            'max_handler_seconds': self.max_handler_seconds
+        }
+
+
+def get_event_types() -> Dict[str, Type[Event]]:
+    """ Event classes by name, to restore events from a serialized queue """
+    event_types = dict()
+    pending = [Event]
+    while pending:
+        event_type = pending.pop()
+        for subclass in event_type.__subclasses__():
+            event_types[subclass.__name__] = subclass
+            pending.append(subclass)
+    return event_types
+
+
+class AbstractEventQueue(ABC):
+    """
+    Events published by handlers and the unit of work, consumed by the MessageBus workers.
+
+    Each event type is routed to a lane, and workers consume from a single lane,
+    so slow events (e.g. dataset submission) are handled by a separate pool of workers.
+    Within a lane, events are taken in priority order (lowest first) then in order of arrival.
+    When a lane has a maximum depth and that many events are waiting, put raises ServiceBusyError.
+
+    A delivery is acknowledged once all handlers have run,
+    if a handler raises, the delivery is nacked and may be redelivered, depending on the backend.
+    Each handler that completes is recorded with mark_handled, so a redelivery only runs the handlers that failed
+    (or had not yet run when a worker stopped part way).
+    """
+
+    def __init__(
+            self,
+            lanes: Dict[str, str] | None = None,
+            priorities: Dict[str, int] | None = None,
+            depths: Dict[str, int] | None = None
+    ):
+        self.lanes = EVENT_LANES if lanes is None else lanes
+        self.priorities = EVENT_PRIORITIES if priorities is None else priorities
+        self.depths = EVENT_LANE_DEPTHS if depths is None else depths
+
+    def lane_for(self, event: Event) -> str:
+        return self.lanes.get(type(event).__name__, DEFAULT_EVENT_LANE)
+
+    def priority_for(self, event: Event) -> int:
+        return self.priorities.get(type(event).__name__, DEFAULT_EVENT_PRIORITY)
+
+    def lane_priorities(self, lane: str) -> List[int]:
+        """ The distinct priorities of events that may be routed to the lane, in order """
+        priorities = {DEFAULT_EVENT_PRIORITY}
+        priorities.update(
+            priority for event_name, priority in self.priorities.items()
+            if self.lanes.get(event_name, DEFAULT_EVENT_LANE) == lane
+        )
+        return sorted(priorities)
+
+    async def put(self, event: Event) -> None:
+        lane = self.lane_for(event)
+        max_depth = self.depths.get(lane, 0)
+        if max_depth and await self.depth(lane) >= max_depth:
+            logger.warning(f"Event lane {lane} is full, refusing {type(event).__name__}")
+            raise ServiceBusyError("Too many requests are waiting to be processed, please try again later")
+        await self._put(EventDelivery(event=event, lane=lane, priority=self.priority_for(event)))
+
+    @abstractmethod
+    async def _put(self, delivery: EventDelivery) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def depth(self, lane: str) -> int:
+        """ Events waiting in the lane, not including those being handled """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, lane: str) -> EventDelivery:
+        """ Wait for the next event in the lane """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def ack(self, delivery: EventDelivery) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def nack(self, delivery: EventDelivery, error: Exception) -> None:
+        """ A handler failed, retry the delivery or give up on it """
+        raise NotImplementedError
+
+    async def mark_handled(self, delivery: EventDelivery, handler: str) -> None:
+        """ A handler completed for the delivery, backends that redeliver keep this with the delivery """
+        delivery.handled.add(handler)
+
+    async def join(self) -> None:
+        """ Wait for events that would be lost on shutdown """
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class InMemoryEventQueue(AbstractEventQueue):
+    """
+    Events are held in process, consumed only by this process and lost on restart.
+    Failed deliveries are logged and dropped, there is no retry.
+    """
+
+    def __init__(
+            self,
+            lanes: Dict[str, str] | None = None,
+            priorities: Dict[str, int] | None = None,
+            depths: Dict[str, int] | None = None
+    ):
+        super().__init__(lanes, priorities, depths)
+        self._queues: Dict[str, PriorityQueue] = defaultdict(PriorityQueue)
+        # arrival order, to keep events of the same priority first in first out
+        self._sequence = count()
+        # events put and not yet acked or nacked, across all lanes
+        self._unfinished = 0
+        self._finished = Signal()
+        self._finished.set()
+
+    async def _put(self, delivery: EventDelivery) -> None:
+        self._unfinished += 1
+        self._finished.clear()
+        await self._queues[delivery.lane].put((delivery.priority, next(self._sequence), delivery))
+
+    async def depth(self, lane: str) -> int:
+        return self._queues[lane].qsize()
+
+    async def get(self, lane: str) -> EventDelivery:
+        _, _, delivery = await self._queues[lane].get()
+        return delivery
+
+    def _done(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    async def ack(self, delivery: EventDelivery) -> None:
+        self._done()
+
+    async def nack(self, delivery: EventDelivery, error: Exception) -> None:
+        logger.error(f"Dropping {type(delivery.event).__name__} after handler failure: {error}")
+        self._done()
+
+    def qsize(self) -> int:
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def join(self) -> None:
+        """ Wait until every event has been handled, including events published by handlers """
+        await self._finished.wait()
@@ -1,20 +1,20 @@
 import logging
 
-import aiofiles
 import asyncio
-import hashlib
 
 from pathlib import Path
 from fastapi import UploadFile, HTTPException
 from typing import Callable
 
 from breedgraph.service_layer.infrastructure.state_store import AbstractStateStore
+from breedgraph.service_layer.infrastructure.upload_sink import UploadSink
+from breedgraph.service_layer.infrastructure.file_store import ContentAddressedFileStore
 
 from breedgraph.config import (
     FILE_STORAGE_PATH,
-    MAX_CONCURRENT_UPLOADS
+    MAX_CONCURRENT_UPLOADS,
+    UPLOAD_CHUNK_SIZE
 )
-from breedgraph.custom_exceptions import IllegalOperationError
 from breedgraph.domain.model.submissions import SubmissionStatus
 
 logger = logging.getLogger(__name__)
@@ -26,7 +26,7 @@ class FileManagementService:
             state_store: AbstractStateStore
     ):
         self.file_storage_path = Path(FILE_STORAGE_PATH)
-        self.file_storage_path.mkdir(parents=True, exist_ok=True)
+        self.store = ContentAddressedFileStore(self.file_storage_path)
         self.state_store = state_store
         self.upload_semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
@@ -45,23 +45,28 @@ class FileManagementService:
 
         async with self.upload_semaphore:
             try:
-                file_path = Path(self.file_storage_path, uuid)
+                file_path = self.store.path(uuid)
                 file_size = file.size
                 logger.debug(f"Saving file {file.filename} with size {file_size} bytes as {uuid} ")
                 await self.state_store.set_status(uuid, SubmissionStatus.PROCESSING)
 
-                # Calculate hash while writing
-                hash_obj = hashlib.sha256()
-                async with aiofiles.open(file_path, 'wb') as buffer:
-                    bytes_written = 0
-                    while chunk := await file.read(8192):
-                        await buffer.write(chunk)
-                        hash_obj.update(chunk)
-                        bytes_written += len(chunk)
-                        progress = int((bytes_written / file_size) * 100)
-                        await self.state_store.set_file_progress(uuid, progress)
-
-                file_hash = hash_obj.hexdigest()
+                # Hashing and writing are handled by the sink worker thread
+                sink = UploadSink(file_path)
+                await sink.start()
+                try:
+                    progress = 0
+                    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                        await sink.write(chunk)
+                        if file_size:
+                            chunk_progress = int((sink.bytes_written / file_size) * 100)
+                            if chunk_progress > progress:
+                                progress = chunk_progress
+                                await self.state_store.set_file_progress(uuid, progress)
+                    file_size, file_hash = await sink.close()
+                except Exception:
+                    await sink.abort()
+                    raise
+
                 logger.debug(f"File {uuid} saved with hash {file_hash}")
 
                 if on_complete:
@@ -76,17 +81,20 @@ class FileManagementService:
                 if on_failed:
                     await on_failed(uuid)
 
+    def get_path(self, key: str) -> Path:
+        """ Local path for a staged upload (by UUID) or a stored blob (by blob ID) """
+        return self.store.path(key)
+
+    async def store_blob(self, uuid: str, file_hash: str, file_size: int | None = None) -> str:
+        """
+        Commit a saved upload to content-addressed storage.
+        If an identical file is already stored the upload is discarded.
+        Returns the blob ID.
+        """
+        return await asyncio.to_thread(self.store.commit, uuid, file_hash, file_size)
+
     async def delete_file(self, uuid: str) -> None:
-        """Delete file locally """
+        """Delete a staged upload or blob locally """
         if not uuid:
             raise ValueError("UUID cannot be empty")
-
-        file_path = Path(self.file_storage_path, uuid)
-
-        if file_path.exists():
-            logger.debug(f"Deleting file {file_path}")
-            if file_path.is_dir():
-                raise IllegalOperationError(
-                    f"Attempt to remove directory {file_path}, uuid supplied is empty string!"
-                )
-            file_path.unlink(missing_ok=True)
\ No newline at end of file
+        await asyncio.to_thread(self.store.delete, uuid)
@@ -0,0 +1,81 @@
+import os
+
+from pathlib import Path
+from uuid import uuid4
+
+from breedgraph.custom_exceptions import IllegalOperationError
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class ContentAddressedFileStore:
+    """
+    Local file storage keyed by content hash.
+
+    Uploads are first written to a staging path named by their upload UUID,
+    then committed to a blob named by their SHA-256 hash.
+    Identical uploads therefore share a single blob on disk (and in the archive).
+
+    Blobs are kept alongside the staged uploads in the storage directory,
+    so files stored under a UUID before content addressing remain valid blobs, identified by that UUID.
+
+    Reference counting (which UUIDs point at which blob) is tracked in the archival records,
+    this class is only concerned with the local filesystem.
+    """
+
+    def __init__(self, storage_path: Path):
+        self.storage_path = storage_path
+        self.storage_path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def blob_id(file_hash: str) -> str:
+        return file_hash
+
+    def path(self, key: str) -> Path:
+        if not key:
+            raise ValueError("File key cannot be empty")
+        path = Path(self.storage_path, key)
+        if path.parent != self.storage_path:
+            raise IllegalOperationError(f"File key resolves outside of the file store: {key}")
+        return path
+
+    def has_blob(self, blob_id: str, file_size: int | None = None) -> bool:
+        """ A blob is considered present only if complete, i.e. not a partially restored copy """
+        blob_path = self.path(blob_id)
+        if not blob_path.is_file():
+            return False
+        return file_size is None or blob_path.stat().st_size == file_size
+
+    def commit(self, key: str, file_hash: str, file_size: int | None = None) -> str:
+        """
+        Move a staged upload to its content-addressed blob, or discard it if the blob is already present.
+        Returns the blob ID.
+        """
+        blob_id = self.blob_id(file_hash)
+        staged_path = self.path(key)
+        if key == blob_id:
+            return blob_id
+
+        if self.has_blob(blob_id, file_size):
+            logger.debug(f"Blob {blob_id} already stored, discarding duplicate upload {key}")
+            staged_path.unlink(missing_ok=True)
+        else:
+            logger.debug(f"Storing upload {key} as blob {blob_id}")
+            os.replace(staged_path, self.path(blob_id))
+        return blob_id
+
+    def restore_path(self, blob_id: str) -> Path:
+        """ A temporary path to write a restored blob to before it is moved into place with replace """
+        return self.path(f"{blob_id}.{uuid4().hex}.restore")
+
+    def replace(self, source: Path, blob_id: str) -> None:
+        os.replace(source, self.path(blob_id))
+
+    def delete(self, key: str) -> None:
+        file_path = self.path(key)
+        if file_path.exists():
+            logger.debug(f"Deleting file {file_path}")
+            if file_path.is_dir():
+                raise IllegalOperationError(f"Attempt to remove directory {file_path}")
+            file_path.unlink(missing_ok=True)
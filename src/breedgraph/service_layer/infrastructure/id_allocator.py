@@ -0,0 +1,64 @@
+import asyncio
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+from breedgraph.config import ID_BLOCK_SIZE
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class AbstractIdAllocator(ABC):
+    """
+    Hands out IDs for new nodes from blocks reserved per counter name (hi/lo allocation).
+
+    A block is reserved by advancing the stored counter in one short transaction of its own,
+    so creating an aggregate no longer locks the counter for the lifetime of the creating transaction,
+    and concurrent writers only contend when a block is exhausted.
+
+    IDs remain unique across processes, but are not contiguous or strictly ordered by creation:
+    each process draws from its own block, and unused IDs in a block are lost on restart.
+    """
+
+    def __init__(self, block_size: int = ID_BLOCK_SIZE):
+        self.block_size = block_size
+        # name: (next, end) where end is exclusive
+        self._blocks: Dict[str, Tuple[int, int]] = dict()
+        self._locks: Dict[str, asyncio.Lock] = dict()
+
+    async def next_id(self, name: str) -> int:
+        return (await self.allocate(name, 1))[0]
+
+    async def allocate(self, name: str, count: int) -> List[int]:
+        """ Return count IDs for the named counter, in ascending order """
+        if count <= 0:
+            return []
+        if name not in self._locks:
+            self._locks[name] = asyncio.Lock()
+
+        async with self._locks[name]:
+            ids = []
+            start, end = self._blocks.get(name, (0, 0))
+            available = end - start
+            if available:
+                taken = min(available, count)
+                ids.extend(range(start, start + taken))
+                start += taken
+
+            remaining = count - len(ids)
+            if remaining:
+                # reserve the remainder and a fresh block in one go, so large batches need a single reservation
+                size = remaining + self.block_size
+                first = await self._reserve(name, size)
+                logger.debug(f"Reserved {size} IDs for {name} from {first}")
+                ids.extend(range(first, first + remaining))
+                start, end = first + remaining, first + size
+
+            self._blocks[name] = (start, end)
+            return ids
+
+    @abstractmethod
+    async def _reserve(self, name: str, size: int) -> int:
+        """ Atomically advance the named counter by size and return the first reserved ID """
+        ...
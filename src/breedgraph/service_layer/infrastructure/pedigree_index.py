@@ -0,0 +1,263 @@
+import asyncio
+
+import numpy as np
+
+from typing import Awaitable, Callable, Dict, Iterable, List, Set, Tuple
+
+import logging
+logger = logging.getLogger(__name__)
+
+Edge = Tuple[int, int]
+
+# changes held outside the arrays before they are rebuilt, as a minimum and as a fraction of the stored edges
+COMPACT_MIN_CHANGES = 1000
+COMPACT_FRACTION = 0.1
+
+
+class PedigreeIndex:
+    """
+    The germplasm pedigree (SOURCE_FOR relationships) held in memory, for traversal without variable length graph queries.
+
+    Edges are stored as compressed sparse rows, sorted entry IDs with an array of row offsets and an array
+    of neighbour positions in each direction (sources to sinks and sinks to sources).
+    Searches are breadth first, taking a whole level of the pedigree per step as array operations,
+    so inbred pedigrees with many paths between entries cost no more than the entries reached.
+
+    Edges added or removed since the arrays were built are held in a small delta and applied during searches,
+    the arrays are rebuilt when the delta grows too large.
+
+    An index is shared by the units of work of a process and labelled with the stored pedigree version,
+    a counter advanced by each transaction that changes relationships.
+    A unit of work takes a snapshot at the version its transaction reads, a copy to record its own changes.
+    The shared index is reloaded only when the stored version is ahead of it,
+    a transaction reading an older version (begun before a change the index already holds) loads a private copy.
+    Committed changes are applied to the shared index by the GermplasmRelationshipsChanged event handler,
+    which runs in the one process that takes the event, other processes reload in full when they next read a newer version.
+    """
+
+    def __init__(self):
+        self.version: int | None = None
+        self._lock = asyncio.Lock()
+        self._build([])
+
+    def _build(self, edges: Iterable[Edge]) -> None:
+        edges = np.array(list(edges), dtype=np.int64).reshape(-1, 2)
+        sources, sinks = edges[:, 0], edges[:, 1]
+        self._ids = np.unique(edges)
+        source_positions = np.searchsorted(self._ids, sources)
+        sink_positions = np.searchsorted(self._ids, sinks)
+        self._sink_indptr, self._sink_indices = self._compress(source_positions, sink_positions)
+        self._source_indptr, self._source_indices = self._compress(sink_positions, source_positions)
+        self._edge_count = len(edges)
+
+        self._added_sinks: Dict[int, Set[int]] = dict()
+        self._added_sources: Dict[int, Set[int]] = dict()
+        self._removed: Set[Edge] = set()
+        self._removed_keys: np.ndarray | None = None
+
+    def _compress(self, rows: np.ndarray, columns: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        indptr = np.zeros(len(self._ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(self._ids)), out=indptr[1:])
+        return indptr, columns[np.argsort(rows, kind='stable')]
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count + sum(len(sinks) for sinks in self._added_sinks.values()) - len(self._removed)
+
+    def load(self, edges: Iterable[Edge], version: int) -> None:
+        self._build(edges)
+        self.version = version
+        logger.debug(f"Loaded pedigree index version {version} with {self._edge_count} relationships")
+
+    async def snapshot(self, version: int, read_edges: Callable[[], Awaitable[List[Edge]]]) -> "PedigreeIndex":
+        """
+        A copy of the index at the given version, read_edges returns the stored relationships at that version.
+        The shared index is reloaded if it is behind, but never moved back to an older version.
+        """
+        async with self._lock:
+            if self.version is None or version > self.version:
+                self.load(await read_edges(), version)
+            elif version < self.version:
+                index = PedigreeIndex()
+                index.load(await read_edges(), version)
+                return index
+            return self.copy()
+
+    def copy(self) -> "PedigreeIndex":
+        """ A copy sharing the (unchanging) arrays, with its own delta """
+        index = PedigreeIndex.__new__(PedigreeIndex)
+        index.__dict__.update(self.__dict__)
+        index._lock = asyncio.Lock()
+        index._added_sinks = {source: set(sinks) for source, sinks in self._added_sinks.items()}
+        index._added_sources = {sink: set(sources) for sink, sources in self._added_sources.items()}
+        index._removed = set(self._removed)
+        return index
+
+    def apply(self, version: int, added: Iterable[Edge] = (), removed: Iterable[Edge] = ()) -> bool:
+        """
+        Apply a committed change, if it follows the version held.
+        Otherwise, the index is left to be reloaded when next used.
+        """
+        if self.version is None or version != self.version + 1:
+            return False
+        self.remove_edges(removed)
+        self.add_edges(added)
+        self.version = version
+        return True
+
+    def _has_stored_edge(self, source_id: int, sink_id: int) -> bool:
+        position = np.searchsorted(self._ids, source_id)
+        if position == len(self._ids) or self._ids[position] != source_id:
+            return False
+        sinks = self._sink_indices[self._sink_indptr[position]:self._sink_indptr[position + 1]]
+        return bool(np.any(self._ids[sinks] == sink_id))
+
+    def add_edges(self, edges: Iterable[Edge]) -> None:
+        for source_id, sink_id in edges:
+            if (source_id, sink_id) in self._removed:
+                self._removed.discard((source_id, sink_id))
+                self._removed_keys = None
+            elif not self._has_stored_edge(source_id, sink_id):
+                self._added_sinks.setdefault(source_id, set()).add(sink_id)
+                self._added_sources.setdefault(sink_id, set()).add(source_id)
+        self._compact_if_large()
+
+    def remove_edges(self, edges: Iterable[Edge]) -> None:
+        for source_id, sink_id in edges:
+            if sink_id in self._added_sinks.get(source_id, ()):
+                self._added_sinks[source_id].discard(sink_id)
+                self._added_sources[sink_id].discard(source_id)
+            elif self._has_stored_edge(source_id, sink_id):
+                self._removed.add((source_id, sink_id))
+                self._removed_keys = None
+        self._compact_if_large()
+
+    def _compact_if_large(self) -> None:
+        changes = sum(len(sinks) for sinks in self._added_sinks.values()) + len(self._removed)
+        if changes > max(COMPACT_MIN_CHANGES, COMPACT_FRACTION * self._edge_count):
+            self._build(self.edges())
+
+    def edges(self) -> List[Edge]:
+        sources = np.repeat(self._ids, np.diff(self._sink_indptr))
+        sinks = self._ids[self._sink_indices]
+        edges = [
+            edge for edge in zip(sources.tolist(), sinks.tolist())
+            if edge not in self._removed
+        ]
+        edges.extend((source, sink) for source, sinks in self._added_sinks.items() for sink in sinks)
+        return edges
+
+    def _step(self, frontier: np.ndarray, forward: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """ (origin, neighbour) ID pairs for each relationship from the frontier, to sinks if forward else to sources """
+        if forward:
+            indptr, indices, added = self._sink_indptr, self._sink_indices, self._added_sinks
+        else:
+            indptr, indices, added = self._source_indptr, self._source_indices, self._added_sources
+
+        positions = np.searchsorted(self._ids, frontier)
+        found = positions < len(self._ids)
+        found[found] = self._ids[positions[found]] == frontier[found]
+        positions = positions[found]
+        starts = indptr[positions]
+        counts = indptr[positions + 1] - starts
+        total = int(counts.sum())
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        origins = np.repeat(frontier[found], counts)
+        neighbours = self._ids[indices[offsets + np.arange(total)]]
+
+        if self._removed:
+            if self._removed_keys is None:
+                self._removed_keys = np.array(
+                    [(source << 32) | sink for source, sink in self._removed], dtype=np.int64
+                )
+            keys = (origins << 32) | neighbours if forward else (neighbours << 32) | origins
+            kept = ~np.isin(keys, self._removed_keys)
+            origins, neighbours = origins[kept], neighbours[kept]
+
+        if added:
+            extra = [(origin, neighbour) for origin in frontier.tolist() for neighbour in added.get(origin, ())]
+            if extra:
+                extra = np.array(extra, dtype=np.int64)
+                origins = np.concatenate([origins, extra[:, 0]])
+                neighbours = np.concatenate([neighbours, extra[:, 1]])
+        return origins, neighbours
+
+    def _levels(self, start_ids: int | Iterable[int], forward: bool, limit: int | None = None):
+        """ Yield (origins, entry_ids) for each level of a breadth first search, entries are yielded once """
+        visited = np.unique(np.array(start_ids, dtype=np.int64).reshape(-1))
+        frontier = visited
+        depth = 0
+        while frontier.size and (limit is None or depth < limit):
+            origins, neighbours = self._step(frontier, forward)
+            neighbours, first = np.unique(neighbours, return_index=True)
+            origins = origins[first]
+            new = ~np.isin(neighbours, visited, assume_unique=True)
+            frontier, origins = neighbours[new], origins[new]
+            if not frontier.size:
+                break
+            visited = np.union1d(visited, frontier)
+            depth += 1
+            yield origins, frontier
+
+    def get_ancestor_ids(self, entry_id: int, path_length_limit: int | None = None) -> List[int]:
+        """ Sources of the entry, their sources and so on, nearest first, a path_length_limit of 0 or None is no limit """
+        return [i for _, level in self._levels(entry_id, False, path_length_limit or None) for i in level.tolist()]
+
+    def get_descendant_ids(self, entry_id: int, path_length_limit: int | None = None) -> List[int]:
+        """ Sinks of the entry, their sinks and so on, nearest first, a path_length_limit of 0 or None is no limit """
+        return [i for _, level in self._levels(entry_id, True, path_length_limit or None) for i in level.tolist()]
+
+    def get_path(self, source_id: int, sink_id: int) -> List[int] | None:
+        """ The entry IDs along a shortest path from source to sink, or None if there is no path """
+        if source_id == sink_id:
+            return [source_id]
+        parents: Dict[int, int] = dict()
+        for origins, level in self._levels(source_id, True):
+            parents.update(zip(level.tolist(), origins.tolist()))
+            if sink_id in parents:
+                path = [sink_id]
+                while path[-1] != source_id:
+                    path.append(parents[path[-1]])
+                return path[::-1]
+        return None
+
+    def has_path(self, source_id: int, sink_id: int) -> bool:
+        if source_id == sink_id:
+            return True
+        for _, level in self._levels(source_id, True):
+            # levels are sorted
+            position = np.searchsorted(level, sink_id)
+            if position < len(level) and level[position] == sink_id:
+                return True
+        return False
+
+    def would_create_cycle(self, source_id: int, sink_id: int) -> bool:
+        """ Whether adding a relationship from source to sink would close a cycle """
+        return self.has_path(sink_id, source_id)
+
+    def get_cycle_ids(self, edges: Iterable[Edge]) -> List[int]:
+        """
+        Entries in (or following) a cycle if the relationships were added, empty if they would not close a cycle.
+        The whole batch is checked at once: any cycle passes through an added relationship,
+        so lies among the added sinks and their descendants, which are sorted topologically by removing
+        entries without sources among them until none remain or a cycle prevents any more being removed.
+        """
+        edges = list(edges)
+        if not edges:
+            return []
+        index = self.copy()
+        index.add_edges(edges)
+        sinks = np.unique(np.array([sink_id for _, sink_id in edges], dtype=np.int64))
+        region = np.concatenate([sinks, *(level for _, level in index._levels(sinks, True))])
+        region = np.unique(region)
+        origins, neighbours = index._step(region, True)
+        inside = np.isin(neighbours, region)
+        origins, neighbours = origins[inside], neighbours[inside]
+        while region.size:
+            roots = np.setdiff1d(region, neighbours, assume_unique=False)
+            if not roots.size:
+                break
+            kept = ~np.isin(origins, roots)
+            origins, neighbours = origins[kept], neighbours[kept]
+            region = np.setdiff1d(region, roots, assume_unique=True)
+        return region.tolist()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Self, List, AsyncGenerator
+from typing import Self, List, Dict, AsyncGenerator
 from breedgraph.domain.model.submissions import SubmissionStatus, SubmissionKeys
 from uuid import uuid4
 from breedgraph.config import SUBMISSION_RETENTION_DAYS, ANALYSIS_RETENTION_DAYS
@@ -8,6 +8,11 @@ from breedgraph.domain.model.errors import ItemError
 
 
 class AbstractStateStore(ABC):
+    """
+    Writes that make up a single operation (e.g. registering a submission) are grouped
+    into one abstract method so implementations can apply them atomically in a single round-trip,
+    and reads have batch counterparts that accept a list of keys.
+    """
 
     @classmethod
     @abstractmethod
@@ -28,11 +33,30 @@ class AbstractStateStore(ABC):
 
     """ Agent and Status control (for dataset, analysis and file management) """
     @abstractmethod
-    async def _set_agent(self, agent_id: int, key: str):
+    async def verify_agent(self, agent_id: int, key: str):
         ...
 
+    @staticmethod
+    def _check_agent(agent_id: int, key: str, stored_agent_id: int | None):
+        if stored_agent_id is None:
+            raise ValueError(f"Agent information not found for key: {key}")
+        if not agent_id == stored_agent_id:
+            raise ValueError(f"Requesting user does not match stored agent for this key: {key}")
+
+    async def get_state(self, agent_id: int, key: str) -> Dict[str, object]:
+        """
+        Get the status, errors, item_errors, dataset_id, file_id and progress for a key in a single read,
+        after verifying the agent.
+
+        Keys of the returned dict are SubmissionKeys values, or 'progress'.
+        """
+        state = await self._get_state(key)
+        self._check_agent(agent_id, key, state.pop(SubmissionKeys.AGENT.value))
+        return state
+
     @abstractmethod
-    async def verify_agent(self, agent_id: int, key: str):
+    async def _get_state(self, key: str) -> Dict[str, object]:
+        """ As get_state, but includes the stored agent ID under SubmissionKeys.AGENT and is not verified """
         ...
 
     @abstractmethod
@@ -64,22 +88,23 @@ class AbstractStateStore(ABC):
 
     async def store_submission(self, agent_id: int, submission: dict) -> str:
         submission_id = uuid4().hex
-        await self._set_agent(agent_id, submission_id)
-        await self._store_user_submission(agent_id, submission_id)
-        await self._set_submission_data(submission_id, submission)
-        await self.set_submission_status(submission_id, SubmissionStatus.PENDING)
+        await self._create_submission(agent_id, submission_id, submission)
         return submission_id
 
+    @abstractmethod
+    async def _create_submission(self, agent_id: int, submission_id: str, submission: dict):
+        """ Atomically set the agent, user submission index, submission data and PENDING status """
+        ...
+
     async def get_user_submissions(self, agent_id: int) -> List[str]:
         """ Return a list of submission ID """
         submission_ids = await self._get_user_submissions(agent_id)
-        valid_submissions = []
-        for submission_id in submission_ids:
-            if await self._submission_exists(submission_id):
-                valid_submissions.append(submission_id)
-            else:
-                # clean up expired submission
-                await self._remove_user_submission(agent_id, submission_id)
+        exists = await self._keys_exist(submission_ids)
+        valid_submissions = [submission_id for submission_id, e in zip(submission_ids, exists) if e]
+        expired = [submission_id for submission_id, e in zip(submission_ids, exists) if not e]
+        if expired:
+            # clean up expired submissions
+            await self._remove_user_submissions(agent_id, expired)
         return valid_submissions
 
     async def get_submission_data(self, agent_id: int, submission_id: str):
@@ -111,35 +136,40 @@ class AbstractStateStore(ABC):
         return await self._get_submission_item_errors(submission_id)
 
     async def set_submission_status(self, submission_id: str, status: SubmissionStatus):
-        await self.set_status(submission_id, status)
         if status == SubmissionStatus.COMPLETED:
             # remove data if successful, no need to keep it in redis,
             # it can be accessed via the dataset_id from the db
-            await self._remove_submission_data(submission_id)
-            # reset expiry from when complete
-            await self._set_expiry(submission_id, duration_seconds=60 * 60 * 24 * SUBMISSION_RETENTION_DAYS)
-
-
-    @abstractmethod
-    async def _store_user_submission(self, agent_id: int, submission_id: str):
-        """ Store a submission ID for the given user """
-        ...
+            # and reset expiry from when complete
+            await self._set_final_status(
+                submission_id,
+                status,
+                duration_seconds=60 * 60 * 24 * SUBMISSION_RETENTION_DAYS,
+                remove_keys=[SubmissionKeys.DATA]
+            )
+        else:
+            await self.set_status(submission_id, status)
 
     @abstractmethod
-    async def _get_user_submissions(self, agent_id: int) -> List[str]:
+    async def _set_final_status(
+            self,
+            key: str,
+            status: SubmissionStatus,
+            duration_seconds: int,
+            remove_keys: List[SubmissionKeys] | None = None
+    ):
+        """ Atomically set the status, remove the given fields and reset the expiry """
         ...
 
     @abstractmethod
-    async def _submission_exists(self, submission_id) -> bool:
+    async def _keys_exist(self, keys: List[str]) -> List[bool]:
         ...
 
     @abstractmethod
-    async def _remove_user_submission(self, user_id, submission_id):
+    async def _get_user_submissions(self, agent_id: int) -> List[str]:
         ...
 
     @abstractmethod
-    async def _set_submission_data(self, submission_id: str, submission: dict):
-        """ Set submission data for the given submission ID """
+    async def _remove_user_submissions(self, user_id, submission_ids: List[str]):
         ...
 
     @abstractmethod
@@ -168,22 +198,16 @@ class AbstractStateStore(ABC):
     async def _set_submission_item_errors(self, submission_id: str, item_errors: List[ItemError]):
         ...
 
-    @abstractmethod
-    async def _remove_submission_data(self, submission_id: str):
-        ...
-
     """ Analysis submissions """
 
     async def store_analysis(self, agent_id: int, analysis: dict) -> str:
         analysis_id = uuid4().hex
-        await self._set_agent(agent_id, analysis_id)
-        await self._store_user_analysis(agent_id, analysis_id)
-        await self._set_analysis_config(analysis_id, analysis)
-        await self.set_submission_status(analysis_id, SubmissionStatus.PENDING)
+        await self._create_analysis(agent_id, analysis_id, analysis)
         return analysis_id
 
     @abstractmethod
-    async def _store_user_analysis(self, agent_id: int, analysis_id: str):
+    async def _create_analysis(self, agent_id: int, analysis_id: str, analysis: dict):
+        """ Atomically set the agent, user analysis index, analysis config and PENDING status """
         ...
 
     async def set_analysis_config(self, agent_id, analysis_id, analysis):
@@ -200,21 +224,26 @@ class AbstractStateStore(ABC):
         ...
 
     async def set_analysis_status(self, analysis_id: str, status: SubmissionStatus):
-        await self.set_status(analysis_id, status)
         if status == SubmissionStatus.COMPLETED:
             # reset expiry from when complete
-            await self._set_expiry(analysis_id, duration_seconds=60 * 60 * 24 * ANALYSIS_RETENTION_DAYS)
+            await self._set_final_status(
+                analysis_id,
+                status,
+                duration_seconds=60 * 60 * 24 * ANALYSIS_RETENTION_DAYS
+            )
+        else:
+            await self.set_status(analysis_id, status)
 
     async def get_analysis_config(self, agent_id: int, analysis_id: str):
         await self.verify_agent(agent_id, analysis_id)
         return await self._get_analysis_config(analysis_id)
 
     async def set_analysis_result(self, analysis_id: str, result: dict):
-        await self.set_status(analysis_id, SubmissionStatus.COMPLETED)
         await self._set_analysis_result(analysis_id, result)
 
     @abstractmethod
     async def _set_analysis_result(self, analysis_id: str, result: dict):
+        """ Atomically store the result and set the COMPLETED status """
         ...
 
     async def get_analysis_result(self, agent_id: int, analysis_id: str):
@@ -228,15 +257,14 @@ class AbstractStateStore(ABC):
     """ File management state """
     async def store_file(self, agent_id: int, filename: str, reference_id: int | None = None) -> str:
         file_id = uuid4().hex
-        await self._set_agent(agent_id, file_id)
-        await self._store_user_file(agent_id, file_id)
-        if reference_id is not None:
-            await self.set_file_reference_id(file_id, reference_id)
-        await self._set_filename(file_id, filename)
-        await self.set_file_progress(file_id, 0)
-        await self.set_status(file_id, SubmissionStatus.PENDING)
+        await self._create_file(agent_id, file_id, filename, reference_id)
         return file_id
 
+    @abstractmethod
+    async def _create_file(self, agent_id: int, file_id: str, filename: str, reference_id: int | None = None):
+        """ Atomically set the agent, user file index, filename, reference ID, zero progress and PENDING status """
+        ...
+
     async def get_file_progress(self, agent_id: int, file_id: str):
         await self.verify_agent(agent_id, file_id)
         return await self._get_file_progress(file_id)
@@ -248,36 +276,32 @@ class AbstractStateStore(ABC):
     async def get_user_file_ids(self, agent_id: int) -> List[str]:
         """ Return a list of submission ID """
         file_ids = await self._get_user_files(agent_id)
-        valid_files = []
-        for file_id in file_ids:
-            if await self._file_exists(file_id):
-                status = await self._get_status(file_id)
-                if status == SubmissionStatus.COMPLETED:
-                    valid_files.append(file_id)
-            else:
-                # clean up expired submissions
-                await self._remove_user_file(agent_id, file_id)
+        # the status is set when a file is stored, so a missing status means the entry has expired
+        statuses = await self._get_statuses(file_ids)
+        valid_files = [
+            file_id for file_id, status in zip(file_ids, statuses) if status == SubmissionStatus.COMPLETED
+        ]
+        expired = [file_id for file_id, status in zip(file_ids, statuses) if status is None]
+        if expired:
+            # clean up expired submissions
+            await self._remove_user_files(agent_id, expired)
         return valid_files
 
-    async def get_user_file_reference_ids(self, user_id: int) -> List[str]:
+    async def get_user_file_reference_ids(self, user_id: int) -> List[int | None]:
         """ Return a list of reference ID """
         file_ids = await self.get_user_file_ids(user_id)
-        reference_ids = []
-        for file_id in file_ids:
-            reference_id = await self.get_file_reference_id(file_id)
-            reference_ids.append(reference_id)
-        return reference_ids
+        return await self.get_file_reference_ids(file_ids)
 
     @abstractmethod
-    async def _store_user_file(self, agent_id: int, file_id: str):
+    async def _get_statuses(self, keys: List[str]) -> List[SubmissionStatus | None]:
         ...
 
-    @abstractmethod
-    async def _set_filename(self, file_id: str, filename: str):
-        ...
+    async def set_file_progress(self, file_id: str, progress: int):
+        await self.set_progress(file_id, progress)
 
     @abstractmethod
-    async def set_file_progress(self, file_id: str, progress: int):
+    async def set_progress(self, key: str, progress: int):
+        """ Percentage progress of a file upload or submission, returned by get_state """
         ...
 
     @abstractmethod
@@ -298,15 +322,16 @@ class AbstractStateStore(ABC):
         ...
 
     @abstractmethod
-    async def _get_user_files(self, agent_id) -> List[str]:
+    async def get_file_reference_ids(self, file_ids: List[str]) -> List[int | None]:
+        """ Get reference IDs for the given file IDs, in the same order """
         ...
 
     @abstractmethod
-    async def _file_exists(self, file_id) -> bool:
+    async def _get_user_files(self, agent_id) -> List[str]:
         ...
 
     @abstractmethod
-    async def _remove_user_file(self, agent_id, file_id) -> None:
+    async def _remove_user_files(self, agent_id, file_ids: List[str]) -> None:
         ...
 
     """
@@ -317,12 +342,11 @@ class AbstractStateStore(ABC):
 
     async def record_failed_login(self, identifier: str, duration_seconds: int) -> int:
         attempts_key = f"login_attempts:{identifier}"
-        attempts = await self._increment_failed_logins(attempts_key)
-        await self._set_expiry(attempts_key, duration_seconds)
-        return attempts
+        return await self._increment_failed_logins(attempts_key, duration_seconds)
 
     @abstractmethod
-    async def _increment_failed_logins(self, identifier: str) -> int:
+    async def _increment_failed_logins(self, attempts_key: str, duration_seconds: int) -> int:
+        """ Increment the attempts counter and reset its expiry, returning the new count """
         ...
 
     @abstractmethod
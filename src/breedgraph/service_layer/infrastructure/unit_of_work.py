@@ -15,6 +15,7 @@ from breedgraph.service_layer.application import (
 from .constraints import AbstractConstraintsHandler
 from .dependency_guards import AbstractDependencyGuards
 from .driver import AbstractAsyncDriver
+from .pedigree_index import PedigreeIndex
 
 
 from typing import AsyncGenerator, Callable, Awaitable, Iterable
@@ -56,6 +57,8 @@ class AbstractUnitOfWorkFactory(ABC):
         super().__init__()
         self.driver = driver
         self.publish_event: EventPublisher | None = None
+        # shared by all units of work, each takes a copy to hold the changes made in its transaction
+        self.pedigree_index = PedigreeIndex()
 
     def set_event_publisher(self, event_publisher: EventPublisher|None):
         self.publish_event = event_publisher
@@ -0,0 +1,124 @@
+import asyncio
+import hashlib
+import queue
+import threading
+
+from pathlib import Path
+from typing import Tuple
+
+from breedgraph.config import UPLOAD_QUEUE_DEPTH, UPLOAD_WRITE_BUFFER
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class UploadSink:
+    """
+    Streams uploaded chunks through a bounded queue to a worker thread.
+
+    The worker thread owns the file handle and the hash object,
+    so the event loop only reads chunks from the request and hands them over.
+    Writes go through a large buffered writer rather than one thread hop per chunk.
+
+    The queue is bounded by a semaphore acquired on the event loop before each chunk is queued,
+    and released by the worker (via call_soon_threadsafe) once that chunk is written,
+    so a slow disk applies backpressure to the upload rather than buffering the whole file in memory.
+
+    Usage:
+        sink = UploadSink(file_path)
+        await sink.start()
+        try:
+            await sink.write(chunk)
+            ...
+            file_size, file_hash = await sink.close()
+        except:
+            await sink.abort()
+            raise
+    """
+    _STOP = object()
+
+    def __init__(
+            self,
+            file_path: Path,
+            max_queued_chunks: int = UPLOAD_QUEUE_DEPTH,
+            buffer_size: int = UPLOAD_WRITE_BUFFER
+    ):
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.bytes_written = 0
+
+        self._chunks: queue.SimpleQueue = queue.SimpleQueue()
+        self._credits = asyncio.Semaphore(max_queued_chunks)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Future | None = None
+        self._error: BaseException | None = None
+        self._aborted = threading.Event()
+
+    async def start(self) -> None:
+        if self._worker is not None:
+            raise RuntimeError("Upload sink already started")
+        self._loop = asyncio.get_running_loop()
+        self._worker = asyncio.ensure_future(asyncio.to_thread(self._drain))
+
+    async def write(self, chunk: bytes) -> None:
+        if self._worker is None:
+            raise RuntimeError("Upload sink not started")
+        if self._error is not None:
+            raise self._error
+        await self._credits.acquire()
+        self._chunks.put(chunk)
+        self.bytes_written += len(chunk)
+
+    async def close(self) -> Tuple[int, str]:
+        """ Flush remaining chunks, close the file and return (file_size, file_hash) """
+        self._chunks.put(self._STOP)
+        return await self._worker
+
+    async def abort(self) -> None:
+        """ Stop the worker without waiting for queued chunks to be written """
+        if self._worker is None:
+            return
+        self._aborted.set()
+        self._chunks.put(self._STOP)
+        try:
+            await self._worker
+        except Exception as e:
+            logger.debug(f"Upload sink for {self.file_path} stopped with error: {e}")
+
+    def _release(self) -> None:
+        self._loop.call_soon_threadsafe(self._credits.release)
+
+    def _drain(self) -> Tuple[int, str]:
+        hash_obj = hashlib.sha256()
+        file_size = 0
+        buffer = None
+        try:
+            buffer = open(self.file_path, 'wb', buffering=self.buffer_size)
+        except Exception as e:
+            self._error = e
+
+        try:
+            while True:
+                chunk = self._chunks.get()
+                if chunk is self._STOP:
+                    break
+                try:
+                    # keep consuming after an error or abort so the producer is never left waiting on credits
+                    if self._error is None and not self._aborted.is_set():
+                        buffer.write(chunk)
+                        hash_obj.update(chunk)
+                        file_size += len(chunk)
+                except Exception as e:
+                    self._error = e
+                finally:
+                    self._release()
+        finally:
+            if buffer is not None:
+                try:
+                    buffer.close()
+                except Exception as e:
+                    self._error = self._error or e
+
+        if self._error is not None:
+            raise self._error
+        return file_size, hash_obj.hexdigest()
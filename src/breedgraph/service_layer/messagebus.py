@@ -1,13 +1,17 @@
 import logging
+import time
 
-from asyncio import Queue, create_task, gather, Task
+from asyncio import create_task, gather, sleep, Task
+from collections import defaultdict
 
 from breedgraph.domain import commands, events
-from breedgraph.config import N_EVENT_HANDLERS
+from breedgraph.config import EVENT_CONSUME_LANES, EVENT_LANE_WORKERS, DEFAULT_EVENT_LANE, EVENT_LANES
 
 #if TYPE_CHECKING:
-from typing import Callable, Dict, List, Union, Type
+from typing import Callable, Dict, Iterable, List, Union, Type
 from breedgraph.service_layer.infrastructure import (
+    AbstractEventQueue,
+    LaneMetrics,
     AbstractUnitOfWorkFactory,
     FileManagementService,
     AbstractStateStore,
@@ -23,7 +27,7 @@ logger = logging.getLogger(__name__)
 logger.debug("Messagebus ready")
 
 #  - Commands are handled consecutively (though still async)
-#  - Events are handled concurrently (asyncio)
+#  - Events are handled concurrently (asyncio) by pools of workers, one pool per event lane
 
 class MessageBus:
 
@@ -36,7 +40,7 @@ class MessageBus:
             file_management: FileManagementService,
             event_handlers: Dict[Type[events.Event], List[Callable]],
             command_handlers: Dict[Type[commands.Command], Callable],
-            event_queue: Queue,
+            event_queue: AbstractEventQueue,
             archival_service: AbstractFileArchivalService | None = None,
     ):
         self.uow_factory = uow_factory
@@ -52,14 +56,21 @@ class MessageBus:
 
         self._workers: List[Task] = []
         self._started = False
+        self.lane_metrics: Dict[str, LaneMetrics] = defaultdict(LaneMetrics)
 
-    async def start(self):
-        """Start the event processing workers. Call once at application startup."""
+    async def start(self, lanes: Iterable[str] | None = None):
+        """
+        Start the event processing workers. Call once at application startup.
+        Only the given lanes are consumed, e.g. to run slow lanes in separate worker processes.
+        """
         if self._started:
             return
         self._started = True
-        for _ in range(N_EVENT_HANDLERS):
-            self._workers.append(create_task(self.handle_event()))
+        for lane in EVENT_CONSUME_LANES if lanes is None else lanes:
+            for _ in range(EVENT_LANE_WORKERS.get(lane, 1)):
+                self._workers.append(create_task(self.handle_event(lane)))
+        if self.archival_service is not None:
+            await self.archival_service.start()
 
     async def stop(self):
         """Gracefully stop workers. Call at application shutdown."""
@@ -68,9 +79,10 @@ class MessageBus:
             task.cancel()
         await gather(*self._workers, return_exceptions=True)
         self._workers.clear()
+        if self.archival_service is not None:
+            await self.archival_service.stop()
         self._started = False
 
-
     async def handle(self, message: Message):
         result = None
         if isinstance(message, commands.Command):
@@ -96,18 +108,58 @@ class MessageBus:
             logger.error(e)
             raise
 
-    async def handle_event(self):
+    async def get_lane_metrics(self) -> Dict[str, dict]:
+        """ Handling times for events consumed by this process and the current depth of each lane """
+        lanes = set(self.lane_metrics) | set(EVENT_CONSUME_LANES) | {DEFAULT_EVENT_LANE, *EVENT_LANES.values()}
+        metrics = dict()
+        for lane in sorted(lanes):
+            metrics[lane] = self.lane_metrics[lane].summary()
+            metrics[lane]['depth'] = await self.event_queue.depth(lane)
+        return metrics
+
+    async def handle_event(self, lane: str):
         while True:
-            event = await self.event_queue.get()
+            try:
+                delivery = await self.event_queue.get(lane)
+            except Exception as e:
+                # e.g. the queue backend is unavailable, wait before trying again
+                logger.error(f"Failed to get event from lane {lane}: {e}")
+                await sleep(1)
+                continue
+            event = delivery.event
+            started = time.time()
             handlers = self.event_handlers.get(type(event))
             if not handlers:
                 logger.debug(f"Event {type(event)} has no handler")
+            error = None
             for handler in handlers or []:
+                name = f"{handler.__module__}.{handler.__qualname__}"
+                if name in delivery.handled:
+                    # completed on an earlier attempt
+                    continue
                 try:
                     logger.info(event.__class__.__name__)
                     logger.debug(event)
                     await handler(event)
                 except Exception as e:
                     logger.error(e)
+                    error = e
                     continue
-            self.event_queue.task_done()
+                try:
+                    await self.event_queue.mark_handled(delivery, name)
+                except Exception as e:
+                    # the handler may then run again if the delivery is retried
+                    logger.error(f"Failed to record {name} as handled for {type(event).__name__}: {e}")
+            finished = time.time()
+            self.lane_metrics[lane].record(
+                wait_seconds=max(0.0, started - delivery.enqueued),
+                handler_seconds=finished - started,
+                failed=error is not None
+            )
+            try:
+                if error is None:
+                    await self.event_queue.ack(delivery)
+                else:
+                    await self.event_queue.nack(delivery, error)
+            except Exception as e:
+                logger.error(f"Failed to complete delivery of {type(event).__name__}: {e}")
@@ -13,6 +13,8 @@ class GermplasmPersistenceService(ABC):
     Persistence service for germplasm operations.
     Handles data operations and validation queries for germplasm entries.
     """
+    # the stored pedigree version following the last relationship change in this transaction, if any
+    pedigree_version: int | None = None
 
     async def create_entry(self, entry: GermplasmInput) -> GermplasmStored:
         """Create a new germplasm entry and return it in stored form (with ID)."""
@@ -132,6 +134,32 @@ class GermplasmPersistenceService(ABC):
         """Get all sink relationships for a germplasm entry."""
         pass
 
+    async def get_relationships_for_entries(self, entry_ids: List[int]) -> List[GermplasmRelationship]:
+        """Get all relationships for the germplasm entries, each relationship once."""
+        relationships = dict()
+        for entry_id in dict.fromkeys(entry_ids):
+            async for rel in self.get_relationships(entry_id):
+                relationships.setdefault((rel.source_id, rel.sink_id), rel)
+        return list(relationships.values())
+
+    async def get_pedigree_relationships(self, entry_ids: List[int]) -> List[GermplasmRelationship]:
+        """Get the source relationships of the entries and of all their ancestors."""
+        relationships = []
+        seen = set(entry_ids)
+        pending = list(seen)
+        while pending:
+            entry_id = pending.pop()
+            async for rel in self.get_source_relationships(entry_id):
+                relationships.append(rel)
+                if rel.source_id not in seen:
+                    seen.add(rel.source_id)
+                    pending.append(rel.source_id)
+        return relationships
+
+    async def get_pedigree_version(self) -> int | None:
+        """The stored pedigree version, advanced whenever relationships are created or removed, if tracked."""
+        return None
+
     @abstractmethod
     async def get_ancestor_ids(self, entry_id: int, path_length_limit=None) -> List[int]:
         """
@@ -155,4 +183,14 @@ class GermplasmPersistenceService(ABC):
         target_id: int
     ) -> bool:
         """Check if a path exists from source to target, used to check if a relationship would create a circular dependency."""
-        pass
\ No newline at end of file
+        pass
+
+    async def get_cycle_ids(self, relationships: List[GermplasmRelationship]) -> List[int]:
+        """
+        Entries that would be in a cycle if the relationships were created, empty if there would be none.
+        By default each relationship is checked against the stored pedigree in turn.
+        """
+        for rel in relationships:
+            if rel.source_id == rel.sink_id or await self.has_path(rel.sink_id, rel.source_id):
+                return [rel.source_id, rel.sink_id]
+        return []
\ No newline at end of file
@@ -23,4 +23,6 @@ from .ontology import (
 
     OntologyEntryPatch
 )
-from .datasets import DatasetSummary
\ No newline at end of file
+from .datasets import DatasetSummary
+from .pages import Page, encode_cursor, decode_cursor, page_size
+from .exports import ExportFormat, EXPORT_COLUMNS
\ No newline at end of file
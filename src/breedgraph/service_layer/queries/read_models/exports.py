@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class ExportFormat(Enum):
+    CSV = 'csv'
+    PARQUET = 'parquet'
+
+
+# a record per row, with its unit, germplasm, location (at the time of the record) and times
+EXPORT_COLUMNS = [
+    'dataset_id',
+    'concept_id',
+    'record_id',
+    'unit_id',
+    'unit_name',
+    'subject_id',
+    'germplasm_id',
+    'germplasm_name',
+    'location_id',
+    'location_name',
+    'layout_id',
+    'start',
+    'end',
+    'value',
+    'submitted',
+    'reference_ids'
+]
\ No newline at end of file
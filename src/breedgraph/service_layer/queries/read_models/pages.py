@@ -0,0 +1,58 @@
+import base64
+import binascii
+
+from dataclasses import dataclass, field
+from typing import Generic, List, TypeVar
+
+from breedgraph.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+T = TypeVar('T')
+
+
+def encode_cursor(label: str, item_id: int) -> str:
+    """ An opaque cursor after the item, items are paged in order of ID """
+    return base64.urlsafe_b64encode(f"{label}:{item_id}".encode()).decode()
+
+
+def decode_cursor(label: str, cursor: str | None) -> int | None:
+    """ The item ID from a cursor, None for the first page """
+    if cursor is None:
+        return None
+    try:
+        cursor_label, item_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(':')
+        if cursor_label != label:
+            raise ValueError
+        return int(item_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise ValueError(f"Invalid cursor for {label}: {cursor}")
+
+
+def page_size(first: int | None) -> int:
+    """ The number of items to page, first if given (up to MAX_PAGE_SIZE) else DEFAULT_PAGE_SIZE """
+    if first is None:
+        return DEFAULT_PAGE_SIZE
+    if first < 1:
+        raise ValueError(f"first must be at least 1, not {first}")
+    return min(first, MAX_PAGE_SIZE)
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    Items of a large collection, in order of ID.
+    The next page starts after end_cursor, which is None when the page is empty.
+    """
+    items: List[T] = field(default_factory=list)
+    end_cursor: str | None = None
+    has_next_page: bool = False
+
+    @classmethod
+    def from_items(cls, label: str, items: List[T], ids: List[int], size: int) -> "Page[T]":
+        """ From up to size + 1 items and their IDs, the extra item only marks that there is a next page """
+        has_next_page = len(items) > size
+        items, ids = items[:size], ids[:size]
+        return cls(
+            items=items,
+            end_cursor=encode_cursor(label, ids[-1]) if ids else None,
+            has_next_page=has_next_page
+        )
@@ -2,4 +2,5 @@ from .views import AbstractViewsFactory, AbstractViewsHolder
 from .regions import AbstractRegionsView
 from .accounts import AbstractAccountsView
 from .datasets import AbstractDatasetsView
-from .ontology import AbstractOntologyView
\ No newline at end of file
+from .ontology import AbstractOntologyView
+from .blocks import AbstractBlocksView
\ No newline at end of file
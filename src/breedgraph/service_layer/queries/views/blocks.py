@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+
+from breedgraph.domain.model.blocks import UnitOutput
+from breedgraph.service_layer.queries.read_models import Page, decode_cursor, page_size
+
+from typing import List
+
+class AbstractBlocksView(ABC):
+    read_teams: List[int]
+
+    async def get_units_page(
+            self,
+            first: int | None = None,
+            after: str | None = None,
+            block_id: int | None = None,
+            location_ids: List[int] | None = None
+    ) -> Page[UnitOutput]:
+        """
+        Units in order of ID, first (up to MAX_PAGE_SIZE) after the cursor.
+        Optionally only units in a block (by root unit ID) or at any of the locations.
+        Units without read access are left out, except block roots which are redacted.
+        """
+        size = page_size(first)
+        units = await self._get_units(
+            after_id=decode_cursor('Unit', after),
+            limit=size + 1,
+            block_id=block_id,
+            location_ids=location_ids
+        )
+        return Page.from_items('Unit', units, [unit.id for unit in units], size)
+
+    @abstractmethod
+    async def _get_units(
+            self,
+            after_id: int | None,
+            limit: int,
+            block_id: int | None,
+            location_ids: List[int] | None
+    ) -> List[UnitOutput]:
+        ...
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from breedgraph.service_layer.queries.read_models import DatasetSummary
+from breedgraph.config import EXPORT_PAGE_SIZE
+from breedgraph.service_layer.queries.read_models import DatasetSummary, Page, decode_cursor, page_size
 
 from typing import List, AsyncGenerator
 
@@ -14,3 +15,40 @@ class AbstractDatasetsView(ABC):
     async def _get_dataset_summaries(self, study_id: int) -> List[DatasetSummary]:
         ...
 
+    async def get_records_page(self, dataset_id: int, first: int | None = None, after: str | None = None) -> Page[dict]:
+        """ Records of a dataset in order of ID, first (up to MAX_PAGE_SIZE) after the cursor, empty if not readable """
+        size = page_size(first)
+        records = await self._get_records(dataset_id, after_id=decode_cursor('Record', after), limit=size + 1)
+        return Page.from_items('Record', records, [record['id'] for record in records], size)
+
+    @abstractmethod
+    async def _get_records(self, dataset_id: int, after_id: int | None, limit: int) -> List[dict]:
+        ...
+
+    async def yield_export_rows(
+            self,
+            dataset_ids: List[int] | None = None,
+            study_ids: List[int] | None = None,
+            page_size: int = EXPORT_PAGE_SIZE
+    ) -> AsyncGenerator[List[dict], None]:
+        """
+        The records of the readable datasets (by ID and/or study) as rows of EXPORT_COLUMNS,
+        read and yielded in pages of up to page_size, by dataset then record ID.
+        """
+        for dataset_id in await self._get_export_dataset_ids(dataset_ids=dataset_ids, study_ids=study_ids):
+            after_id = None
+            while True:
+                rows = await self._get_export_rows(dataset_id, after_id=after_id, limit=page_size)
+                if rows:
+                    yield rows
+                if len(rows) < page_size:
+                    break
+                after_id = rows[-1]['record_id']
+
+    @abstractmethod
+    async def _get_export_dataset_ids(self, dataset_ids: List[int] | None, study_ids: List[int] | None) -> List[int]:
+        ...
+
+    @abstractmethod
+    async def _get_export_rows(self, dataset_id: int, after_id: int | None, limit: int) -> List[dict]:
+        ...
\ No newline at end of file
@@ -8,6 +8,7 @@ from .ontology import AbstractOntologyView
 from .accounts import AbstractAccountsView
 from .regions import AbstractRegionsView
 from .datasets import AbstractDatasetsView
+from .blocks import AbstractBlocksView
 
 
 from typing import AsyncGenerator
@@ -20,6 +21,7 @@ class AbstractViewsHolder(ABC):
     accounts: AbstractAccountsView
     regions: AbstractRegionsView
     datasets: AbstractDatasetsView
+    blocks: AbstractBlocksView
 
 
 class AbstractViewsFactory(ABC):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, AsyncGenerator, TypeVar, Generic, Union, cast
+from typing import Dict, AsyncGenerator, List, TypeVar, Generic, Union, cast
 from neo4j import Record
 
 from breedgraph.service_layer.tracking import TrackableProtocol, TrackedObject, tracked
@@ -76,6 +76,15 @@ class BaseRepository(ABC, Generic[TAggregateInput, TAggregate]):
     async def _create(self, aggregate_input: TAggregateInput|None) -> TAggregate:
         ...
 
+    async def create_many(self, aggregate_inputs: List[TAggregateInput]) -> List[TAggregate]:
+        """ Create an aggregate for each input, in the same order """
+        aggregates = await self._create_many(aggregate_inputs)
+        return [cast(TAggregate, self._track(aggregate)) for aggregate in aggregates]
+
+    async def _create_many(self, aggregate_inputs: List[TAggregateInput]) -> List[TAggregate]:
+        """ Override where aggregates can be created together """
+        return [await self._create(aggregate_input) for aggregate_input in aggregate_inputs]
+
     async def get(self, **kwargs) -> TAggregate|None:
         aggregate = await self._get(**kwargs)
         if aggregate is not None:
@@ -1,5 +1,6 @@
 from abc import abstractmethod
-from typing import Dict, Set, AsyncGenerator, TypeVar, Generic
+from typing import Dict, List, Set, AsyncGenerator, TypeVar, Generic
+from collections import defaultdict
 from dataclasses import dataclass
 
 from pydantic import BaseModel
@@ -114,6 +115,45 @@ class ControlledRepository(
     ) -> TControlledAggregate:
         raise NotImplementedError
 
+    async def _create_many(
+            self,
+            aggregate_inputs: List[BaseModel]
+    ) -> List[TControlledAggregate]:
+        """ As for _create, with controls set, writes recorded and controllers read for all the aggregates at once """
+        if self.controls.user_id is None:
+            raise UnauthorisedOperationError("Creation of controlled entities requires a user_id")
+        if not aggregate_inputs:
+            return []
+
+        aggregates = await self._create_controlled_many(aggregate_inputs)
+        await self.controls.set_controls(
+            aggregates,
+            control_teams=self.access_teams[Access.WRITE] if self.write_team is None else { self.write_team },
+            release=self.release
+        )
+        await self.controls.record_writes(aggregates)
+        label_model_ids = defaultdict(list)
+        for aggregate in aggregates:
+            for model in aggregate.controlled_models:
+                label_model_ids[model.label].append(model.id)
+        controllers = {
+            label: await self.controls.get_controllers(label, model_ids)
+            for label, model_ids in label_model_ids.items()
+        }
+        return [
+            aggregate.redacted(
+                controllers=controllers,
+                user_id=self.user_id,
+                read_teams=self.access_teams[Access.READ]
+            ) for aggregate in aggregates
+        ]
+
+    async def _create_controlled_many(
+            self, aggregate_inputs: List[BaseModel]
+    ) -> List[TControlledAggregate]:
+        """ Override where the aggregates can be written together """
+        return [await self._create_controlled(aggregate_input) for aggregate_input in aggregate_inputs]
+
     async def _get(self, **kwargs) -> TControlledAggregate | None:
         result = await self._get_controlled(**kwargs)
         if result is None:
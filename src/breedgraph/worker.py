@@ -0,0 +1,66 @@
+"""
+Event worker process, consumes event lanes from the durable (redis) event queue
+so that slow work, e.g. dataset ingestion and analysis, is scaled separately from the web server.
+
+    breedgraph-worker --lanes ingest,analysis
+
+The web server should then be configured to consume only the remaining lanes, e.g. EVENT_CONSUME_LANES=default.
+"""
+import argparse
+import asyncio
+import signal
+
+from breedgraph import bootstrap
+from breedgraph.config import EVENT_QUEUE_BACKEND, EVENT_CONSUME_LANES, EVENT_METRICS_LOG_INTERVAL
+from breedgraph.service_layer.messagebus import MessageBus
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(lanes: list[str]):
+    if EVENT_QUEUE_BACKEND != 'redis':
+        raise ValueError("Separate event workers require EVENT_QUEUE_BACKEND=redis")
+
+    logger.info(f"Starting event worker for lanes: {lanes}")
+    bus: MessageBus = await bootstrap.bootstrap()
+    await bus.start(lanes=lanes)
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    try:
+        while not stopping.is_set():
+            try:
+                await asyncio.wait_for(stopping.wait(), timeout=EVENT_METRICS_LOG_INTERVAL or None)
+            except asyncio.TimeoutError:
+                # there is no metrics endpoint for a worker, the lane metrics are logged instead
+                logger.info(f"Event lane metrics: {await bus.get_lane_metrics()}")
+    finally:
+        # unacknowledged events are left pending and retried by another worker
+        logger.info("Stopping event worker")
+        await bus.stop()
+        await bus.event_queue.close()
+        if hasattr(bus.uow_factory, "driver"):
+            await bus.uow_factory.driver.close()
+        if hasattr(bus.state_store, "connection"):
+            await bus.state_store.connection.aclose()
+    logger.info("Event worker stopped")
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="Consume BreedGraph events from the durable event queue")
+    parser.add_argument(
+        "--lanes",
+        default=",".join(EVENT_CONSUME_LANES),
+        help="Comma separated event lanes to consume"
+    )
+    args = parser.parse_args()
+    lanes = [lane.strip() for lane in args.lanes.split(",") if lane.strip()]
+    asyncio.run(run_worker(lanes))
+
+
+if __name__ == "__main__":
+    cli()
@@ -18,6 +18,7 @@ from breedgraph.adapters.neo4j import Neo4jViewsFactory
 from breedgraph.adapters.neo4j import queries
 
 from breedgraph.service_layer.messagebus import MessageBus
+from breedgraph.service_layer.infrastructure import InMemoryEventQueue
 
 from tests.breedgraph.utilities.inputs import UserInputGenerator, LoremTextGenerator
 from tests.breedgraph.scenarios import (
@@ -174,14 +175,14 @@ async def state_store(bus) -> RedisStateStore:
 
 
 @pytest_asyncio.fixture(scope="session", loop_scope="session")
-async def event_queue(bus) -> asyncio.Queue:
+async def event_queue(bus) -> InMemoryEventQueue:
     return bus.event_queue
 
 @pytest_asyncio.fixture(scope="module", loop_scope="session", autouse=True)
 async def isolated_state(
         uow_factory: Neo4jUnitOfWorkFactory,
         state_store: RedisStateStore,
-        event_queue: asyncio.Queue
+        event_queue: InMemoryEventQueue
 ) -> AsyncGenerator[None, None]:
     await event_queue.join()
     logger.debug("Cleaning state before test")
@@ -60,7 +60,7 @@ async def test_create_dataset_with_records(
             break
         elif status == SubmissionStatus.FAILED:
             pytest.fail(f"Dataset submission failed")
-        elif status in [SubmissionStatus.PENDING, SubmissionStatus.PROCESSING]:
+        elif status in [SubmissionStatus.PENDING, SubmissionStatus.QUEUED, SubmissionStatus.PROCESSING]:
             continue
         else:
             pytest.fail(f"Unexpected submission status: {status}")
@@ -23,6 +23,28 @@ async def test_create(
         assert retrieved.root.subject == tree_subject
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_many(
+        uow_factory,
+        block_build_context
+):
+    user_id = block_build_context['user_id']
+    tree_subject = block_build_context['ontology_subject_tree']
+    tree_names = ["Tree A", "Tree B", "Tree C"]
+    async with uow_factory.get_uow(user_id=user_id) as uow:
+        stored_blocks = await uow.repositories.blocks.create_many([
+            UnitInput(name=name, subject=tree_subject) for name in tree_names
+        ])
+        await uow.commit()
+
+    assert [block.root.name for block in stored_blocks] == tree_names
+    async with uow_factory.get_uow(user_id=user_id) as uow:
+        for block, name in zip(stored_blocks, tree_names):
+            retrieved = await uow.repositories.blocks.get(unit_id=block.root.id)
+            assert retrieved.root.name == name
+            assert len(retrieved.entries) == 1
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_rename(
         uow_factory,
@@ -1,7 +1,10 @@
 import pytest, pytest_asyncio
 
+from breedgraph.domain.model.controls import ReadRelease
 from breedgraph.domain.model.datasets import DatasetInput, DataRecordInput
 
+from tests.breedgraph.scenarios.account_builder import AccountBuilder
+
 
 from typing import Dict
 
@@ -44,3 +47,77 @@ async def test_get_dataset_summaries(
         summaries = await views.datasets.get_dataset_summaries(study_id=dataset_with_records['study_id'])
         assert summaries, f"Expected dataset summaries for study {dataset_with_records['study_id']}, but got none"
 
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_dataset_summary_follows_record_changes(
+        uow_factory,
+        views_factory,
+        dataset_with_records
+):
+    user_id = dataset_with_records['user_id']
+    dataset_id = dataset_with_records['dataset_id']
+
+    async def get_summary():
+        async with views_factory.get_views(user_id=user_id) as views:
+            summaries = await views.datasets.get_dataset_summaries(study_id=dataset_with_records['study_id'])
+        return next(summary for summary in summaries if summary.id == dataset_id)
+
+    before = await get_summary()
+    assert before.unit_count == 1
+
+    async with uow_factory.get_uow(user_id=user_id) as uow:
+        dataset = await uow.repositories.datasets.get(dataset_id=dataset_id)
+        unit_id = dataset.records[0].unit
+        for i in range(5):
+            dataset.records.append(DataRecordInput(unit=unit_id, value=str(i)))
+        await uow.commit()
+    added = await get_summary()
+    assert added.record_count == before.record_count + 5
+    assert added.unit_count == 1
+
+    async with uow_factory.get_uow(user_id=user_id) as uow:
+        dataset = await uow.repositories.datasets.get(dataset_id=dataset_id)
+        dataset.records.pop()
+        await uow.commit()
+    removed = await get_summary()
+    assert removed.record_count == added.record_count - 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    'release, registered_reads, anonymous_reads',
+    [
+        (ReadRelease.PRIVATE, False, False),
+        (ReadRelease.REGISTERED, True, False),
+        (ReadRelease.PUBLIC, True, True)
+    ]
+)
+async def test_dataset_summaries_follow_release(
+        uow_factory,
+        views_factory,
+        dataset_build_context,
+        release,
+        registered_reads,
+        anonymous_reads
+):
+    user_id = dataset_build_context['user_id']
+    study_id = dataset_build_context['study_id']
+    other_user_id = await AccountBuilder(uow_factory=uow_factory).account()
+
+    async with uow_factory.get_uow(user_id=user_id) as uow:
+        dataset = await uow.repositories.datasets.create(
+            DatasetInput(concept=dataset_build_context['concept_id'], study=study_id)
+        )
+        dataset.records.append(DataRecordInput(unit=dataset_build_context['unit_id'], value='1'))
+        await uow.controls.set_controls(dataset, control_teams={dataset_build_context['team_id']}, release=release)
+        await uow.commit()
+
+    async def summarised(reader_id: int | None) -> bool:
+        async with views_factory.get_views(user_id=reader_id) as views:
+            summaries = await views.datasets.get_dataset_summaries(study_id=study_id)
+        return dataset.id in [summary.id for summary in summaries]
+
+    assert await summarised(user_id)
+    assert await summarised(other_user_id) == registered_reads
+    assert await summarised(None) == anonymous_reads
@@ -0,0 +1,26 @@
+import pytest
+
+from breedgraph.adapters.neo4j.cypher import queries, fragments, substitute_fragments
+
+
+def test_fragment_arguments_are_substituted():
+    query = substitute_fragments("MATCH (dataset: Dataset) WHERE {{ readable(node=dataset, controller=TeamDatasets) }} RETURN dataset")
+    assert '{{' not in query
+    assert "MATCH (dataset)<-[controls:CONTROLS]-(:TeamDatasets)" in query
+    assert "$read_teams" in query and "$registered" in query
+
+def test_missing_fragment_arguments_are_rejected():
+    with pytest.raises(ValueError):
+        substitute_fragments("MATCH (dataset: Dataset) WHERE {{ readable(node=dataset) }} RETURN dataset")
+
+def test_unknown_fragments_are_rejected():
+    with pytest.raises(ValueError):
+        substitute_fragments("RETURN {{ unknown(node=dataset) }}")
+
+def test_loaded_queries_have_fragments_substituted():
+    assert 'fragments' not in queries
+    assert 'readable' in fragments
+    for folder, folder_queries in queries.items():
+        for name, query in folder_queries.items():
+            assert '{{' not in query, f"{folder}/{name}"
+    assert substitute_fragments("{{ readable(node=dataset, controller=TeamDatasets) }}") in queries['datasets']['read_datasets']
@@ -0,0 +1,88 @@
+import pytest
+
+from datetime import datetime
+
+from breedgraph.adapters.neo4j.cypher import queries
+from breedgraph.adapters.neo4j.repositories.datasets import Neo4jDatasetsRepository
+
+from tests.breedgraph.unit.fixtures.mock_access_control_service import MockAccessControlService
+from tests.breedgraph.unit.fixtures.mock_neo4j_session import FakeSession, FakeTransaction
+
+
+STORED = {
+    'record_count': 3,
+    'unit_count': 2,
+    'subject_ids': [1],
+    'location_ids': [7],
+    'block_ids': [4],
+    'start': datetime(2024, 3, 1),
+    'end': datetime(2024, 6, 1)
+}
+
+def get_repository(respond) -> tuple[Neo4jDatasetsRepository, FakeSession]:
+    session = FakeSession(respond)
+    repository = Neo4jDatasetsRepository(
+        tx=FakeTransaction(session),
+        id_allocator=None,
+        controls=MockAccessControlService(user_id=1)
+    )
+    return repository, session
+
+
+@pytest.mark.asyncio
+async def test_added_records_are_merged_into_the_stored_summary():
+    added = {
+        'record_count': 2,
+        # one of the two units has earlier records in the dataset
+        'unit_count': 1,
+        'subject_ids': [1, 2],
+        'location_ids': [],
+        'block_ids': [5],
+        'start': datetime(2024, 1, 1),
+        'end': None
+    }
+    repository, session = get_repository(
+        lambda query, params: [{'summary': STORED, 'added': added}]
+        if query == queries['datasets']['summarise_records'] else []
+    )
+
+    await repository._add_records_to_summary(dataset_id=1, record_ids=[11, 12])
+
+    assert [query for query, _ in session.runs] == [
+        queries['datasets']['summarise_records'],
+        queries['datasets']['set_dataset_summary']
+    ]
+    assert session.runs[0][1] == {'dataset_id': 1, 'record_ids': [11, 12]}
+    assert session.runs[1][1] == {
+        'dataset_id': 1,
+        'summary': {
+            'record_count': 5,
+            'unit_count': 3,
+            'subject_ids': [1, 2],
+            'location_ids': [7],
+            'block_ids': [4, 5],
+            'start': datetime(2024, 1, 1),
+            'end': datetime(2024, 6, 1)
+        }
+    }
+
+
+def test_records_without_times_leave_the_summary_times():
+    empty = {'record_count': 0, 'unit_count': 0, 'subject_ids': [], 'location_ids': [], 'block_ids': []}
+    added = {**STORED, 'start': None, 'end': None}
+    summary = Neo4jDatasetsRepository.add_to_summary(empty, added)
+    assert summary['start'] is None and summary['end'] is None
+    summary = Neo4jDatasetsRepository.add_to_summary(STORED, added)
+    assert (summary['start'], summary['end']) == (STORED['start'], STORED['end'])
+
+
+@pytest.mark.asyncio
+async def test_summary_that_was_only_just_created_is_refreshed():
+    repository, session = get_repository(
+        lambda query, params: [{'summary': {'record_count': 0}, 'added': STORED}]
+        if query == queries['datasets']['summarise_records'] else []
+    )
+
+    await repository._add_records_to_summary(dataset_id=1, record_ids=[11])
+
+    assert session.runs[-1] == (queries['datasets']['refresh_dataset_summaries'], {'dataset_ids': [1]})
@@ -0,0 +1,72 @@
+import pytest
+
+from breedgraph.adapters.neo4j.cypher import queries, substitute_fragments
+from breedgraph.adapters.neo4j.views.datasets import Neo4jDatasetsView
+
+from tests.breedgraph.unit.fixtures.mock_neo4j_session import FakeSession
+
+
+def summary_row(dataset_id: int, record_count: int = 1) -> dict:
+    return {
+        'dataset_id': dataset_id,
+        'concept_id': 10,
+        'summary': {
+            'record_count': record_count,
+            'unit_count': 1,
+            'subject_ids': [],
+            'location_ids': [],
+            'block_ids': [dataset_id],
+            'start': None,
+            'end': None
+        }
+    }
+
+
+def test_summaries_are_filtered_by_the_readable_fragment():
+    query = queries['datasets']['read_dataset_summaries']
+    assert substitute_fragments("{{ readable(node=dataset, controller=TeamDatasets) }}") in query
+    # the baseline filter exposed datasets with any PUBLIC control
+    assert "= 'PUBLIC'" not in query
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'user_id, read_teams, registered',
+    [
+        # PRIVATE datasets are readable only with a read team
+        (1, [2], True),
+        # REGISTERED datasets are readable by any user
+        (1, [], True),
+        # PUBLIC datasets are readable without a user
+        (None, [], False)
+    ]
+)
+async def test_summaries_are_read_with_the_visibility_of_the_user(user_id, read_teams, registered):
+    session = FakeSession(lambda query, params: [summary_row(1)])
+    view = Neo4jDatasetsView(session=session, read_teams=read_teams, user_id=user_id)
+
+    summaries = await view.get_dataset_summaries(study_id=5)
+
+    assert [summary.id for summary in summaries] == [1]
+    query, params = session.runs[0]
+    assert query == queries['datasets']['read_dataset_summaries']
+    assert params == {'study_id': 5, 'read_teams': read_teams, 'registered': registered}
+
+
+@pytest.mark.asyncio
+async def test_datasets_without_a_stored_summary_are_summarised_without_writing():
+    def respond(query, params):
+        if query == queries['datasets']['read_dataset_summaries']:
+            return [summary_row(1), {**summary_row(2), 'summary': None}]
+        if query == queries['datasets']['summarise_datasets']:
+            assert params == {'dataset_ids': [2]}
+            return [{'dataset_id': 2, 'summary': summary_row(2, record_count=4)['summary']}]
+        raise AssertionError(f"Unexpected query: {query}")
+
+    session = FakeSession(respond)
+    view = Neo4jDatasetsView(session=session, read_teams=[], user_id=1)
+
+    summaries = await view.get_dataset_summaries(study_id=5)
+
+    assert [(summary.id, summary.record_count) for summary in summaries] == [(1, 1), (2, 4)]
+    assert len(session.runs) == 2
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+from dataclasses import dataclass
+from enum import Enum
+
+from breedgraph.adapters.json_encoding import dumps, loads
+from breedgraph.adapters.redis.payloads import encode_payload, decode_payload
+from breedgraph.domain.model.authentication import Token
+from breedgraph.domain.model.errors import ItemError
+
+
+class Colour(Enum):
+    RED = 'red'
+
+
+@dataclass
+class Point:
+    x: int
+    colour: Colour
+
+
+def test_numpy_values_are_native():
+    value = {
+        'count': np.int64(3),
+        'mean': np.float64(1.5),
+        'missing': np.float64('nan'),
+        'values': np.arange(3, dtype=np.float64),
+        'strided': np.arange(6)[::2],
+        'start': np.datetime64('2024-01-01T10:00:00')
+    }
+    assert loads(dumps(value)) == {
+        'count': 3,
+        'mean': 1.5,
+        'missing': None,
+        'values': [0.0, 1.0, 2.0],
+        'strided': [0, 2, 4],
+        'start': '2024-01-01T10:00:00'
+    }
+
+def test_dataclasses_models_and_timestamps():
+    value = {
+        'point': Point(x=1, colour=Colour.RED),
+        'error': ItemError(index=0, error='invalid'),
+        'token': Token(access_token='abc', token_type='bearer'),
+        'ids': {1},
+        'time': pd.Timestamp('2024-01-01T10:00:00')
+    }
+    assert loads(dumps(value)) == {
+        'point': {'x': 1, 'colour': 'red'},
+        'error': ItemError(index=0, error='invalid').model_dump(),
+        'token': {'access_token': 'abc', 'token_type': 'bearer'},
+        'ids': [1],
+        'time': '2024-01-01T10:00:00'
+    }
+
+def test_analysis_result_payload_round_trip():
+    result = {'group': [{'mean': np.float64(2.0), 'n': np.int64(4)}, {'mean': np.float64('nan'), 'n': np.int64(0)}]}
+    assert decode_payload(encode_payload(result, chunk_size=16)) == {
+        'group': [{'mean': 2.0, 'n': 4}, {'mean': None, 'n': 0}]
+    }
+
+def test_datetime64_precision_is_kept():
+    value = {
+        'step': np.datetime64(2, '2D'),
+        'times': np.array(['2024-03', 'NaT'], dtype='datetime64[M]')
+    }
+    assert loads(dumps(value)) == {'step': '1970-01-05', 'times': ['2024-03', None]}
+
+def test_arrays_orjson_does_not_take_go_through_the_default():
+    value = {
+        'mixed': np.array([1, 'a', np.datetime64('2024-03')], dtype=object),
+        'strided_times': np.array(['2024', '2025', '2026'], dtype='datetime64[Y]')[::2],
+        'nested': [(np.datetime64('2024-03-05'),)]
+    }
+    assert loads(dumps(value)) == {
+        'mixed': [1, 'a', '2024-03'],
+        'strided_times': ['2024', '2026'],
+        'nested': [['2024-03-05']]
+    }
+
+def test_submission_payload_round_trip_keeps_time_units():
+    submission = {'records': [
+        {'unit': 1, 'start': np.datetime64('2024')},
+        {'unit': 2, 'start': np.datetime64('2024-03')},
+        {'unit': 3, 'start': np.datetime64('2024-03-05')}
+    ]}
+    records = decode_payload(encode_payload(submission, chunk_size=16))['records']
+    assert [np.datetime_data(np.datetime64(record['start']))[0] for record in records] == ['Y', 'M', 'D']
+    assert [record['start'] for record in records] == ['2024', '2024-03', '2024-03-05']
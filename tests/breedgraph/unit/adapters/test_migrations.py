@@ -0,0 +1,33 @@
+from breedgraph.adapters.neo4j.migrations import get_migrations, find_filtered_scans
+
+
+def test_migrations_are_ordered_with_split_statements():
+    migrations = get_migrations()
+    versions = [migration.version for migration in migrations]
+    assert versions == sorted(versions)
+    assert versions[0] == 1
+    for migration in migrations:
+        assert migration.statements
+        assert all(not statement.endswith(';') for statement in migration.statements)
+
+def test_filtered_label_scan_is_found():
+    plan = {
+        'operatorType': 'ProduceResults@neo4j',
+        'children': [{
+            'operatorType': 'Filter@neo4j',
+            'args': {'Details': 'program.name_lower = $name_lower'},
+            'children': [{
+                'operatorType': 'NodeByLabelScan@neo4j',
+                'args': {'Details': 'program:Program'},
+                'children': []
+            }]
+        }]
+    }
+    assert find_filtered_scans(plan) == ['NodeByLabelScan program:Program']
+
+def test_unfiltered_label_scan_is_ignored():
+    plan = {
+        'operatorType': 'ProduceResults@neo4j',
+        'children': [{'operatorType': 'NodeByLabelScan@neo4j', 'args': {}, 'children': []}]
+    }
+    assert find_filtered_scans(plan) == []
@@ -0,0 +1,31 @@
+import json
+
+from breedgraph.adapters.redis.payloads import (
+    encode_payload, decode_payload, to_columns, payload_header, parse_payload_header, COLUMNS
+)
+
+
+def test_records_are_stored_by_column():
+    records = [
+        {'unit_id': 1, 'value': '1.5', 'start': '2024-01-01'},
+        {'unit_id': 2, 'value': '2.5'}
+    ]
+    table = to_columns({'records': records})['records']
+    assert table[COLUMNS]['unit_id'] == [1, 2]
+    assert table[COLUMNS]['start'] == ['2024-01-01', None]
+
+def test_payload_round_trip_in_chunks():
+    submission = {
+        'dataset_id': 1,
+        'records': [{'unit_id': i, 'value': str(i), 'references': [i]} for i in range(1000)] + [{'unit_id': None}],
+        'contributor_ids': [],
+        'single': [{'a': 1}]
+    }
+    chunks = encode_payload(submission, chunk_size=256)
+    assert len(chunks) > 1
+    assert sum(len(chunk) for chunk in chunks) < len(json.dumps(submission)) / 4
+    assert decode_payload(chunks) == submission
+
+def test_payload_header():
+    assert parse_payload_header(payload_header(3).encode()) == 3
+    assert parse_payload_header(b'{"dataset_id": 1}') is None
@@ -0,0 +1,312 @@
+import asyncio
+import pytest
+
+from breedgraph.adapters.redis.event_queue import RedisEventQueue
+from breedgraph.domain.events.accounts import AccountCreated
+from breedgraph.domain.events.analysis import AnalysisRequested
+
+
+def _key(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+def _order(message_id: bytes):
+    return tuple(int(part) for part in message_id.split(b"-"))
+
+
+class FakePipeline:
+    """ Queues calls to the fake client, run in order on execute """
+
+    def __init__(self, client: "FakeStreamsClient"):
+        self.client = client
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append((getattr(self.client, name), args, kwargs))
+        return call
+
+    async def execute(self):
+        return [await method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+class FakeStreamsClient:
+    """
+    The subset of Redis Streams used by the RedisEventQueue, for a single consumer group.
+    Time only moves when the test advances now (milliseconds).
+    """
+
+    def __init__(self):
+        self.now = 1000
+        self.sequence = 0
+        self.streams = dict()
+        # by stream, the last delivered id and the pending entries: id -> [consumer, delivered at, times delivered]
+        self.groups = dict()
+        self.sets = dict()
+
+    def pipeline(self, transaction: bool = True):
+        return FakePipeline(self)
+
+    async def xgroup_create(self, name, groupname, id="0", mkstream=False):
+        self.streams.setdefault(name, dict())
+        self.groups.setdefault(name, {"last": b"0-0", "pending": dict()})
+
+    async def xadd(self, name, fields):
+        self.sequence += 1
+        message_id = f"{self.now}-{self.sequence}".encode()
+        self.streams.setdefault(name, dict())[message_id] = {_key(k): _key(v) for k, v in fields.items()}
+        return message_id
+
+    async def xlen(self, name):
+        return len(self.streams.get(name, {}))
+
+    async def xpending(self, name, groupname):
+        return {"pending": len(self.groups[name]["pending"])}
+
+    async def xpending_range(self, name, groupname, min, max, count, consumername=None):
+        entry = self.groups[name]["pending"].get(_key(min))
+        if entry is None or (consumername is not None and entry[0] != consumername):
+            return []
+        return [{"message_id": _key(min), "times_delivered": entry[2]}]
+
+    async def xclaim(self, name, groupname, consumername, min_idle_time, message_ids, justid=False):
+        claimed = []
+        for message_id in map(_key, message_ids):
+            entry = self.groups[name]["pending"].get(message_id)
+            if entry is not None and self.now - entry[1] >= min_idle_time:
+                times = entry[2] if justid else entry[2] + 1
+                self.groups[name]["pending"][message_id] = [consumername, self.now, times]
+                claimed.append(message_id)
+        return claimed
+
+    async def xautoclaim(self, name, groupname, consumername, min_idle_time, start_id, count):
+        group = self.groups[name]
+        claimed, deleted = [], []
+        for message_id, entry in sorted(group["pending"].items(), key=lambda item: _order(item[0])):
+            if len(claimed) >= count:
+                break
+            if self.now - entry[1] < min_idle_time:
+                continue
+            if message_id not in self.streams[name]:
+                deleted.append(message_id)
+                continue
+            group["pending"][message_id] = [consumername, self.now, entry[2] + 1]
+            claimed.append((message_id, self.streams[name][message_id]))
+        for message_id in deleted:
+            del group["pending"][message_id]
+        return [b"0-0", claimed, deleted]
+
+    async def xreadgroup(self, groupname, consumername, streams, count, block=None):
+        response = []
+        for name in streams:
+            group = self.groups[name]
+            new = sorted(
+                (i for i in self.streams[name] if _order(i) > _order(group["last"])), key=_order
+            )[:count]
+            for message_id in new:
+                group["pending"][message_id] = [consumername, self.now, 1]
+                group["last"] = message_id
+            if new:
+                response.append([name.encode(), [(i, self.streams[name][i]) for i in new]])
+        if not response and block:
+            await asyncio.sleep(block / 1000)
+        return response
+
+    async def xack(self, name, groupname, *message_ids):
+        return sum(self.groups[name]["pending"].pop(_key(i), None) is not None for i in message_ids)
+
+    async def xdel(self, name, *message_ids):
+        return sum(self.streams[name].pop(_key(i), None) is not None for i in message_ids)
+
+    async def sadd(self, name, *values):
+        members = self.sets.setdefault(name, set())
+        added = {_key(value) for value in values} - members
+        members.update(added)
+        return len(added)
+
+    async def smembers(self, name):
+        return set(self.sets.get(name, set()))
+
+    async def expire(self, name, time):
+        return name in self.sets
+
+    async def delete(self, *names):
+        return sum(self.sets.pop(name, None) is not None for name in names)
+
+    async def aclose(self):
+        pass
+
+
+RETRY_IDLE = 100
+
+
+def get_queue(client: FakeStreamsClient, consumer: str = 'test', priorities: dict | None = None, **kwargs) -> RedisEventQueue:
+    return RedisEventQueue(
+        client,
+        lanes={},
+        priorities=priorities or {},
+        depths={},
+        consumer=consumer,
+        retry_idle=RETRY_IDLE,
+        poll_block=10,
+        **kwargs
+    )
+
+
+async def get(queue: RedisEventQueue, lane: str = 'default'):
+    return await asyncio.wait_for(queue.get(lane), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_claimed_once_idle():
+    client = FakeStreamsClient()
+    queue = get_queue(client, max_deliveries=3)
+    await queue.put(AccountCreated(user_id=1))
+
+    delivery = await get(queue)
+    assert delivery.attempts == 1
+    await queue.nack(delivery, ValueError('failed'))
+    # still pending and not yet idle for long enough to be retried
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.get('default'), timeout=0.05)
+
+    client.now += RETRY_IDLE
+    retried = await get(queue)
+    assert retried.event == AccountCreated(user_id=1)
+    assert retried.delivery_id == delivery.delivery_id
+    assert retried.attempts == 2
+
+    await queue.ack(retried)
+    assert await client.xlen('events:default') == 0
+    assert await client.xpending('events:default', 'breedgraph') == {'pending': 0}
+
+
+@pytest.mark.asyncio
+async def test_delivery_is_dead_lettered_after_max_deliveries():
+    client = FakeStreamsClient()
+    queue = get_queue(client, max_deliveries=2)
+    await queue.put(AccountCreated(user_id=1))
+
+    await queue.nack(await get(queue), ValueError('first'))
+    client.now += RETRY_IDLE
+    await queue.nack(await get(queue), ValueError('second'))
+
+    assert await client.xlen('events:default') == 0
+    assert await queue.depth('default') == 0
+    dead = list(client.streams[RedisEventQueue.DEAD_LETTER_STREAM].values())
+    assert len(dead) == 1
+    assert dead[0][b'type'] == b'AccountCreated'
+    assert dead[0][b'error'] == b'second'
+
+
+@pytest.mark.asyncio
+async def test_delivery_left_unacknowledged_is_dead_lettered_when_claimed_beyond_max():
+    client = FakeStreamsClient()
+    queue = get_queue(client, max_deliveries=1)
+    await queue.put(AccountCreated(user_id=1))
+    # the worker stops without acking or nacking
+    await get(queue)
+
+    client.now += RETRY_IDLE
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.get('default'), timeout=0.05)
+    assert await client.xlen('events:default') == 0
+    assert len(client.streams[RedisEventQueue.DEAD_LETTER_STREAM]) == 1
+
+
+@pytest.mark.asyncio
+async def test_undecodable_messages_are_dead_lettered():
+    client = FakeStreamsClient()
+    queue = get_queue(client)
+    await queue._ensure_group('events:default')
+    await client.xadd('events:default', {'type': 'RemovedEvent', 'event': '{}'})
+    await client.xadd('events:default', {'type': 'AccountCreated', 'event': '{"user_id": "not an id"}'})
+    await queue.put(AccountCreated(user_id=1))
+
+    delivery = await get(queue)
+    assert delivery.event == AccountCreated(user_id=1)
+
+    dead = list(client.streams[RedisEventQueue.DEAD_LETTER_STREAM].values())
+    assert [message[b'type'] for message in dead] == [b'RemovedEvent', b'AccountCreated']
+    assert all(message[b'lane'] == b'default' for message in dead)
+    # only the decoded delivery is left
+    assert await client.xlen('events:default') == 1
+    assert await client.xpending('events:default', 'breedgraph') == {'pending': 1}
+
+
+@pytest.mark.asyncio
+async def test_buffered_deliveries_are_reclaimed_before_they_are_returned():
+    client = FakeStreamsClient()
+    queue = get_queue(client, priorities={'AnalysisRequested': 0})
+    await queue.put(AnalysisRequested(agent_id=1, analysis_id='a'))
+    await queue.put(AccountCreated(user_id=1))
+    # a blocking read across priorities may return a delivery from each stream, as if both arrived while waiting
+    streams = queue.streams('default')
+    for stream in streams:
+        await queue._ensure_group(stream)
+    first, *rest = await queue._read('default', streams, block=None)
+    queue._buffered['default'].extend(rest)
+    assert isinstance(first.event, AnalysisRequested)
+
+    # the buffered delivery passes retry_idle while the first is handled
+    client.now += RETRY_IDLE
+    await queue.ack(first)
+
+    # it is still pending for this consumer, so it is returned with its idle time reset
+    delivery = await get(queue)
+    assert delivery.event == AccountCreated(user_id=1)
+    assert delivery.attempts == 1
+    assert client.groups['events:default']['pending'][delivery.delivery_id.encode()][:2] == ['test', client.now]
+
+    # and is not claimed by another worker while it is handled
+    other = get_queue(client, consumer='other', priorities={'AnalysisRequested': 0})
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(other.get('default'), timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_buffered_delivery_claimed_by_another_worker_is_skipped():
+    client = FakeStreamsClient()
+    queue = get_queue(client, priorities={'AnalysisRequested': 0})
+    await queue.put(AnalysisRequested(agent_id=1, analysis_id='a'))
+    await queue.put(AccountCreated(user_id=1))
+    streams = queue.streams('default')
+    for stream in streams:
+        await queue._ensure_group(stream)
+    first, *rest = await queue._read('default', streams, block=None)
+    queue._buffered['default'].extend(rest)
+    await queue.ack(first)
+
+    client.now += RETRY_IDLE
+    other = get_queue(client, consumer='other', priorities={'AnalysisRequested': 0})
+    claimed = await get(other)
+    assert claimed.event == AccountCreated(user_id=1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.get('default'), timeout=0.05)
+    assert not queue._buffered['default']
+
+
+@pytest.mark.asyncio
+async def test_handled_handlers_are_restored_on_retry():
+    client = FakeStreamsClient()
+    queue = get_queue(client, max_deliveries=3)
+    await queue.put(AccountCreated(user_id=1))
+
+    delivery = await get(queue)
+    await queue.mark_handled(delivery, 'handlers.first')
+    await queue.nack(delivery, ValueError('second handler failed'))
+
+    client.now += RETRY_IDLE
+    other = get_queue(client, consumer='other', max_deliveries=3)
+    retried = await get(other)
+    assert retried.handled == {'handlers.first'}
+
+    await other.ack(retried)
+    assert not client.sets
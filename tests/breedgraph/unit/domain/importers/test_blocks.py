@@ -0,0 +1,45 @@
+import pytest
+from pydantic import ValidationError
+
+from breedgraph.domain.importers import UnitImport, read_unit_rows
+from breedgraph.service_layer.handlers.events.blocks import _import_order
+
+CSV_CONTENT = """ref,subjectId,parentRefs,parentIds,locationId,layoutId,coordinates,start
+field,1,,,10,,,2024-01-01
+plot-1,2,field,,10,20,1;2,
+plant-1,3,plot-1,,,,,
+plant-2,3,,5,,,,
+"""
+
+def test_csv_rows_are_read_by_alias_with_list_values():
+    units = [UnitImport(**row) for row in read_unit_rows(CSV_CONTENT, 'csv')]
+    field, plot, plant, existing_parent = units
+    assert field.to_position().location_id == 10
+    assert field.parent_refs == []
+    assert plot.parent_refs == ['field']
+    assert plot.coordinates == ['1', '2']
+    assert plant.to_position() is None
+    assert existing_parent.parent_ids == [5]
+    assert field.to_unit_input().subject == 1
+
+def test_units_without_parents_require_a_location():
+    with pytest.raises(ValidationError):
+        UnitImport(subject_id=1)
+
+def test_json_rows():
+    rows = read_unit_rows('{"units": [{"subject_id": 1, "location_id": 2}]}', 'json')
+    assert UnitImport(**rows[0]).location_id == 2
+
+def test_import_order_puts_parents_first_and_rejects_unknown_refs():
+    units = {
+        0: UnitImport(ref='plant', subject_id=3, parent_refs=['plot']),
+        1: UnitImport(ref='plot', subject_id=2, parent_refs=['field']),
+        2: UnitImport(ref='field', subject_id=1, location_id=1),
+        3: UnitImport(subject_id=3, parent_refs=['missing']),
+        4: UnitImport(ref='a', subject_id=3, parent_refs=['b']),
+        5: UnitImport(ref='b', subject_id=3, parent_refs=['a'])
+    }
+    item_errors = []
+    order = _import_order(units, item_errors)
+    assert order.index(2) < order.index(1) < order.index(0)
+    assert {error.index for error in item_errors} == {3, 4, 5}
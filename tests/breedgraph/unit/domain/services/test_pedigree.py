@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from breedgraph.domain.model.germplasm import GermplasmRelationship, GermplasmSourceType
+from breedgraph.domain.services.pedigree import RelationshipMatrixService
+
+
+def relationship(source_id, sink_id, source_type):
+    return GermplasmRelationship(source_id=source_id, sink_id=sink_id, source_type=source_type)
+
+
+@pytest.fixture
+def relationships():
+    # Mrode (2005) example 2.1, with 7 a clone of 6 and 1 sourced from an unknown (e.g. species) entry
+    return [
+        relationship(1, 3, GermplasmSourceType.PATERNAL),
+        relationship(2, 3, GermplasmSourceType.MATERNAL),
+        relationship(1, 4, GermplasmSourceType.PATERNAL),
+        relationship(4, 5, GermplasmSourceType.PATERNAL),
+        relationship(3, 5, GermplasmSourceType.MATERNAL),
+        relationship(5, 6, GermplasmSourceType.PATERNAL),
+        relationship(2, 6, GermplasmSourceType.MATERNAL),
+        relationship(6, 7, GermplasmSourceType.TISSUE),
+        relationship(99, 1, GermplasmSourceType.UNKNOWN)
+    ]
+
+
+def test_tabular_relationship_matrix(relationships):
+    service = RelationshipMatrixService([1, 2, 3, 4, 5, 6, 7], relationships)
+    expected = np.array([
+        [1, 0, 0.5, 0.5, 0.5, 0.25],
+        [0, 1, 0.5, 0, 0.25, 0.625],
+        [0.5, 0.5, 1, 0.25, 0.625, 0.5625],
+        [0.5, 0, 0.25, 1, 0.625, 0.3125],
+        [0.5, 0.25, 0.625, 0.625, 1.125, 0.6875],
+        [0.25, 0.625, 0.5625, 0.3125, 0.6875, 1.125]
+    ])
+    matrix = service.build_matrix()
+    assert np.allclose(matrix[:6, :6], expected)
+    # a clone has the relationships of its source
+    assert np.allclose(matrix[6], matrix[5])
+
+
+def test_result_is_sparse_over_requested_entries(relationships):
+    result = RelationshipMatrixService([6, 4, 2], relationships).get_result(min_value=0.0)
+    assert result['germplasm_ids'] == [6, 4, 2]
+    assert np.allclose(result['inbreeding'], [0.125, 0, 0])
+    # 4 and 2 are unrelated so left out
+    assert list(zip(result['rows'], result['columns'])) == [(0, 1), (0, 2)]
+    assert np.allclose(result['values'], [0.3125, 0.625])
+
+
+def test_selfing_and_cycles():
+    selfed = [
+        relationship(1, 2, GermplasmSourceType.MATERNAL),
+        relationship(1, 2, GermplasmSourceType.PATERNAL)
+    ]
+    result = RelationshipMatrixService([2], selfed).get_result()
+    assert result['inbreeding'] == [0.5]
+
+    cycle = [relationship(1, 2, GermplasmSourceType.SEED), relationship(2, 1, GermplasmSourceType.SEED)]
+    with pytest.raises(ValueError):
+        RelationshipMatrixService([1], cycle)
@@ -0,0 +1,90 @@
+import pytest
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+from itsdangerous import URLSafeTimedSerializer
+
+from breedgraph.config import SECRET_KEY, FILE_DOWNLOAD_SALT
+from breedgraph.custom_exceptions import NoResultFoundError
+from breedgraph.domain.model.archive import FileArchivalRecord, ArchiveState, LocalState
+from breedgraph.entrypoints.fastapi.downloads import router
+
+UPLOAD_ID = 'legacy-upload-uuid'
+FILE_HASH = 'b' * 64
+CONTENT = b'legacy content'
+
+
+class InMemoryArchivalService:
+
+    def __init__(self, records: dict):
+        self.records = records
+        self.accessed = []
+
+    async def get_for_file(self, file_id: str) -> FileArchivalRecord:
+        if file_id not in self.records:
+            raise NoResultFoundError(f"No archival record found for file {file_id}")
+        return self.records[file_id]
+
+    def mark_accessed(self, file_id: str):
+        self.accessed.append(file_id)
+
+
+class InMemoryFileManagement:
+
+    def __init__(self, root):
+        self.root = root
+
+    def get_path(self, key: str):
+        return self.root / key
+
+
+@pytest.fixture
+def archival_service():
+    # records created before content addressing are keyed by the upload UUID
+    return InMemoryArchivalService({UPLOAD_ID: FileArchivalRecord(
+        file_id=UPLOAD_ID,
+        file_size=len(CONTENT),
+        file_hash=FILE_HASH,
+        last_accessed=datetime.now(),
+        archive_state=ArchiveState.ARCHIVED,
+        local_state=LocalState.LOCAL,
+        file_ids=[]
+    )})
+
+
+@pytest.fixture
+def client(tmp_path, archival_service):
+    (tmp_path / UPLOAD_ID).write_bytes(CONTENT)
+    app = FastAPI()
+    app.include_router(router)
+    app.bus = SimpleNamespace(archival_service=archival_service, file_management=InMemoryFileManagement(tmp_path))
+    return TestClient(app)
+
+
+def get_token(details: dict) -> str:
+    return URLSafeTimedSerializer(SECRET_KEY).dumps(details, salt=FILE_DOWNLOAD_SALT)
+
+
+def test_legacy_token_resolves_hash_from_archival_record(client, archival_service):
+    response = client.get('/download', params={'token': get_token({'uuid': UPLOAD_ID, 'filename': 'data.txt'})})
+    assert response.status_code == 200
+    assert response.content == CONTENT
+    assert response.headers['etag'] == f'"{FILE_HASH}"'
+    assert archival_service.accessed == [UPLOAD_ID]
+
+
+def test_legacy_token_without_record_is_not_found(client):
+    response = client.get('/download', params={'token': get_token({'uuid': 'unknown'})})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize('path', ['/download', '/export'])
+def test_invalid_tokens_are_refused(client, path):
+    response = client.get(path, params={'token': 'not a token'})
+    assert response.status_code == 401
+    # signed for another purpose
+    response = client.get(path, params={'token': URLSafeTimedSerializer(SECRET_KEY).dumps({'uuid': UPLOAD_ID})})
+    assert response.status_code == 401
@@ -0,0 +1,95 @@
+import asyncio
+import csv
+import io
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from datetime import datetime, timezone
+
+from breedgraph.entrypoints.fastapi.exports import get_export_writer, stream_export
+from breedgraph.service_layer.queries.read_models import ExportFormat, EXPORT_COLUMNS
+from breedgraph.service_layer.queries.views import AbstractDatasetsView
+
+
+class InMemoryDatasetsView(AbstractDatasetsView):
+
+    def __init__(self, records: dict):
+        self.read_teams = []
+        self.records = records
+        self.queries = 0
+
+    async def _get_dataset_summaries(self, study_id):
+        return []
+
+    async def _get_records(self, dataset_id, after_id, limit):
+        return []
+
+    async def _get_export_dataset_ids(self, dataset_ids, study_ids):
+        return sorted(dataset_ids)
+
+    async def _get_export_rows(self, dataset_id, after_id, limit):
+        self.queries += 1
+        rows = [row for row in self.records[dataset_id] if after_id is None or row['record_id'] > after_id]
+        return rows[:limit]
+
+
+def get_row(dataset_id: int, record_id: int) -> dict:
+    return {
+        'dataset_id': dataset_id,
+        'concept_id': 10,
+        'record_id': record_id,
+        'unit_id': 100 + record_id,
+        'unit_name': None,
+        'subject_id': 5,
+        'germplasm_id': 7,
+        'germplasm_name': 'REDACTED',
+        'location_id': 3,
+        'location_name': 'Field',
+        'layout_id': None,
+        'start': np.datetime64('2024-05', 'M'),
+        'end': None,
+        'value': '1.5',
+        'submitted': datetime(2024, 6, 1, tzinfo=timezone.utc),
+        'reference_ids': [1, 2]
+    }
+
+
+async def collect(view: AbstractDatasetsView, export_format: ExportFormat, page_size: int) -> bytes:
+    pages = view.yield_export_rows(dataset_ids=[2, 1], page_size=page_size)
+    return b"".join([chunk async for chunk in stream_export(pages, get_export_writer(export_format))])
+
+
+def test_rows_are_read_in_pages_by_dataset():
+    view = InMemoryDatasetsView({1: [get_row(1, i) for i in range(5)], 2: [get_row(2, i) for i in range(5, 9)]})
+
+    async def pages():
+        return [[row['record_id'] for row in rows] async for rows in view.yield_export_rows([1, 2], page_size=2)]
+
+    assert asyncio.run(pages()) == [[0, 1], [2, 3], [4], [5, 6], [7, 8]]
+    # a full last page takes one more (empty) query to find the end
+    assert view.queries == 6
+
+
+def test_csv_export():
+    view = InMemoryDatasetsView({1: [get_row(1, 0), get_row(1, 1)], 2: [get_row(2, 2)]})
+    rows = list(csv.reader(io.StringIO(asyncio.run(collect(view, ExportFormat.CSV, page_size=2)).decode())))
+    assert rows[0] == EXPORT_COLUMNS
+    assert len(rows) == 4
+    first = dict(zip(rows[0], rows[1]))
+    assert first['start'] == '2024-05'
+    assert first['end'] == ''
+    assert first['unit_name'] == ''
+    assert first['reference_ids'] == '1;2'
+    assert first['submitted'] == '2024-06-01T00:00:00+00:00'
+
+
+def test_parquet_export_has_a_row_group_per_page():
+    view = InMemoryDatasetsView({1: [get_row(1, i) for i in range(3)], 2: [get_row(2, 3)]})
+    parquet_file = pq.ParquetFile(io.BytesIO(asyncio.run(collect(view, ExportFormat.PARQUET, page_size=2))))
+    assert parquet_file.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column_names == EXPORT_COLUMNS
+    assert table.column('record_id').to_pylist() == [0, 1, 2, 3]
+    assert table.column('start').to_pylist()[0] == '2024-05'
+    assert table.column('reference_ids').to_pylist()[0] == [1, 2]
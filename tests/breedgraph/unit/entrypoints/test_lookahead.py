@@ -0,0 +1,51 @@
+from graphql import build_schema, graphql_sync, parse, validate
+
+from breedgraph.config import GQL_LIST_COST_FACTOR, GQL_MAX_QUERY_DEPTH
+from breedgraph.entrypoints.fastapi.graphql.query_cost import QueryCostRule, get_selection_cost
+from breedgraph.entrypoints.fastapi.graphql.resolvers.queries.lookahead import get_selected_paths, selects
+
+SCHEMA = build_schema("""
+    type Unit { id: ID!, subject: String, children: [Unit] }
+    type Record { unit: Unit, value: String }
+    type Dataset { id: ID!, records: [Record] }
+    type DatasetsPayload { status: String, result: [Dataset] }
+    type Query { datasets: DatasetsPayload }
+""")
+
+
+def test_selected_paths_expand_fragments():
+    selected = dict()
+
+    def resolve_datasets(_, info):
+        selected['paths'] = get_selected_paths(info)
+        return None
+
+    query = """
+        query { datasets { status, result { records { ...RecordFields } } } }
+        fragment RecordFields on Record { value, unit { children { subject } } }
+    """
+    SCHEMA.query_type.fields['datasets'].resolve = resolve_datasets
+    graphql_sync(SCHEMA, query)
+    paths = selected['paths']
+    assert "result.records.value" in paths
+    assert "result.records.unit.children.subject" in paths
+    assert selects(paths, "result.records.unit", "subject")
+    assert not selects(paths, "result.records.unit", "germplasm")
+
+
+def test_cost_multiplies_within_lists():
+    document = parse("{ datasets { status, result { id, records { value } } } }")
+    operation = document.definitions[0]
+    cost, depth = get_selection_cost(SCHEMA, SCHEMA.query_type, operation.selection_set, dict())
+    assert depth == 4
+    assert cost == 3 + GQL_LIST_COST_FACTOR * (2 + GQL_LIST_COST_FACTOR)
+    assert validate(SCHEMA, document, [QueryCostRule]) == []
+
+
+def test_deep_queries_rejected():
+    nested = "{ id }"
+    for _ in range(GQL_MAX_QUERY_DEPTH):
+        nested = "{ id, children " + nested + " }"
+    document = parse("{ datasets { result { records { unit " + nested + " } } } }")
+    errors = validate(SCHEMA, document, [QueryCostRule])
+    assert any("exceeds the maximum" in error.message for error in errors)
@@ -0,0 +1,45 @@
+import pytest
+
+from graphql import build_schema
+
+from breedgraph.entrypoints.fastapi.graphql.query_cache import (
+    QueryCache, PersistedQueryNotFound, PersistedQueryMismatch, get_query_hash
+)
+
+SCHEMA = build_schema("type Query { hello: String }")
+QUERY = "{ hello }"
+
+
+def persisted(query_hash: str) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+def test_documents_are_reused_and_validated_once():
+    cache = QueryCache(max_size=2)
+    cached = cache.get({"query": QUERY})
+    assert cache.get({"query": QUERY}) is cached
+
+    validator = cache.get_validator(cached)
+    assert validator(SCHEMA, cached.document) == []
+    assert cached.errors == []
+
+    invalid = cache.get({"query": "{ goodbye }"})
+    assert len(cache.get_validator(invalid)(SCHEMA, invalid.document)) == 1
+
+    cache.get({"query": "{ __typename }"})
+    assert len(cache) == 2
+    assert cache.get({"query": QUERY}) is not cached
+
+
+def test_persisted_queries():
+    cache = QueryCache(max_size=10)
+    query_hash = get_query_hash(QUERY)
+    with pytest.raises(PersistedQueryNotFound):
+        cache.get({"extensions": persisted(query_hash)})
+    with pytest.raises(PersistedQueryMismatch):
+        cache.get({"query": "{ __typename }", "extensions": persisted(query_hash)})
+
+    cached = cache.get({"query": QUERY, "extensions": persisted(query_hash)})
+    data = {"extensions": persisted(query_hash)}
+    assert cache.get(data) is cached
+    assert data["query"] == QUERY
@@ -0,0 +1,46 @@
+import pytest
+
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from breedgraph.entrypoints.fastapi.responses import BlobFileResponse
+
+FILE_HASH = 'a' * 64
+CONTENT = bytes(range(256)) * 16
+
+
+@pytest.fixture
+def client(tmp_path):
+    blob_path = tmp_path / FILE_HASH
+    blob_path.write_bytes(CONTENT)
+
+    async def download(request):
+        return BlobFileResponse(blob_path, file_hash=FILE_HASH, filename='data.bin')
+
+    return TestClient(Starlette(routes=[Route('/download', download)]))
+
+def test_etag_is_content_hash(client):
+    response = client.get('/download')
+    assert response.status_code == 200
+    assert response.headers['etag'] == f'"{FILE_HASH}"'
+    assert response.content == CONTENT
+
+def test_if_none_match_not_modified(client):
+    response = client.get('/download', headers={'If-None-Match': f'W/"other", "{FILE_HASH}"'})
+    assert response.status_code == 304
+    assert response.content == b''
+
+def test_range(client):
+    response = client.get('/download', headers={'Range': 'bytes=10-19'})
+    assert response.status_code == 206
+    assert response.headers['content-range'] == f'bytes 10-19/{len(CONTENT)}'
+    assert response.content == CONTENT[10:20]
+
+def test_if_range_mismatch_returns_full_file(client):
+    response = client.get('/download', headers={'Range': 'bytes=10-19', 'If-Range': '"stale"'})
+    assert response.status_code == 200
+    assert response.content == CONTENT
+
+    response = client.get('/download', headers={'Range': 'bytes=10-19', 'If-Range': f'"{FILE_HASH}"'})
+    assert response.status_code == 206
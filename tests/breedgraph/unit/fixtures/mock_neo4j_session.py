@@ -0,0 +1,58 @@
+from typing import Callable, Dict, List
+
+
+class FakeRecord(dict):
+    """ A result record, as returned by the neo4j driver """
+
+    def data(self) -> dict:
+        return dict(self)
+
+
+class FakeResult:
+
+    def __init__(self, rows: List[dict]):
+        self.rows = [FakeRecord(row) for row in rows]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+    async def single(self, strict: bool = False):
+        return self.rows[0] if self.rows else None
+
+    async def consume(self):
+        pass
+
+
+class FakeTransaction:
+
+    def __init__(self, session: "FakeSession"):
+        self.session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def run(self, query: str, parameters: dict | None = None, **kwargs) -> FakeResult:
+        params = {**(parameters or {}), **kwargs}
+        self.session.runs.append((query, params))
+        return FakeResult(self.session.respond(query, params))
+
+
+class FakeSession:
+    """
+    Records the queries run in transactions of the session, with their parameters,
+    and answers each with the rows returned by respond(query, params).
+    """
+
+    def __init__(self, respond: Callable[[str, Dict], List[dict]] = lambda query, params: []):
+        self.respond = respond
+        self.runs = []
+
+    async def begin_transaction(self) -> FakeTransaction:
+        return FakeTransaction(self)
@@ -0,0 +1,34 @@
+import pytest
+
+from breedgraph.service_layer.infrastructure.access_recorder import LastAccessRecorder
+
+
+@pytest.mark.asyncio
+async def test_accesses_are_batched():
+    batches = []
+    async def flush(keys):
+        batches.append(sorted(keys))
+
+    recorder = LastAccessRecorder(flush, interval=60)
+    await recorder.start()
+    for key in ['a', 'b', 'a', 'a']:
+        recorder.record(key)
+    assert not batches
+
+    await recorder.stop()
+    assert batches == [['a', 'b']]
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_retried():
+    batches = []
+    async def flush(keys):
+        if not batches:
+            batches.append(None)
+            raise ConnectionError
+        batches.append(sorted(keys))
+
+    recorder = LastAccessRecorder(flush, interval=60)
+    recorder.record('a')
+    await recorder.flush()
+    await recorder.flush()
+    assert batches == [None, ['a']]
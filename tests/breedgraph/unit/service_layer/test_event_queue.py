@@ -0,0 +1,123 @@
+import asyncio
+import pytest
+
+from breedgraph.domain.events.analysis import AnalysisRequested
+from breedgraph.domain.events.accounts import AccountCreated
+from breedgraph.custom_exceptions import ServiceBusyError
+from breedgraph.service_layer.infrastructure.event_queue import (
+    InMemoryEventQueue, EventDelivery, LaneMetrics, get_event_types
+)
+from breedgraph.service_layer.messagebus import MessageBus
+
+
+def test_event_types_are_found_by_name():
+    event_types = get_event_types()
+    assert event_types['AnalysisRequested'] is AnalysisRequested
+    assert event_types['AccountCreated'] is AccountCreated
+
+@pytest.mark.asyncio
+async def test_events_are_routed_to_lanes():
+    queue = InMemoryEventQueue(lanes={'AnalysisRequested': 'analysis'})
+    analysis_event = AnalysisRequested(agent_id=1, analysis_id='a')
+    await queue.put(analysis_event)
+
+    delivery = await asyncio.wait_for(queue.get('analysis'), timeout=1)
+    assert delivery.event == analysis_event
+    assert delivery.lane == 'analysis'
+    assert queue.qsize() == 0
+
+@pytest.mark.asyncio
+async def test_join_waits_for_events_published_by_handlers():
+    queue = InMemoryEventQueue(lanes={'AnalysisRequested': 'analysis'})
+    await queue.put(AnalysisRequested(agent_id=1, analysis_id='a'))
+
+    async def worker():
+        delivery = await queue.get('analysis')
+        # the handler publishes a follow-up event to another lane before acknowledging
+        await queue.put(AccountCreated(user_id=1))
+        await queue.ack(delivery)
+        follow_up = await queue.get('default')
+        await queue.nack(follow_up, ValueError('failed'))
+
+    task = asyncio.create_task(worker())
+    await asyncio.wait_for(queue.join(), timeout=1)
+    assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_events_are_taken_in_priority_order():
+    queue = InMemoryEventQueue(lanes={}, priorities={'AnalysisRequested': 0}, depths={})
+    await queue.put(AccountCreated(user_id=1))
+    await queue.put(AccountCreated(user_id=2))
+    await queue.put(AnalysisRequested(agent_id=1, analysis_id='a'))
+
+    taken = [(await queue.get('default')).event for _ in range(3)]
+    assert isinstance(taken[0], AnalysisRequested)
+    assert [event.user_id for event in taken[1:]] == [1, 2]
+
+@pytest.mark.asyncio
+async def test_full_lane_refuses_events():
+    queue = InMemoryEventQueue(lanes={'AnalysisRequested': 'analysis'}, depths={'analysis': 1})
+    await queue.put(AnalysisRequested(agent_id=1, analysis_id='a'))
+    with pytest.raises(ServiceBusyError):
+        await queue.put(AnalysisRequested(agent_id=1, analysis_id='b'))
+    # other lanes are unaffected
+    await queue.put(AccountCreated(user_id=1))
+    assert await queue.depth('analysis') == 1
+
+    await queue.get('analysis')
+    await queue.put(AnalysisRequested(agent_id=1, analysis_id='b'))
+
+def test_lane_metrics_summary():
+    metrics = LaneMetrics()
+    metrics.record(wait_seconds=1.0, handler_seconds=2.0)
+    metrics.record(wait_seconds=3.0, handler_seconds=4.0, failed=True)
+    summary = metrics.summary()
+    assert summary['handled'] == 2
+    assert summary['failed'] == 1
+    assert summary['mean_wait_seconds'] == 2.0
+    assert summary['max_handler_seconds'] == 4.0
+
+
+class RecordingUnitOfWorkFactory:
+    def set_event_publisher(self, publisher):
+        self.publisher = publisher
+
+
+@pytest.mark.asyncio
+async def test_redelivered_event_runs_only_handlers_not_yet_handled():
+    queue = InMemoryEventQueue(lanes={})
+    called = []
+
+    async def first(event):
+        called.append('first')
+
+    async def second(event):
+        called.append('second')
+
+    handled = []
+    mark_handled = queue.mark_handled
+    async def record_handled(delivery, handler):
+        handled.append(handler)
+        await mark_handled(delivery, handler)
+    queue.mark_handled = record_handled
+
+    bus = MessageBus(
+        uow_factory=RecordingUnitOfWorkFactory(),
+        views_factory=None,
+        state_store=None,
+        auth_service=None,
+        file_management=None,
+        event_handlers={AccountCreated: [first, second]},
+        command_handlers={},
+        event_queue=queue
+    )
+    first_name = f"{first.__module__}.{first.__qualname__}"
+    # as redelivered after the second handler failed on an earlier attempt
+    await queue._put(EventDelivery(event=AccountCreated(user_id=1), lane='default', attempts=2, handled={first_name}))
+    worker = asyncio.create_task(bus.handle_event('default'))
+    await asyncio.wait_for(queue.join(), timeout=1)
+    worker.cancel()
+
+    assert called == ['second']
+    assert handled == [f"{second.__module__}.{second.__qualname__}"]
@@ -0,0 +1,43 @@
+import pytest
+import hashlib
+
+from breedgraph.service_layer.infrastructure.file_store import ContentAddressedFileStore
+from breedgraph.custom_exceptions import IllegalOperationError
+
+
+def stage(store: ContentAddressedFileStore, key: str, content: bytes) -> str:
+    store.path(key).write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+def test_commit_moves_upload_to_blob(tmp_path):
+    store = ContentAddressedFileStore(tmp_path)
+    file_hash = stage(store, 'upload_1', b'content')
+
+    blob_id = store.commit('upload_1', file_hash, file_size=7)
+
+    assert blob_id == file_hash
+    assert not store.path('upload_1').exists()
+    assert store.path(blob_id).read_bytes() == b'content'
+
+def test_commit_deduplicates_identical_uploads(tmp_path):
+    store = ContentAddressedFileStore(tmp_path)
+    file_hash = stage(store, 'upload_1', b'content')
+    stage(store, 'upload_2', b'content')
+
+    assert store.commit('upload_1', file_hash, file_size=7) == store.commit('upload_2', file_hash, file_size=7)
+    assert [p.name for p in tmp_path.iterdir()] == [file_hash]
+
+def test_commit_replaces_incomplete_blob(tmp_path):
+    store = ContentAddressedFileStore(tmp_path)
+    file_hash = stage(store, 'upload_1', b'content')
+    store.path(file_hash).write_bytes(b'cont')
+
+    store.commit('upload_1', file_hash, file_size=7)
+    assert store.path(file_hash).read_bytes() == b'content'
+
+def test_path_rejects_keys_outside_store(tmp_path):
+    store = ContentAddressedFileStore(tmp_path / 'store')
+    with pytest.raises(IllegalOperationError):
+        store.path('../outside')
+    with pytest.raises(ValueError):
+        store.path('')
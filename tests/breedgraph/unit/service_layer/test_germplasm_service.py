@@ -221,3 +221,34 @@ class TestGermplasmApplicationService:
                 break
         else:
             raise ValueError("Parent not found in source relationships")
+
+    @pytest.mark.asyncio
+    async def test_output_relationships_limited_to_readable_entries(self, germplasm_service):
+        await germplasm_service.access_control._change_user_context(user_id=1)
+        parent = await germplasm_service.create_entry(GermplasmInput(name="Parent"))
+        child = await germplasm_service.create_entry(GermplasmInput(name="Child"))
+        grandchild = await germplasm_service.create_entry(GermplasmInput(name="Grandchild"))
+        await germplasm_service.create_relationships([
+            GermplasmRelationship(source_id=parent.id, sink_id=child.id),
+            GermplasmRelationship(source_id=child.id, sink_id=grandchild.id)
+        ])
+        # user 2 may read the child but not its parent or grandchild
+        await germplasm_service.access_control._set_controls(
+            label="Germplasm", model_ids=[child.id], team_ids=[2], user_id=1, release=ReadRelease.PRIVATE
+        )
+
+        entries = {
+            entry.id: entry async for entry in
+            germplasm_service.get_entries(entry_ids=[parent.id, child.id, grandchild.id], as_output=True)
+        }
+        assert [rel.sink_id for rel in entries[parent.id].sinks] == [child.id]
+        assert [rel.source_id for rel in entries[child.id].sources] == [parent.id]
+        assert [rel.sink_id for rel in entries[child.id].sinks] == [grandchild.id]
+
+        await germplasm_service.access_control._change_user_context(user_id=2)
+        entries = {
+            entry.id: entry async for entry in
+            germplasm_service.get_entries(entry_ids=[child.id], as_output=True)
+        }
+        assert entries[child.id].name == "Child"
+        assert entries[child.id].sources == [] and entries[child.id].sinks == []
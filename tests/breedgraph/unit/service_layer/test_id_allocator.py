@@ -0,0 +1,42 @@
+import asyncio
+import pytest
+
+from breedgraph.service_layer.infrastructure.id_allocator import AbstractIdAllocator
+
+
+class MockIdAllocator(AbstractIdAllocator):
+    def __init__(self, block_size: int):
+        super().__init__(block_size=block_size)
+        self.counters = dict()
+        self.reservations = 0
+
+    async def _reserve(self, name: str, size: int) -> int:
+        self.reservations += 1
+        first = self.counters.get(name, 0) + 1
+        self.counters[name] = first + size - 1
+        return first
+
+
+@pytest.mark.asyncio
+async def test_ids_served_from_reserved_block():
+    allocator = MockIdAllocator(block_size=10)
+    ids = [await allocator.next_id('unit') for _ in range(10)]
+    assert ids == list(range(1, 11))
+    assert allocator.reservations == 1
+    assert await allocator.next_id('dataset') == 1
+
+@pytest.mark.asyncio
+async def test_large_batch_reserved_at_once():
+    allocator = MockIdAllocator(block_size=10)
+    await allocator.next_id('record')
+    ids = await allocator.allocate('record', 25)
+    assert ids == list(range(2, 27))
+    assert allocator.reservations == 2
+    assert await allocator.next_id('record') == 27
+
+@pytest.mark.asyncio
+async def test_concurrent_allocation_is_unique():
+    allocator = MockIdAllocator(block_size=3)
+    batches = await asyncio.gather(*[allocator.allocate('unit', 2) for _ in range(20)])
+    ids = [i for batch in batches for i in batch]
+    assert len(set(ids)) == 40
@@ -0,0 +1,33 @@
+import pytest
+
+from breedgraph.config import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from breedgraph.service_layer.queries.read_models import Page, encode_cursor, decode_cursor, page_size
+
+
+def test_cursor_round_trip():
+    assert decode_cursor('Record', encode_cursor('Record', 42)) == 42
+    assert decode_cursor('Record', None) is None
+    with pytest.raises(ValueError):
+        decode_cursor('Unit', encode_cursor('Record', 42))
+    with pytest.raises(ValueError):
+        decode_cursor('Record', 'not a cursor')
+
+
+def test_page_from_extra_item():
+    page = Page.from_items('Unit', ['a', 'b', 'c'], [1, 2, 3], size=2)
+    assert page.items == ['a', 'b']
+    assert page.has_next_page
+    assert decode_cursor('Unit', page.end_cursor) == 2
+
+    last = Page.from_items('Unit', ['c'], [3], size=2)
+    assert not last.has_next_page
+    assert Page.from_items('Unit', [], [], size=2).end_cursor is None
+
+
+def test_page_size():
+    assert page_size(None) == DEFAULT_PAGE_SIZE
+    assert page_size(1) == 1
+    assert page_size(MAX_PAGE_SIZE + 1) == MAX_PAGE_SIZE
+    for first in (0, -1):
+        with pytest.raises(ValueError):
+            page_size(first)
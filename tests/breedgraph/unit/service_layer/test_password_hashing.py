@@ -0,0 +1,28 @@
+import asyncio
+import pytest
+
+from breedgraph.custom_exceptions import ServiceBusyError
+from breedgraph.service_layer.infrastructure.password_hashing import PasswordHashingService
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify():
+    hasher = PasswordHashingService(rounds=4, max_workers=1, queue_limit=1)
+    password_hash = await hasher.hash('Password1!')
+    assert password_hash.startswith('$2b$04$')
+    assert await hasher.verify('Password1!', password_hash)
+    assert not await hasher.verify('Password2!', password_hash)
+    hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_saturated_hasher_rejects_requests():
+    hasher = PasswordHashingService(rounds=4, max_workers=1, queue_limit=1)
+    password_hash = await hasher.hash('Password1!')
+    results = await asyncio.gather(
+        *[hasher.verify('Password1!', password_hash) for _ in range(3)],
+        return_exceptions=True
+    )
+    assert results[:2] == [True, True]
+    assert isinstance(results[2], ServiceBusyError)
+    assert hasher.pending == 0
+    hasher.shutdown()
@@ -0,0 +1,92 @@
+import pytest
+
+from breedgraph.service_layer.infrastructure.pedigree_index import PedigreeIndex
+
+
+@pytest.fixture
+def pedigree():
+    # 1 -> 2 -> 4, 1 -> 3 -> 4 -> 5, 3 -> 5
+    index = PedigreeIndex()
+    index.load([(1, 2), (1, 3), (2, 4), (3, 4), (4, 5), (3, 5)], version=1)
+    return index
+
+
+def test_ancestors_and_descendants_nearest_first(pedigree):
+    assert pedigree.get_ancestor_ids(5) == [3, 4, 1, 2]
+    assert pedigree.get_ancestor_ids(5, path_length_limit=1) == [3, 4]
+    assert pedigree.get_descendant_ids(1) == [2, 3, 4, 5]
+    assert pedigree.get_descendant_ids(5) == []
+    assert pedigree.get_ancestor_ids(99) == []
+    # as for the graph queries, a limit of 0 is no limit
+    assert pedigree.get_ancestor_ids(5, path_length_limit=0) == [3, 4, 1, 2]
+    assert pedigree.get_descendant_ids(1, path_length_limit=0) == [2, 3, 4, 5]
+
+
+def test_paths_and_cycles(pedigree):
+    assert pedigree.get_path(1, 5) == [1, 3, 5]
+    assert pedigree.get_path(5, 1) is None
+    assert pedigree.has_path(2, 5)
+    assert not pedigree.has_path(2, 3)
+    assert pedigree.would_create_cycle(5, 1)
+    assert pedigree.would_create_cycle(4, 4)
+    assert not pedigree.would_create_cycle(2, 3)
+
+
+def test_copy_holds_changes_apart(pedigree):
+    copy = pedigree.copy()
+    copy.remove_edges([(3, 5), (4, 5)])
+    copy.add_edges([(5, 6), (2, 6)])
+    assert copy.get_ancestor_ids(6) == [2, 5, 1]
+    assert copy.get_descendant_ids(4) == []
+    assert sorted(copy.edges()) == [(1, 2), (1, 3), (2, 4), (2, 6), (3, 4), (5, 6)]
+    assert pedigree.get_descendant_ids(4) == [5]
+
+
+def test_apply_follows_version(pedigree):
+    assert not pedigree.apply(3, added=[(5, 6)])
+    assert pedigree.apply(2, added=[(5, 6)], removed=[(1, 2)])
+    assert pedigree.version == 2
+    assert pedigree.get_ancestor_ids(6) == [5, 3, 4, 1, 2]
+    assert pedigree.get_ancestor_ids(2) == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_never_moves_shared_index_back(pedigree):
+    reads = []
+    async def read_edges(edges):
+        reads.append(edges)
+        return edges
+
+    snapshot = await pedigree.snapshot(1, lambda: read_edges([]))
+    assert not reads
+    snapshot.add_edges([(5, 6)])
+    assert pedigree.get_descendant_ids(5) == []
+
+    # a transaction reading an older version gets a private copy
+    pedigree.apply(2, added=[(5, 6)])
+    older = await pedigree.snapshot(1, lambda: read_edges([(1, 2)]))
+    assert older.version == 1 and older.edges() == [(1, 2)]
+    assert pedigree.version == 2 and pedigree.get_descendant_ids(5) == [6]
+
+    # a newer version reloads the shared index
+    newer = await pedigree.snapshot(4, lambda: read_edges([(7, 8)]))
+    assert pedigree.version == 4 and pedigree.edges() == [(7, 8)]
+    assert newer is not pedigree and newer.edges() == [(7, 8)]
+
+
+def test_large_delta_is_compacted():
+    index = PedigreeIndex()
+    index.load([], version=0)
+    index.add_edges((i, i + 1) for i in range(2000))
+    assert index._edge_count == 2000
+    assert index.get_path(0, 2000) == list(range(2001))
+
+
+def test_cycles_checked_for_whole_batch(pedigree):
+    assert pedigree.get_cycle_ids([(5, 6), (2, 6)]) == []
+    assert pedigree.get_cycle_ids([(5, 6), (6, 7)]) == []
+    # neither relationship closes a cycle alone, but together they do
+    assert sorted(pedigree.get_cycle_ids([(5, 6), (6, 1)])) == [1, 2, 3, 4, 5, 6]
+    assert pedigree.get_cycle_ids([(6, 7), (7, 6)]) == [6, 7]
+    assert pedigree.get_cycle_ids([(8, 8)]) == [8]
+    assert pedigree.get_descendant_ids(5) == []
@@ -0,0 +1,161 @@
+import pytest
+
+from datetime import datetime
+
+from types import SimpleNamespace
+
+from breedgraph.domain.events.references import UploadCompleted
+from breedgraph.domain.model.archive import FileArchivalRecord, ArchiveState, LocalState
+from breedgraph.service_layer.handlers.events.references import release_file, upload_completed
+
+
+class FakeFileManagement:
+
+    def __init__(self, fail_store: bool = False):
+        self.deleted = []
+        self.stored = []
+        self.fail_store = fail_store
+
+    async def store_blob(self, uuid: str, file_hash: str, file_size: int | None = None) -> str:
+        if self.fail_store:
+            raise OSError('No space left on device')
+        self.stored.append(uuid)
+        return file_hash
+
+    async def delete_file(self, uuid: str) -> None:
+        self.deleted.append(uuid)
+
+
+class FakeArchivalService:
+    """ Blob records by blob ID with the linked upload UUIDs, released as by AbstractFileArchivalService """
+
+    def __init__(self, links: dict[str, list[str]]):
+        self.links = links
+
+    async def add_file(self, file_id, file_size, file_hash):
+        self.links.setdefault(file_hash, []).append(file_id)
+
+    async def release_file(self, file_id, delete_local=None):
+        blob_id = next((blob for blob, files in self.links.items() if file_id in files), None)
+        if blob_id is None:
+            return None
+        self.links[blob_id].remove(file_id)
+        if not self.links[blob_id] and delete_local is not None:
+            await delete_local(blob_id)
+        return FileArchivalRecord(
+            file_id=blob_id,
+            file_size=1,
+            file_hash=blob_id,
+            last_accessed=datetime.now(),
+            archive_state=ArchiveState.ARCHIVED if self.links[blob_id] else ArchiveState.DELETION_PENDING,
+            local_state=LocalState.LOCAL,
+            file_ids=list(self.links[blob_id])
+        )
+
+
+@pytest.mark.asyncio
+async def test_blob_is_deleted_by_the_release_of_its_last_upload():
+    file_management = FakeFileManagement()
+    archival_service = FakeArchivalService({'hash': ['a', 'b']})
+
+    await release_file('a', file_management, archival_service)
+    assert file_management.deleted == []
+
+    await release_file('b', file_management, archival_service)
+    assert file_management.deleted == ['hash']
+
+
+@pytest.mark.asyncio
+async def test_released_or_unregistered_upload_is_deleted_by_uuid():
+    file_management = FakeFileManagement()
+    archival_service = FakeArchivalService({'hash': ['a']})
+
+    await release_file('a', file_management, archival_service)
+    # a concurrent release of the same upload finds no record
+    await release_file('a', file_management, archival_service)
+    assert file_management.deleted == ['hash', 'a']
+
+
+class FakeUnitOfWork:
+
+    def __init__(self, reference):
+        self.committed = False
+        user = SimpleNamespace(id=1, fullname='User', email='user@example.com')
+        self.repositories = SimpleNamespace(
+            references=SimpleNamespace(get=self._async(reference)),
+            accounts=SimpleNamespace(get=self._async(SimpleNamespace(user=user)))
+        )
+
+    @staticmethod
+    def _async(value):
+        async def get(**kwargs):
+            return value
+        return get
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def commit(self):
+        self.committed = True
+
+
+class FakeUowFactory:
+
+    def __init__(self, uow: FakeUnitOfWork):
+        self.uow = uow
+
+    def get_uow(self, user_id=None):
+        return self.uow
+
+
+class RecordingNotifications:
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, recipients, message):
+        self.sent.append(message)
+
+
+def get_upload(file_id: str | None = None):
+    reference = SimpleNamespace(id=3, filename='data.csv', file_id=file_id)
+    event = UploadCompleted(user_id=1, uuid='new', reference_id=3, file_size=1, file_hash='hash')
+    return event, reference
+
+
+@pytest.mark.asyncio
+async def test_upload_is_referenced_and_notified_once_stored():
+    event, reference = get_upload(file_id='old')
+    uow = FakeUnitOfWork(reference)
+    notifications = RecordingNotifications()
+    file_management = FakeFileManagement()
+    archival_service = FakeArchivalService({'old-hash': ['old']})
+
+    await upload_completed(event, FakeUowFactory(uow), notifications, file_management, archival_service)
+
+    assert file_management.stored == ['new']
+    assert reference.file_id == 'new' and uow.committed
+    assert len(notifications.sent) == 1
+    # the replaced upload was released
+    assert archival_service.links == {'old-hash': [], 'hash': ['new']}
+    assert file_management.deleted == ['old-hash']
+
+
+@pytest.mark.asyncio
+async def test_upload_that_fails_to_store_is_unlinked_without_notifying():
+    event, reference = get_upload()
+    uow = FakeUnitOfWork(reference)
+    notifications = RecordingNotifications()
+    file_management = FakeFileManagement(fail_store=True)
+    archival_service = FakeArchivalService({'hash': ['other']})
+
+    with pytest.raises(OSError):
+        await upload_completed(event, FakeUowFactory(uow), notifications, file_management, archival_service)
+
+    assert archival_service.links == {'hash': ['other']}
+    assert file_management.deleted == []
+    assert reference.file_id is None and not uow.committed
+    assert notifications.sent == []
@@ -0,0 +1,45 @@
+import pytest
+import hashlib
+
+from breedgraph.service_layer.infrastructure.upload_sink import UploadSink
+
+
+@pytest.mark.asyncio
+async def test_sink_writes_and_hashes(tmp_path):
+    file_path = tmp_path / 'upload'
+    chunks = [bytes([i]) * 1000 for i in range(50)]
+
+    sink = UploadSink(file_path, max_queued_chunks=2, buffer_size=4096)
+    await sink.start()
+    for chunk in chunks:
+        await sink.write(chunk)
+    file_size, file_hash = await sink.close()
+
+    content = b''.join(chunks)
+    assert file_size == len(content)
+    assert file_hash == hashlib.sha256(content).hexdigest()
+    assert file_path.read_bytes() == content
+
+@pytest.mark.asyncio
+async def test_sink_write_error_is_raised(tmp_path):
+    file_path = tmp_path / 'missing_dir' / 'upload'
+
+    sink = UploadSink(file_path, max_queued_chunks=1)
+    await sink.start()
+    try:
+        with pytest.raises(FileNotFoundError):
+            for _ in range(10):
+                await sink.write(b'data')
+            await sink.close()
+    finally:
+        await sink.abort()
+
+@pytest.mark.asyncio
+async def test_sink_abort_releases_worker(tmp_path):
+    file_path = tmp_path / 'upload'
+
+    sink = UploadSink(file_path, max_queued_chunks=1)
+    await sink.start()
+    await sink.write(b'data')
+    await sink.abort()
+    assert sink._worker.done()